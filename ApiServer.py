@@ -0,0 +1,230 @@
+"""
+HTTP API for running analyses
+
+Serves the job queue over HTTP and runs the jobs on a pool of worker processes, each
+holding a warm Orchestrator:
+
+    python ApiServer.py --port 8080 --workers 4
+
+Endpoints:
+    POST   /jobs               {"goal": ..., "options": {...}, "idempotency_key": ..., "use_cache": true}
+                               201 for a new job, 200 for an existing or cached one
+    GET    /jobs               Recent jobs (?status=queued|running|done|failed|cancelled&limit=50, at most 500)
+    GET    /jobs/{id}          Job status, timings and result summary
+    DELETE /jobs/{id}          Cancel a queued or running job
+    GET    /jobs/{id}/events   Progress events as server-sent events (resumes from Last-Event-ID or ?after=)
+    GET    /jobs/{id}/report   HTML report of a finished job
+    GET    /jobs/{id}/results  Workflow results JSON of a finished job
+    GET    /health             Job counts per status and live workers
+
+Use --workers 0 to serve the API only and run the workers elsewhere on the same queue file
+(python ApiServer.py --serve-workers-only --workers 8).
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+from aiohttp import web
+from dotenv import load_dotenv
+
+from agent.JobQueue import JobQueue
+from agent.JobWorkerPool import ORCHESTRATOR_OPTIONS, JobWorkerPool
+
+
+QUEUE_KEY = web.AppKey("queue", JobQueue)
+POOL_KEY = web.AppKey("pool", object)
+MAX_LIST_LIMIT = 500
+
+
+def _job_or_404(queue: JobQueue, job_id: str) -> dict:
+    job = queue.get(job_id)
+    if job is None:
+        raise web.HTTPNotFound(text=json.dumps({"error": f"job {job_id} not found"}), content_type="application/json")
+    return job
+
+
+def _non_negative_int(value: str, name: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = -1
+    if number < 0:
+        raise web.HTTPBadRequest(text=json.dumps({"error": f"{name} must be a non-negative integer, got {value!r}"}),
+                                 content_type="application/json")
+    return number
+
+
+async def submit_job(request: web.Request) -> web.Response:
+    try:
+        body = await request.json()
+    except json.JSONDecodeError:
+        return web.json_response({"error": "body must be JSON"}, status=400)
+    goal = (body.get("goal") or "").strip() if isinstance(body, dict) else ""
+    if not goal:
+        return web.json_response({"error": "goal is required"}, status=400)
+    options = body.get("options") or {}
+    unknown = sorted(set(options) - ORCHESTRATOR_OPTIONS) if isinstance(options, dict) else ["<not an object>"]
+    if unknown:
+        return web.json_response({"error": f"unsupported options: {', '.join(unknown)}",
+                                  "supported": sorted(ORCHESTRATOR_OPTIONS)}, status=400)
+    job, disposition = await asyncio.to_thread(
+        request.app[QUEUE_KEY].submit, goal, options, body.get("idempotency_key"), bool(body.get("use_cache", True))
+    )
+    return web.json_response({**job, "disposition": disposition}, status=201 if disposition == "created" else 200)
+
+
+async def list_jobs(request: web.Request) -> web.Response:
+    limit = min(max(_non_negative_int(request.query.get("limit", "50"), "limit"), 1), MAX_LIST_LIMIT)
+    jobs = await asyncio.to_thread(request.app[QUEUE_KEY].list, request.query.get("status"), limit)
+    return web.json_response({"jobs": jobs})
+
+
+async def get_job(request: web.Request) -> web.Response:
+    return web.json_response(await asyncio.to_thread(_job_or_404, request.app[QUEUE_KEY], request.match_info["job_id"]))
+
+
+async def cancel_job(request: web.Request) -> web.Response:
+    queue = request.app[QUEUE_KEY]
+    await asyncio.to_thread(_job_or_404, queue, request.match_info["job_id"])
+    return web.json_response(await asyncio.to_thread(queue.cancel, request.match_info["job_id"]))
+
+
+async def stream_events(request: web.Request) -> web.StreamResponse:
+    queue = request.app[QUEUE_KEY]
+    job_id = request.match_info["job_id"]
+    if request.headers.get("Last-Event-ID"):
+        after = _non_negative_int(request.headers["Last-Event-ID"], "Last-Event-ID")
+    else:
+        after = _non_negative_int(request.query.get("after") or "0", "after")
+    await asyncio.to_thread(_job_or_404, queue, job_id)
+
+    response = web.StreamResponse(headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"})
+    await response.prepare(request)
+    while True:
+        # Read the status first: a job's final status event is committed with its status
+        job = await asyncio.to_thread(queue.get, job_id)
+        events = await asyncio.to_thread(queue.events, job_id, after)
+        for event in events:
+            after = event["seq"]
+            await response.write(f"id: {after}\nevent: {event['type']}\ndata: {json.dumps(event)}\n\n".encode())
+        if not events:
+            if job["finished"]:
+                break
+            await asyncio.sleep(0.5)
+    await response.write_eof()
+    return response
+
+
+def _file_response(job: dict, path_key: str, content_type: str) -> web.StreamResponse:
+    path = job.get(path_key)
+    if not path or not Path(path).exists():
+        status = 404 if job["finished"] else 409
+        return web.json_response({"error": f"no {path_key.split('_')[0]} for job {job['job_id']} ({job['status']})"},
+                                 status=status)
+    return web.FileResponse(path, headers={"Content-Type": content_type})
+
+
+async def get_report(request: web.Request) -> web.StreamResponse:
+    job = await asyncio.to_thread(_job_or_404, request.app[QUEUE_KEY], request.match_info["job_id"])
+    return _file_response(job, "report_path", "text/html")
+
+
+async def get_results(request: web.Request) -> web.StreamResponse:
+    job = await asyncio.to_thread(_job_or_404, request.app[QUEUE_KEY], request.match_info["job_id"])
+    return _file_response(job, "results_path", "application/json")
+
+
+async def health(request: web.Request) -> web.Response:
+    pool = request.app[POOL_KEY]
+    stats = await asyncio.to_thread(request.app[QUEUE_KEY].stats)
+    return web.json_response({"jobs": stats, "workers": pool.alive() if pool else 0})
+
+
+def create_app(queue: JobQueue, pool: Optional[JobWorkerPool] = None, supervise_interval: float = 10.0) -> web.Application:
+    """Build the application; the pool (if any) is started, supervised and stopped with it."""
+    app = web.Application()
+    app[QUEUE_KEY] = queue
+    app[POOL_KEY] = pool
+    app.router.add_post("/jobs", submit_job)
+    app.router.add_get("/jobs", list_jobs)
+    app.router.add_get("/jobs/{job_id}", get_job)
+    app.router.add_delete("/jobs/{job_id}", cancel_job)
+    app.router.add_get("/jobs/{job_id}/events", stream_events)
+    app.router.add_get("/jobs/{job_id}/report", get_report)
+    app.router.add_get("/jobs/{job_id}/results", get_results)
+    app.router.add_get("/health", health)
+
+    async def run_pool(app: web.Application):
+        if pool is None:
+            yield
+            return
+        pool.start()
+
+        async def supervise():
+            while True:
+                await asyncio.sleep(supervise_interval)
+                await asyncio.to_thread(pool.supervise)
+
+        supervisor = asyncio.create_task(supervise())
+        yield
+        supervisor.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await supervisor
+        await asyncio.to_thread(pool.stop)
+
+    app.cleanup_ctx.append(run_pool)
+    return app
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Serve data quality analyses over HTTP")
+    parser.add_argument("--host", default=os.environ.get("API_HOST") or "127.0.0.1", help="Bind address (default: API_HOST or 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("API_PORT") or 8080), help="Port (default: API_PORT or 8080)")
+    parser.add_argument("--reports-dir", default="ge_reports", help="Directory for reports and the job queue (default: ge_reports)")
+    parser.add_argument("--workers", type=int, default=int(os.environ.get("API_WORKERS") or 2),
+                        help="Worker processes, each with a warm Orchestrator (default: API_WORKERS or 2)")
+    parser.add_argument("--result-ttl", type=float, default=float(os.environ.get("JOB_RESULT_TTL") or 3600),
+                        help="Seconds a finished job is returned for the same goal and options (default: JOB_RESULT_TTL or 3600)")
+    parser.add_argument("--heartbeat-interval", type=float, default=10.0,
+                        help="Seconds between heartbeats of a running job; jobs silent for 3 intervals are requeued")
+    parser.add_argument("--serve-workers-only", action="store_true",
+                        help="Run the worker pool without the HTTP API (to add workers to an existing queue)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    load_dotenv()
+    args = parse_args(argv)
+    queue_path = os.environ.get("JOB_QUEUE_PATH") or str(Path(args.reports_dir) / "job_queue.db")
+    queue = JobQueue(queue_path, result_ttl=args.result_ttl)
+    pool = JobWorkerPool(queue_path, workers=args.workers, runner_kwargs={"reports_dir": args.reports_dir},
+                         heartbeat_interval=args.heartbeat_interval) if args.workers > 0 else None
+
+    if args.serve_workers_only:
+        if pool is None:
+            print("❌ --serve-workers-only needs --workers > 0")
+            return 1
+        pool.start()
+        try:
+            while True:
+                time.sleep(args.heartbeat_interval)
+                pool.supervise()
+        except KeyboardInterrupt:
+            print("🛑 Stopping workers")
+            pool.stop()
+        return 0
+
+    print(f"🌐 Serving on http://{args.host}:{args.port} with {args.workers} worker process(es), queue {queue_path}")
+    web.run_app(create_app(queue, pool), host=args.host, port=args.port, print=None)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
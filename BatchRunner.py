@@ -0,0 +1,86 @@
+"""
+Command-line batch runner
+
+Runs every goal in a goals file with query and profiling tasks shared across goals:
+
+    python BatchRunner.py nightly_goals.txt --max-parallel-goals 4 --run-check-suite
+
+Goals files contain one goal per line (# starts a comment) or a JSON list of goals.
+"""
+
+import argparse
+import asyncio
+import sys
+
+from agent.BatchGoalRunner import load_goals
+from WorkflowRunner import run_batch_analysis
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run a batch of data quality goals with shared query execution")
+    parser.add_argument("goals_file", help="File with one goal per line, or a JSON list of goals")
+    parser.add_argument("--reports-dir", default="ge_reports", help="Directory for reports (default: ge_reports)")
+    parser.add_argument("--max-concurrent-tasks", type=int, default=8,
+                        help="Unique query/profiling tasks executed at the same time (default: 8)")
+    parser.add_argument("--max-parallel-goals", type=int, default=4,
+                        help="Goals analyzed and reported at the same time (default: 4)")
+    parser.add_argument("--incremental-analysis", action="store_true",
+                        help="Digest shared results into findings before the per-goal analysis")
+    parser.add_argument("--run-check-suite", action="store_true",
+                        help="Run the schema's check suite once for the whole batch")
+    parser.add_argument("--detect-drift", action="store_true",
+                        help="Compare each goal's profiles with the previous profiles of the table")
+    parser.add_argument("--no-rule-based-planner", action="store_true",
+                        help="Send every goal to the PlannerAgent")
+    parser.add_argument("--task-timeout", type=float, default=None,
+                        help="Seconds a single agent task may run before it is cancelled")
+    parser.add_argument("--phase-timeout", type=float, default=None,
+                        help="Seconds a phase may run before continuing with partial results")
+    parser.add_argument("--workflow-timeout", type=float, default=None,
+                        help="Seconds the whole batch may take")
+    parser.add_argument("--trace-path", default=None,
+                        help="Write spans of the batch to this JSONL file (view with TraceViewer.py)")
+    parser.add_argument("--console", action="store_true", help="Stream agent conversations to the console")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    goals = load_goals(args.goals_file)
+    if not goals:
+        print(f"❌ No goals found in {args.goals_file}")
+        return 1
+
+    batch = asyncio.run(run_batch_analysis(
+        goals,
+        reports_dir=args.reports_dir,
+        max_concurrent_tasks=args.max_concurrent_tasks,
+        max_parallel_goals=args.max_parallel_goals,
+        incremental_analysis=args.incremental_analysis,
+        run_check_suite=args.run_check_suite,
+        detect_drift=args.detect_drift,
+        use_rule_based_planner=not args.no_rule_based_planner,
+        enable_console_output=args.console,
+        task_timeout=args.task_timeout,
+        phase_timeout=args.phase_timeout,
+        workflow_timeout=args.workflow_timeout,
+        trace_path=args.trace_path
+    ))
+
+    print("\n" + "=" * 80)
+    print("BATCH SUMMARY")
+    print("=" * 80)
+    print(f"Goals: {len(goals)} | Query tasks executed: {batch['unique_query_tasks']} of {batch['total_query_tasks']} planned"
+          f" | Profiling tasks executed: {batch['unique_profiling_tasks']} of {batch['total_profiling_tasks']} planned")
+    for result in batch["goal_results"]:
+        status = "✓" if result["success"] else f"✗ {result.get('error', '')}"
+        issues = len(result["analysis"].issues) if result.get("analysis") else 0
+        print(f"  [{status}] {result['goal']} ({issues} issues)")
+    if batch["timed_out"]:
+        print(f"⏱️ Timed out: {', '.join(batch['timed_out'])}")
+    print("=" * 80)
+    return 0 if batch["success"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
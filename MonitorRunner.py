@@ -0,0 +1,76 @@
+"""
+Command-line monitoring daemon
+
+Watches tables and runs their check suites whenever the data changed:
+
+    python MonitorRunner.py RIDEBOOKING ANALYTICS.PUBLIC.PAYMENTS:1 --poll-interval 300 --max-concurrent-runs 2
+
+Tables take an optional ":priority" suffix (lower runs first, default 0). Idle tables cost
+one metadata query per poll. Use --once to poll a single time, e.g. from cron.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+from agent.MonitorService import MonitorService, MonitoredTable
+from agent.RunHistory import RunHistory
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run data quality checks on tables when their data changes")
+    parser.add_argument("tables", nargs="+", help="Tables to watch, as TABLE or DATABASE.SCHEMA.TABLE with an optional :priority")
+    parser.add_argument("--reports-dir", default="ge_reports", help="Directory for state and run history (default: ge_reports)")
+    parser.add_argument("--poll-interval", type=float, default=float(os.environ.get("MONITOR_POLL_INTERVAL") or 300),
+                        help="Seconds between polls of the change signals (default: MONITOR_POLL_INTERVAL or 300)")
+    parser.add_argument("--max-concurrent-runs", type=int, default=int(os.environ.get("MONITOR_MAX_CONCURRENT_RUNS") or 2),
+                        help="Check runs executing at the same time (default: MONITOR_MAX_CONCURRENT_RUNS or 2)")
+    parser.add_argument("--min-interval", type=float, default=0,
+                        help="Minimum seconds between two runs of the same table (default: 0)")
+    parser.add_argument("--checks", default="",
+                        help="Comma-separated check names to run (e.g. not_null:FARE); default: the whole suite")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Check only rows appended since the last run (needs CHANGE_TRACKING = TRUE on the tables)")
+    parser.add_argument("--no-commit-time", action="store_true",
+                        help="Do not poll SYSTEM$LAST_CHANGE_COMMIT_TIME")
+    parser.add_argument("--once", action="store_true", help="Poll once, run the triggered checks and exit")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    load_dotenv()
+    args = parse_args(argv)
+    reports_dir = Path(args.reports_dir)
+    service = MonitorService(
+        state_path=str(reports_dir / "monitor_state.db"),
+        run_history=RunHistory(os.environ.get("RUN_HISTORY_PATH") or str(reports_dir / "run_history.db")),
+        poll_interval=args.poll_interval,
+        max_concurrent_runs=args.max_concurrent_runs,
+        use_commit_time=not args.no_commit_time
+    )
+    check_names = [name.strip() for name in args.checks.split(",") if name.strip()]
+    for spec in args.tables:
+        name, _, priority = spec.partition(":")
+        service.register(MonitoredTable(table_name=name, priority=int(priority or 0), check_names=check_names,
+                                        min_interval_seconds=args.min_interval, incremental=args.incremental))
+
+    print(f"👀 Monitoring {len(args.tables)} table(s), polling every {args.poll_interval:g}s "
+          f"with up to {args.max_concurrent_runs} concurrent runs")
+    try:
+        if args.once:
+            changed = asyncio.run(service.run_once())
+            print(f"✅ {len(changed)} changed table(s) checked: {', '.join(changed) or 'none'}")
+        else:
+            asyncio.run(service.run_forever())
+    except KeyboardInterrupt:
+        print("🛑 Monitor stopped")
+    print(f"📊 {service.stats}")
+    return 0 if service.stats["failed_runs"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
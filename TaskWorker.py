@@ -0,0 +1,70 @@
+"""
+Command-line task worker
+
+Runs query and profiling tasks shipped by Orchestrators on other nodes:
+
+    TASK_WORKER_TOKEN=<secret> python TaskWorker.py --host 0.0.0.0 --port 7070 --slots 4
+
+Point the Orchestrators at the workers with TASK_WORKERS=node1:7070,node2:7070 and the same
+TASK_WORKER_TOKEN. Tasks run SQL with this worker's Snowflake credentials and the protocol is
+not encrypted, so only expose workers on a trusted network, always with a token; the worker
+refuses to listen on a non-loopback address without one. Each worker
+keeps a warm Orchestrator, so its agents, model clients and Snowflake connection are reused
+across tasks.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+from dotenv import load_dotenv
+
+from agent.TaskWorkerServer import TaskWorkerServer, orchestrator_task_handler
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run investigation tasks for remote Orchestrators")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="Bind address (default: 127.0.0.1). WARNING: tasks run SQL with this worker's Snowflake "
+                             "credentials and the protocol is unencrypted; use 0.0.0.0 only on a trusted network "
+                             "and with --token")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("TASK_WORKER_PORT") or 7070),
+                        help="Port (default: TASK_WORKER_PORT or 7070)")
+    parser.add_argument("--slots", type=int, default=int(os.environ.get("TASK_WORKER_SLOTS") or 4),
+                        help="Tasks run at the same time (default: TASK_WORKER_SLOTS or 4)")
+    parser.add_argument("--token", default=os.environ.get("TASK_WORKER_TOKEN") or None,
+                        help="Shared secret every task must carry (default: TASK_WORKER_TOKEN; required unless "
+                             "--host is a loopback address)")
+    parser.add_argument("--heartbeat-interval", type=float, default=5.0,
+                        help="Seconds between heartbeats of a running task (default: 5)")
+    parser.add_argument("--reports-dir", default="ge_reports", help="Directory for profiling reports (default: ge_reports)")
+    parser.add_argument("--task-timeout", type=float, default=None, help="Seconds a single task may take (default: no limit)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    load_dotenv()
+    args = parse_args(argv)
+    if not args.token and args.host not in ("127.0.0.1", "localhost", "::1"):
+        print(f"❌ Refusing to listen on {args.host} without a token: set TASK_WORKER_TOKEN or pass --token")
+        return 2
+    handler = orchestrator_task_handler(reports_dir=args.reports_dir, task_timeout=args.task_timeout)
+    server = TaskWorkerServer(handler, host=args.host, port=args.port, slots=args.slots,
+                              heartbeat_interval=args.heartbeat_interval, token=args.token)
+
+    async def serve():
+        port = await server.start()
+        print(f"🛰️  Task worker {server.worker_id} listening on {args.host}:{port} with {args.slots} slot(s)"
+              f"{'' if args.token else ' (no token: local connections only)'}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        print(f"🛑 Task worker stopped: {server.stats}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+"""
+Command-line trace viewer
+
+Shows where a run spent its time from the trace file written when TRACE_PATH (or the
+Orchestrator's trace_path) is set:
+
+    python TraceViewer.py traces/workflow.jsonl                 # latest run as a tree
+    python TraceViewer.py traces/workflow.jsonl --list          # all runs in the file
+    python TraceViewer.py traces/workflow.jsonl --html run.html # waterfall chart
+
+Spans on the critical path (the chain of work that determined the run's duration) are
+marked with ★ in the tree and highlighted in the waterfall.
+"""
+
+import argparse
+import html
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+from agent.Tracer import critical_path, load_traces
+
+# Counters shown next to each span
+COUNTERS = ("prompt_tokens", "completion_tokens", "cache_hits", "rows", "bytes")
+
+KIND_COLORS = {
+    "workflow": "#6c757d",
+    "phase": "#4e79a7",
+    "agent": "#59a14f",
+    "model": "#f28e2b",
+    "tool": "#76b7b2",
+}
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Show the spans and critical path of traced runs")
+    parser.add_argument("trace_file", help="JSONL trace file (OTLP/JSON)")
+    parser.add_argument("--trace-id", help="Trace to show (default: the most recent run)")
+    parser.add_argument("--list", action="store_true", help="List the runs in the file")
+    parser.add_argument("--html", help="Write an HTML waterfall chart to this file")
+    return parser.parse_args(argv)
+
+
+def _duration(span: Dict[str, Any]) -> float:
+    return (span["end_ns"] - span["start_ns"]) / 1e9
+
+
+def _counters(span: Dict[str, Any]) -> str:
+    attributes = span["attributes"]
+    parts = [f"{key}={attributes[key]:,}" for key in COUNTERS if attributes.get(key)]
+    return " ".join(parts)
+
+
+def _root(spans: List[Dict[str, Any]]) -> Dict[str, Any]:
+    ids = {span["span_id"] for span in spans}
+    roots = [span for span in spans if span["parent_id"] not in ids]
+    return max(roots, key=_duration)
+
+
+def render_tree(spans: List[Dict[str, Any]]) -> str:
+    """
+    Render a trace as an indented tree.
+
+    Args:
+        spans: Spans of one trace as returned by load_traces
+
+    Returns:
+        str: One line per span with its offset, duration and counters; ★ marks the critical path
+    """
+    on_path = {span["span_id"] for span in critical_path(spans)}
+    children: Dict[str, List[Dict[str, Any]]] = {}
+    for span in spans:
+        children.setdefault(span["parent_id"], []).append(span)
+    root = _root(spans)
+
+    lines = []
+
+    def walk(span: Dict[str, Any], depth: int) -> None:
+        marker = "★" if span["span_id"] in on_path else " "
+        offset = (span["start_ns"] - root["start_ns"]) / 1e9
+        status = " ✗" if span["status"] == "error" else ""
+        label = f"{'  ' * depth}{span['name']}{status}"
+        lines.append(f"{marker} {label:<60} +{offset:7.2f}s {_duration(span):8.2f}s  {_counters(span)}".rstrip())
+        for child in children.get(span["span_id"], []):
+            walk(child, depth + 1)
+
+    walk(root, 0)
+    return "\n".join(lines)
+
+
+def render_html(spans: List[Dict[str, Any]]) -> str:
+    """
+    Render a trace as an HTML waterfall chart with the critical path highlighted.
+
+    Args:
+        spans: Spans of one trace as returned by load_traces
+
+    Returns:
+        str: Self-contained HTML page
+    """
+    on_path = {span["span_id"] for span in critical_path(spans)}
+    root = _root(spans)
+    total = max(root["end_ns"] - root["start_ns"], 1)
+    depth = {root["span_id"]: 0}
+    by_id = {span["span_id"]: span for span in spans}
+
+    def span_depth(span: Dict[str, Any]) -> int:
+        if span["span_id"] not in depth:
+            parent = by_id.get(span["parent_id"])
+            depth[span["span_id"]] = span_depth(parent) + 1 if parent else 0
+        return depth[span["span_id"]]
+
+    rows = []
+    for span in spans:
+        left = 100 * (span["start_ns"] - root["start_ns"]) / total
+        width = max(100 * (span["end_ns"] - span["start_ns"]) / total, 0.2)
+        critical = span["span_id"] in on_path
+        color = KIND_COLORS.get(span["kind"], "#bab0ac")
+        outline = "outline: 2px solid #e15759;" if critical else "opacity: 0.6;"
+        rows.append(
+            f'<tr class="{"critical" if critical else ""}">'
+            f'<td style="padding-left: {span_depth(span) * 14 + 4}px">{"★ " if critical else ""}{html.escape(span["name"])}</td>'
+            f'<td class="num">{_duration(span):.2f}s</td>'
+            f'<td class="chart"><div class="bar" style="left: {left:.2f}%; width: {width:.2f}%; '
+            f'background: {color}; {outline}"></div></td>'
+            f'<td class="counters">{html.escape(_counters(span))}</td></tr>'
+        )
+
+    started = datetime.fromtimestamp(root["start_ns"] / 1e9).strftime("%Y-%m-%d %H:%M:%S")
+    title = html.escape(str(root["attributes"].get("goal", root["name"])))
+    critical_seconds = sum(_duration(span) for span in critical_path(spans) if span["kind"] in ("model", "tool"))
+    return f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Trace {root['trace_id'][:12]}</title>
+<style>
+body {{ font-family: -apple-system, Segoe UI, sans-serif; margin: 24px; color: #222; }}
+table {{ border-collapse: collapse; width: 100%; font-size: 13px; }}
+td {{ padding: 3px 6px; border-bottom: 1px solid #eee; white-space: nowrap; }}
+td.num {{ text-align: right; font-variant-numeric: tabular-nums; }}
+td.chart {{ position: relative; width: 55%; }}
+td.counters {{ color: #666; font-size: 12px; }}
+.bar {{ position: absolute; top: 4px; height: 12px; border-radius: 2px; }}
+tr.critical td:first-child {{ font-weight: 600; color: #c0392b; }}
+</style>
+</head>
+<body>
+<h2>{title}</h2>
+<p>Trace {root['trace_id']} &middot; started {started} &middot; {_duration(root):.2f}s total &middot;
+{critical_seconds:.2f}s of model and tool calls on the critical path (★) &middot; {html.escape(_counters(root))}</p>
+<table>
+{chr(10).join(rows)}
+</table>
+</body>
+</html>
+"""
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    traces = load_traces(args.trace_file)
+    if not traces:
+        print(f"❌ No spans found in {args.trace_file}")
+        return 1
+
+    if args.list:
+        for trace_id, spans in sorted(traces.items(), key=lambda item: _root(item[1])["start_ns"]):
+            root = _root(spans)
+            started = datetime.fromtimestamp(root["start_ns"] / 1e9).strftime("%Y-%m-%d %H:%M:%S")
+            print(f"{trace_id}  {started}  {_duration(root):8.2f}s  {len(spans):4d} spans  "
+                  f"{root['attributes'].get('goal', root['name'])}")
+        return 0
+
+    trace_id = args.trace_id or max(traces, key=lambda key: _root(traces[key])["start_ns"])
+    if trace_id not in traces:
+        print(f"❌ Trace {trace_id} not found in {args.trace_file}")
+        return 1
+    spans = traces[trace_id]
+
+    print(render_tree(spans))
+    if args.html:
+        Path(args.html).write_text(render_html(spans), encoding='utf-8')
+        print(f"\n📄 Waterfall written to {args.html}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
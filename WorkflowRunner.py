@@ -1,12 +1,22 @@
 from agent.Orchestrator import Orchestrator
-from typing import Any, Dict
+from agent.BatchGoalRunner import BatchGoalRunner
+from agent.SchemaFanOutRunner import DEFAULT_GOAL_TEMPLATE, SchemaFanOutRunner, SchemaRollup
+from typing import Any, Dict, List, Optional
 import asyncio
 
 async def run_data_quality_analysis(
     goal: str,
     reports_dir: str = "ge_reports",
     max_rounds: int = 20,
-    enable_console: bool = True
+    enable_console: bool = True,
+    incremental_analysis: bool = False,
+    use_rule_based_planner: bool = True,
+    run_check_suite: bool = False,
+    followup_iterations: int = 0,
+    task_timeout: Optional[float] = None,
+    phase_timeout: Optional[float] = None,
+    workflow_timeout: Optional[float] = None,
+    trace_path: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Convenience function to run complete data quality analysis.
@@ -16,6 +26,14 @@ async def run_data_quality_analysis(
         reports_dir: Directory for storing reports
         max_rounds: Maximum conversation rounds per phase
         enable_console: Whether to show console output
+        incremental_analysis: Digest results into findings while investigation is running
+        use_rule_based_planner: Plan stock goals from the schema without calling the LLM
+        run_check_suite: Run the schema's check suite as one single-scan query alongside the agents
+        followup_iterations: Refinement rounds that execute the analysis' follow-up queries (0 = off)
+        task_timeout: Seconds a single agent task may run before it is cancelled (None = no limit)
+        phase_timeout: Seconds a workflow phase may run before continuing with partial results
+        workflow_timeout: Seconds the whole run may take (None = no limit)
+        trace_path: JSONL file receiving the run's spans (defaults to TRACE_PATH; unset = off)
         
     Returns:
         Dictionary with complete workflow results
@@ -23,10 +41,78 @@ async def run_data_quality_analysis(
     orchestrator = Orchestrator(
         reports_dir=reports_dir,
         max_rounds=max_rounds,
-        enable_console_output=enable_console
+        enable_console_output=enable_console,
+        incremental_analysis=incremental_analysis,
+        use_rule_based_planner=use_rule_based_planner,
+        run_check_suite=run_check_suite,
+        followup_iterations=followup_iterations,
+        task_timeout=task_timeout,
+        phase_timeout=phase_timeout,
+        workflow_timeout=workflow_timeout,
+        trace_path=trace_path
     )
     return await orchestrator.run_analysis(goal)
 
+async def run_schema_analysis(
+    schema_name: str = None,
+    database: str = None,
+    max_parallel_tables: int = 3,
+    reports_dir: str = "ge_reports",
+    goal_template: str = DEFAULT_GOAL_TEMPLATE,
+    **orchestrator_kwargs
+) -> SchemaRollup:
+    """
+    Convenience function to analyze every table of a schema in parallel.
+    
+    Args:
+        schema_name: Snowflake schema to analyze (defaults to the connection's schema)
+        database: Snowflake database (defaults to the connection's database)
+        max_parallel_tables: Number of tables analyzed concurrently
+        reports_dir: Root directory for per-table reports and the roll-up
+        goal_template: Goal per table; {table} is replaced by the table name
+        **orchestrator_kwargs: Extra Orchestrator options (e.g. run_check_suite=True)
+        
+    Returns:
+        SchemaRollup with per-table outcomes, most severe first
+    """
+    runner = SchemaFanOutRunner(
+        schema_name=schema_name,
+        database=database,
+        max_parallel_tables=max_parallel_tables,
+        reports_dir=reports_dir,
+        **orchestrator_kwargs
+    )
+    return await runner.run(goal_template)
+
+async def run_batch_analysis(
+    goals: List[str],
+    reports_dir: str = "ge_reports",
+    max_concurrent_tasks: int = 8,
+    max_parallel_goals: int = 4,
+    **orchestrator_kwargs
+) -> Dict[str, Any]:
+    """
+    Convenience function to run many goals with shared, deduplicated tasks.
+    
+    Args:
+        goals: Data quality goals
+        reports_dir: Directory for storing reports
+        max_concurrent_tasks: Number of unique query/profiling tasks executed concurrently
+        max_parallel_goals: Number of goals analyzed and reported concurrently
+        **orchestrator_kwargs: Extra Orchestrator options (e.g. run_check_suite=True)
+        
+    Returns:
+        Dictionary with per-goal results and task deduplication statistics
+    """
+    orchestrator_kwargs.setdefault("enable_console_output", False)
+    runner = BatchGoalRunner(
+        reports_dir=reports_dir,
+        max_concurrent_tasks=max_concurrent_tasks,
+        max_parallel_goals=max_parallel_goals,
+        **orchestrator_kwargs
+    )
+    return await runner.run(goals)
+
 if __name__ == "__main__":
     """Example usage of the Orchestrator"""
     
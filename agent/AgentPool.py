@@ -0,0 +1,78 @@
+"""
+Pool of reusable agent instances of one kind
+
+An AutoGen AssistantAgent keeps its model context across team runs, so one instance that
+serves several runs carries every earlier task, tool result and answer into the next
+prompt, and runs that overlap interleave their messages in the same context. Each run
+instead borrows an instance of its own from an AgentPool: a run that finds no idle instance
+gets a new one, so overlapping runs never share an agent, and every instance is reset
+before it is handed out, so no run sees another run's messages. Returned instances are
+kept for reuse, which keeps the agents' model clients and tools warm.
+"""
+
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, Callable, List, Optional
+
+from autogen_core import CancellationToken
+
+
+class AgentPool:
+    """
+    Idle instances of one agent, reused most-recently-returned first.
+
+    Attributes:
+        factory: Callable creating a new agent for a given index
+        max_idle (Optional[int]): Idle instances kept; more are dropped when returned (None = all)
+        stats (Dict[str, int]): Instances created and reused
+    """
+
+    def __init__(self, factory: Callable[[int], Any], max_idle: Optional[int] = None):
+        self.factory = factory
+        self.max_idle = max_idle
+        self._idle: List[Any] = []
+        self._lock = threading.Lock()
+        self.stats = {"created": 0, "reused": 0}
+
+    @asynccontextmanager
+    async def agent(self):
+        """
+        Borrow a freshly reset agent for one run.
+
+        The agent goes back to the pool afterwards, even if the run failed or was cancelled;
+        it is reset again before its next run.
+
+        Yields:
+            Agent used by no other run
+        """
+        agent = self._take()
+        try:
+            await agent.on_reset(CancellationToken())
+            yield agent
+        finally:
+            self._give_back(agent)
+
+    def warm(self, count: int = 1) -> None:
+        """Create idle agents up to count, e.g. to pay their construction cost up front."""
+        with self._lock:
+            missing = count - len(self._idle)
+        for _ in range(missing):
+            self._give_back(self._create())
+
+    def _take(self) -> Any:
+        with self._lock:
+            if self._idle:
+                self.stats["reused"] += 1
+                return self._idle.pop()
+        return self._create()
+
+    def _create(self) -> Any:
+        with self._lock:
+            index = self.stats["created"]
+            self.stats["created"] += 1
+        return self.factory(index)
+
+    def _give_back(self, agent: Any) -> None:
+        with self._lock:
+            if self.max_idle is None or len(self._idle) < self.max_idle:
+                self._idle.append(agent)
@@ -0,0 +1,342 @@
+"""
+Batch goal runner with cross-goal task deduplication
+
+Running N goals one Orchestrator at a time executes every shared query N times. The batch
+runner instead:
+1. Plans all goals concurrently
+2. Merges equivalent query and profiling tasks across plans (same content words, operators
+   and quoted literals, see task_key) so each runs once
+3. Executes the unique tasks concurrently through one shared Orchestrator
+4. Fans the shared results out to a per-goal analysis, report and results file
+
+Each goal's planning, analysis and reporting runs on an agent of its own (the Orchestrator's
+agent pools), so no goal's prompts contain another goal's plan, findings or report.
+
+Tasks are compared before any SQL exists (the DataAgent writes it while running the task),
+so only tasks that ask for the same thing in the same terms are merged. Rule-based plans
+repeat their task wording and merge fully; PlannerAgent tasks merge when they differ only in
+word order, case, plurals, punctuation, filler words or the spelling of column names
+("Booking Value" / BOOKING_VALUE), and paraphrases run once per wording.
+
+The check suite (run_check_suite) is also run once per batch and shared by all goals.
+"""
+
+import asyncio
+import json
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from agent.Orchestrator import Orchestrator
+from agent.PlannerAgent import DataQualityPlan
+from agent.Tracer import Tracer
+from agent.WorkflowDeadline import WorkflowDeadline
+
+
+def load_goals(path: str) -> List[str]:
+    """
+    Read goals from a file.
+
+    Supported formats:
+    - .json: a list of goal strings, or {"goals": [...]}
+    - anything else: one goal per line; blank lines and lines starting with # are ignored
+
+    Args:
+        path: Path to the goals file
+
+    Returns:
+        List[str]: Goals in file order
+    """
+    text = Path(path).read_text(encoding='utf-8')
+    if path.lower().endswith(".json"):
+        data = json.loads(text)
+        goals = data.get("goals", []) if isinstance(data, dict) else data
+        return [str(goal).strip() for goal in goals if str(goal).strip()]
+    return [line.strip() for line in text.splitlines() if line.strip() and not line.strip().startswith("#")]
+
+
+# Words that do not change what a task asks for
+_FILLER_WORDS = {
+    "a", "an", "the", "of", "in", "on", "from", "into", "table", "tables", "column", "columns", "field", "fields",
+    "please", "all", "each", "every", "any", "and", "also", "then", "that", "which", "to",
+}
+_TASK_TOKEN = re.compile(r"'[^']*'|[<>=!]+|[a-z0-9]+")
+
+
+def task_key(task_goal: str) -> str:
+    """
+    Return the deduplication key of a task goal.
+
+    The key is the sorted multiset of the goal's content words (lower-cased, split on
+    spaces, underscores and punctuation, trailing plural "s" removed, filler words dropped)
+    together with its comparison operators and quoted literals, which keep e.g. "< 0" and
+    "> 0" or two status values apart.
+    """
+    tokens = []
+    for token in _TASK_TOKEN.findall(task_goal.lower()):
+        if token in _FILLER_WORDS:
+            continue
+        if token.isalpha() and len(token) > 3 and token.endswith("s") and not token.endswith(("ss", "us")):
+            token = token[:-1]
+        tokens.append(token)
+    return " ".join(sorted(tokens))
+
+
+class BatchGoalRunner:
+    """
+    Runs many goals with each distinct query and profiling task executed once.
+
+    Attributes:
+        orchestrator (Orchestrator): Shared orchestrator whose agents run all tasks
+        max_concurrent_tasks (int): Maximum number of unique tasks executing at the same time
+        max_parallel_goals (int): Maximum number of goals analyzed and reported at the same time
+    """
+
+    def __init__(
+        self,
+        orchestrator: Optional[Orchestrator] = None,
+        max_concurrent_tasks: int = 8,
+        max_parallel_goals: int = 4,
+        **orchestrator_kwargs
+    ):
+        """
+        Initialize the BatchGoalRunner.
+
+        Args:
+            orchestrator: Orchestrator to use; created from orchestrator_kwargs if omitted
+            max_concurrent_tasks: Limit for concurrently executing unique tasks
+            max_parallel_goals: Limit for concurrently running per-goal analysis and reporting
+            **orchestrator_kwargs: Orchestrator options (reports_dir, run_check_suite, ...)
+        """
+        self.orchestrator = orchestrator or Orchestrator(**orchestrator_kwargs)
+        self.max_concurrent_tasks = max(1, max_concurrent_tasks)
+        self.max_parallel_goals = max(1, max_parallel_goals)
+
+    async def run(self, goals: List[str]) -> Dict[str, Any]:
+        """
+        Run a batch of goals.
+
+        Args:
+            goals: Data quality goals
+
+        Returns:
+            Dictionary containing:
+                - goal_results: Per-goal results in the same format as Orchestrator.run_analysis
+                - total_query_tasks / unique_query_tasks: Query tasks planned vs executed
+                - total_profiling_tasks / unique_profiling_tasks: Profiling tasks planned vs executed
+                - elapsed_seconds: Wall-clock time of the batch
+                - timed_out: Phases and tasks cut short by the Orchestrator's timeouts
+                - usage: Tokens, credits and CPU of the whole batch (RunUsage); each goal's
+                  results carry the usage of its own analysis and reporting
+                - trace_id: Id of the batch's trace
+                - success: Whether every goal completed
+        """
+        # The Orchestrator's workflow_timeout bounds the whole batch
+        deadline = WorkflowDeadline(self.orchestrator.workflow_timeout)
+        deadline_token = deadline.activate()
+        # One trace per batch: shared tasks and every goal's phases are spans of it
+        trace_span, trace_token = self.orchestrator._start_trace("batch", goals=len(goals))
+        batch: Dict[str, Any] = {"success": False}
+        try:
+            batch = await self._run(goals)
+        except BaseException as e:
+            trace_span.fail(e)
+            raise
+        finally:
+            self.orchestrator._end_trace(trace_span, trace_token, batch)
+            deadline.deactivate(deadline_token)
+        batch["timed_out"] = deadline.timed_out
+        return batch
+
+    async def _run(self, goals: List[str]) -> Dict[str, Any]:
+        """Plan, execute shared tasks and finish every goal."""
+        started = time.perf_counter()
+        orchestrator = self.orchestrator
+        print(f"\n{'='*80}")
+        print(f"🗂️ Starting batch of {len(goals)} goals")
+        print(f"{'='*80}")
+
+        # Phase 1: plan every goal at once
+        print("📋 Planning all goals concurrently...")
+        planned = await asyncio.gather(
+            *(orchestrator._run_planning_phase(goal) for goal in goals), return_exceptions=True
+        )
+        plans: List[Optional[DataQualityPlan]] = []
+        for goal, plan in zip(goals, planned):
+            if isinstance(plan, Exception):
+                print(f"  ❌ Planning failed for '{goal}': {str(plan)}")
+                plan = None
+            plans.append(plan)
+
+        # Phase 2: merge equivalent tasks across plans and run each once
+        query_tasks: Dict[str, Any] = {}
+        profiling_tasks: Dict[str, Any] = {}
+        for plan in plans:
+            for task in plan.query_tasks if plan else []:
+                query_tasks.setdefault(task_key(task.goal), task)
+            for task in plan.profiling_tasks if plan else []:
+                profiling_tasks.setdefault(task_key(task.goal), task)
+        total_queries = sum(len(plan.query_tasks) for plan in plans if plan)
+        total_profiles = sum(len(plan.profiling_tasks) for plan in plans if plan)
+        print(f"\n🔍 Executing {len(query_tasks)} unique query tasks (of {total_queries} planned) and "
+              f"{len(profiling_tasks)} unique profiling tasks (of {total_profiles} planned)...")
+
+        check_task = asyncio.create_task(orchestrator._run_check_suite_phase()) if orchestrator.run_check_suite else None
+        try:
+            query_reports, profiling_reports = await self._execute_unique_tasks(query_tasks, profiling_tasks)
+            check_results = await orchestrator._await_check_suite(check_task)
+        except BaseException:
+            if check_task and not check_task.done():
+                check_task.cancel()
+            raise
+
+        findings_by_key: Dict[str, list] = {}
+        if orchestrator.incremental_analysis:
+            # Findings are extracted once per shared report, not once per goal
+            reports = {**query_reports, **{f"profile:{k}": v for k, v in profiling_reports.items()}}
+            keys = [key for key, report in reports.items() if report is not None]
+            extracted = await asyncio.gather(
+                *(asyncio.to_thread(orchestrator.finding_extractor.extract, reports[key]) for key in keys)
+            )
+            findings_by_key = dict(zip(keys, extracted))
+
+        # Phases 3 and 4: per-goal analysis and reporting over the shared results
+        print(f"\n📊 Analyzing and reporting {len(goals)} goals (up to {self.max_parallel_goals} at a time)...")
+        semaphore = asyncio.Semaphore(self.max_parallel_goals)
+
+        async def finish(goal: str, plan: Optional[DataQualityPlan]) -> Dict[str, Any]:
+            async with semaphore:
+                with Tracer.span("goal", "workflow", goal=goal):
+                    return await self._finish_goal(
+                        goal, plan, query_reports, profiling_reports, findings_by_key, check_results
+                    )
+
+        goal_results = await asyncio.gather(*(finish(goal, plan) for goal, plan in zip(goals, plans)))
+
+        batch = {
+            "goal_results": goal_results,
+            "total_query_tasks": total_queries,
+            "unique_query_tasks": len(query_tasks),
+            "total_profiling_tasks": total_profiles,
+            "unique_profiling_tasks": len(profiling_tasks),
+            "elapsed_seconds": round(time.perf_counter() - started, 2),
+            "success": all(result["success"] for result in goal_results)
+        }
+        batch["usage"] = await orchestrator._account_usage(
+            Tracer.current(), f"Batch of {len(goals)} goals", batch["success"]
+        )
+        summary_path = self._save_batch_summary(batch)
+        succeeded = sum(1 for result in goal_results if result["success"])
+        print(f"\n✅ Batch complete: {succeeded}/{len(goals)} goals in {batch['elapsed_seconds']:.1f}s, "
+              f"summary saved to {summary_path}")
+        return batch
+
+    async def _execute_unique_tasks(
+        self,
+        query_tasks: Dict[str, Any],
+        profiling_tasks: Dict[str, Any]
+    ) -> tuple[Dict[str, Any], Dict[str, Any]]:
+        """Execute each unique task once, bounded by max_concurrent_tasks and the phase timeout."""
+        semaphore = asyncio.Semaphore(self.max_concurrent_tasks)
+
+        async def execute(runner, task):
+            async with semaphore:
+                try:
+                    return await runner(task)
+                except Exception as e:
+                    print(f"    ❌ Task failed with error: {str(e)}")
+                    return None
+
+        query_results = await self.orchestrator._gather_within_budget(
+            [execute(self.orchestrator._execute_query_task, task) for task in query_tasks.values()]
+            + [execute(self.orchestrator._execute_profiling_task, task) for task in profiling_tasks.values()],
+            "Batch investigation phase"
+        )
+        query_reports = dict(zip(query_tasks, query_results[:len(query_tasks)]))
+        profiling_reports = dict(zip(profiling_tasks, query_results[len(query_tasks):]))
+        return query_reports, profiling_reports
+
+    async def _finish_goal(
+        self,
+        goal: str,
+        plan: Optional[DataQualityPlan],
+        query_reports: Dict[str, Any],
+        profiling_reports: Dict[str, Any],
+        findings_by_key: Dict[str, list],
+        check_results: Optional[list]
+    ) -> Dict[str, Any]:
+        """Run analysis and reporting for one goal over its share of the batch results."""
+        orchestrator = self.orchestrator
+        results = {
+            "goal": goal,
+            "plan": plan,
+            "investigation_results": None,
+            "profiling_results": None,
+            "analysis": None,
+            "report": None,
+            "check_results": check_results,
+            "success": False
+        }
+        if not plan:
+            results["error"] = "Planning failed"
+            return results
+
+        try:
+            query_keys = [task_key(task.goal) for task in plan.query_tasks]
+            profiling_keys = [task_key(task.goal) for task in plan.profiling_tasks]
+            investigation_results = [query_reports[k] for k in query_keys if query_reports.get(k)] or None
+            profiling_results = [profiling_reports[k] for k in profiling_keys if profiling_reports.get(k)] or None
+            results["investigation_results"] = investigation_results
+            results["profiling_results"] = profiling_results
+
+            findings = None
+            if orchestrator.incremental_analysis:
+                keys = query_keys + [f"profile:{k}" for k in profiling_keys]
+                findings = [finding for k in keys for finding in findings_by_key.get(k, [])]
+                results["findings"] = findings
+
+            analysis = await orchestrator._run_analysis_phase(
+                goal, plan, investigation_results, profiling_results, findings=findings,
+                check_results=check_results
+            )
+            if orchestrator.followup_iterations > 0 and analysis:
+                analysis, results["followup_results"] = await orchestrator._run_followup_phase(goal, analysis)
+            results["analysis"] = analysis
+            if orchestrator.detect_drift:
+                analysis = await orchestrator._apply_drift_detection(analysis, profiling_results, results)
+
+            results["report"] = await orchestrator._run_reporting_phase(
+                goal, plan, investigation_results, profiling_results, analysis
+            )
+            results["success"] = True
+            # The goal's own analysis and reporting; shared tasks are accounted to the batch
+            results["usage"] = await orchestrator._account_usage(Tracer.current(), goal, True, record_history=False)
+            orchestrator._save_results(results)
+        except Exception as e:
+            print(f"❌ Goal '{goal}' failed: {str(e)}")
+            results["error"] = str(e)
+        return results
+
+    def _save_batch_summary(self, batch: Dict[str, Any]) -> Path:
+        """Save a compact batch summary next to the per-goal results."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        summary = {key: value for key, value in batch.items() if key not in ("goal_results", "usage")}
+        if batch.get("usage"):
+            summary["usage"] = batch["usage"].model_dump()
+        summary["timestamp"] = timestamp
+        summary["goals"] = [
+            {
+                "goal": result["goal"],
+                "success": result["success"],
+                "issues": len(result["analysis"].issues) if result.get("analysis") else 0,
+                "error": result.get("error")
+            }
+            for result in batch["goal_results"]
+        ]
+        path = self.orchestrator._unique_path(self.orchestrator.reports_dir / f"batch_results_{timestamp}.json")
+        return self.orchestrator.report_catalog.write_text(
+            path, json.dumps(summary, indent=2, ensure_ascii=False), "batch_summary",
+            goal=f"Batch of {len(batch['goal_results'])} goals", run_id=Tracer.run_id()
+        )
@@ -1,10 +1,13 @@
 from agent.SummarizerAgent import DataQualityIssue
 from agent.tool.SnowflakeQueryToolFactory import SnowflakeQueryToolFactory
+from agent.tool.DataQualityCheckTool import DataQualityCheckTool
+from agent.tool.DataQualityCheckToolFactory import DataQualityCheckToolFactory
+from agent.tool.SketchToolFactory import SketchToolFactory
 from autogen_agentchat.agents import AssistantAgent
 from agent.model.ModelFactory import ModelFactory
+from agent.SchemaRegistry import SchemaRegistry
 from pydantic import BaseModel
 import json
-import os
 
 
 class QueryExecution(BaseModel):
@@ -22,22 +25,27 @@ class DataAgentReport(BaseModel):
     next_steps: list[str]  # Recommended follow-up actions
 
 class DataAgent:
-    def __init__(self, name="DataAgent", system_message=None):
+    def __init__(self, name="DataAgent", system_message=None, schema=None):
         """
         Initialize DataAgent.
         
         Args:
             name: Agent name
             system_message: Custom system prompt
+            schema: Table schema to investigate (defaults to metadata/schema.json)
             output_structured_report: If True, outputs DataAgentReport instead of plain text
         """
         self.snowflakeToolFactory = SnowflakeQueryToolFactory()
         self.model = ModelFactory.get_model()
-        self.schema = self._get_schema()
+        self.schema = schema if schema is not None else SchemaRegistry.load_schema()
+        self.checkToolFactory = DataQualityCheckToolFactory(DataQualityCheckTool(schema=self.schema))
+        self.sketchToolFactory = SketchToolFactory()
         self.tools = [
             self.snowflakeToolFactory.create_query_tool(), 
             self.snowflakeToolFactory.create_table_info_tool(), 
-            self.snowflakeToolFactory.create_list_tables_tool()
+            self.snowflakeToolFactory.create_list_tables_tool(),
+            self.checkToolFactory.create_check_suite_tool(),
+            self.sketchToolFactory.create_column_statistics_tool()
         ]
         
         self.agent = AssistantAgent(
@@ -57,18 +65,20 @@ class DataAgent:
         quality_notes_text = "\n    ".join(quality_notes) if quality_notes else "None"
         
         base_description = f"""{{
-        "role": "You are the Data Investigation Agent. Given a goal, generate and execute Snowflake SQL queries on RIDEBOOKING data to identify data quality issues.",
+        "role": "You are the Data Investigation Agent. Given a goal, generate and execute Snowflake SQL queries on {self.schema.get('table_name', 'the target table')} data to identify data quality issues.",
 
         "schema": {json.dumps(self.schema)},
 
         "capabilities": {{
-            "tools": ["list_tables", "table_info", "execute_query"],
+            "tools": ["list_tables", "table_info", "execute_query", "run_check_suite", "get_column_statistics"],
             "actions": [
             "Generate ONE valid Snowflake SQL query per goal",
             "Execute the query using snowflake_sql",
             "Analyze query results for data quality issues",
             "Summarize findings with row counts, samples, and observations",
-            "Use list_tables and table_info to explore schema as needed"
+            "Use list_tables and table_info to explore schema as needed",
+            "Use run_check_suite for standard null, sentinel, range, accepted-value, uniqueness and consistency checks; it covers them all in one table scan",
+            "Use get_column_statistics for approximate distinct counts, percentiles and top values of profiled columns over a date range before querying Snowflake for them"
             ]
         }},
 
@@ -121,18 +131,5 @@ class DataAgent:
         }}"""
         return base_description
 
-    def _get_schema(self):
-        """Load table schema from metadata/schema.json"""
-        schema_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'metadata', 'schema.json')
-        try:
-            with open(schema_path, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            print(f"Warning: Schema file not found at {schema_path}")
-            return {}
-        except json.JSONDecodeError:
-            print(f"Warning: Invalid JSON in schema file {schema_path}")
-            return {}
-    
     def get_agent(self):
         return self.agent
\ No newline at end of file
@@ -1,8 +1,8 @@
-import os
 import json
 from agent.tool.SnowflakeDataProfilingToolFactory import SnowflakeDataProfilingToolFactory
 from autogen_agentchat.agents import AssistantAgent
 from agent.model.ModelFactory import ModelFactory
+from agent.SchemaRegistry import SchemaRegistry
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 
@@ -32,7 +32,7 @@ class DataProfilingAgent:
     - Provide insights on data patterns and anomalies
     """
 
-    def __init__(self, name="DataProfilingAgent", system_message=None, reports_dir="ge_reports"):
+    def __init__(self, name="DataProfilingAgent", system_message=None, reports_dir="ge_reports", schema=None):
         """
         Initialize the DataProfilingAgent.
         
@@ -40,13 +40,14 @@ class DataProfilingAgent:
             name (str): Name of the agent
             description (str): Custom description/system prompt for the agent
             reports_dir (str): Directory for storing generated reports
+            schema (dict): Table schema to profile (defaults to metadata/schema.json)
         """
         self.profiling_tool_factory = SnowflakeDataProfilingToolFactory(reports_dir=reports_dir)
         self.model = ModelFactory.get_model()
         self.tools = [
             self.profiling_tool_factory.create_profile_tool()
         ]
-        self.schema = self._get_schema()
+        self.schema = schema if schema is not None else SchemaRegistry.load_schema()
         self.agent = AssistantAgent(
             name=name,
             tools=self.tools,
@@ -102,19 +103,6 @@ class DataProfilingAgent:
                 "termination_condition": "Execute profiling once, produce a complete DataProfilingReport, and terminate after returning results."
         }}"""
 
-    def _get_schema(self):
-        """Load table schema from metadata/schema.json"""
-        schema_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'metadata', 'schema.json')
-        try:
-            with open(schema_path, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            print(f"Warning: Schema file not found at {schema_path}")
-            return {}
-        except json.JSONDecodeError:
-            print(f"Warning: Invalid JSON in schema file {schema_path}")
-            return {}
-    
     def get_agent(self):
         """
         Get the configured AutoGen agent.
@@ -0,0 +1,237 @@
+"""
+Profile drift detection
+
+Compares the current ydata-profiling JSON report of a table with a baseline report of the
+same table and returns ranked drift alerts. Only the stored profile statistics are used
+(histograms, value counts, quantiles, missing and distinct counts), so a comparison takes
+milliseconds and never queries Snowflake. Signals per column:
+- psi: Population Stability Index of the histogram (numeric/date) or value counts (categorical)
+- ks: Kolmogorov-Smirnov distance between the histogram CDFs
+- null_rate: change of the missing-value rate, in percentage points
+- cardinality: relative change of the distinct count (non ID-like columns)
+- new_categories / vanished_categories: categories that appeared or disappeared
+- quantile_shift: largest 5%..95% quantile shift, relative to the baseline IQR
+
+Each signal is scored as value / threshold; a score of 1 raises a Medium alert, the high
+threshold a High one and twice the high threshold a Critical one.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from pydantic import BaseModel
+
+from agent.SummarizerAgent import DataQualityIssue
+
+
+QUANTILES = ["5%", "25%", "50%", "75%", "95%"]
+CATEGORICAL_TYPES = ("Categorical", "Boolean")
+SEVERITY_ORDER = {"Critical": 0, "High": 1, "Medium": 2}
+
+# metric -> (alert threshold, high threshold)
+DEFAULT_THRESHOLDS: Dict[str, Tuple[float, float]] = {
+    "psi": (0.1, 0.25),
+    "ks": (0.1, 0.2),
+    "null_rate": (2.0, 10.0),  # percentage points
+    "cardinality": (0.2, 0.5),  # relative change
+    "new_categories": (0.0001, 0.05),  # share of current rows in new categories
+    "vanished_categories": (0.0001, 0.05),  # share of baseline rows in vanished categories
+    "quantile_shift": (0.25, 0.5),  # shift / baseline IQR
+}
+
+_EPSILON = 1e-4
+
+
+class DriftAlert(BaseModel):
+    """A drift signal between a baseline profile and the current profile"""
+    table: str  # Table the profiles describe
+    column: str  # Column that drifted
+    metric: str  # One of DEFAULT_THRESHOLDS
+    value: float  # Measured drift (PSI, KS distance, points, ratio, share or IQR multiples)
+    score: float  # value / alert threshold, used for ranking
+    severity: str  # "Critical", "High" or "Medium"
+    description: str  # Human readable explanation with baseline and current values
+    baseline_report: str  # Baseline JSON profile
+    current_report: str  # Current JSON profile
+
+    def to_issue(self) -> DataQualityIssue:
+        """Return the alert as an issue of the analysis report."""
+        return DataQualityIssue(
+            type=f"Data Drift ({self.metric.replace('_', ' ')})",
+            severity=self.severity,
+            evidence_query=f"-- profile comparison, no query: {Path(self.baseline_report).name} -> {Path(self.current_report).name}",
+            evidence_description=self.description
+        )
+
+
+class DriftDetector:
+    """
+    Compares two profiles of a table.
+
+    Attributes:
+        thresholds (Dict[str, Tuple[float, float]]): (alert, high) threshold per metric
+        max_categories (int): Columns with more distinct values are not compared category by category
+    """
+
+    def __init__(self, thresholds: Optional[Dict[str, Tuple[float, float]]] = None, max_categories: int = 100):
+        self.thresholds = {**DEFAULT_THRESHOLDS, **(thresholds or {})}
+        self.max_categories = max_categories
+
+    def compare_files(self, baseline_path: str, current_path: str, table: str = "") -> List[DriftAlert]:
+        """Compare two JSON profile reports (see compare())."""
+        baseline = json.loads(Path(baseline_path).read_text(encoding='utf-8'))
+        current = json.loads(Path(current_path).read_text(encoding='utf-8'))
+        return self.compare(baseline, current, table=table, baseline_report=str(baseline_path),
+                            current_report=str(current_path))
+
+    def compare(
+        self,
+        baseline: Dict[str, Any],
+        current: Dict[str, Any],
+        table: str = "",
+        baseline_report: str = "",
+        current_report: str = ""
+    ) -> List[DriftAlert]:
+        """
+        Compare the columns two profiles have in common.
+
+        Args:
+            baseline: Baseline ydata-profiling description (parsed JSON report)
+            current: Current ydata-profiling description
+            table: Table name recorded on the alerts
+            baseline_report / current_report: Report paths recorded on the alerts
+
+        Returns:
+            List[DriftAlert]: Alerts above their threshold, most severe first
+        """
+        alerts: List[DriftAlert] = []
+
+        def alert(column: str, metric: str, value: float, description: str) -> None:
+            low, high = self.thresholds[metric]
+            score = value / low
+            if score < 1:
+                return
+            severity = "Critical" if value >= 2 * high else "High" if value >= high else "Medium"
+            alerts.append(DriftAlert(
+                table=table, column=column, metric=metric, value=round(value, 6), score=round(score, 3),
+                severity=severity, description=description,
+                baseline_report=baseline_report, current_report=current_report
+            ))
+
+        base_vars = baseline.get("variables", {})
+        current_vars = current.get("variables", {})
+        for column in [name for name in current_vars if name in base_vars]:
+            base, cur = base_vars[column], current_vars[column]
+
+            null_delta = (_float(cur.get("p_missing")) - _float(base.get("p_missing"))) * 100
+            alert(column, "null_rate", abs(null_delta),
+                  f"{column} null rate moved from {_float(base.get('p_missing')):.2%} to "
+                  f"{_float(cur.get('p_missing')):.2%} ({null_delta:+.2f} points)")
+
+            base_distinct, cur_distinct = _float(base.get("n_distinct")), _float(cur.get("n_distinct"))
+            if base_distinct > 0 and _float(base.get("p_distinct"), 1.0) < 0.5:
+                change = (cur_distinct - base_distinct) / base_distinct
+                alert(column, "cardinality", abs(change),
+                      f"{column} distinct values changed from {base_distinct:.0f} to {cur_distinct:.0f} ({change:+.0%})")
+
+            if _has_histogram(base) and _has_histogram(cur):
+                psi, ks = histogram_drift(base["histogram"], cur["histogram"])
+                alert(column, "psi", psi, f"{column} distribution shifted (PSI {psi:.3f} over the baseline histogram bins)")
+                alert(column, "ks", ks, f"{column} distribution shifted (KS distance {ks:.3f} between histogram CDFs)")
+            elif base.get("type") in CATEGORICAL_TYPES and cur.get("type") in CATEGORICAL_TYPES \
+                    and max(base_distinct, cur_distinct) <= self.max_categories:
+                self._compare_categories(column, base, cur, alert)
+
+            if all(q in base and q in cur for q in QUANTILES):
+                shift, quantile = quantile_shift(base, cur)
+                alert(column, "quantile_shift", shift,
+                      f"{column} {quantile} quantile moved from {_float(base[quantile]):g} to {_float(cur[quantile]):g} "
+                      f"({shift:.2f}x the baseline IQR)")
+
+        return rank(alerts)
+
+    def _compare_categories(self, column: str, base: Dict[str, Any], cur: Dict[str, Any], alert) -> None:
+        base_counts = base.get("value_counts_without_nan") or {}
+        cur_counts = cur.get("value_counts_without_nan") or {}
+        if not base_counts or not cur_counts:
+            return
+        categories = sorted(set(base_counts) | set(cur_counts))
+        p = np.array([base_counts.get(category, 0) for category in categories], dtype=float)
+        q = np.array([cur_counts.get(category, 0) for category in categories], dtype=float)
+        p, q = p / p.sum(), q / q.sum()
+        alert(column, "psi", psi(p, q), f"{column} category mix shifted (PSI {psi(p, q):.3f})")
+
+        new = [category for category in categories if category not in base_counts]
+        vanished = [category for category in categories if category not in cur_counts]
+        if new:
+            share = float(q[[categories.index(category) for category in new]].sum())
+            alert(column, "new_categories", share,
+                  f"{column} has new categories {', '.join(map(str, new))} ({share:.1%} of current rows)")
+        if vanished:
+            share = float(p[[categories.index(category) for category in vanished]].sum())
+            alert(column, "vanished_categories", share,
+                  f"{column} no longer contains {', '.join(map(str, vanished))} ({share:.1%} of baseline rows)")
+
+
+def psi(p: np.ndarray, q: np.ndarray) -> float:
+    """Population Stability Index between two probability vectors."""
+    p, q = np.clip(p, _EPSILON, None), np.clip(q, _EPSILON, None)
+    return float(np.sum((q - p) * np.log(q / p)))
+
+
+def histogram_drift(baseline: Dict[str, List[float]], current: Dict[str, List[float]]) -> Tuple[float, float]:
+    """
+    PSI and KS distance between two histograms with different bin edges.
+
+    The current histogram's CDF (linear within bins) is evaluated at the baseline edges, so
+    both are compared on the baseline bins plus one bin below and one above its range.
+
+    Returns:
+        Tuple[float, float]: (psi, ks)
+    """
+    base_edges, base_cdf = _cdf(baseline)
+    cur_edges, cur_cdf = _cdf(current)
+    cur_at_base = np.interp(base_edges, cur_edges, cur_cdf, left=0.0, right=1.0)
+    p = np.concatenate(([0.0], np.diff(base_cdf), [0.0]))
+    q = np.concatenate(([cur_at_base[0]], np.diff(cur_at_base), [1.0 - cur_at_base[-1]]))
+
+    points = np.union1d(base_edges, cur_edges)
+    ks = np.max(np.abs(
+        np.interp(points, base_edges, base_cdf, left=0.0, right=1.0)
+        - np.interp(points, cur_edges, cur_cdf, left=0.0, right=1.0)
+    ))
+    return psi(p, q), float(ks)
+
+
+def quantile_shift(baseline: Dict[str, Any], current: Dict[str, Any]) -> Tuple[float, str]:
+    """Largest quantile shift in baseline IQRs (std, or 1, when the IQR is 0) and its quantile."""
+    base = np.array([_float(baseline[q]) for q in QUANTILES])
+    cur = np.array([_float(current[q]) for q in QUANTILES])
+    scale = base[3] - base[1] or _float(baseline.get("std")) or 1.0
+    shifts = np.abs(cur - base) / abs(scale)
+    index = int(np.argmax(shifts))
+    return float(shifts[index]), QUANTILES[index]
+
+
+def rank(alerts: List[DriftAlert]) -> List[DriftAlert]:
+    """Order alerts by severity, then by score."""
+    return sorted(alerts, key=lambda alert: (SEVERITY_ORDER[alert.severity], -alert.score))
+
+
+def _cdf(histogram: Dict[str, List[float]]) -> Tuple[np.ndarray, np.ndarray]:
+    edges = np.asarray(histogram["bin_edges"], dtype=float)
+    counts = np.asarray(histogram["counts"], dtype=float)
+    total = counts.sum() or 1.0
+    return edges, np.concatenate(([0.0], np.cumsum(counts) / total))
+
+
+def _has_histogram(variable: Dict[str, Any]) -> bool:
+    histogram = variable.get("histogram")
+    return isinstance(histogram, dict) and len(histogram.get("counts") or []) > 0 \
+        and len(histogram.get("bin_edges") or []) == len(histogram["counts"]) + 1
+
+
+def _float(value: Any, default: float = 0.0) -> float:
+    return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else default
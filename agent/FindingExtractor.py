@@ -0,0 +1,228 @@
+"""
+Finding Extractor for incremental analysis
+
+This module turns individual investigation results into compact findings as soon as
+they arrive, so the SummarizerAgent only has to reduce pre-digested evidence instead of
+re-reading every SQL statement, sample and multi-megabyte profiling report.
+
+- DataAgentReport: one finding per executed query (goal, SQL, row count, trimmed summary)
+- DataProfilingReport: one finding per profile, built from the ydata-profiling JSON
+  (dataset-level missing/duplicate rates plus the most affected columns and alerts)
+- CheckResult: one finding per check of the compiled check suite with violations
+"""
+
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+class InvestigationFinding(BaseModel):
+    """Compact, pre-digested evidence extracted from a single investigation result"""
+    source: str  # "query", "profile" or "check"
+    goal: str  # Investigation or profiling goal the finding came from
+    table: str  # Table the evidence refers to (best effort, "UNKNOWN" if not detectable)
+    theme: str  # Quality dimension, e.g. "completeness", "uniqueness", "validity"
+    evidence_query: str  # SQL query or dataset that produced the evidence
+    row_count: int  # Rows returned or profiled
+    observation: str  # Compact, human readable description of what was observed
+
+
+# Keyword → quality dimension mapping used to tag findings with a theme
+THEME_KEYWORDS = {
+    "completeness": ["missing", "null", "blank", "empty", "completeness", "sentinel"],
+    "uniqueness": ["duplicate", "unique", "uniqueness", "distinct"],
+    "validity": ["invalid", "negative", "zero", "range", "outlier", "non-numeric", "cast", "rating", "validity"],
+    "consistency": ["consisten", "mismatch", "cross-field", "contradict", "status", "cancel"],
+    "freshness": ["fresh", "latest", "stale", "future", "recent", "date range", "timeliness"],
+    "distribution": ["distribution", "profile", "histogram", "skew", "percentile", "quantile"],
+}
+
+# Check suite type → quality dimension
+CHECK_THEMES = {
+    "not_null": "completeness",
+    "null_sentinel": "completeness",
+    "unique": "uniqueness",
+    "range": "validity",
+    "accepted_values": "validity",
+    "consistency": "consistency",
+}
+
+_IDENTIFIER = r'(?:"[^"]+"|[\w$]+)'
+_TABLE_PATTERN = re.compile(rf'\b(?:FROM|JOIN)\s+({_IDENTIFIER}(?:\.{_IDENTIFIER})*)', re.IGNORECASE)
+
+
+def detect_theme(text: str) -> str:
+    """Return the first quality dimension whose keywords appear in the text."""
+    lowered = (text or "").lower()
+    for theme, keywords in THEME_KEYWORDS.items():
+        if any(keyword in lowered for keyword in keywords):
+            return theme
+    return "general"
+
+
+def detect_table(sql: str, default: str = "UNKNOWN") -> str:
+    """Return the first table referenced in a FROM/JOIN clause of a SQL statement."""
+    for match in _TABLE_PATTERN.finditer(sql or ""):
+        name = re.findall(_IDENTIFIER, match.group(1))[-1].strip('"')
+        if name:
+            return name.upper()
+    return default
+
+
+def _truncate(text: str, limit: int) -> str:
+    text = " ".join((text or "").split())
+    return text if len(text) <= limit else text[:limit - 3] + "..."
+
+
+class FindingExtractor:
+    """
+    Map step of the incremental analysis pipeline.
+
+    Each completed DataAgentReport or DataProfilingReport is converted into a list of
+    InvestigationFinding objects. Profiling reports are summarized from their JSON file
+    so the (slow) file parsing overlaps with the investigation tail.
+
+    Attributes:
+        reports_dir (Path): Directory used to resolve relative profiling report paths
+        default_table (str): Table name used when it cannot be detected from SQL
+        max_observation_chars (int): Upper bound for the length of each observation
+        top_columns (int): Number of most affected columns reported per profile
+    """
+
+    def __init__(
+        self,
+        reports_dir: str = "ge_reports",
+        default_table: str = "RIDEBOOKING",
+        max_observation_chars: int = 600,
+        top_columns: int = 5
+    ):
+        log_level = os.environ.get('LOG_LEVEL', 'ERROR').upper()
+        numeric_level = getattr(logging, log_level, logging.ERROR)
+        logging.basicConfig(level=numeric_level)
+        self.logger = logging.getLogger(__name__)
+
+        self.reports_dir = Path(reports_dir)
+        self.default_table = default_table
+        self.max_observation_chars = max_observation_chars
+        self.top_columns = top_columns
+
+    def extract(self, report: Any) -> List[InvestigationFinding]:
+        """
+        Extract findings from a DataAgentReport or DataProfilingReport.
+
+        Args:
+            report: Structured output produced by DataAgent or DataProfilingAgent
+
+        Returns:
+            List[InvestigationFinding]: Compact findings (empty for unknown report types)
+        """
+        tasks = getattr(report, "tasks_executed", None) or []
+        if tasks and hasattr(tasks[0], "sql_query"):
+            return self.extract_from_query_report(report)
+        if tasks and hasattr(tasks[0], "json_report_path"):
+            return self.extract_from_profiling_report(report)
+        return []
+
+    def extract_from_query_report(self, report: Any) -> List[InvestigationFinding]:
+        """Create one finding per query executed by the DataAgent."""
+        findings = []
+        for execution in report.tasks_executed:
+            goal = execution.investigation_goal or report.plan_goal
+            findings.append(InvestigationFinding(
+                source="query",
+                goal=goal,
+                table=detect_table(execution.sql_query, self.default_table),
+                theme=detect_theme(goal),
+                evidence_query=execution.sql_query,
+                row_count=execution.row_count,
+                observation=_truncate(execution.summary, self.max_observation_chars)
+            ))
+        return findings
+
+    def extract_from_profiling_report(self, report: Any) -> List[InvestigationFinding]:
+        """Create one finding per profile, summarizing the ydata-profiling JSON output."""
+        findings = []
+        for profile in report.tasks_executed:
+            observation = self._summarize_profile(profile.json_report_path)
+            if not observation:
+                observation = (f"Profiled {profile.row_count} rows and {profile.column_count} columns; "
+                               f"profile JSON not available for summarization")
+            findings.append(InvestigationFinding(
+                source="profile",
+                goal=profile.task_purpose or report.plan_goal,
+                table=detect_table(profile.query_or_dataset, self.default_table),
+                theme=detect_theme(profile.task_purpose) if profile.task_purpose else "distribution",
+                evidence_query=profile.query_or_dataset,
+                row_count=profile.row_count,
+                observation=_truncate(observation, self.max_observation_chars)
+            ))
+        return findings
+
+    def extract_from_check_results(self, results: List[Any], table: Optional[str] = None) -> List[InvestigationFinding]:
+        """Create one finding per check-suite result with at least one violating row."""
+        findings = []
+        for result in results:
+            if result.failed_count == 0:
+                continue
+            status = {True: "within threshold", False: "FAILED", None: "informational"}[result.passed]
+            threshold = f" (threshold {result.max_failed_pct:g}%)" if result.max_failed_pct is not None else ""
+            findings.append(InvestigationFinding(
+                source="check",
+                goal=result.description,
+                table=table or self.default_table,
+                theme=CHECK_THEMES.get(result.check_type, "general"),
+                evidence_query=result.expression,
+                row_count=result.total_count,
+                observation=_truncate(
+                    f"{result.name}: {result.failed_count} of {result.total_count} rows "
+                    f"({result.failed_pct:.2f}%) violate the check{threshold} - {status}",
+                    self.max_observation_chars
+                )
+            ))
+        return findings
+
+    def _resolve_path(self, file_path: str) -> Path:
+        path = Path(file_path)
+        if path.is_absolute() or path.exists():
+            return path
+        return self.reports_dir / path.name
+
+    def _summarize_profile(self, json_report_path: str) -> Optional[str]:
+        """Build a compact textual summary from a ydata-profiling JSON report."""
+        if not json_report_path:
+            return None
+        path = self._resolve_path(json_report_path)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                profile: Dict[str, Any] = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.warning(f"Could not read profile {path}: {str(e)}")
+            return None
+
+        table = profile.get("table", {}) or {}
+        parts = [
+            f"{table.get('n', 0)} rows x {table.get('n_var', 0)} columns",
+            f"missing cells {100 * float(table.get('p_cells_missing', 0) or 0):.2f}%",
+            f"duplicate rows {table.get('n_duplicates', 0)} ({100 * float(table.get('p_duplicates', 0) or 0):.2f}%)"
+        ]
+
+        variables = profile.get("variables", {}) or {}
+        missing = sorted(
+            ((name, float(stats.get("p_missing", 0) or 0)) for name, stats in variables.items()),
+            key=lambda item: item[1],
+            reverse=True
+        )
+        missing = [(name, pct) for name, pct in missing[:self.top_columns] if pct > 0]
+        if missing:
+            parts.append("most missing: " + ", ".join(f"{name} {100 * pct:.1f}%" for name, pct in missing))
+
+        alerts = [alert for alert in profile.get("alerts", []) or [] if "constant value" not in alert]
+        if alerts:
+            parts.append("alerts: " + "; ".join(alerts[:self.top_columns]))
+
+        return "; ".join(parts)
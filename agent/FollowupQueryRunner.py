@@ -0,0 +1,279 @@
+"""
+Follow-up Query Runner for the bounded refinement loop
+
+The SummarizerAgent lists `required_followup_queries` it would like to see answered. This
+module turns that list into executed evidence without a second workflow run:
+1. Deduplicate queries (comments, whitespace, case and trailing semicolons are ignored)
+2. Validate that each one is a single read-only SELECT/WITH statement
+3. Execute the accepted queries concurrently through the shared SnowflakeQueryEngine,
+   capping the rows they return
+4. Account for elapsed time and estimated warehouse credits against a FollowupBudget
+
+The Orchestrator feeds the results back to the SummarizerAgent and repeats until no new
+queries are requested or the iteration, time or credit budget is exhausted.
+"""
+
+import asyncio
+import json
+import os
+import re
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from autogen_core import CancellationToken
+from pydantic import BaseModel
+
+from agent.Tracer import Tracer
+from agent.tool.SnowflakeQueryEngine import SnowflakeQueryEngine
+
+
+# Statements that must never run as part of an automatic follow-up
+FORBIDDEN_KEYWORDS = (
+    "INSERT", "UPDATE", "DELETE", "MERGE", "DROP", "CREATE", "ALTER", "TRUNCATE", "GRANT",
+    "REVOKE", "CALL", "COPY", "PUT", "REMOVE", "UNDROP", "EXECUTE", "USE",
+)
+
+_STRING_LITERAL = re.compile(r"('(?:[^']|'')*')")
+_COMMENTS = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+
+
+class FollowupQueryResult(BaseModel):
+    """Outcome of one follow-up query"""
+    sql: str  # Query as requested by the SummarizerAgent
+    iteration: int  # Refinement iteration the query belongs to
+    success: bool  # Whether the query ran successfully
+    row_count: int  # Rows returned (capped by max_rows)
+    columns: list[str]  # Result column names
+    rows_preview: str  # JSON preview of the first rows
+    error: Optional[str]  # Validation, budget or execution error
+    elapsed_seconds: float  # Wall-clock execution time
+    estimated_credits: float  # Warehouse credits attributed to the query
+
+
+class FollowupBudget:
+    """
+    Iteration, time and credit limits for one refinement loop.
+
+    Attributes:
+        max_iterations (int): Maximum number of follow-up rounds
+        max_seconds (float): Wall-clock limit for the whole loop
+        max_credits (float): Estimated warehouse credits the loop may spend
+        iterations (int): Rounds completed so far
+        credits_spent (float): Estimated credits spent so far
+    """
+
+    def __init__(self, max_iterations: int, max_seconds: float, max_credits: float):
+        self.max_iterations = max_iterations
+        self.max_seconds = max_seconds
+        self.max_credits = max_credits
+        self.iterations = 0
+        self.credits_spent = 0.0
+        self.started_at = time.monotonic()
+
+    def remaining_seconds(self) -> float:
+        """Seconds left before the time budget is exhausted."""
+        return max(0.0, self.max_seconds - (time.monotonic() - self.started_at))
+
+    def exhausted(self) -> Optional[str]:
+        """Return the reason the loop must stop, or None while budget remains."""
+        if self.iterations >= self.max_iterations:
+            return f"iteration budget of {self.max_iterations} reached"
+        if self.remaining_seconds() <= 0:
+            return f"time budget of {self.max_seconds:g}s reached"
+        if self.credits_spent >= self.max_credits:
+            return f"credit budget of {self.max_credits:g} reached ({self.credits_spent:.4f} spent)"
+        return None
+
+
+class FollowupQueryRunner:
+    """
+    Deduplicates, validates and concurrently executes follow-up SQL.
+
+    Attributes:
+        query_engine (SnowflakeQueryEngine): Engine used to run the queries
+        max_concurrency (int): Maximum number of queries in flight
+        max_rows (int): Row cap applied to every follow-up query
+        credits_per_hour (float): Credit rate of the warehouse used for cost estimates
+    """
+
+    def __init__(
+        self,
+        query_engine: Optional[SnowflakeQueryEngine] = None,
+        max_concurrency: int = 4,
+        max_rows: int = 100,
+        credits_per_hour: Optional[float] = None
+    ):
+        """
+        Initialize the FollowupQueryRunner.
+
+        Args:
+            query_engine: Engine to use; defaults to the process-wide shared engine
+            max_concurrency: Maximum number of queries executed at the same time
+            max_rows: Row cap wrapped around every query
+            credits_per_hour: Warehouse credit rate; defaults to the
+                SNOWFLAKE_WAREHOUSE_CREDITS_PER_HOUR env var (1 = X-Small)
+        """
+        self._query_engine = query_engine
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_rows = max_rows
+        if credits_per_hour is None:
+            credits_per_hour = float(os.environ.get("SNOWFLAKE_WAREHOUSE_CREDITS_PER_HOUR", "1"))
+        self.credits_per_hour = credits_per_hour
+
+    @property
+    def query_engine(self) -> SnowflakeQueryEngine:
+        """Engine used for execution; the shared engine is resolved on first use."""
+        if self._query_engine is None:
+            self._query_engine = SnowflakeQueryEngine.get_shared_instance()
+        return self._query_engine
+
+    @staticmethod
+    def normalize_sql(sql: str) -> str:
+        """
+        Return a canonical form of a query used for deduplication.
+
+        Comments and trailing semicolons are removed, whitespace is collapsed and everything
+        outside string literals is upper-cased.
+        """
+        parts = _STRING_LITERAL.split(_COMMENTS.sub(" ", sql))
+        for index in range(0, len(parts), 2):
+            parts[index] = re.sub(r"\s+", " ", parts[index]).upper()
+        return "".join(parts).strip().rstrip(";").strip()
+
+    @staticmethod
+    def validate_sql(sql: str) -> Optional[str]:
+        """
+        Check that a query is a single read-only statement.
+
+        Args:
+            sql: Query to validate
+
+        Returns:
+            Optional[str]: Reason the query is rejected, or None if it may run
+        """
+        # Keywords inside string literals (e.g. WHERE STATUS = 'Delete') are not statements
+        code = " ".join(_STRING_LITERAL.split(_COMMENTS.sub(" ", sql))[0::2]).strip().rstrip(";").strip()
+        if not code:
+            return "Empty query"
+        if ";" in code:
+            return "Multiple statements are not allowed"
+        first_word = code.split(None, 1)[0].upper()
+        if first_word not in ("SELECT", "WITH"):
+            return f"Only SELECT or WITH queries are allowed, got {first_word}"
+        words = set(re.findall(r"[A-Z_$]+", code.upper()))
+        forbidden = sorted(words.intersection(FORBIDDEN_KEYWORDS))
+        if forbidden:
+            return f"Forbidden keyword(s): {', '.join(forbidden)}"
+        if "SYSTEM$" in code.upper():
+            return "System functions are not allowed"
+        return None
+
+    def select_queries(
+        self,
+        queries: Iterable[str],
+        seen: Set[str],
+        iteration: int
+    ) -> Tuple[List[str], List[FollowupQueryResult]]:
+        """
+        Deduplicate and validate requested queries.
+
+        Args:
+            queries: Queries requested by the SummarizerAgent
+            seen: Normalized queries already executed or rejected in this loop (updated in place)
+            iteration: Current iteration, recorded on rejected results
+
+        Returns:
+            Tuple of queries to run and results for the rejected ones
+        """
+        accepted: List[str] = []
+        rejected: List[FollowupQueryResult] = []
+        for sql in queries:
+            key = self.normalize_sql(sql)
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            error = self.validate_sql(sql)
+            if error:
+                rejected.append(self._result(sql, iteration, error=f"Rejected: {error}"))
+            else:
+                accepted.append(sql.strip().rstrip(";").strip())
+        return accepted, rejected
+
+    async def run_queries(
+        self,
+        queries: List[str],
+        budget: FollowupBudget,
+        iteration: int
+    ) -> List[FollowupQueryResult]:
+        """
+        Execute queries concurrently within the remaining budget.
+
+        Queries that would start after the time or credit budget is exhausted are skipped;
+        queries still running when the time budget runs out are reported as timed out.
+
+        Args:
+            queries: Validated queries to run
+            budget: Budget shared by the whole refinement loop (credits are charged to it)
+            iteration: Current iteration number
+
+        Returns:
+            List[FollowupQueryResult]: One result per query, in input order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run_one(sql: str) -> FollowupQueryResult:
+            async with semaphore:
+                if budget.remaining_seconds() <= 0 or budget.credits_spent >= budget.max_credits:
+                    return self._result(sql, iteration, error="Skipped: follow-up budget exhausted")
+                cancellation_token = CancellationToken()
+                try:
+                    result = await asyncio.wait_for(
+                        asyncio.to_thread(self._execute, sql, cancellation_token), timeout=budget.remaining_seconds()
+                    )
+                except asyncio.TimeoutError:
+                    # Aborts the query in Snowflake; the worker thread returns shortly after
+                    cancellation_token.cancel()
+                    return self._result(sql, iteration, error="Timed out: follow-up time budget exhausted")
+                except asyncio.CancelledError:
+                    cancellation_token.cancel()
+                    raise
+                budget.credits_spent += result["estimated_credits"]
+                return self._result(sql, iteration, **result)
+
+        return list(await asyncio.gather(*(run_one(sql) for sql in queries)))
+
+    def _execute(self, sql: str, cancellation_token: Optional[CancellationToken] = None) -> Dict[str, Any]:
+        """Run one capped query and measure its cost."""
+        capped = f"SELECT * FROM (\n{sql}\n) LIMIT {self.max_rows}"
+        started = time.monotonic()
+        with Tracer.span("query:followup", "tool") as span:
+            outcome = self.query_engine.execute_query(
+                capped, "Follow-up investigation query", "list", cancellation_token
+            )
+            span.set(success=outcome["success"])
+            span.accumulate(rows=outcome.get("row_count", 0))
+        elapsed = time.monotonic() - started
+        rows = outcome.get("data") or []
+        return {
+            "success": outcome["success"],
+            "row_count": outcome.get("row_count", 0),
+            "columns": [str(column) for column in outcome.get("columns", [])],
+            "rows_preview": json.dumps(rows[:10], default=str),
+            "error": outcome.get("error"),
+            "elapsed_seconds": round(elapsed, 3),
+            "estimated_credits": elapsed * self.credits_per_hour / 3600.0
+        }
+
+    @staticmethod
+    def _result(sql: str, iteration: int, **values: Any) -> FollowupQueryResult:
+        fields = {
+            "success": False,
+            "row_count": 0,
+            "columns": [],
+            "rows_preview": "[]",
+            "error": None,
+            "elapsed_seconds": 0.0,
+            "estimated_credits": 0.0,
+        }
+        fields.update(values)
+        return FollowupQueryResult(sql=sql, iteration=iteration, **fields)
@@ -0,0 +1,323 @@
+"""
+Incremental check suites for append-heavy tables
+
+Instead of scanning the whole table, each run reads only the rows appended since the last
+consumed offset and folds them into running aggregates kept in SQLite:
+- row-level checks (not_null, null_sentinel, range, accepted_values, consistency) add the
+  failed counts of the new rows to the running totals
+- unique checks add the duplicates inside the new rows plus the new keys already present in
+  a local key index (64-bit key hashes), then add the new keys to the index
+
+The first run takes a baseline: the full suite and the key index as of a snapshot time.
+The running aggregates, the key index and the new offset are written in one SQLite
+transaction, and only if the offset did not move meanwhile (compare-and-set). A failed or
+interrupted run therefore leaves the state untouched and the next run re-reads the same
+delta. Check cost scales with the ingested rows instead of the table size.
+
+Change sources:
+- SnowflakeChangeSource: Snowflake change tracking (CHANGES(INFORMATION => APPEND_ONLY)
+  between two timestamps, AT(TIMESTAMP) for the baseline). Read-only queries; the table
+  needs CHANGE_TRACKING = TRUE and the offset must stay within the time travel retention.
+- SQLiteChangeSource: local stand-in that diffs a SQLite table by rowid watermark and runs
+  the same compiled suite against the new rows.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from agent.tool.CheckSuiteCompiler import (
+    DataQualityCheck,
+    compile_check_suite,
+    parse_check_results,
+    quote_identifier,
+    quote_table,
+)
+from agent.tool.SnowflakeQueryEngine import SnowflakeQueryEngine
+
+
+class SnowflakeChangeSource:
+    """
+    Reads appended rows of a Snowflake table with change tracking.
+
+    Attributes:
+        table_name (str): Table to read, optionally qualified
+        query_engine (SnowflakeQueryEngine): Engine executing the read-only queries
+    """
+
+    TIMESTAMP_FORMAT = "YYYY-MM-DD HH24:MI:SS.FF9 TZHTZM"
+
+    def __init__(self, table_name: str, query_engine: Optional[SnowflakeQueryEngine] = None):
+        self.table_name = table_name
+        self.query_engine = query_engine or SnowflakeQueryEngine.get_shared_instance()
+
+    def current_offset(self) -> str:
+        """Return the current Snowflake timestamp, used as the end of the next delta."""
+        row = self._query(f"SELECT TO_VARCHAR(CURRENT_TIMESTAMP(), '{self.TIMESTAMP_FORMAT}') AS NOW",
+                          "Incremental checks offset")[0]
+        return row["NOW"]
+
+    def relation(self, start: Optional[str], end: str) -> str:
+        """FROM clause of the rows appended in (start, end], or of the whole table at end."""
+        table = quote_table(self.table_name)
+        end_clause = f"TIMESTAMP => TO_TIMESTAMP_TZ('{end}', '{self.TIMESTAMP_FORMAT}')"
+        if start is None:
+            return f"{table} AT({end_clause})"
+        return (f"{table} CHANGES(INFORMATION => APPEND_ONLY) "
+                f"AT(TIMESTAMP => TO_TIMESTAMP_TZ('{start}', '{self.TIMESTAMP_FORMAT}')) END({end_clause})")
+
+    def aggregate(self, checks: List[DataQualityCheck], start: Optional[str], end: str) -> Dict[str, Any]:
+        """Run the compiled suite over the delta and return its TOTAL_ROWS/CHECK_<n> row."""
+        query = compile_check_suite(self.table_name, checks, source=self.relation(start, end))
+        return self._query(query, f"Incremental check suite for {self.table_name}")[0]
+
+    def key_hashes(self, column: str, start: Optional[str], end: str) -> List[int]:
+        """Return the distinct 64-bit hashes of a key column's non-null values in the delta."""
+        column = quote_identifier(column)
+        rows = self._query(
+            f"SELECT DISTINCT HASH({column}) AS H FROM {self.relation(start, end)} WHERE {column} IS NOT NULL",
+            f"Incremental key index for {self.table_name}"
+        )
+        return [int(row["H"]) for row in rows]
+
+    def _query(self, query: str, goal: str) -> List[Dict[str, Any]]:
+        result = self.query_engine.execute_query(query, goal, "list")
+        if not result["success"]:
+            raise RuntimeError(result.get("error", "query failed"))
+        return result["data"] or [{}]
+
+
+class SQLiteChangeSource:
+    """
+    Local stand-in reading appended rows of a SQLite table by rowid watermark.
+
+    The compiled Snowflake suite runs unchanged: COUNT_IF, TRY_TO_DOUBLE, TO_VARCHAR and
+    HASH are registered as SQLite functions.
+
+    Attributes:
+        table_name (str): Table to read
+        conn (sqlite3.Connection): Connection holding the table
+    """
+
+    def __init__(self, table_name: str, conn: sqlite3.Connection):
+        self.table_name = table_name
+        self.conn = conn
+        conn.create_aggregate("COUNT_IF", 1, _CountIf)
+        conn.create_function("TRY_TO_DOUBLE", 1, _try_to_double, deterministic=True)
+        conn.create_function("TO_VARCHAR", 1, lambda value: None if value is None else str(value), deterministic=True)
+        conn.create_function("HASH", 1, stable_hash, deterministic=True)
+
+    def current_offset(self) -> str:
+        """Return the largest rowid of the table."""
+        return str(self.conn.execute(f"SELECT COALESCE(MAX(rowid), 0) FROM {quote_table(self.table_name)}").fetchone()[0])
+
+    def relation(self, start: Optional[str], end: str) -> str:
+        """Subquery of the rows with rowid in (start, end]."""
+        return (f"(SELECT * FROM {quote_table(self.table_name)} "
+                f"WHERE rowid > {int(start or 0)} AND rowid <= {int(end)})")
+
+    def aggregate(self, checks: List[DataQualityCheck], start: Optional[str], end: str) -> Dict[str, Any]:
+        """Run the compiled suite over the delta and return its TOTAL_ROWS/CHECK_<n> row."""
+        cursor = self.conn.execute(compile_check_suite(self.table_name, checks, source=self.relation(start, end)))
+        return dict(zip([column[0] for column in cursor.description], cursor.fetchone()))
+
+    def key_hashes(self, column: str, start: Optional[str], end: str) -> List[int]:
+        """Return the distinct 64-bit hashes of a key column's non-null values in the delta."""
+        column = quote_identifier(column)
+        return [row[0] for row in self.conn.execute(
+            f"SELECT DISTINCT HASH({column}) FROM {self.relation(start, end)} WHERE {column} IS NOT NULL"
+        )]
+
+
+class IncrementalCheckRunner:
+    """
+    Runs a check suite on the rows appended since the last run.
+
+    Attributes:
+        source: Change source of the table (SnowflakeChangeSource or SQLiteChangeSource)
+        path (Path): SQLite file with offsets, running aggregates and key indexes
+    """
+
+    def __init__(self, source, state_path: str = "ge_reports/incremental_checks.db"):
+        self.source = source
+        self.table_key = source.table_name.upper()
+        self.path = Path(state_path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS offsets (
+                    table_key TEXT PRIMARY KEY,
+                    offset TEXT NOT NULL,
+                    suite TEXT NOT NULL,
+                    total_rows INTEGER NOT NULL,
+                    updated_at REAL NOT NULL
+                )"""
+            )
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS aggregates (
+                    table_key TEXT NOT NULL,
+                    check_name TEXT NOT NULL,
+                    failed_count INTEGER NOT NULL,
+                    PRIMARY KEY (table_key, check_name)
+                )"""
+            )
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS key_index (
+                    table_key TEXT NOT NULL,
+                    column_name TEXT NOT NULL,
+                    key_hash INTEGER NOT NULL,
+                    PRIMARY KEY (table_key, column_name, key_hash)
+                ) WITHOUT ROWID"""
+            )
+
+    def run(self, checks: List[DataQualityCheck]) -> Dict[str, Any]:
+        """
+        Fold the rows appended since the last run into the running aggregates.
+
+        A baseline over the whole table is taken on the first run and whenever the check
+        suite changed.
+
+        Args:
+            checks: Checks to maintain
+
+        Returns:
+            Dict[str, Any]: success flag, mode ("baseline" or "incremental"), delta_rows,
+            total_rows and cumulative CheckResults (same shape as DataQualityCheckTool.run_checks)
+        """
+        try:
+            suite = json.dumps([check.model_dump() for check in checks], sort_keys=True)
+            state = self._state()
+            start = state["offset"] if state and state["suite"] == suite else None
+            end = self.source.current_offset()
+
+            row = self.source.aggregate(checks, start, end) if start != end else {}
+            delta_rows = int(row.get("TOTAL_ROWS") or 0)
+            failed = {check.name: int(row.get(f"CHECK_{index}") or 0) for index, check in enumerate(checks)}
+            new_keys: Dict[str, List[int]] = {}
+            for check in checks:
+                if check.check_type == "unique" and delta_rows:
+                    new_keys[check.name] = self.source.key_hashes(check.column, start, end)
+
+            total_rows = self._commit(state if start is not None else None, suite, end, checks, delta_rows,
+                                      failed, new_keys)
+            cumulative = self._aggregates()
+            results = parse_check_results(
+                {"TOTAL_ROWS": total_rows, **{f"CHECK_{index}": cumulative.get(check.name, 0)
+                                              for index, check in enumerate(checks)}},
+                checks
+            )
+            return {
+                "success": True,
+                "table_name": self.source.table_name,
+                "mode": "incremental" if start is not None else "baseline",
+                "offset": end,
+                "delta_rows": delta_rows,
+                "total_rows": total_rows,
+                "checks_run": len(results),
+                "checks_failed": sum(1 for result in results if result.passed is False),
+                "results": results
+            }
+        except Exception as e:
+            return {"success": False, "error": f"Incremental check run failed: {str(e)}",
+                    "table_name": self.source.table_name}
+
+    def reset(self) -> None:
+        """Drop the offset, aggregates and key index so the next run takes a new baseline."""
+        with self._lock, self._conn:
+            for table in ("offsets", "aggregates", "key_index"):
+                self._conn.execute(f"DELETE FROM {table} WHERE table_key = ?", (self.table_key,))
+
+    def _commit(
+        self,
+        state: Optional[Dict[str, Any]],
+        suite: str,
+        end: str,
+        checks: List[DataQualityCheck],
+        delta_rows: int,
+        failed: Dict[str, int],
+        new_keys: Dict[str, List[int]]
+    ) -> int:
+        with self._lock, self._conn:
+            if state is None:
+                for table in ("offsets", "aggregates", "key_index"):
+                    self._conn.execute(f"DELETE FROM {table} WHERE table_key = ?", (self.table_key,))
+                total_rows = delta_rows
+                self._conn.execute(
+                    "INSERT INTO offsets (table_key, offset, suite, total_rows, updated_at) VALUES (?, ?, ?, ?, ?)",
+                    (self.table_key, end, suite, total_rows, time.time())
+                )
+            else:
+                total_rows = state["total_rows"] + delta_rows
+                moved = self._conn.execute(
+                    """UPDATE offsets SET offset = ?, total_rows = ?, updated_at = ?
+                       WHERE table_key = ? AND offset = ?""",
+                    (end, total_rows, time.time(), self.table_key, state["offset"])
+                ).rowcount
+                if not moved:
+                    raise RuntimeError("another run consumed this delta; retry")
+
+            for check in checks:
+                count = failed[check.name]
+                if check.name in new_keys:
+                    count += self._index_keys(check.column, new_keys[check.name])
+                self._conn.execute(
+                    """INSERT INTO aggregates (table_key, check_name, failed_count) VALUES (?, ?, ?)
+                       ON CONFLICT (table_key, check_name) DO UPDATE SET failed_count = failed_count + excluded.failed_count""",
+                    (self.table_key, check.name, count)
+                )
+        return total_rows
+
+    def _index_keys(self, column: str, hashes: List[int]) -> int:
+        """Add delta keys to the index and return how many were already present."""
+        before = self._conn.total_changes
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO key_index (table_key, column_name, key_hash) VALUES (?, ?, ?)",
+            [(self.table_key, column, key_hash) for key_hash in hashes]
+        )
+        return len(hashes) - (self._conn.total_changes - before)
+
+    def _state(self) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM offsets WHERE table_key = ?", (self.table_key,)).fetchone()
+        return dict(row) if row else None
+
+    def _aggregates(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT check_name, failed_count FROM aggregates WHERE table_key = ?", (self.table_key,)
+            ).fetchall()
+        return {row["check_name"]: row["failed_count"] for row in rows}
+
+
+def stable_hash(value: Any) -> Optional[int]:
+    """Signed 64-bit hash of a value's text, stable across processes."""
+    if value is None:
+        return None
+    return int.from_bytes(hashlib.blake2b(str(value).encode("utf-8"), digest_size=8).digest(), "big", signed=True)
+
+
+def _try_to_double(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class _CountIf:
+    def __init__(self):
+        self.count = 0
+
+    def step(self, condition: Any) -> None:
+        if condition:
+            self.count += 1
+
+    def finalize(self) -> int:
+        return self.count
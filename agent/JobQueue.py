@@ -0,0 +1,316 @@
+"""
+Persistent job queue
+
+SQLite-backed queue of analysis jobs shared by the HTTP API and any number of worker
+processes, so analyses run without an external broker and survive a restart. Each job
+row carries its goal, options and state; workers claim queued jobs with one atomic UPDATE,
+refresh a heartbeat while they run and record the paths of the saved results and report.
+Jobs whose worker stopped heartbeating are requeued (up to max_attempts).
+
+Submission is idempotent: a goal is keyed by the hash of its normalized text and options,
+and submitting it again returns the job that is already queued or running, or, within
+result_ttl seconds, the job that already finished successfully. A client-chosen
+idempotency key always returns the job it first created.
+
+Progress events (status changes, finished phases and agent runs) are appended to an events
+table with a global sequence number, so clients can stream them from any position.
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from agent.WorkflowWorker import JOB_CANCELLED, JOB_DONE, JOB_FAILED, JOB_QUEUED, JOB_RUNNING
+
+
+FINISHED_STATUSES = (JOB_DONE, JOB_FAILED, JOB_CANCELLED)
+
+
+def goal_hash(goal: str, options: Optional[Dict[str, Any]] = None) -> str:
+    """Hash of a goal (case and whitespace normalized) and its options, used to deduplicate jobs."""
+    normalized = re.sub(r"\s+", " ", goal).strip().lower()
+    payload = json.dumps({"goal": normalized, "options": options or {}}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class JobQueue:
+    """
+    SQLite-backed job queue.
+
+    Attributes:
+        path (Path): Location of the SQLite database file
+        result_ttl (float): Seconds a successful job is returned for a repeated submission
+        max_attempts (int): Claims a job gets before a stale job is failed instead of requeued
+    """
+
+    def __init__(self, path: str = "ge_reports/job_queue.db", result_ttl: float = 3600.0, max_attempts: int = 3):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.result_ttl = result_ttl
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        # Several processes write the same file; wait for their locks instead of failing
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    goal TEXT NOT NULL,
+                    goal_hash TEXT NOT NULL,
+                    options TEXT NOT NULL,
+                    idempotency_key TEXT UNIQUE,
+                    status TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    started_at REAL,
+                    finished_at REAL,
+                    heartbeat_at REAL,
+                    worker_id TEXT,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    cancel_requested INTEGER NOT NULL DEFAULT 0,
+                    run_id TEXT,
+                    results_path TEXT,
+                    report_path TEXT,
+                    summary TEXT,
+                    error TEXT
+                )"""
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_goal_hash ON jobs (goal_hash, status, finished_at)")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS events (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_id TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    event TEXT NOT NULL
+                )"""
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS events_job ON events (job_id, seq)")
+
+    def submit(
+        self,
+        goal: str,
+        options: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+        use_cache: bool = True
+    ) -> Tuple[Dict[str, Any], str]:
+        """
+        Queue a goal unless an equivalent job already exists.
+
+        Args:
+            goal: Data quality goal to analyze
+            options: Orchestrator options of the run (part of the goal hash)
+            idempotency_key: Client-chosen key; resubmitting it returns the same job
+            use_cache: If False, a finished job with the same goal hash is not reused
+
+        Returns:
+            Tuple of the job and how it was obtained: "created", "existing" (same
+            idempotency key, or the same goal queued or running) or "cached" (the same
+            goal finished successfully within result_ttl)
+        """
+        options = options or {}
+        digest = goal_hash(goal, options)
+        with self._lock, self._conn:
+            if idempotency_key:
+                row = self._conn.execute("SELECT * FROM jobs WHERE idempotency_key = ?", (idempotency_key,)).fetchone()
+                if row:
+                    return self._job(row), "existing"
+            row = self._conn.execute(
+                "SELECT * FROM jobs WHERE goal_hash = ? AND status IN (?, ?) ORDER BY created_at LIMIT 1",
+                (digest, JOB_QUEUED, JOB_RUNNING)
+            ).fetchone()
+            if row:
+                return self._job(row), "existing"
+            if use_cache and self.result_ttl > 0:
+                row = self._conn.execute(
+                    "SELECT * FROM jobs WHERE goal_hash = ? AND status = ? AND finished_at >= ? "
+                    "ORDER BY finished_at DESC LIMIT 1",
+                    (digest, JOB_DONE, time.time() - self.result_ttl)
+                ).fetchone()
+                if row:
+                    return self._job(row), "cached"
+            job_id = uuid.uuid4().hex[:12]
+            now = time.time()
+            self._conn.execute(
+                "INSERT INTO jobs (job_id, goal, goal_hash, options, idempotency_key, status, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, goal, digest, json.dumps(options, sort_keys=True, default=str), idempotency_key,
+                 JOB_QUEUED, now)
+            )
+            self._add_event(job_id, {"type": "status", "status": JOB_QUEUED}, now)
+            row = self._conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._job(row), "created"
+
+    def claim(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        """Atomically move the oldest queued job to running for a worker; None if the queue is empty."""
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                """UPDATE jobs SET status = ?, worker_id = ?, started_at = ?, heartbeat_at = ?,
+                       attempts = attempts + 1
+                   WHERE job_id = (SELECT job_id FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1)
+                     AND status = ?
+                   RETURNING *""",
+                (JOB_RUNNING, worker_id, now, now, JOB_QUEUED, JOB_QUEUED)
+            ).fetchone()
+            if row:
+                self._add_event(row["job_id"], {"type": "status", "status": JOB_RUNNING, "worker_id": worker_id}, now)
+        return self._job(row) if row else None
+
+    def heartbeat(self, job_id: str, worker_id: str) -> bool:
+        """
+        Refresh a running job's heartbeat.
+
+        Returns:
+            False if the job should stop: it was cancelled, or it is no longer owned by the
+            worker (requeued after a stale heartbeat)
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET heartbeat_at = ? WHERE job_id = ? AND worker_id = ? AND status = ? "
+                "AND cancel_requested = 0",
+                (time.time(), job_id, worker_id, JOB_RUNNING)
+            )
+        return cursor.rowcount == 1
+
+    def complete(
+        self,
+        job_id: str,
+        worker_id: str,
+        success: bool,
+        run_id: Optional[str] = None,
+        results_path: Optional[str] = None,
+        report_path: Optional[str] = None,
+        summary: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None
+    ) -> bool:
+        """Record the outcome of a run; False if the worker no longer owns the job."""
+        status = JOB_DONE if success else JOB_FAILED
+        now = time.time()
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, run_id = ?, results_path = ?, report_path = ?, "
+                "summary = ?, error = ? WHERE job_id = ? AND worker_id = ? AND status = ?",
+                (status, now, run_id, results_path, report_path, json.dumps(summary or {}, default=str), error,
+                 job_id, worker_id, JOB_RUNNING)
+            )
+            if cursor.rowcount == 1:
+                self._add_event(job_id, {"type": "status", "status": status, "error": error}, now)
+        return cursor.rowcount == 1
+
+    def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Cancel a queued job immediately, or ask the worker of a running job to stop it."""
+        now = time.time()
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, cancel_requested = 1 WHERE job_id = ? AND status = ?",
+                (JOB_CANCELLED, now, job_id, JOB_QUEUED)
+            )
+            if cursor.rowcount == 1:
+                self._add_event(job_id, {"type": "status", "status": JOB_CANCELLED}, now)
+            self._conn.execute(
+                "UPDATE jobs SET cancel_requested = 1 WHERE job_id = ? AND status = ?", (job_id, JOB_RUNNING)
+            )
+            row = self._conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._job(row) if row else None
+
+    def mark_cancelled(self, job_id: str, worker_id: str) -> bool:
+        """Record that a worker stopped a running job after a cancel request."""
+        now = time.time()
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ? WHERE job_id = ? AND worker_id = ? AND status = ?",
+                (JOB_CANCELLED, now, job_id, worker_id, JOB_RUNNING)
+            )
+            if cursor.rowcount == 1:
+                self._add_event(job_id, {"type": "status", "status": JOB_CANCELLED}, now)
+        return cursor.rowcount == 1
+
+    def requeue_stale(self, stale_after: float) -> int:
+        """
+        Requeue running jobs whose heartbeat is older than stale_after seconds (their worker
+        died); jobs that already used max_attempts claims are failed instead.
+
+        Returns:
+            Number of jobs requeued or failed
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                "SELECT job_id, attempts, cancel_requested FROM jobs WHERE status = ? AND heartbeat_at < ?",
+                (JOB_RUNNING, now - stale_after)
+            ).fetchall()
+            for row in rows:
+                if row["cancel_requested"]:
+                    status, error = JOB_CANCELLED, None
+                elif row["attempts"] >= self.max_attempts:
+                    status, error = JOB_FAILED, f"worker stopped responding ({row['attempts']} attempts)"
+                else:
+                    status, error = JOB_QUEUED, None
+                self._conn.execute(
+                    "UPDATE jobs SET status = ?, worker_id = NULL, error = ?, finished_at = ? "
+                    "WHERE job_id = ? AND status = ?",
+                    (status, error, now if status != JOB_QUEUED else None, row["job_id"], JOB_RUNNING)
+                )
+                self._add_event(row["job_id"], {"type": "status", "status": status, "error": error}, now)
+        return len(rows)
+
+    def emit(self, job_id: str, event: Dict[str, Any]) -> None:
+        """Append a progress event to a job."""
+        with self._lock, self._conn:
+            self._add_event(job_id, event, time.time())
+
+    def events(self, job_id: str, after: int = 0, limit: int = 500) -> List[Dict[str, Any]]:
+        """Return a job's events with a sequence number above after, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, created_at, event FROM events WHERE job_id = ? AND seq > ? ORDER BY seq LIMIT ?",
+                (job_id, after, limit)
+            ).fetchall()
+        return [{"seq": row["seq"], "created_at": row["created_at"], **json.loads(row["event"])} for row in rows]
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return a job, or None if it does not exist."""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._job(row) if row else None
+
+    def list(self, status: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """Return jobs, optionally of one status, newest first."""
+        where, params = ("WHERE status = ?", (status,)) if status else ("", ())
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM jobs {where} ORDER BY created_at DESC LIMIT ?", (*params, limit)
+            ).fetchall()
+        return [self._job(row) for row in rows]
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of jobs per status."""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status").fetchall()
+        counts = {status: 0 for status in (JOB_QUEUED, JOB_RUNNING, *FINISHED_STATUSES)}
+        counts.update({row["status"]: row["n"] for row in rows})
+        return counts
+
+    def _add_event(self, job_id: str, event: Dict[str, Any], created_at: float) -> None:
+        # Callers hold the lock and the transaction
+        self._conn.execute(
+            "INSERT INTO events (job_id, created_at, event) VALUES (?, ?, ?)",
+            (job_id, created_at, json.dumps(event, default=str))
+        )
+
+    @staticmethod
+    def _job(row: sqlite3.Row) -> Dict[str, Any]:
+        job = dict(row)
+        job["options"] = json.loads(job["options"] or "{}")
+        job["summary"] = json.loads(job["summary"]) if job.get("summary") else None
+        job["cancel_requested"] = bool(job["cancel_requested"])
+        job["finished"] = job["status"] in FINISHED_STATUSES
+        return job
@@ -0,0 +1,328 @@
+"""
+Job worker processes
+
+Workers claim jobs from the shared JobQueue and run them. Each worker process builds its
+runner once and keeps it for every job it claims, so the default runner holds a warm
+Orchestrator (agents, model clients and the Snowflake connection are created on the first
+job and reused afterwards). The Orchestrator resets every agent before it runs, so a job's
+prompts never carry earlier jobs' tasks, query rows or reports. Throughput scales with the number of worker processes: add
+workers to the pool, or start more pools on the same queue file.
+
+While a job runs, its worker refreshes the job's heartbeat and stops the run when the job
+was cancelled. The phase and agent spans the run finishes are written to the queue as
+progress events. The pool's supervisor restarts worker processes that died and requeues
+the jobs whose heartbeat went stale.
+
+A runner factory is any importable callable "module:function" returning an async
+runner(job, emit) -> dict with the keys success, run_id, results_path, report_path,
+summary and error.
+"""
+
+import asyncio
+import contextlib
+import importlib
+import json
+import multiprocessing
+import os
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from agent.JobQueue import JobQueue
+
+
+# Orchestrator arguments a submitted job may set; everything else is fixed by the worker
+ORCHESTRATOR_OPTIONS = {
+    "max_rounds", "incremental_analysis", "use_rule_based_planner", "run_check_suite", "followup_iterations",
+    "followup_time_budget", "followup_credit_budget", "task_timeout", "phase_timeout", "workflow_timeout",
+    "detect_drift", "max_drift_alerts",
+}
+
+Runner = Callable[[Dict[str, Any], Callable[[Dict[str, Any]], None]], Awaitable[Dict[str, Any]]]
+
+
+class JobEventExporter:
+    """Span exporter that turns finished workflow, phase and agent spans into job events."""
+
+    KINDS = ("workflow", "phase", "agent")
+
+    def __init__(self, exporter=None):
+        self.exporter = exporter  # Exporter the spans are forwarded to (e.g. the JSONL trace file)
+        self.emit: Optional[Callable[[Dict[str, Any]], None]] = None  # Set per job by the runner
+
+    def export(self, span) -> None:
+        """Emit a finished span as an event and forward it."""
+        if self.emit is not None and span.kind in self.KINDS:
+            self.emit({
+                "type": "span",
+                "kind": span.kind,
+                "name": span.name,
+                "status": span.status,
+                "duration_seconds": round(span.duration_seconds, 3),
+                "error": span.error,
+            })
+        if self.exporter is not None:
+            self.exporter.export(span)
+
+
+def orchestrator_runner(reports_dir: str = "ge_reports", max_orchestrators: int = 4, **defaults) -> Runner:
+    """
+    Runner factory keeping a warm Orchestrator per distinct set of job options.
+
+    Args:
+        reports_dir: Directory the Orchestrators write their reports to
+        max_orchestrators: Orchestrators kept; the least recently used one is dropped beyond this
+        **defaults: Orchestrator arguments used when a job does not set them
+    """
+    from agent.Orchestrator import Orchestrator
+
+    orchestrators: "OrderedDict[str, Any]" = OrderedDict()
+
+    async def run(job: Dict[str, Any], emit: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+        options = {**defaults, **job["options"]}
+        key = json.dumps(options, sort_keys=True, default=str)
+        if key in orchestrators:
+            orchestrators.move_to_end(key)
+        else:
+            orchestrator = Orchestrator(reports_dir=reports_dir, enable_console_output=False, **options)
+            orchestrator.trace_exporter = JobEventExporter(orchestrator.trace_exporter)
+            orchestrators[key] = orchestrator
+            while len(orchestrators) > max(1, max_orchestrators):
+                orchestrators.popitem(last=False)
+        orchestrator = orchestrators[key]
+        orchestrator.trace_exporter.emit = emit
+        try:
+            results = await orchestrator.run_analysis(job["goal"])
+        finally:
+            orchestrator.trace_exporter.emit = None
+
+        run_id = results.get("run_id")
+        paths = {
+            kind: next(iter(orchestrator.report_catalog.find(kind=kind, run_id=run_id, limit=1)), {}).get("path")
+            for kind in ("results", "report")
+        } if run_id else {}
+        analysis = results.get("analysis")
+        issues = getattr(analysis, "issues", None) if analysis is not None else None
+        return {
+            "success": bool(results.get("success")),
+            "run_id": run_id,
+            "results_path": paths.get("results"),
+            "report_path": paths.get("report"),
+            "summary": {
+                "partial": bool(results.get("partial")),
+                "timed_out": results.get("timed_out") or [],
+                "issue_count": len(issues) if issues is not None else None,
+                "trace_id": results.get("trace_id"),
+            },
+            "error": results.get("error"),
+        }
+
+    return run
+
+
+def load_runner_factory(path: str) -> Callable[..., Runner]:
+    """Import a runner factory given as "module:function"."""
+    module_name, _, function_name = path.partition(":")
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+class JobWorker:
+    """
+    Claims and runs jobs one at a time.
+
+    Attributes:
+        queue (JobQueue): Queue the jobs are claimed from
+        runner (Runner): Runs a job and returns its outcome
+        worker_id (str): Id recorded on the claimed jobs
+        poll_interval (float): Seconds to wait when the queue is empty
+        heartbeat_interval (float): Seconds between heartbeats (and cancellation checks) of a running job
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        runner: Runner,
+        worker_id: Optional[str] = None,
+        poll_interval: float = 1.0,
+        heartbeat_interval: float = 10.0
+    ):
+        self.queue = queue
+        self.runner = runner
+        self.worker_id = worker_id or f"{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.jobs_run = 0
+
+    async def run_forever(self, stop: Optional[asyncio.Event] = None) -> None:
+        """Run jobs until the stop event is set; the job in progress is finished first."""
+        stop = stop or asyncio.Event()
+        while not stop.is_set():
+            if await self.run_once() is None:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(stop.wait(), timeout=self.poll_interval)
+
+    async def run_once(self) -> Optional[Dict[str, Any]]:
+        """Claim and run one job; returns the finished job, or None if the queue was empty."""
+        job = await asyncio.to_thread(self.queue.claim, self.worker_id)
+        if job is None:
+            return None
+        job_id = job["job_id"]
+        task = asyncio.create_task(self.runner(job, lambda event: self.queue.emit(job_id, event)))
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=self.heartbeat_interval)
+            if done:
+                break
+            if not await asyncio.to_thread(self.queue.heartbeat, job_id, self.worker_id):
+                # Cancelled, or requeued after this worker looked dead: stop the run
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await task
+                await asyncio.to_thread(self.queue.mark_cancelled, job_id, self.worker_id)
+                print(f"🛑 Job {job_id} stopped")
+                return await asyncio.to_thread(self.queue.get, job_id)
+
+        try:
+            outcome = task.result()
+        except Exception as e:
+            outcome = {"success": False, "error": f"{type(e).__name__}: {e}"}
+        await asyncio.to_thread(
+            self.queue.complete, job_id, self.worker_id, bool(outcome.get("success")),
+            outcome.get("run_id"), outcome.get("results_path"), outcome.get("report_path"),
+            outcome.get("summary"), outcome.get("error")
+        )
+        self.jobs_run += 1
+        print(f"{'✅' if outcome.get('success') else '❌'} Job {job_id} finished on worker {self.worker_id}")
+        return await asyncio.to_thread(self.queue.get, job_id)
+
+
+def _worker_main(
+    queue_path: str,
+    worker_id: str,
+    runner_factory: str,
+    runner_kwargs: Dict[str, Any],
+    poll_interval: float,
+    heartbeat_interval: float,
+    stop_flag
+) -> None:
+    """Entry point of a worker process: build the runner once, then run jobs until stopped."""
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
+    queue = JobQueue(queue_path)
+    runner = load_runner_factory(runner_factory)(**runner_kwargs)
+    worker = JobWorker(queue, runner, worker_id=worker_id, poll_interval=poll_interval,
+                       heartbeat_interval=heartbeat_interval)
+
+    async def main():
+        stop = asyncio.Event()
+
+        async def watch():
+            while not stop_flag.is_set():
+                await asyncio.sleep(min(poll_interval, 0.5))
+            stop.set()
+
+        watcher = asyncio.create_task(watch())
+        await worker.run_forever(stop)
+        watcher.cancel()
+
+    asyncio.run(main())
+
+
+class JobWorkerPool:
+    """
+    A supervised set of worker processes sharing one queue file.
+
+    Attributes:
+        queue_path (str): SQLite file of the JobQueue
+        workers (int): Number of worker processes kept alive
+        runner_factory (str): "module:function" building each process's runner
+        runner_kwargs (dict): Arguments of the runner factory (must be picklable)
+        stale_after (float): Seconds without a heartbeat after which a running job is requeued
+    """
+
+    def __init__(
+        self,
+        queue_path: str = "ge_reports/job_queue.db",
+        workers: int = 2,
+        runner_factory: str = "agent.JobWorkerPool:orchestrator_runner",
+        runner_kwargs: Optional[Dict[str, Any]] = None,
+        poll_interval: float = 1.0,
+        heartbeat_interval: float = 10.0,
+        stale_after: Optional[float] = None
+    ):
+        self.queue_path = queue_path
+        self.workers = workers
+        self.runner_factory = runner_factory
+        self.runner_kwargs = runner_kwargs or {}
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.stale_after = stale_after if stale_after is not None else 3 * heartbeat_interval
+        self.queue = JobQueue(queue_path)
+        # Spawned (not forked) so no locks, connections or event loops leak into the workers
+        self._context = multiprocessing.get_context("spawn")
+        self._processes: List[Any] = []
+        self._stop_flags: List[Any] = []
+        self._retired: List[Any] = []  # Processes removed by scale() that may still finish a job
+        self.restarts = 0
+
+    def start(self) -> None:
+        """Start the worker processes."""
+        self.queue.requeue_stale(self.stale_after)
+        self.scale(self.workers)
+        print(f"👷 Started {self.workers} job worker process(es)")
+
+    def scale(self, workers: int) -> None:
+        """Grow or shrink the pool; removed workers finish their current job first."""
+        self.workers = workers
+        while len(self._processes) < workers:
+            self._processes.append(None)
+            self._stop_flags.append(None)
+            self._spawn(len(self._processes) - 1)
+        while len(self._processes) > workers:
+            self._retired.append(self._processes.pop())
+            self._stop_flags.pop().set()
+
+    def supervise(self) -> int:
+        """
+        Restart dead worker processes and requeue the jobs of workers that stopped heartbeating.
+
+        Returns:
+            Number of stale jobs requeued (or failed after max_attempts)
+        """
+        for index, process in enumerate(self._processes):
+            if process is not None and not process.is_alive():
+                print(f"⚠️  Job worker {process.name} exited with code {process.exitcode}; restarting")
+                self.restarts += 1
+                self._spawn(index)
+        return self.queue.requeue_stale(self.stale_after)
+
+    def alive(self) -> int:
+        """Number of worker processes currently running."""
+        return sum(1 for process in self._processes if process is not None and process.is_alive())
+
+    def stop(self, timeout: float = 30.0) -> None:
+        """Ask every worker to stop after its current job; terminate those still running after timeout."""
+        for flag in self._stop_flags:
+            flag.set()
+        deadline = time.monotonic() + timeout
+        for process in self._processes + self._retired:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        self._processes, self._stop_flags, self._retired = [], [], []
+
+    def _spawn(self, index: int) -> None:
+        stop_flag = self._context.Event()
+        worker_id = f"worker{index + 1}-{uuid.uuid4().hex[:6]}"
+        process = self._context.Process(
+            target=_worker_main, name=worker_id, daemon=True,
+            args=(self.queue_path, worker_id, self.runner_factory, self.runner_kwargs,
+                  self.poll_interval, self.heartbeat_interval, stop_flag)
+        )
+        process.start()
+        self._processes[index] = process
+        self._stop_flags[index] = stop_flag
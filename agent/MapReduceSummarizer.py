@@ -0,0 +1,201 @@
+"""
+Map-reduce summarization for large investigations
+
+When an investigation produces many results, a single SummarizerAgent prompt grows past
+useful context limits. The MapReduceSummarizer splits pre-digested findings into chunks by
+table and theme, summarizes the chunks in parallel with a pool of worker SummarizerAgents
+(map), and merges the partial DataQualityAgentReports into one report with deduplicated
+issues (reduce).
+"""
+
+import asyncio
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Iterable, List, Optional
+
+from agent.AgentPool import AgentPool
+from agent.FindingExtractor import InvestigationFinding
+from agent.SummarizerAgent import DataQualityAgentReport, DataQualityIssue
+
+
+# Ordering used when deduplicated issues disagree on severity
+SEVERITY_RANK = {"critical": 4, "high": 3, "medium": 2, "low": 1}
+
+
+def chunk_findings(
+    findings: List[InvestigationFinding],
+    max_findings_per_chunk: int = 8
+) -> List[List[InvestigationFinding]]:
+    """
+    Group findings by (table, theme) and split oversized groups.
+
+    Args:
+        findings: Findings to distribute across worker summarizers
+        max_findings_per_chunk: Upper bound on findings per chunk
+
+    Returns:
+        List of chunks, largest groups first so long-running chunks start early
+    """
+    groups: "OrderedDict[tuple, List[InvestigationFinding]]" = OrderedDict()
+    for finding in findings:
+        groups.setdefault((finding.table, finding.theme), []).append(finding)
+
+    chunks = []
+    size = max(1, max_findings_per_chunk)
+    for group in groups.values():
+        for start in range(0, len(group), size):
+            chunks.append(group[start:start + size])
+
+    return sorted(chunks, key=len, reverse=True)
+
+
+def create_chunk_task(goal: str, chunk: List[InvestigationFinding], chunk_num: int, total_chunks: int) -> str:
+    """Create the task description for one worker summarizer."""
+    tables = sorted({finding.table for finding in chunk})
+    themes = sorted({finding.theme for finding in chunk})
+    task = f"""Analyze this subset ({chunk_num} of {total_chunks}) of data quality findings:
+
+        Original Goal: {goal}
+        Tables: {", ".join(tables)}
+        Themes: {", ".join(themes)}
+
+        """
+    for num, finding in enumerate(chunk, 1):
+        task += f"\nFinding {num} [{finding.source}]: {finding.goal}\n"
+        task += f"  Evidence: {finding.evidence_query}\n"
+        task += f"  Rows: {finding.row_count}\n"
+        task += f"  Observation: {finding.observation}\n"
+
+    task += "\n\nOnly report issues supported by the findings above. Provide:\n"
+    task += "1. A short summary of the data quality findings in this subset\n"
+    task += "2. Identified issues with severity levels\n"
+    task += "3. Recommendations for remediation\n"
+    task += "4. Any follow-up queries needed for deeper investigation\n"
+    return task
+
+
+def _normalize(text: str) -> str:
+    return " ".join((text or "").lower().split()).rstrip(";")
+
+
+def _unique(items: Iterable[str]) -> List[str]:
+    seen = set()
+    unique_items = []
+    for item in items:
+        key = _normalize(item)
+        if key and key not in seen:
+            seen.add(key)
+            unique_items.append(item)
+    return unique_items
+
+
+def merge_reports(reports: List[DataQualityAgentReport]) -> DataQualityAgentReport:
+    """
+    Merge partial reports from worker summarizers into one DataQualityAgentReport.
+
+    Issues are deduplicated on (type, evidence query); duplicates keep the highest severity
+    and the longest evidence description. Recommendations and follow-up queries are
+    deduplicated case- and whitespace-insensitively while preserving order.
+
+    Args:
+        reports: Partial reports produced by the map step
+
+    Returns:
+        DataQualityAgentReport: Combined report, issues ordered by severity
+    """
+    issues: "OrderedDict[tuple, DataQualityIssue]" = OrderedDict()
+    for report in reports:
+        for issue in report.issues:
+            key = (_normalize(issue.type), _normalize(issue.evidence_query))
+            existing = issues.get(key)
+            if existing is None:
+                issues[key] = issue.model_copy()
+                continue
+            if SEVERITY_RANK.get(issue.severity.lower(), 0) > SEVERITY_RANK.get(existing.severity.lower(), 0):
+                existing.severity = issue.severity
+            if len(issue.evidence_description) > len(existing.evidence_description):
+                existing.evidence_description = issue.evidence_description
+
+    merged_issues = sorted(
+        issues.values(),
+        key=lambda issue: SEVERITY_RANK.get(issue.severity.lower(), 0),
+        reverse=True
+    )
+
+    return DataQualityAgentReport(
+        summary=" ".join(report.summary.strip() for report in reports if report.summary.strip()),
+        issues=merged_issues,
+        recommendations=_unique(rec for report in reports for rec in report.recommendations),
+        required_followup_queries=_unique(q for report in reports for q in report.required_followup_queries),
+        analysis_complete=bool(reports) and all(report.analysis_complete for report in reports)
+    )
+
+
+class MapReduceSummarizer:
+    """
+    Hierarchical summarization over a pool of worker SummarizerAgents.
+
+    Chunks of one summarize() call are summarized concurrently by at most `fan_out` workers.
+    Workers come from one AgentPool shared by all calls, so concurrent calls (e.g. several
+    goals of a batch) never drive the same worker, and each worker is reset before it takes
+    a new chunk so chunk contexts never leak into each other. The partial reports are merged
+    deterministically with merge_reports().
+
+    Attributes:
+        workers (AgentPool): Worker agents, created by worker_factory as needed
+        fan_out (int): Number of worker agents summarizing in parallel per call
+        max_findings_per_chunk (int): Upper bound on findings per chunk
+    """
+
+    def __init__(
+        self,
+        worker_factory: Callable[[int], Any],
+        fan_out: int = 4,
+        max_findings_per_chunk: int = 8
+    ):
+        self.workers = AgentPool(worker_factory)
+        self.fan_out = max(1, fan_out)
+        self.max_findings_per_chunk = max_findings_per_chunk
+
+    async def summarize(
+        self,
+        goal: str,
+        findings: List[InvestigationFinding],
+        run_team: Callable[..., Awaitable[Optional[DataQualityAgentReport]]]
+    ) -> Optional[DataQualityAgentReport]:
+        """
+        Summarize findings with the map-reduce strategy.
+
+        Args:
+            goal: Original data quality goal
+            findings: Pre-digested findings to summarize
+            run_team: Coroutine function (agent, task, output_type, max_messages) running one agent
+
+        Returns:
+            Merged DataQualityAgentReport, or None if no chunk produced a report
+        """
+        chunks = chunk_findings(findings, self.max_findings_per_chunk)
+        if not chunks:
+            return None
+
+        semaphore = asyncio.Semaphore(self.fan_out)
+
+        async def summarize_chunk(chunk_num: int, chunk: List[InvestigationFinding]):
+            async with semaphore, self.workers.agent() as worker:
+                task = create_chunk_task(goal, chunk, chunk_num, len(chunks))
+                return await run_team(worker, task, DataQualityAgentReport, 5)
+
+        partials = await asyncio.gather(
+            *(summarize_chunk(num, chunk) for num, chunk in enumerate(chunks, 1)),
+            return_exceptions=True
+        )
+
+        reports = []
+        for partial in partials:
+            if isinstance(partial, Exception):
+                print(f"    ❌ Summarizer worker failed with error: {str(partial)}")
+            elif partial is not None:
+                reports.append(partial)
+
+        print(f"  ✅ Map step completed: {len(reports)}/{len(chunks)} chunks summarized "
+              f"by {min(self.fan_out, len(chunks))} workers")
+        return merge_reports(reports) if reports else None
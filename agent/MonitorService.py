@@ -0,0 +1,364 @@
+"""
+Change-triggered monitoring service
+
+Long-running service that watches registered tables and runs their check suites only when
+the data changed. Each poll reads cheap change signals for all registered tables:
+- LAST_ALTERED, ROW_COUNT and BYTES from INFORMATION_SCHEMA.TABLES (one metadata query per
+  database/schema, no table scan)
+- SYSTEM$LAST_CHANGE_COMMIT_TIME per table (one batched SELECT; skipped when unsupported)
+
+A table whose signals differ from the ones recorded at its last successful run is put on a
+priority queue. A fixed number of workers (the concurrency cap) take tables off the queue
+and run their checks. Unchanged tables cost one metadata row per poll. The signals of the
+last successful run are kept in SQLite, so a restarted service only re-runs tables that
+changed in the meantime. Check results are appended to the run history.
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from agent.IncrementalCheckRunner import IncrementalCheckRunner, SnowflakeChangeSource
+from agent.RunHistory import RunHistory
+from agent.SchemaRegistry import SchemaRegistry
+from agent.Tracer import Tracer
+from agent.tool.CheckSuiteCompiler import DataQualityCheck, build_checks_from_schema
+from agent.tool.DataQualityCheckTool import DataQualityCheckTool
+from agent.tool.SnowflakeQueryEngine import SnowflakeQueryEngine
+
+
+class MonitoredTable(BaseModel):
+    """A table registered with the monitor"""
+    table_name: str  # Table to watch, optionally qualified as DATABASE.SCHEMA.TABLE
+    priority: int = 0  # Lower values run first when several tables changed
+    check_names: List[str] = []  # Checks to run (e.g. "not_null:FARE"); empty runs the whole suite
+    min_interval_seconds: float = 0  # Minimum time between two runs; later changes wait for the next poll
+    table_schema: Optional[dict] = None  # Schema the checks are derived from; looked up when omitted
+    incremental: bool = False  # Check only appended rows via change tracking (see IncrementalCheckRunner)
+
+    @property
+    def key(self) -> str:
+        """Upper-case qualified name used to identify the table."""
+        return ".".join(part.strip('"').upper() for part in self.table_name.split("."))
+
+
+class MonitorService:
+    """
+    Polls change signals of registered tables and runs checks on changed tables.
+
+    Attributes:
+        query_engine (SnowflakeQueryEngine): Engine used for signal queries and checks
+        check_tool (DataQualityCheckTool): Runs the compiled check suites
+        run_history (Optional[RunHistory]): History the check results are appended to
+        poll_interval (float): Seconds between two polls in run_forever()
+        max_concurrent_runs (int): Check runs executing at the same time
+        use_commit_time (bool): Also poll SYSTEM$LAST_CHANGE_COMMIT_TIME
+        stats (Dict[str, int]): Counters of polls, changes, runs, failures and unchanged tables
+    """
+
+    def __init__(
+        self,
+        query_engine: Optional[SnowflakeQueryEngine] = None,
+        state_path: str = "ge_reports/monitor_state.db",
+        run_history: Optional[RunHistory] = None,
+        poll_interval: float = 300.0,
+        max_concurrent_runs: int = 2,
+        use_commit_time: bool = True,
+        run_table: Optional[Callable[[MonitoredTable], Awaitable[Dict[str, Any]]]] = None
+    ):
+        """
+        Initialize the MonitorService.
+
+        Args:
+            query_engine: Engine to use; defaults to the process-wide shared engine
+            state_path: SQLite file keeping the signals of each table's last successful run
+            run_history: History to append check results to (None = not recorded)
+            poll_interval: Seconds between two polls in run_forever()
+            max_concurrent_runs: Check runs executing at the same time
+            use_commit_time: Also poll SYSTEM$LAST_CHANGE_COMMIT_TIME
+            run_table: Coroutine replacing the default check run for a changed table (e.g. a
+                full Orchestrator analysis); returns a dict with at least "success"
+        """
+        self.query_engine = query_engine or SnowflakeQueryEngine.get_shared_instance()
+        self.check_tool = DataQualityCheckTool(query_engine=self.query_engine, schema={})
+        self.run_history = run_history
+        self.poll_interval = poll_interval
+        self.max_concurrent_runs = max(1, max_concurrent_runs)
+        self.use_commit_time = use_commit_time
+        self.run_table = run_table or self._run_checks
+        self.stats = {"polls": 0, "changed": 0, "unchanged": 0, "runs": 0, "failed_runs": 0, "poll_errors": 0}
+
+        self._tables: Dict[str, MonitoredTable] = {}
+        self._schemas: Dict[str, dict] = {}
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._pending: Dict[str, Dict[str, Any]] = {}  # key -> {"signals", "running"} of queued or running tables
+        self._sequence = 0
+        self._incremental_runners: Dict[str, IncrementalCheckRunner] = {}
+
+        path = Path(state_path)
+        self.incremental_state_path = str(path.with_name("incremental_checks.db"))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS monitor_state (
+                    table_key TEXT PRIMARY KEY,
+                    signals TEXT NOT NULL,
+                    last_run_at REAL NOT NULL,
+                    last_success INTEGER NOT NULL
+                )"""
+            )
+
+    def register(self, table: MonitoredTable) -> None:
+        """Start watching a table (replaces an earlier registration of the same table)."""
+        self._tables[table.key] = table
+        self._schemas.pop(table.key, None)
+
+    def unregister(self, table_name: str) -> None:
+        """Stop watching a table."""
+        key = MonitoredTable(table_name=table_name).key
+        self._tables.pop(key, None)
+        self._schemas.pop(key, None)
+
+    def tables(self) -> List[MonitoredTable]:
+        """Return the registered tables, highest priority first."""
+        return sorted(self._tables.values(), key=lambda table: (table.priority, table.key))
+
+    async def run_forever(self, stop: Optional[asyncio.Event] = None) -> None:
+        """
+        Poll every poll_interval seconds and run checks on changed tables until stopped.
+
+        Args:
+            stop: Event ending the loop; queued runs are cancelled when it is set
+        """
+        stop = stop or asyncio.Event()
+        workers = self._start_workers()
+        try:
+            while not stop.is_set():
+                await self.poll()
+                try:
+                    await asyncio.wait_for(stop.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            await self._stop_workers(workers)
+
+    async def run_once(self) -> List[str]:
+        """Poll once and wait for the triggered runs (e.g. from cron). Returns the changed tables."""
+        workers = self._start_workers()
+        try:
+            changed = await self.poll()
+            await self._queue.join()
+            return changed
+        finally:
+            await self._stop_workers(workers)
+
+    async def poll(self) -> List[str]:
+        """
+        Read the change signals of all registered tables and queue the changed ones.
+
+        Returns:
+            List[str]: Keys of the tables queued by this poll
+        """
+        if self._queue is None:
+            raise RuntimeError("poll() needs running workers; use run_forever() or run_once()")
+        self.stats["polls"] += 1
+        try:
+            signals = await asyncio.to_thread(self.read_signals, list(self._tables.values()))
+        except Exception as e:
+            self.stats["poll_errors"] += 1
+            print(f"⚠️ Monitor poll failed: {str(e)}")
+            return []
+
+        state = self._load_state()
+        changed = []
+        now = time.time()
+        for table in self.tables():
+            current = signals.get(table.key)
+            if current is None:
+                print(f"⚠️ {table.key} not found in INFORMATION_SCHEMA.TABLES")
+                continue
+            previous = state.get(table.key)
+            if table.key in self._pending:
+                # A queued run sees the newest data; a running one is re-queued by the next poll
+                # because its recorded signals no longer match
+                if not self._pending[table.key]["running"]:
+                    self._pending[table.key]["signals"] = current
+                continue
+            if previous and previous["last_success"] and previous["signals"] == current:
+                self.stats["unchanged"] += 1
+                continue
+            if previous and now - previous["last_run_at"] < table.min_interval_seconds:
+                continue  # still differs at the next poll, so the change is not lost
+            self.stats["changed"] += 1
+            self._enqueue(table, current)
+            changed.append(table.key)
+        return changed
+
+    def read_signals(self, tables: List[MonitoredTable]) -> Dict[str, Dict[str, Any]]:
+        """
+        Read the change signals of tables with metadata queries only.
+
+        Args:
+            tables: Tables to read
+
+        Returns:
+            Dict mapping table keys to {"last_altered", "row_count", "bytes"[, "last_commit"]}
+        """
+        groups: Dict[Tuple[str, str], List[MonitoredTable]] = {}
+        for table in tables:
+            parts = table.key.split(".")
+            database = parts[-3] if len(parts) == 3 else ""
+            schema = parts[-2] if len(parts) >= 2 else ""
+            groups.setdefault((database, schema), []).append(table)
+
+        signals: Dict[str, Dict[str, Any]] = {}
+        for (database, schema), group in groups.items():
+            names = ", ".join(f"'{table.key.split('.')[-1]}'" for table in group)
+            query = f"""
+            SELECT TABLE_NAME, LAST_ALTERED, ROW_COUNT, BYTES
+            FROM {database + '.' if database else ''}INFORMATION_SCHEMA.TABLES
+            WHERE TABLE_SCHEMA = {f"'{schema}'" if schema else 'CURRENT_SCHEMA()'} AND TABLE_NAME IN ({names})
+            """
+            result = self.query_engine.execute_query(query, "Monitor change signals", "list")
+            if not result["success"]:
+                raise RuntimeError(result.get("error", "signal query failed"))
+            rows = {row["TABLE_NAME"]: row for row in result["data"] or []}
+            for table in group:
+                row = rows.get(table.key.split(".")[-1])
+                if row is not None:
+                    signals[table.key] = {
+                        "last_altered": str(row.get("LAST_ALTERED")),
+                        "row_count": row.get("ROW_COUNT"),
+                        "bytes": row.get("BYTES")
+                    }
+
+        if self.use_commit_time and signals:
+            keys = sorted(signals)
+            columns = ", ".join(f"SYSTEM$LAST_CHANGE_COMMIT_TIME('{key}') AS C{index}" for index, key in enumerate(keys))
+            result = self.query_engine.execute_query(f"SELECT {columns}", "Monitor commit times", "list")
+            if result["success"] and result["data"]:
+                for index, key in enumerate(keys):
+                    signals[key]["last_commit"] = result["data"][0].get(f"C{index}")
+            else:
+                # Views and some table types do not support it; LAST_ALTERED still covers them
+                self.use_commit_time = False
+                print(f"⚠️ SYSTEM$LAST_CHANGE_COMMIT_TIME unavailable, using INFORMATION_SCHEMA only: "
+                      f"{result.get('error', 'no rows')}")
+        return signals
+
+    def checks_for(self, table: MonitoredTable) -> List[DataQualityCheck]:
+        """Return the checks to run for a table (its selected checks of the schema's suite)."""
+        schema = self._schema_for(table)
+        checks = build_checks_from_schema(schema)
+        if table.check_names:
+            checks = [check for check in checks if check.name in table.check_names]
+        return checks
+
+    def _schema_for(self, table: MonitoredTable) -> dict:
+        if table.key not in self._schemas:
+            schema = table.table_schema
+            if schema is None:
+                default = SchemaRegistry.load_schema()
+                if default.get("table_name", "").upper() == table.key.split(".")[-1]:
+                    schema = default
+                else:
+                    parts = table.key.split(".")
+                    info = self.query_engine.get_table_info(
+                        parts[-1], parts[-2] if len(parts) >= 2 else "", parts[-3] if len(parts) == 3 else ""
+                    )
+                    if not info["success"]:
+                        raise RuntimeError(info.get("error", f"No schema for {table.key}"))
+                    schema = SchemaRegistry.from_table_info(table.key, info["columns"])
+            self._schemas[table.key] = schema
+        return self._schemas[table.key]
+
+    def _start_workers(self) -> List[asyncio.Task]:
+        self._queue = asyncio.PriorityQueue()
+        return [asyncio.create_task(self._worker()) for _ in range(self.max_concurrent_runs)]
+
+    async def _stop_workers(self, workers: List[asyncio.Task]) -> None:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._queue = None
+        self._pending.clear()
+
+    def _enqueue(self, table: MonitoredTable, signals: Dict[str, Any]) -> None:
+        self._sequence += 1
+        self._pending[table.key] = {"signals": signals, "running": False}
+        self._queue.put_nowait((table.priority, self._sequence, table.key))
+
+    async def _worker(self) -> None:
+        while True:
+            _, _, key = await self._queue.get()
+            try:
+                table = self._tables.get(key)
+                if table is not None:
+                    await self._run(table)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, table: MonitoredTable) -> None:
+        pending = self._pending[table.key]
+        pending["running"] = True
+        try:
+            with Tracer.span(f"monitor:{table.key}", "workflow", table=table.key) as span:
+                try:
+                    outcome = await self.run_table(table)
+                except Exception as e:
+                    span.fail(e)
+                    outcome = {"success": False, "error": str(e)}
+            self.stats["runs"] += 1
+            if not outcome.get("success"):
+                self.stats["failed_runs"] += 1
+                print(f"❌ Monitor run for {table.key} failed: {outcome.get('error', 'unknown error')}")
+            self._save_state(table.key, pending["signals"], bool(outcome.get("success")))
+        finally:
+            self._pending.pop(table.key, None)
+
+    async def _run_checks(self, table: MonitoredTable) -> Dict[str, Any]:
+        checks = await asyncio.to_thread(self.checks_for, table)
+        if table.incremental:
+            runner = self._incremental_runners.get(table.key)
+            if runner is None:
+                runner = IncrementalCheckRunner(SnowflakeChangeSource(table.table_name, self.query_engine),
+                                                state_path=self.incremental_state_path)
+                self._incremental_runners[table.key] = runner
+            outcome = await asyncio.to_thread(runner.run, checks)
+        else:
+            outcome = await asyncio.to_thread(self.check_tool.run_checks, table.table_name, checks)
+        if not outcome["success"]:
+            return outcome
+        print(f"🔔 {table.key} changed: {outcome['checks_failed']} of {outcome['checks_run']} checks failed")
+        if self.run_history is not None:
+            self.run_history.record({
+                "goal": f"Monitor checks for {table.key}",
+                "run_id": Tracer.run_id() or uuid.uuid4().hex,
+                "success": True,
+                "check_results": [result.model_dump() for result in outcome["results"]],
+            }, table_name=table.key.split(".")[-1])
+        return outcome
+
+    def _load_state(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM monitor_state").fetchall()
+        return {row["table_key"]: {"signals": json.loads(row["signals"]), "last_run_at": row["last_run_at"],
+                                   "last_success": bool(row["last_success"])} for row in rows}
+
+    def _save_state(self, key: str, signals: Dict[str, Any], success: bool) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO monitor_state (table_key, signals, last_run_at, last_success) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(signals, default=str), time.time(), int(success))
+            )
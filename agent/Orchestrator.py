@@ -12,6 +12,8 @@ The orchestrator uses AutoGen's team framework to coordinate agent interactions.
 """
 
 import asyncio
+import os
+from functools import cached_property
 from typing import Optional, Dict, Any
 from pathlib import Path
 import json
@@ -20,12 +22,29 @@ from autogen_agentchat.teams import RoundRobinGroupChat, Swarm
 from autogen_agentchat.conditions import MaxMessageTermination, TextMentionTermination
 from autogen_agentchat.ui import Console
 from autogen_agentchat.messages import StructuredMessage
+from autogen_core import CancellationToken
 
-from agent.PlannerAgent import PlannerAgent, DataQualityPlan
+from agent.PlannerAgent import PlannerAgent, DataQualityPlan, ProfilingTask, QueryTask
 from agent.DataAgent import DataAgent, DataAgentReport
 from agent.DataProfilingAgent import DataProfilingAgent, DataProfilingReport
 from agent.SummarizerAgent import SummarizerAgent, DataQualityAgentReport
 from agent.ReportAgent import ReportAgent, ReportResponse
+from agent.AgentPool import AgentPool
+from agent.DriftDetector import DriftAlert, DriftDetector, rank
+from agent.FindingExtractor import FindingExtractor, InvestigationFinding
+from agent.FollowupQueryRunner import FollowupBudget, FollowupQueryResult, FollowupQueryRunner
+from agent.MapReduceSummarizer import MapReduceSummarizer
+from agent.RemoteTaskExecutor import TASK_PROFILING, TASK_QUERY, RemoteTaskExecutor
+from agent.ReportCatalog import ReportCatalog
+from agent.RuleBasedPlanner import RuleBasedPlanner
+from agent.RunHistory import RunHistory
+from agent.SchemaRegistry import SchemaRegistry
+from agent.tool.CheckSuiteCompiler import CheckResult
+from agent.tool.DataQualityCheckTool import DataQualityCheckTool
+from agent.Tracer import JsonlSpanExporter, Span, Tracer
+from agent.UsageAccountant import RunUsage, UsageAccountant
+from agent.UsageHistory import UsageHistory
+from agent.WorkflowDeadline import WorkflowDeadline
 
 
 class Orchestrator:
@@ -39,43 +58,172 @@ class Orchestrator:
     4. Reporting Phase: ReportAgent generates final HTML report
     
     Attributes:
-        planner_agent: Agent for creating analysis plans
-        data_agent: Agent for executing SQL queries
-        profiling_agent: Agent for data profiling
-        summarizer_agent: Agent for synthesizing findings
-        report_agent: Agent for generating reports
+        planner_agents: Pool of agents creating analysis plans
+        data_agents: Pool of agents executing SQL queries
+        profiling_agents: Pool of agents profiling data
+        summarizer_agents: Pool of agents synthesizing findings
+        report_agents: Pool of agents generating reports
         reports_dir: Directory for storing generated reports
+        incremental_analysis: Whether results are digested into findings as they arrive
+        map_reduce_summarizer: Parallel worker summarizers used for large investigations
+        followup_runner: Executes the SummarizerAgent's follow-up queries within a budget
+        schema: Schema of the table under analysis, shared by all agents and tools
+        trace_exporter: Writes workflow, phase, agent, model and tool spans (None = tracing off)
+        usage_history: SQLite history of the tokens, credits and CPU time of every run
+        report_catalog: Indexed catalog of the reports written to reports_dir
+        run_history: Append-only history of run issues and metrics for trend queries
     """
     
     def __init__(
         self,
         reports_dir: str = "ge_reports",
         max_rounds: int = 7,
-        enable_console_output: bool = True
+        enable_console_output: bool = True,
+        incremental_analysis: bool = False,
+        summarization_fan_out: int = 4,
+        map_reduce_threshold: int = 12,
+        use_rule_based_planner: bool = True,
+        run_check_suite: bool = False,
+        followup_iterations: int = 0,
+        followup_time_budget: float = 300.0,
+        followup_credit_budget: float = 0.5,
+        followup_concurrency: int = 4,
+        schema: Optional[dict] = None,
+        task_timeout: Optional[float] = None,
+        phase_timeout: Optional[float] = None,
+        workflow_timeout: Optional[float] = None,
+        trace_path: Optional[str] = None,
+        usage_history_path: Optional[str] = None,
+        run_history_path: Optional[str] = None,
+        detect_drift: bool = False,
+        max_drift_alerts: int = 10,
+        task_executor: Optional[RemoteTaskExecutor] = None
     ):
         """
-        Initialize the Orchestrator with all required agents.
+        Initialize the Orchestrator. Agents are created lazily on first use and share the
+        process-wide model clients, query engine, profiling tool and schema registry.
         
         Args:
             reports_dir: Directory for storing generated reports
             max_rounds: Maximum number of conversation rounds
             enable_console_output: Whether to print progress to console
+            incremental_analysis: If True, each completed investigation result is mapped to
+                compact findings while the remaining tasks are still running, and the
+                SummarizerAgent reduces those findings instead of the raw results
+            summarization_fan_out: Number of worker SummarizerAgents used in parallel when
+                the analysis is split into chunks (1 disables map-reduce summarization)
+            map_reduce_threshold: Minimum number of results/findings before the analysis is
+                chunked by table and theme instead of sent as one prompt
+            use_rule_based_planner: If True, goals that consist only of a stock template for an
+                intent (completeness, duplicates, validity, consistency, freshness), optionally
+                naming the table or columns, are planned deterministically from the schema; goals
+                asking for anything more and all other goals are sent to the PlannerAgent
+            run_check_suite: If True, the declarative check suite from the schema is compiled
+                into one aggregate query and run alongside the investigation; its metrics
+                are included in the analysis
+            followup_iterations: Maximum number of refinement rounds in which the
+                SummarizerAgent's required_followup_queries are executed and fed back to it
+                (0 disables the loop)
+            followup_time_budget: Wall-clock seconds the refinement loop may take
+            followup_credit_budget: Estimated warehouse credits the follow-up queries may spend
+            followup_concurrency: Maximum number of follow-up queries running at the same time
+            schema: Schema of the table to analyze (same format as metadata/schema.json);
+                defaults to the RIDEBOOKING schema from metadata/schema.json
+            task_timeout: Wall-clock seconds a single agent task may take before its team is
+                stopped via its CancellationToken (None = no limit)
+            phase_timeout: Wall-clock seconds per phase; unfinished tasks are cancelled and the
+                workflow continues with the results completed so far (None = no limit)
+            workflow_timeout: Wall-clock seconds for the whole run; later phases get whatever
+                time is left and the results are marked partial (None = no limit)
+            trace_path: JSONL file (OTLP/JSON) that receives a span per phase, agent run, model
+                call and tool invocation; defaults to the TRACE_PATH env var (unset = no tracing)
+            usage_history_path: SQLite file receiving the usage of every run; defaults to the
+                USAGE_HISTORY_PATH env var, then to usage_history.db in reports_dir
+            run_history_path: SQLite file receiving the issues, check metrics and profile
+                statistics of every saved run for trend queries; defaults to the
+                RUN_HISTORY_PATH env var, then to run_history.db in reports_dir
+            detect_drift: If True, the run's JSON profiles are compared with the previous
+                catalogued profile of the same table (PSI, KS, null rate, cardinality,
+                categories, quantiles) and the top drift alerts are added to the analysis
+            max_drift_alerts: Maximum number of drift alerts added as issues
+            task_executor: Runs the investigation phase's query and profiling tasks instead of
+                this process's agents, e.g. a RemoteTaskExecutor shipping them to TaskWorker
+                processes on other nodes; defaults to the workers in the TASK_WORKERS env var
+                (unset = run the tasks locally)
         """
         self.reports_dir = Path(reports_dir)
         self.reports_dir.mkdir(parents=True, exist_ok=True)
         
         self.max_rounds = max_rounds
+        self.schema = schema if schema is not None else SchemaRegistry.load_schema()
         self.enable_console_output = enable_console_output
-        
-        # Initialize all agents
-        print("🔧 Initializing agents...")
-        self.planner_agent = PlannerAgent().get_agent()
-        self.data_agent = DataAgent().get_agent()
-        self.profiling_agent = DataProfilingAgent(reports_dir=reports_dir).get_agent()
-        self.summarizer_agent = SummarizerAgent().get_agent()
-        self.report_agent = ReportAgent().get_agent()
-        
-        print("✅ All agents initialized successfully")
+        self.incremental_analysis = incremental_analysis
+        self.finding_extractor = FindingExtractor(
+            reports_dir=reports_dir, default_table=self.schema.get("table_name") or "RIDEBOOKING"
+        )
+        self.map_reduce_threshold = map_reduce_threshold
+        self.use_rule_based_planner = use_rule_based_planner
+        self.run_check_suite = run_check_suite
+        self.followup_iterations = followup_iterations
+        self.followup_time_budget = followup_time_budget
+        self.followup_credit_budget = followup_credit_budget
+        self.followup_runner = FollowupQueryRunner(max_concurrency=followup_concurrency)
+        self.task_timeout = task_timeout
+        self.phase_timeout = phase_timeout
+        self.workflow_timeout = workflow_timeout
+        trace_path = trace_path or os.environ.get("TRACE_PATH")
+        self.trace_exporter = JsonlSpanExporter(trace_path) if trace_path else None
+        self.usage_history_path = usage_history_path or os.environ.get("USAGE_HISTORY_PATH") \
+            or str(self.reports_dir / "usage_history.db")
+        self.run_history_path = run_history_path or os.environ.get("RUN_HISTORY_PATH") \
+            or str(self.reports_dir / "run_history.db")
+        self.detect_drift = detect_drift
+        self.max_drift_alerts = max_drift_alerts
+        self.drift_detector = DriftDetector()
+        self.task_executor = task_executor or RemoteTaskExecutor.from_env()
+        self.map_reduce_summarizer = MapReduceSummarizer(
+            worker_factory=lambda index: SummarizerAgent(
+                name=f"SummarizerWorker{index + 1}", schema=self.schema
+            ).get_agent(),
+            fan_out=summarization_fan_out
+        )
+        # Each agent run borrows a reset agent of its own, so concurrent or consecutive goals,
+        # tasks and jobs never see each other's messages
+        self.planner_agents = AgentPool(lambda index: PlannerAgent(schema=self.schema).get_agent())
+        self.data_agents = AgentPool(lambda index: DataAgent(schema=self.schema).get_agent())
+        self.profiling_agents = AgentPool(
+            lambda index: DataProfilingAgent(reports_dir=str(self.reports_dir), schema=self.schema).get_agent()
+        )
+        self.summarizer_agents = AgentPool(lambda index: SummarizerAgent(schema=self.schema).get_agent())
+        self.report_agents = AgentPool(lambda index: ReportAgent().get_agent())
+
+        print("✅ Orchestrator ready (agents are created on first use)")
+
+    @cached_property
+    def rule_based_planner(self) -> RuleBasedPlanner:
+        """Deterministic fast-path planner, created on first use."""
+        return RuleBasedPlanner(schema=self.schema)
+
+    @cached_property
+    def check_tool(self) -> DataQualityCheckTool:
+        """Single-scan check suite runner, created on first use."""
+        return DataQualityCheckTool(schema=self.schema)
+
+    @cached_property
+    def usage_history(self) -> UsageHistory:
+        """Usage history store, opened on first use."""
+        return UsageHistory(self.usage_history_path)
+
+    @cached_property
+    def run_history(self) -> RunHistory:
+        """Run history store, opened on first use."""
+        return RunHistory(self.run_history_path)
+
+    @cached_property
+    def report_catalog(self) -> ReportCatalog:
+        """Catalog of reports_dir, shared with the profiling tool."""
+        return ReportCatalog.get_shared_instance(str(self.reports_dir))
+
     
     async def run_analysis(self, goal: str) -> Dict[str, Any]:
         """
@@ -97,8 +245,21 @@ class Orchestrator:
                 - profiling_results: Results from DataProfilingAgent
                 - analysis: Summary and findings from SummarizerAgent
                 - report: Final HTML report from ReportAgent
+                - check_results: Check suite metrics (when run_check_suite is enabled)
+                - followup_results: Executed follow-up queries (when followup_iterations > 0)
+                - drift_alerts: Ranked profile drift alerts (when detect_drift is enabled)
+                - usage: Tokens, Snowflake credits/bytes scanned and profiling CPU per run,
+                  agent and phase (RunUsage)
+                - timed_out: Phases and tasks cut short by a timeout
+                - partial: True if any timeout was hit (results contain what completed in time)
+                - trace_id: Id of the run's trace (when tracing is enabled)
+                - run_id: Id of the run, also recorded with its reports in the report catalog
                 - success: Whether the workflow completed successfully
         """
+        check_task = None
+        deadline = WorkflowDeadline(self.workflow_timeout)
+        deadline_token = deadline.activate()
+        trace_span, trace_token = self._start_trace("workflow", goal=goal)
         results = {
             "goal": goal,
             "plan": None,
@@ -122,17 +283,40 @@ class Orchestrator:
             
             # Phase 2: Investigation & Profiling
             print("\n🔍 Phase 2: Executing Investigation and Profiling...")
-            investigation_results, profiling_results = await self._run_investigation_phase(plan)
+            findings = None
+            # The compiled check suite is one Snowflake query; run it next to the agents
+            check_task = asyncio.create_task(self._run_check_suite_phase()) if self.run_check_suite else None
+            if self.incremental_analysis:
+                investigation_results, profiling_results, findings = \
+                    await self._run_incremental_investigation_phase(plan)
+                results["findings"] = findings
+            else:
+                investigation_results, profiling_results = await self._run_investigation_phase(plan)
             results["investigation_results"] = investigation_results
             results["profiling_results"] = profiling_results
+            check_results = await self._await_check_suite(check_task)
+            results["check_results"] = check_results
             
             # Phase 3: Analysis & Summarization
             print("\n📊 Phase 3: Analyzing and Summarizing Findings...")
             analysis = await self._run_analysis_phase(
-                goal, plan, investigation_results, profiling_results
+                goal, plan, investigation_results, profiling_results, findings=findings,
+                check_results=check_results
             )
             results["analysis"] = analysis
             
+            # Optional refinement: run the requested follow-up queries and re-summarize
+            if self.followup_iterations > 0 and analysis:
+                print("\n🔁 Running follow-up queries requested by the analysis...")
+                analysis, followup_results = await self._run_followup_phase(goal, analysis)
+                results["analysis"] = analysis
+                results["followup_results"] = followup_results
+            
+            # Optional drift check: compare the run's profiles with the previous ones
+            if self.detect_drift:
+                print("\n📉 Comparing profiles with their baselines...")
+                analysis = await self._apply_drift_detection(analysis, profiling_results, results)
+            
             # Phase 4: Report Generation
             print("\n📄 Phase 4: Generating Final Report...")
             report = await self._run_reporting_phase(
@@ -141,9 +325,15 @@ class Orchestrator:
             results["report"] = report
             
             results["success"] = True
+            results["timed_out"] = deadline.timed_out
+            results["partial"] = bool(deadline.timed_out)
+            results["usage"] = await self._account_usage(trace_span, goal, success=True)
             
             print(f"\n{'='*80}")
-            print("✅ Data Quality Analysis Complete!")
+            if deadline.timed_out:
+                print(f"⏱️ Data Quality Analysis Complete with partial results (timed out: {', '.join(deadline.timed_out)})")
+            else:
+                print("✅ Data Quality Analysis Complete!")
             print(f"{'='*80}\n")
             
             # Save results to file
@@ -152,15 +342,251 @@ class Orchestrator:
             return results
             
         except Exception as e:
+            if check_task and not check_task.done():
+                check_task.cancel()
             print(f"\n❌ Error during analysis: {str(e)}")
             results["error"] = str(e)
             import traceback
             results["traceback"] = traceback.format_exc()
+            trace_span.fail(e)
+            results["usage"] = await self._account_usage(trace_span, goal, success=False)
             return results
+        finally:
+            self._end_trace(trace_span, trace_token, results)
+            deadline.deactivate(deadline_token)
+    
+    def _start_trace(self, name: str, **attributes) -> tuple[Span, Any]:
+        """
+        Start the root span of a run (or a child span when a batch trace is already active).
+        
+        Returns:
+            Tuple of the span and the token for _end_trace
+        """
+        # Spans are always recorded for usage accounting; the trace file is optional
+        exporter = UsageAccountant(self.trace_exporter)
+        span = Tracer.start_span(name, "workflow", exporter=exporter, **attributes)
+        return span, span.activate()
+    
+    async def _account_usage(
+        self,
+        span: Span,
+        goal: str,
+        success: bool,
+        record_history: bool = True
+    ) -> Optional[RunUsage]:
+        """
+        Aggregate the usage recorded under a run's span and store it in the usage history.
+        
+        Snowflake query ids are resolved to bytes scanned and credits with one QUERY_HISTORY
+        lookup; queries that cannot be resolved are counted as unresolved.
+        
+        Args:
+            span: The run's span (started by _start_trace)
+            goal: Goal recorded in the history
+            success: Whether the run completed
+            record_history: Whether to store the usage in the usage history
+            
+        Returns:
+            RunUsage, or None when the span is not accounted
+        """
+        accountant = span.exporter
+        if not isinstance(accountant, UsageAccountant):
+            return None
+        
+        query_stats: Dict[str, dict] = {}
+        query_ids = accountant.query_ids(span)
+        if query_ids:
+            try:
+                from agent.tool.SnowflakeQueryEngine import SnowflakeQueryEngine
+                engine = SnowflakeQueryEngine.get_shared_instance()
+                # run_in_executor does not copy the context: the lookup is not charged to the run
+                lookup = await asyncio.get_running_loop().run_in_executor(None, engine.get_query_stats, query_ids)
+                if lookup["success"]:
+                    query_stats = lookup["queries"]
+                else:
+                    print(f"⚠️ Could not look up query costs: {lookup.get('error')}")
+            except Exception as e:
+                print(f"⚠️ Could not look up query costs: {str(e)}")
+        
+        usage = accountant.summarize(span, query_stats)
+        run = usage.run
+        print(f"💰 Usage: {run.prompt_tokens + run.completion_tokens:,} tokens in {run.model_calls} model calls "
+              f"({run.cache_hits} cached), {run.queries} queries scanning {run.bytes_scanned:,} bytes, "
+              f"~{run.snowflake_credits:.4f} credits, {run.profiling_cpu_seconds:.1f}s profiling CPU")
+        if record_history:
+            try:
+                self.usage_history.record(goal, usage, success)
+            except Exception as e:
+                print(f"⚠️ Could not record usage history: {str(e)}")
+        return usage
+    
+    @staticmethod
+    def _end_trace(span: Span, token: Any, results: Dict[str, Any]) -> None:
+        """Finish a run's span and record its trace id in the results."""
+        span.set(success=results.get("success"), partial=results.get("partial"))
+        span.deactivate(token)
+        span.end()
+        if span.recording:
+            results["trace_id"] = span.trace_id
+            results["run_id"] = span.span_id
+    
+    async def _await_with_budget(self, awaitable, step: str, default: Any = None) -> Any:
+        """
+        Await a phase step within the phase timeout and the remaining workflow time.
+        
+        Args:
+            awaitable: Coroutine to run
+            step: Name recorded when the step times out
+            default: Value returned on timeout
+            
+        Returns:
+            The awaitable's result, or default if it timed out
+        """
+        deadline = WorkflowDeadline.current()
+        timeout = deadline.budget(self.phase_timeout)
+        try:
+            return await asyncio.wait_for(awaitable, timeout)
+        except asyncio.TimeoutError:
+            print(f"⏱️ {step} timed out after {timeout:g}s; continuing with partial results")
+            deadline.record_timeout(step)
+            return default
+    
+    async def _gather_within_budget(self, coroutines: list, step: str) -> list:
+        """
+        Run coroutines concurrently until they finish or the phase budget runs out.
+        
+        Unfinished coroutines are cancelled (stopping their agent teams and Snowflake
+        queries) and reported as None; exceptions are returned in place of results.
+        """
+        deadline = WorkflowDeadline.current()
+        timeout = deadline.budget(self.phase_timeout)
+        tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+        if not tasks:
+            return []
+        done, pending = await asyncio.wait(tasks, timeout=timeout)
+        if pending:
+            print(f"    ⏱️ {step}: {len(pending)} of {len(tasks)} tasks timed out after {timeout:g}s and were cancelled")
+            deadline.record_timeout(step)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        results = []
+        for task in tasks:
+            if task in pending or task.cancelled():
+                results.append(None)
+            else:
+                results.append(task.exception() or task.result())
+        return results
+    
+    async def _run_single_agent_team(
+        self,
+        agent,
+        task: str,
+        output_type: type,
+        max_messages: int
+    ) -> Optional[Any]:
+        """
+        Run a single-agent RoundRobinGroupChat and return its structured output.
+        
+        Args:
+            agent: AutoGen agent to run
+            task: Task description sent to the agent
+            output_type: Pydantic model the agent is expected to produce
+            max_messages: Maximum number of messages before the team terminates
+            
+        Returns:
+            The last message content of type output_type, or None if none was produced or
+            the task exceeded task_timeout
+        """
+        termination = MaxMessageTermination(max_messages=max_messages)
+        team = RoundRobinGroupChat(
+            [agent],
+            termination_condition=termination,
+            custom_message_types=[StructuredMessage[output_type]]
+        )
+        
+        # Cancelling the token stops the team and aborts in-flight Snowflake queries of its tools
+        cancellation_token = CancellationToken()
+        if self.enable_console_output:
+            run = Console(team.run_stream(task=task, cancellation_token=cancellation_token))
+        else:
+            run = team.run(task=task, cancellation_token=cancellation_token)
+        
+        deadline = WorkflowDeadline.current()
+        timeout = deadline.budget(self.task_timeout)
+        # The team's runtime is started inside the span, so model and tool spans nest under it
+        with Tracer.span(f"agent:{agent.name}", "agent", output_type=output_type.__name__) as span:
+            run_task = asyncio.ensure_future(run)
+            try:
+                done, _ = await asyncio.wait([run_task], timeout=timeout)
+            except asyncio.CancelledError:
+                await self._stop_team_run(run_task, cancellation_token)
+                raise
+            if not done:
+                await self._stop_team_run(run_task, cancellation_token)
+                print(f"    ⏱️ {agent.name} task timed out after {timeout:g}s and was cancelled")
+                deadline.record_timeout(f"{agent.name} task")
+                span.set(timed_out=True)
+                return None
+            result = run_task.result()
+            span.set(messages=len(result.messages))
+        
+        for message in reversed(result.messages):
+            if hasattr(message, 'content') and isinstance(message.content, output_type):
+                return message.content
+        return None
+    
+    async def _run_pooled_agent(
+        self,
+        pool: AgentPool,
+        task: str,
+        output_type: type,
+        max_messages: int
+    ) -> Optional[Any]:
+        """Run a task on a freshly reset agent borrowed from pool (see _run_single_agent_team)."""
+        async with pool.agent() as agent:
+            return await self._run_single_agent_team(agent, task, output_type, max_messages)
+    
+    async def _run_remote_task(self, kind: str, task, output_type: type) -> Optional[Any]:
+        """
+        Run a task through the task executor within task_timeout and the remaining workflow time.
+        
+        The worker keeps heartbeating while its agent runs, so without this bound a stuck remote
+        agent would block the phase; the budget is also sent to the worker, which cancels the task.
+        
+        Returns:
+            The report, or None if the task timed out
+        """
+        deadline = WorkflowDeadline.current()
+        timeout = deadline.budget(self.task_timeout)
+        try:
+            return await asyncio.wait_for(self.task_executor.execute(kind, task, output_type, timeout=timeout), timeout)
+        except asyncio.TimeoutError:
+            print(f"    ⏱️ Remote {kind} task timed out after {timeout:g}s and was cancelled")
+            deadline.record_timeout(f"remote {kind} task")
+            return None
+    
+    @staticmethod
+    async def _stop_team_run(run_task: asyncio.Future, cancellation_token: CancellationToken) -> None:
+        """
+        Stop a running team through its cancellation token.
+        
+        The token interrupts the agent's model call and tool calls (including Snowflake queries)
+        so the team shuts down cleanly; the task itself is only cancelled if it has not finished
+        within a short grace period.
+        """
+        cancellation_token.cancel()
+        done, _ = await asyncio.wait([run_task], timeout=5.0)
+        if not done:
+            run_task.cancel()
+        elif not run_task.cancelled():
+            run_task.exception()  # Retrieved so asyncio does not log it as unhandled
     
+    @Tracer.traced("phase:planning")
     async def _run_planning_phase(self, goal: str) -> Optional[DataQualityPlan]:
         """
-        Phase 1: Create execution plan using PlannerAgent.
+        Phase 1: Create execution plan with the rule-based planner, or PlannerAgent for
+        goals that match no stock intent.
         
         Args:
             goal: Data quality goal to plan for
@@ -169,29 +595,24 @@ class Orchestrator:
             DataQualityPlan object or None if planning failed
         """
         try:
-            
-            # Create a single-agent team for planning
-            termination = MaxMessageTermination(max_messages=3)
-            team = RoundRobinGroupChat(
-                [self.planner_agent],
-                termination_condition=termination,
-                custom_message_types=[StructuredMessage[DataQualityPlan]]
-            )
-            
-            # Run planning
+            if self.use_rule_based_planner:
+                plan = self.rule_based_planner.plan(goal)
+                if plan:
+                    print(f"⚡ Plan created by rule-based planner: {len(plan.query_tasks)} query tasks, "
+                          f"{len(plan.profiling_tasks)} profiling tasks")
+                    return plan
+
+            # Run planning with a single-agent team
             task = f"Create a comprehensive execution plan for this data quality goal: {goal}"
+            plan = await self._await_with_budget(
+                self._run_pooled_agent(self.planner_agents, task, DataQualityPlan, max_messages=3),
+                "Planning phase"
+            )
             
-            if self.enable_console_output:
-                result = await Console(team.run_stream(task=task))
-            else:
-                result = await team.run(task=task)
-            
-            # Extract the plan from the last message
-            for message in reversed(result.messages):
-                if hasattr(message, 'content') and isinstance(message.content, DataQualityPlan):
-                    print(f"✅ Plan created: {len(message.content.query_tasks)} query tasks, "
-                          f"{len(message.content.profiling_tasks)} profiling tasks")
-                    return message.content
+            if plan:
+                print(f"✅ Plan created: {len(plan.query_tasks)} query tasks, "
+                      f"{len(plan.profiling_tasks)} profiling tasks")
+                return plan
             
             print("⚠️ Warning: Could not extract plan from planner response")
             return None
@@ -200,6 +621,68 @@ class Orchestrator:
             print(f"❌ Planning phase failed: {str(e)}")
             raise
     
+    async def run_task(self, kind: str, task: Dict[str, Any]) -> Optional[Any]:
+        """
+        Run one query or profiling task as shipped by a RemoteTaskExecutor.
+        
+        Args:
+            kind: "query" or "profiling"
+            task: The QueryTask or ProfilingTask as a dict
+            
+        Returns:
+            DataAgentReport or DataProfilingReport, or None if the agent produced none
+        """
+        if kind == TASK_QUERY:
+            return await self._execute_query_task(QueryTask.model_validate(task))
+        if kind == TASK_PROFILING:
+            return await self._execute_profiling_task(ProfilingTask.model_validate(task))
+        raise ValueError(f"Unknown task kind: {kind}")
+    
+    async def _execute_query_task(self, query_task) -> Optional[DataAgentReport]:
+        """Run the DataAgent (or the task executor) for a single query task and return its report."""
+        print(f"    🔄 Starting query task: {query_task.goal}")
+        
+        # Create task for this specific query
+        query_task_str = f"""Execute this specific data quality query task:
+                        Goal: {query_task.goal}
+                        """
+        
+        if self.task_executor is not None:
+            report = await self._run_remote_task(TASK_QUERY, query_task, DataAgentReport)
+        else:
+            report = await self._run_pooled_agent(
+                self.data_agents, query_task_str, DataAgentReport, max_messages=5
+            )
+        
+        if report:
+            print(f"    ✅ Completed query task: {query_task.goal}")
+        else:
+            print(f"    ⚠️ No result for query task: {query_task.goal}")
+        return report
+    
+    async def _execute_profiling_task(self, profiling_task) -> Optional[DataProfilingReport]:
+        """Run the DataProfilingAgent (or the task executor) for a single profiling task and return its report."""
+        print(f"    🔄 Starting profiling task: {profiling_task.goal}")
+        
+        # Create task for this specific profiling
+        profiling_task_str = f"""Execute this specific data profiling task:
+                            Goal: {profiling_task.goal}
+                            """
+        
+        if self.task_executor is not None:
+            report = await self._run_remote_task(TASK_PROFILING, profiling_task, DataProfilingReport)
+        else:
+            report = await self._run_pooled_agent(
+                self.profiling_agents, profiling_task_str, DataProfilingReport, max_messages=5
+            )
+        
+        if report:
+            print(f"    ✅ Completed profiling task: {profiling_task.goal}")
+        else:
+            print(f"    ⚠️ No result for profiling task: {profiling_task.goal}")
+        return report
+    
+    @Tracer.traced("phase:investigation")
     async def _run_investigation_phase(
         self,
         plan: Optional[DataQualityPlan]
@@ -220,76 +703,14 @@ class Orchestrator:
             return None, None
         
         try:
-            # Helper function to execute a single query task
-            async def execute_query_task(query_task):
-                print(f"    🔄 Starting query task: {query_task.goal}")
-                
-                # Create task for this specific query
-                query_task_str = f"""Execute this specific data quality query task:
-                                Goal: {query_task.goal}
-                                """
-                
-                # Run DataAgent for this task
-                termination = MaxMessageTermination(max_messages=5)
-                team = RoundRobinGroupChat(
-                    [self.data_agent],
-                    termination_condition=termination,
-                    custom_message_types=[StructuredMessage[DataAgentReport]]
-                )
-                
-                if self.enable_console_output:
-                    result = await Console(team.run_stream(task=query_task_str))
-                else:
-                    result = await team.run(task=query_task_str)
-                
-                # Extract and return result
-                for message in reversed(result.messages):
-                    if hasattr(message, 'content') and isinstance(message.content, DataAgentReport):
-                        print(f"    ✅ Completed query task: {query_task.goal}")
-                        return message.content
-                
-                print(f"    ⚠️ No result for query task: {query_task.goal}")
-                return None
-            
-            # Helper function to execute a single profiling task
-            async def execute_profiling_task(profiling_task):
-                print(f"    🔄 Starting profiling task: {profiling_task.goal}")
-                
-                # Create task for this specific profiling
-                profiling_task_str = f"""Execute this specific data profiling task:
-                                    Goal: {profiling_task.goal}
-                                    """
-                
-                # Run DataProfilingAgent for this task
-                termination = MaxMessageTermination(max_messages=5)
-                team = RoundRobinGroupChat(
-                    [self.profiling_agent],
-                    termination_condition=termination,
-                    custom_message_types=[StructuredMessage[DataProfilingReport]]
-                )
-                
-                if self.enable_console_output:
-                    result = await Console(team.run_stream(task=profiling_task_str))
-                else:
-                    result = await team.run(task=profiling_task_str)
-                
-                # Extract and return result
-                for message in reversed(result.messages):
-                    if hasattr(message, 'content') and isinstance(message.content, DataProfilingReport):
-                        print(f"    ✅ Completed profiling task: {profiling_task.goal}")
-                        return message.content
-                
-                print(f"    ⚠️ No result for profiling task: {profiling_task.goal}")
-                return None
-            
             # Execute all query tasks concurrently
             all_investigation_results = []
             if plan.query_tasks:
                 print(f"  📊 Executing {len(plan.query_tasks)} query tasks concurrently...")
-                query_coroutines = [execute_query_task(task) for task in plan.query_tasks]
-                query_results = await asyncio.gather(*query_coroutines, return_exceptions=True)
+                query_coroutines = [self._execute_query_task(task) for task in plan.query_tasks]
+                query_results = await self._gather_within_budget(query_coroutines, "Investigation phase (queries)")
                 
-                # Filter out None values and exceptions
+                # Filter out None values (including timed out tasks) and exceptions
                 for result in query_results:
                     if isinstance(result, Exception):
                         print(f"    ❌ Query task failed with error: {str(result)}")
@@ -300,10 +721,10 @@ class Orchestrator:
             all_profiling_results = []
             if plan.profiling_tasks:
                 print(f"  📈 Executing {len(plan.profiling_tasks)} profiling tasks concurrently...")
-                profiling_coroutines = [execute_profiling_task(task) for task in plan.profiling_tasks]
-                profiling_results = await asyncio.gather(*profiling_coroutines, return_exceptions=True)
+                profiling_coroutines = [self._execute_profiling_task(task) for task in plan.profiling_tasks]
+                profiling_results = await self._gather_within_budget(profiling_coroutines, "Investigation phase (profiling)")
                 
-                # Filter out None values and exceptions
+                # Filter out None values (including timed out tasks) and exceptions
                 for result in profiling_results:
                     if isinstance(result, Exception):
                         print(f"    ❌ Profiling task failed with error: {str(result)}")
@@ -322,12 +743,98 @@ class Orchestrator:
             print(f"❌ Investigation phase failed: {str(e)}")
             raise
     
+    @Tracer.traced("phase:investigation")
+    async def _run_incremental_investigation_phase(
+        self,
+        plan: Optional[DataQualityPlan]
+    ) -> tuple[Optional[list], Optional[list], Optional[list[InvestigationFinding]]]:
+        """
+        Phase 2 (incremental mode): execute all tasks and digest results as they arrive.
+        
+        Query and profiling tasks run concurrently. Every completed report is handed to
+        the FindingExtractor (map step) on a worker thread immediately, so parsing the
+        profiling JSON and compacting query summaries overlaps with the slowest tasks.
+        
+        Args:
+            plan: Execution plan from PlannerAgent
+            
+        Returns:
+            Tuple of (investigation results, profiling results, findings), with None for empty lists
+        """
+        if not plan:
+            print("⚠️ Skipping investigation phase - no plan available")
+            return None, None, None
+        
+        try:
+            print(f"  📊 Executing {len(plan.query_tasks)} query tasks and "
+                  f"{len(plan.profiling_tasks)} profiling tasks concurrently (incremental analysis)...")
+            
+            pending = [asyncio.ensure_future(self._execute_query_task(task)) for task in plan.query_tasks]
+            pending += [asyncio.ensure_future(self._execute_profiling_task(task)) for task in plan.profiling_tasks]
+            
+            all_investigation_results = []
+            all_profiling_results = []
+            map_steps = []
+            
+            deadline = WorkflowDeadline.current()
+            timeout = deadline.budget(self.phase_timeout)
+            for next_done in asyncio.as_completed(pending, timeout=timeout):
+                try:
+                    result = await next_done
+                except asyncio.TimeoutError:
+                    # as_completed raises once the phase budget is spent; keep what finished
+                    unfinished = [task for task in pending if not task.done()]
+                    print(f"    ⏱️ {len(unfinished)} of {len(pending)} tasks timed out after {timeout:g}s and were cancelled")
+                    deadline.record_timeout("Investigation phase")
+                    for task in unfinished:
+                        task.cancel()
+                    await asyncio.gather(*unfinished, return_exceptions=True)
+                    break
+                except Exception as e:
+                    print(f"    ❌ Task failed with error: {str(e)}")
+                    continue
+                if result is None:
+                    continue
+                
+                if isinstance(result, DataProfilingReport):
+                    all_profiling_results.append(result)
+                else:
+                    all_investigation_results.append(result)
+                
+                # Map step: extract compact findings without blocking the event loop
+                map_steps.append(asyncio.ensure_future(
+                    asyncio.to_thread(self.finding_extractor.extract, result)
+                ))
+            
+            findings = []
+            for extracted in await asyncio.gather(*map_steps, return_exceptions=True):
+                if isinstance(extracted, Exception):
+                    print(f"    ⚠️ Finding extraction failed: {str(extracted)}")
+                else:
+                    findings.extend(extracted)
+            
+            print(f"  ✅ Investigation phase completed: {len(all_investigation_results)} query results, "
+                  f"{len(all_profiling_results)} profiling results, {len(findings)} findings extracted")
+            
+            return (
+                all_investigation_results or None,
+                all_profiling_results or None,
+                findings or None
+            )
+            
+        except Exception as e:
+            print(f"❌ Investigation phase failed: {str(e)}")
+            raise
+    
+    @Tracer.traced("phase:analysis")
     async def _run_analysis_phase(
         self,
         goal: str,
         plan: Optional[DataQualityPlan],
         investigation_results: Optional[DataAgentReport],
-        profiling_results: Optional[DataProfilingReport]
+        profiling_results: Optional[DataProfilingReport],
+        findings: Optional[list[InvestigationFinding]] = None,
+        check_results: Optional[list[CheckResult]] = None
     ) -> Optional[DataQualityAgentReport]:
         """
         Phase 3: Synthesize findings using SummarizerAgent.
@@ -337,33 +844,51 @@ class Orchestrator:
             plan: Execution plan
             investigation_results: Results from DataAgent
             profiling_results: Results from DataProfilingAgent
+            findings: Pre-digested findings from incremental analysis (optional)
+            check_results: Metrics from the compiled check suite (optional)
             
         Returns:
             DataQualityAgentReport or None if analysis failed
         """
         try:
-            # Create analysis task with results from investigation phase
-            task = self._create_analysis_task(goal, plan, investigation_results, profiling_results)
-            
-            # Create single-agent team for summarization
-            termination = MaxMessageTermination(max_messages=5)
-            team = RoundRobinGroupChat(
-                [self.summarizer_agent],
-                termination_condition=termination,
-                custom_message_types=[StructuredMessage[DataQualityAgentReport]]
-            )
+            check_findings = self.finding_extractor.extract_from_check_results(
+                check_results, self.check_tool.schema.get("table_name")
+            ) if check_results else []
+
+            # Large investigations are summarized hierarchically by parallel workers
+            if self._should_map_reduce(investigation_results, profiling_results, findings):
+                if not findings:
+                    findings = await self._extract_findings(investigation_results, profiling_results)
+                findings = findings + check_findings
+                print(f"  🧩 Summarizing {len(findings)} findings with up to "
+                      f"{self.map_reduce_summarizer.fan_out} parallel summarizers...")
+                analysis = await self._await_with_budget(
+                    self.map_reduce_summarizer.summarize(goal, findings, self._run_single_agent_team),
+                    "Analysis phase"
+                )
+                if analysis:
+                    print(f"✅ Analysis completed: {len(analysis.issues)} issues identified")
+                    return analysis
+                print("⚠️ Warning: Map-reduce summarization produced no analysis")
+                return None
             
-            # Run analysis
-            if self.enable_console_output:
-                result = await Console(team.run_stream(task=task))
+            # Create analysis task with results (or digested findings) from investigation phase
+            if findings:
+                task = self._create_findings_analysis_task(goal, findings + check_findings)
             else:
-                result = await team.run(task=task)
+                task = self._create_analysis_task(
+                    goal, plan, investigation_results, profiling_results, check_results
+                )
             
-            # Extract analysis
-            for message in reversed(result.messages):
-                if hasattr(message, 'content') and isinstance(message.content, DataQualityAgentReport):
-                    print(f"✅ Analysis completed: {len(message.content.issues)} issues identified")
-                    return message.content
+            # Run analysis with a single-agent team
+            analysis = await self._await_with_budget(
+                self._run_pooled_agent(self.summarizer_agents, task, DataQualityAgentReport, max_messages=5),
+                "Analysis phase"
+            )
+            
+            if analysis:
+                print(f"✅ Analysis completed: {len(analysis.issues)} issues identified")
+                return analysis
             
             print("⚠️ Warning: Could not extract analysis from summarizer response")
             return None
@@ -372,6 +897,200 @@ class Orchestrator:
             print(f"❌ Analysis phase failed: {str(e)}")
             raise
     
+    @Tracer.traced("phase:check_suite")
+    async def _run_check_suite_phase(self) -> Optional[list[CheckResult]]:
+        """Run the schema's check suite as one aggregate query on a worker thread."""
+        cancellation_token = CancellationToken()
+        try:
+            check_results = await asyncio.to_thread(self.check_tool.run_default_suite, cancellation_token)
+        except asyncio.CancelledError:
+            cancellation_token.cancel()
+            raise
+        except Exception as e:
+            print(f"⚠️ Check suite failed: {str(e)}")
+            return None
+        if not check_results:
+            print("⚠️ Check suite produced no results")
+            return None
+        failed = sum(1 for result in check_results if result.passed is False)
+        print(f"  ✅ Check suite: {len(check_results)} checks in one scan, {failed} failed")
+        return check_results
+    
+    @Tracer.traced("phase:followup")
+    async def _run_followup_phase(
+        self,
+        goal: str,
+        analysis: DataQualityAgentReport
+    ) -> tuple[DataQualityAgentReport, list[FollowupQueryResult]]:
+        """
+        Refinement loop: execute the analysis' follow-up queries and let the SummarizerAgent
+        refine its report with the results.
+        
+        Stops when no new valid queries are requested, a round produces no usable results,
+        or the iteration, time or credit budget is exhausted.
+        
+        Args:
+            goal: Original data quality goal
+            analysis: Analysis produced by Phase 3
+            
+        Returns:
+            Tuple of the (possibly refined) analysis and all follow-up query results
+        """
+        budget = FollowupBudget(
+            max_iterations=self.followup_iterations,
+            max_seconds=WorkflowDeadline.current().budget(self.followup_time_budget),
+            max_credits=self.followup_credit_budget
+        )
+        seen: set[str] = set()
+        executed: list[FollowupQueryResult] = []
+        
+        while True:
+            reason = budget.exhausted()
+            if reason:
+                print(f"  ⏹️ Follow-up loop stopped: {reason}")
+                break
+            iteration = budget.iterations + 1
+            queries, rejected = self.followup_runner.select_queries(
+                analysis.required_followup_queries, seen, iteration
+            )
+            executed.extend(rejected)
+            for result in rejected:
+                print(f"  ⚠️ {result.error}: {result.sql[:80]}")
+            if not queries:
+                print("  ✅ No new follow-up queries requested")
+                break
+            
+            print(f"  🔄 Follow-up round {iteration}: running {len(queries)} queries")
+            round_results = await self.followup_runner.run_queries(queries, budget, iteration)
+            executed.extend(round_results)
+            budget.iterations = iteration
+            succeeded = [result for result in round_results if result.success]
+            print(f"  ✅ {len(succeeded)}/{len(round_results)} follow-up queries succeeded "
+                  f"({budget.credits_spent:.4f} credits estimated so far)")
+            if not succeeded:
+                break
+            
+            remaining = budget.remaining_seconds()
+            if remaining <= 0:
+                print(f"  ⏹️ Follow-up loop stopped: time budget of {budget.max_seconds:g}s reached before refinement")
+                break
+            task = self._create_followup_analysis_task(goal, analysis, round_results)
+            try:
+                # Bounded by the loop's time budget as well as task_timeout and the workflow deadline
+                refined = await asyncio.wait_for(
+                    self._run_pooled_agent(self.summarizer_agents, task, DataQualityAgentReport, max_messages=5),
+                    remaining
+                )
+            except asyncio.TimeoutError:
+                print(f"  ⏱️ Refinement timed out after {remaining:.1f}s (follow-up time budget); "
+                      f"keeping the previous analysis")
+                WorkflowDeadline.current().record_timeout("followup refinement")
+                break
+            if not refined:
+                print("⚠️ Warning: Could not extract refined analysis; keeping the previous one")
+                break
+            analysis = refined
+            print(f"  ✅ Analysis refined: {len(analysis.issues)} issues identified")
+        
+        return analysis, executed
+    
+    @Tracer.traced("phase:drift")
+    async def _run_drift_phase(self, profiling_results: Optional[list[DataProfilingReport]]) -> list[DriftAlert]:
+        """
+        Compare each JSON profile of the run with the previous profile of the same table.
+        
+        The baseline is the newest catalogued JSON profile of the table written before the
+        current one by another run. Only stored profile statistics are compared.
+        
+        Args:
+            profiling_results: Profiling reports of the run
+            
+        Returns:
+            list[DriftAlert]: Alerts of all profiles, most severe first
+        """
+        current_paths = [
+            task.json_report_path
+            for report in profiling_results or []
+            for task in report.tasks_executed
+            if task.json_report_path and Path(task.json_report_path).is_file()
+        ]
+        
+        def compare_all() -> list[DriftAlert]:
+            alerts = []
+            for current_path in current_paths:
+                entry = self.report_catalog.get(current_path)
+                table = (entry or {}).get("table_name") or self.schema.get("table_name") or ""
+                baseline = next((
+                    candidate for candidate in self.report_catalog.find(kind="profile", table_name=table, format="json")
+                    if candidate["created_at"] < (entry or {}).get("created_at", float("inf"))
+                    and candidate["path"] != str(Path(current_path).resolve())
+                    and (candidate["run_id"] is None or candidate["run_id"] != (entry or {}).get("run_id"))
+                    and Path(candidate["path"]).is_file()
+                ), None)
+                if baseline is None:
+                    print(f"  ℹ️ No baseline profile for {table}; drift check skipped")
+                    continue
+                alerts.extend(self.drift_detector.compare_files(baseline["path"], current_path, table=table))
+            return rank(alerts)
+        
+        alerts = await asyncio.to_thread(compare_all)
+        print(f"  📉 {len(alerts)} drift alerts from {len(current_paths)} profiles")
+        return alerts
+    
+    async def _apply_drift_detection(
+        self,
+        analysis: Optional[DataQualityAgentReport],
+        profiling_results: Optional[list[DataProfilingReport]],
+        results: Dict[str, Any]
+    ) -> Optional[DataQualityAgentReport]:
+        """Run the drift phase, store its alerts in results and add the top ones to the analysis issues."""
+        try:
+            alerts = await self._await_with_budget(self._run_drift_phase(profiling_results), "Drift detection", [])
+        except Exception as e:
+            print(f"⚠️ Drift detection failed: {str(e)}")
+            alerts = []
+        results["drift_alerts"] = alerts
+        if analysis and alerts:
+            drift_issues = [alert.to_issue() for alert in alerts[:self.max_drift_alerts]]
+            analysis = analysis.model_copy(update={"issues": list(analysis.issues) + drift_issues})
+            results["analysis"] = analysis
+        return analysis
+    
+    async def _await_check_suite(self, check_task: Optional[asyncio.Task]) -> Optional[list[CheckResult]]:
+        """Wait for the check suite started in Phase 2 within the phase budget."""
+        if check_task is None:
+            return None
+        return await self._await_with_budget(check_task, "Check suite")
+    
+    def _should_map_reduce(
+        self,
+        investigation_results: Optional[list],
+        profiling_results: Optional[list],
+        findings: Optional[list[InvestigationFinding]]
+    ) -> bool:
+        """Decide whether the analysis is large enough for map-reduce summarization."""
+        if self.map_reduce_summarizer.fan_out <= 1:
+            return False
+        if findings:
+            result_count = len(findings)
+        else:
+            result_count = sum(len(report.tasks_executed) for report in investigation_results or [])
+            result_count += sum(len(report.tasks_executed) for report in profiling_results or [])
+        return result_count >= self.map_reduce_threshold
+    
+    async def _extract_findings(
+        self,
+        investigation_results: Optional[list],
+        profiling_results: Optional[list]
+    ) -> list[InvestigationFinding]:
+        """Map all investigation and profiling reports to findings on worker threads."""
+        reports = list(investigation_results or []) + list(profiling_results or [])
+        extracted = await asyncio.gather(
+            *(asyncio.to_thread(self.finding_extractor.extract, report) for report in reports)
+        )
+        return [finding for report_findings in extracted for finding in report_findings]
+    
+    @Tracer.traced("phase:reporting")
     async def _run_reporting_phase(
         self,
         goal: str,
@@ -397,29 +1116,17 @@ class Orchestrator:
             # Create task with all context
             task = self._create_reporting_task(goal, plan, investigation_results, profiling_results, analysis)
             
-            # Create single-agent team for reporting
-            termination = MaxMessageTermination(max_messages=3)
-            team = RoundRobinGroupChat(
-                [self.report_agent],
-                termination_condition=termination,
-                custom_message_types=[StructuredMessage[ReportResponse]]
+            # Run reporting with a single-agent team
+            response = await self._await_with_budget(
+                self._run_pooled_agent(self.report_agents, task, ReportResponse, max_messages=3),
+                "Reporting phase"
             )
             
-            # Run reporting
-            if self.enable_console_output:
-                result = await Console(team.run_stream(task=task))
-            else:
-                result = await team.run(task=task)
-            
-            # Extract report
-            for message in reversed(result.messages):
-                if hasattr(message, 'content') and isinstance(message.content, ReportResponse):
-                    html_report = message.content.html
-                    if html_report:
-                        # Save HTML report to file
-                        report_path = self._save_html_report(html_report, goal)
-                        print(f"✅ Report generated and saved to: {report_path}")
-                        return html_report
+            if response and response.html:
+                # Save HTML report to file
+                report_path = self._save_html_report(response.html, goal)
+                print(f"✅ Report generated and saved to: {report_path}")
+                return response.html
             
             print("⚠️ Warning: Could not extract report from report agent response")
             return None
@@ -433,7 +1140,8 @@ class Orchestrator:
         goal: str,
         plan: Optional[DataQualityPlan],
         investigation_results: Optional[list],
-        profiling_results: Optional[list]
+        profiling_results: Optional[list],
+        check_results: Optional[list[CheckResult]] = None
     ) -> str:
         """Create task description for analysis phase."""
         task = f"""Analyze the following data quality investigation results and provide comprehensive insights:
@@ -469,6 +1177,16 @@ class Orchestrator:
                     task += f"  JSON Report: {prof.json_report_path}\n"
                     profile_num += 1
         
+        if check_results:
+            failed = [result for result in check_results if result.passed is False]
+            task += f"\nCheck Suite Metrics ({len(check_results)} checks in one scan, {len(failed)} failed):\n"
+            for result in check_results:
+                if result.failed_count == 0:
+                    continue
+                status = "FAILED" if result.passed is False else ("ok" if result.passed else "info")
+                task += (f"- [{status}] {result.name}: {result.failed_count}/{result.total_count} rows "
+                         f"({result.failed_pct:.2f}%) | {result.expression}\n")
+        
         task += "\n\nPlease analyze these results and provide:\n"
         task += "1. A comprehensive summary of data quality findings\n"
         task += "2. List of identified issues with severity levels\n"
@@ -477,6 +1195,69 @@ class Orchestrator:
         
         return task
     
+    def _create_findings_analysis_task(
+        self,
+        goal: str,
+        findings: list[InvestigationFinding]
+    ) -> str:
+        """Create task description for the reduce step over pre-digested findings."""
+        task = f"""Analyze the following pre-digested data quality findings and provide comprehensive insights:
+
+        Original Goal: {goal}
+
+        """
+        task += f"Findings ({len(findings)} total, extracted from query and profiling results):\n"
+        
+        for num, finding in enumerate(findings, 1):
+            task += f"\nFinding {num} [{finding.source} | {finding.table} | {finding.theme}]: {finding.goal}\n"
+            task += f"  Evidence: {finding.evidence_query}\n"
+            task += f"  Rows: {finding.row_count}\n"
+            task += f"  Observation: {finding.observation}\n"
+        
+        task += "\n\nThe profiling statistics are already summarized above; only read a profiling JSON report if a finding is ambiguous.\n"
+        task += "Please analyze these findings and provide:\n"
+        task += "1. A comprehensive summary of data quality findings\n"
+        task += "2. List of identified issues with severity levels\n"
+        task += "3. Prioritized recommendations for remediation\n"
+        task += "4. Any follow-up queries needed for deeper investigation\n"
+        
+        return task
+    
+    def _create_followup_analysis_task(
+        self,
+        goal: str,
+        analysis: DataQualityAgentReport,
+        followup_results: list[FollowupQueryResult]
+    ) -> str:
+        """Create task description for refining an analysis with follow-up query results."""
+        task = f"""Refine your previous data quality analysis using the results of the follow-up queries you requested:
+
+        Original Goal: {goal}
+
+        """
+        task += f"Previous Summary:\n{analysis.summary}\n\n"
+        task += "Previous Issues:\n"
+        for num, issue in enumerate(analysis.issues, 1):
+            task += f"{num}. [{issue.severity}] {issue.type}: {issue.evidence_description}\n"
+        
+        task += f"\nFollow-up Query Results ({len(followup_results)} queries, rows capped at {self.followup_runner.max_rows}):\n"
+        for num, result in enumerate(followup_results, 1):
+            task += f"\nFollow-up {num}:\n"
+            task += f"  SQL: {result.sql}\n"
+            if result.success:
+                task += f"  Rows: {result.row_count}, Columns: {', '.join(result.columns)}\n"
+                task += f"  Sample: {result.rows_preview}\n"
+            else:
+                task += f"  Error: {result.error}\n"
+        
+        task += "\n\nPlease return the complete updated report:\n"
+        task += "1. Update the summary, issues and severities with the new evidence\n"
+        task += "2. Keep issues that the follow-up results do not contradict\n"
+        task += "3. Update the prioritized recommendations\n"
+        task += "4. Only list follow-up queries that are still needed and were not run above\n"
+        
+        return task
+    
     def _create_reporting_task(
         self,
         goal: str,
@@ -541,12 +1322,22 @@ class Orchestrator:
         safe_goal = "".join(c if c.isalnum() or c in (' ', '_') else '_' for c in goal)
         safe_goal = safe_goal[:50]  # Limit length
         filename = f"data_quality_report_{safe_goal}_{timestamp}.html"
-        report_path = self.reports_dir / filename
+        report_path = self._unique_path(self.reports_dir / filename)
         
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(html)
-        
-        return report_path
+        return self.report_catalog.write_text(
+            report_path, html, "report",
+            goal=goal, table_name=self.schema.get("table_name"), run_id=Tracer.run_id()
+        )
+    
+    @staticmethod
+    def _unique_path(path: Path) -> Path:
+        """Return path, or path with a numeric suffix if a file saved in the same second exists."""
+        candidate = path
+        counter = 2
+        while candidate.exists():
+            candidate = path.with_name(f"{path.stem}_{counter}{path.suffix}")
+            counter += 1
+        return candidate
     
     def _save_results(self, results: Dict[str, Any]) -> None:
         """Save complete workflow results to JSON file."""
@@ -583,14 +1374,40 @@ class Orchestrator:
             else:
                 json_results["profiling_results"] = results["profiling_results"].model_dump() if hasattr(results["profiling_results"], "model_dump") else str(results["profiling_results"])
         
+        if results.get("check_results"):
+            json_results["check_results"] = [r.model_dump() for r in results["check_results"]]
+        
+        if results.get("followup_results"):
+            json_results["followup_results"] = [r.model_dump() for r in results["followup_results"]]
+        
+        if results.get("drift_alerts"):
+            json_results["drift_alerts"] = [a.model_dump() for a in results["drift_alerts"]]
+        
+        if results.get("findings"):
+            json_results["findings"] = [f.model_dump() for f in results["findings"]]
+        
         if results.get("analysis"):
             json_results["analysis"] = results["analysis"].model_dump() if hasattr(results["analysis"], "model_dump") else str(results["analysis"])
         
+        if results.get("usage"):
+            json_results["usage"] = results["usage"].model_dump()
+        
         if results.get("error"):
             json_results["error"] = results["error"]
         
-        results_path = self.reports_dir / f"workflow_results_{timestamp}.json"
-        with open(results_path, 'w', encoding='utf-8') as f:
-            json.dump(json_results, f, indent=2, ensure_ascii=False)
+        run_id = Tracer.run_id()
+        if run_id:
+            json_results["run_id"] = run_id
+        
+        results_path = self._unique_path(self.reports_dir / f"workflow_results_{timestamp}.json")
+        self.report_catalog.write_text(
+            results_path, json.dumps(json_results, indent=2, ensure_ascii=False), "results",
+            goal=results["goal"], table_name=self.schema.get("table_name"), run_id=run_id
+        )
         
-        print(f"📁 Workflow results saved to: {results_path}")
\ No newline at end of file
+        print(f"📁 Workflow results saved to: {results_path}")
+        
+        try:
+            self.run_history.record(json_results, table_name=self.schema.get("table_name"))
+        except Exception as e:
+            print(f"⚠️ Could not record run history: {str(e)}")
\ No newline at end of file
@@ -1,8 +1,8 @@
 import json
-import os
 from pydantic import BaseModel
 from autogen_agentchat.agents import AssistantAgent
 from agent.model.ModelFactory import ModelFactory
+from agent.SchemaRegistry import SchemaRegistry
 
 
 class QueryTask(BaseModel):
@@ -38,16 +38,17 @@ class PlannerAgent:
     - Provides clear success criteria
     """
 
-    def __init__(self, name="PlannerAgent", system_message=None):
+    def __init__(self, name="PlannerAgent", system_message=None, schema=None):
         """
         Initialize the PlannerAgent.
         
         Args:
             name (str): Name of the agent
             system_message (str): Custom system message/prompt for the agent
+            schema (dict): Table schema to plan for (defaults to metadata/schema.json)
         """
         self.model = ModelFactory.get_model()
-        self.schema = self._load_schema()
+        self.schema = schema if schema is not None else SchemaRegistry.load_schema()
         
         self.agent = AssistantAgent(
             name=name,
@@ -59,18 +60,6 @@ class PlannerAgent:
             output_content_type=DataQualityPlan
         )
     
-    def _load_schema(self) -> dict:
-        """Load table schema from metadata/schema.json"""
-        schema_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'metadata', 'schema.json')
-        try:
-            with open(schema_path, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            print(f"Warning: Schema file not found at {schema_path}")
-            return {}
-        except json.JSONDecodeError:
-            print(f"Warning: Invalid JSON in schema file {schema_path}")
-            return {}
     
     def _system_message(self) -> str:
         """Return the default agent description/system prompt."""
@@ -0,0 +1,287 @@
+"""
+Remote task executor
+
+Ships the investigation phase's QueryTask and ProfilingTask units to TaskWorker processes
+(agent/TaskWorkerServer.py) on other nodes, so the number of tasks running at once is no
+longer capped by one process. Plug it into the Orchestrator with
+Orchestrator(task_executor=RemoteTaskExecutor([...])) or the TASK_WORKERS env var.
+
+Protocol: one TCP connection per task carrying newline-delimited JSON messages.
+    client -> worker  {"type": "task", "task_id", "kind": "query" | "profiling", "task": {...},
+                       "timeout": seconds | null,                 remaining budget of the task
+                       "token": shared secret | null}
+    worker -> client  {"type": "accepted", "worker_id"}
+                      {"type": "heartbeat"}                      every heartbeat_interval
+                      {"type": "result", "report": {...} | null, "usage": {...}, "query_ids": [...]}
+                      {"type": "error", "error", "retryable", "timed_out"?}
+Workers started with a token (TASK_WORKER_TOKEN) reject tasks that do not carry the same
+token, since a task runs SQL with the worker's Snowflake credentials.
+Closing the connection cancels the task on the worker, and so does running past the
+timeout sent with the task (reported as a non-retryable error).
+
+Each worker gets at most slots_per_worker tasks at a time; tasks go to the least-loaded
+healthy worker. A refused connection, a dropped connection or a heartbeat_timeout without
+any message marks the worker down for cooldown seconds and the task is retried on another
+worker, up to max_attempts in total. The returned report is validated against the task's
+output type, and the worker's token and row counters and Snowflake query ids are added to
+the local trace so usage accounting covers remote tasks.
+"""
+
+import asyncio
+import json
+import os
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from agent.Tracer import Tracer
+
+
+TASK_QUERY = "query"
+TASK_PROFILING = "profiling"
+TASK_KINDS = (TASK_QUERY, TASK_PROFILING)
+
+# Span counters a worker reports back with each result
+USAGE_COUNTERS = ("prompt_tokens", "completion_tokens", "model_calls", "cache_hits", "tool_calls", "rows", "bytes",
+                  "profiling_cpu_seconds")
+
+
+class RemoteTaskError(RuntimeError):
+    """A task failed on a worker or no worker could run it."""
+
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+def parse_address(address: str) -> Tuple[str, int]:
+    """Split "host:port" (host defaults to 127.0.0.1)."""
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+async def send_message(writer: asyncio.StreamWriter, message: Dict[str, Any]) -> None:
+    """Write one protocol message."""
+    writer.write(json.dumps(message, default=str).encode("utf-8") + b"\n")
+    await writer.drain()
+
+
+async def read_message(reader: asyncio.StreamReader, timeout: Optional[float]) -> Optional[Dict[str, Any]]:
+    """Read one protocol message; None at end of stream. Raises asyncio.TimeoutError after timeout."""
+    line = await asyncio.wait_for(reader.readline(), timeout=timeout)
+    return json.loads(line) if line else None
+
+
+class _Worker:
+    """Client-side state of one worker address."""
+
+    __slots__ = ("address", "host", "port", "running", "down_until", "completed", "failures")
+
+    def __init__(self, address: str):
+        self.address = address
+        self.host, self.port = parse_address(address)
+        self.running = 0
+        self.down_until = 0.0
+        self.completed = 0
+        self.failures = 0
+
+
+class RemoteTaskExecutor:
+    """
+    Runs query and profiling tasks on remote TaskWorker processes.
+
+    Attributes:
+        workers (List[str]): Worker addresses as "host:port"
+        slots_per_worker (int): Tasks sent to one worker at the same time
+        heartbeat_timeout (float): Seconds without a message from a worker before its task is retried
+        max_attempts (int): Workers a task is tried on before it fails
+        connect_timeout (float): Seconds to wait for a worker to accept a connection
+        cooldown (float): Seconds a worker that failed is skipped
+        token (Optional[str]): Shared secret sent with every task
+    """
+
+    def __init__(
+        self,
+        workers: List[str],
+        slots_per_worker: int = 4,
+        heartbeat_timeout: float = 30.0,
+        max_attempts: int = 3,
+        connect_timeout: float = 5.0,
+        cooldown: float = 30.0,
+        token: Optional[str] = None
+    ):
+        if not workers:
+            raise ValueError("RemoteTaskExecutor needs at least one worker address")
+        self.workers = list(workers)
+        self.slots_per_worker = slots_per_worker
+        self.heartbeat_timeout = heartbeat_timeout
+        self.max_attempts = max_attempts
+        self.connect_timeout = connect_timeout
+        self.cooldown = cooldown
+        self.token = token
+        self._workers = [_Worker(address) for address in self.workers]
+        self._slot_freed: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.stats = {"tasks": 0, "retries": 0, "failed": 0}
+
+    @classmethod
+    def from_env(cls) -> Optional["RemoteTaskExecutor"]:
+        """Executor over the comma-separated TASK_WORKERS addresses, or None if unset."""
+        addresses = [address.strip() for address in os.environ.get("TASK_WORKERS", "").split(",") if address.strip()]
+        if not addresses:
+            return None
+        return cls(
+            addresses,
+            slots_per_worker=int(os.environ.get("TASK_WORKER_SLOTS") or 4),
+            heartbeat_timeout=float(os.environ.get("TASK_HEARTBEAT_TIMEOUT") or 30),
+            max_attempts=int(os.environ.get("TASK_MAX_ATTEMPTS") or 3),
+            token=os.environ.get("TASK_WORKER_TOKEN") or None
+        )
+
+    def worker_stats(self) -> List[Dict[str, Any]]:
+        """Per worker: running and completed tasks, failures and whether it is marked down."""
+        now = time.monotonic()
+        return [{"address": worker.address, "running": worker.running, "completed": worker.completed,
+                 "failures": worker.failures, "down": worker.down_until > now} for worker in self._workers]
+
+    async def execute(
+        self,
+        kind: str,
+        task: BaseModel,
+        output_type: Type[BaseModel],
+        timeout: Optional[float] = None
+    ) -> Optional[BaseModel]:
+        """
+        Run one task on a worker.
+
+        Heartbeats only prove that the worker is alive, not that the task makes progress, so
+        the caller bounds the task with asyncio.wait_for(). The remaining part of that budget
+        is sent with each attempt so the worker cancels the task at the same time.
+
+        Args:
+            kind: "query" or "profiling"
+            task: The QueryTask or ProfilingTask
+            output_type: Model the worker's report is validated against
+            timeout: Seconds the task may take over all attempts (None = no limit)
+
+        Returns:
+            The report, or None if the agent produced none
+
+        Raises:
+            RemoteTaskError: The task failed on max_attempts workers or with a non-retryable error
+            asyncio.TimeoutError: The worker cancelled the task when its timeout ran out
+        """
+        self.stats["tasks"] += 1
+        task_id = uuid.uuid4().hex[:12]
+        errors = []
+        expires_at = time.monotonic() + timeout if timeout is not None else None
+        with Tracer.span(f"remote:{kind}", "agent", task_id=task_id) as span:
+            for attempt in range(1, self.max_attempts + 1):
+                worker = await self._acquire(exclude={error[0] for error in errors})
+                span.set(worker=worker.address, attempts=attempt)
+                try:
+                    remaining = max(0.0, expires_at - time.monotonic()) if expires_at is not None else None
+                    reply = await self._run_on(worker, task_id, kind, task, remaining)
+                except RemoteTaskError as e:
+                    errors.append((worker.address, str(e)))
+                    if not e.retryable:
+                        break
+                    if attempt < self.max_attempts:
+                        self.stats["retries"] += 1
+                        print(f"    🔁 Task {task_id} failed on {worker.address} ({e}); retrying")
+                    continue
+                finally:
+                    await self._release(worker)
+                span.accumulate(**{key: value for key, value in (reply.get("usage") or {}).items()
+                                   if key in USAGE_COUNTERS})
+                for query_id in reply.get("query_ids") or []:
+                    span.record_query(query_id)
+                report = reply.get("report")
+                return output_type.model_validate(report) if report is not None else None
+
+        self.stats["failed"] += 1
+        summary = "; ".join(f"{address}: {error}" for address, error in errors)
+        raise RemoteTaskError(f"{kind} task failed after {len(errors)} attempt(s): {summary}", retryable=False)
+
+    async def _run_on(
+        self,
+        worker: _Worker,
+        task_id: str,
+        kind: str,
+        task: BaseModel,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Send a task to one worker and wait for its result, treating silence as failure."""
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(worker.host, worker.port), timeout=self.connect_timeout
+            )
+        except (OSError, asyncio.TimeoutError) as e:
+            self._mark_down(worker)
+            raise RemoteTaskError(f"cannot connect: {type(e).__name__}") from e
+
+        try:
+            await send_message(writer, {"type": "task", "task_id": task_id, "kind": kind, "task": task.model_dump(),
+                                        "timeout": timeout, "token": self.token})
+            while True:
+                try:
+                    message = await read_message(reader, self.heartbeat_timeout)
+                except asyncio.TimeoutError:
+                    self._mark_down(worker)
+                    raise RemoteTaskError(f"no heartbeat for {self.heartbeat_timeout:g}s")
+                if message is None:
+                    self._mark_down(worker)
+                    raise RemoteTaskError("connection closed before a result")
+                if message["type"] == "result":
+                    worker.completed += 1
+                    return message
+                if message["type"] == "error":
+                    if message.get("timed_out"):
+                        raise asyncio.TimeoutError(message.get("error"))
+                    worker.failures += 1
+                    raise RemoteTaskError(message.get("error") or "worker error", message.get("retryable", True))
+        except asyncio.TimeoutError:
+            raise  # The worker timed the task out (TimeoutError is an OSError)
+        except (ConnectionError, OSError) as e:
+            self._mark_down(worker)
+            raise RemoteTaskError(f"connection lost: {type(e).__name__}") from e
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    def _mark_down(self, worker: _Worker) -> None:
+        worker.failures += 1
+        worker.down_until = time.monotonic() + self.cooldown
+
+    async def _acquire(self, exclude: set) -> _Worker:
+        """Take a slot on the least-loaded healthy worker, preferring workers the task has not failed on."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Conditions belong to one event loop; each asyncio.run() gets a fresh one
+            self._slot_freed, self._loop = asyncio.Condition(), loop
+            for worker in self._workers:
+                worker.running = 0
+        async with self._slot_freed:
+            while True:
+                now = time.monotonic()
+                healthy = [worker for worker in self._workers if worker.down_until <= now]
+                if not healthy:
+                    # Every worker failed recently: try the one that recovers first
+                    healthy = [min(self._workers, key=lambda worker: worker.down_until)]
+                preferred = [worker for worker in healthy if worker.address not in exclude] or healthy
+                free = [worker for worker in preferred if worker.running < self.slots_per_worker]
+                if free:
+                    worker = min(free, key=lambda worker: worker.running)
+                    worker.running += 1
+                    return worker
+                await self._slot_freed.wait()
+
+    async def _release(self, worker: _Worker) -> None:
+        async with self._slot_freed:
+            worker.running -= 1
+            self._slot_freed.notify()
@@ -0,0 +1,238 @@
+"""
+Report catalog
+
+SQLite index of the files written to a reports directory (HTML reports, workflow results
+and profiling reports). Every writer registers its file here, so the latest report, the
+latest profile of a table or the files of a run are found with an indexed lookup instead
+of globbing and stat()-ing the whole directory.
+
+Files are written atomically: content goes to a temporary file in the same directory that
+is renamed into place, so readers never see a half-written report, and the file is only
+registered once it is complete. Files of an existing directory are indexed once, when its
+catalog is created.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+
+# Report kinds and the file names that identify them when indexing an existing directory
+_KIND_PATTERNS = [
+    ("report", re.compile(r"^data_quality_report_.*\.html$")),
+    ("results", re.compile(r"^workflow_results_.*\.json$")),
+    ("batch_summary", re.compile(r"^batch_results_.*\.json$")),
+    ("profile", re.compile(r"^(?P<table>.+)_profile_\d{8}_\d{6}(_\d+)?\.(html|json)$")),
+]
+
+
+class ReportCatalog:
+    """
+    Indexed catalog of the reports in a directory.
+
+    Attributes:
+        reports_dir (Path): Directory the catalog indexes
+        path (Path): Location of the SQLite database file
+    """
+
+    _shared_instances: Dict[str, "ReportCatalog"] = {}
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def get_shared_instance(cls, reports_dir: str = "ge_reports") -> "ReportCatalog":
+        """
+        Return the process-wide catalog of a reports directory.
+
+        Args:
+            reports_dir: Directory the catalog indexes
+
+        Returns:
+            ReportCatalog: Shared catalog stored as report_catalog.db in reports_dir
+        """
+        key = str(Path(reports_dir).resolve())
+        with cls._shared_lock:
+            if key not in cls._shared_instances:
+                cls._shared_instances[key] = cls(reports_dir)
+            return cls._shared_instances[key]
+
+    def __init__(self, reports_dir: str = "ge_reports", path: Optional[str] = None):
+        """
+        Open (or create and populate) the catalog.
+
+        Args:
+            reports_dir: Directory the catalog indexes
+            path: SQLite file; defaults to report_catalog.db in reports_dir
+        """
+        self.reports_dir = Path(reports_dir)
+        self.reports_dir.mkdir(parents=True, exist_ok=True)
+        self.path = Path(path) if path else self.reports_dir / "report_catalog.db"
+        created = not self.path.exists()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS reports (
+                    path TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    format TEXT NOT NULL,
+                    run_id TEXT,
+                    goal TEXT,
+                    table_name TEXT COLLATE NOCASE,
+                    created_at REAL NOT NULL,
+                    size_bytes INTEGER NOT NULL
+                )"""
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_reports_kind ON reports (kind, created_at)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_reports_format ON reports (format)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_reports_table ON reports (table_name, kind, created_at)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_reports_run ON reports (run_id)")
+        if created:
+            self.index_existing()
+
+    @contextmanager
+    def writing(
+        self,
+        path: Path,
+        kind: str,
+        goal: Optional[str] = None,
+        table_name: Optional[str] = None,
+        run_id: Optional[str] = None
+    ) -> Iterator[Path]:
+        """
+        Write a report atomically and register it.
+
+        Yields a temporary path (with the same suffix, for writers that pick the format from
+        it) to write to. When the block completes the file is renamed to path and
+        registered; if it fails the temporary file is removed.
+
+        Args:
+            path: Final location of the report
+            kind: "report", "results", "batch_summary" or "profile"
+            goal: Goal the report was written for
+            table_name: Table the report describes
+            run_id: Id of the run that wrote the report (see Tracer.run_id)
+        """
+        path = Path(path)
+        temp_path = path.with_name(f".{path.stem}.{os.getpid()}.{threading.get_ident()}.tmp{path.suffix}")
+        try:
+            yield temp_path
+            os.replace(temp_path, path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        self.register(path, kind, goal=goal, table_name=table_name, run_id=run_id)
+
+    def write_text(self, path: Path, content: str, kind: str, **metadata) -> Path:
+        """Write text content atomically and register it (see writing())."""
+        with self.writing(path, kind, **metadata) as temp_path:
+            temp_path.write_text(content, encoding='utf-8')
+        return Path(path)
+
+    def register(
+        self,
+        path: Path,
+        kind: str,
+        goal: Optional[str] = None,
+        table_name: Optional[str] = None,
+        run_id: Optional[str] = None
+    ) -> None:
+        """Add an existing file to the catalog (replacing an earlier entry for the path)."""
+        path = Path(path)
+        stat = path.stat()
+        with self._lock, self._conn:
+            self._conn.execute(
+                """INSERT OR REPLACE INTO reports (path, kind, format, run_id, goal, table_name, created_at, size_bytes)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (self._key(path), kind, path.suffix.lstrip(".").lower(), run_id, goal, table_name,
+                 stat.st_mtime, stat.st_size)
+            )
+
+    def index_existing(self) -> int:
+        """
+        Register the reports already in the directory that are not in the catalog.
+
+        Returns:
+            int: Number of files added
+        """
+        added = 0
+        for path in self.reports_dir.iterdir():
+            if not path.is_file() or path.name.startswith("."):
+                continue
+            for kind, pattern in _KIND_PATTERNS:
+                match = pattern.match(path.name)
+                if match:
+                    with self._lock:
+                        known = self._conn.execute("SELECT 1 FROM reports WHERE path = ?", (self._key(path),)).fetchone()
+                    if not known:
+                        self.register(path, kind, table_name=match.groupdict().get("table"))
+                        added += 1
+                    break
+        return added
+
+    def latest(self, kind: str, table_name: Optional[str] = None, format: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Return the newest report of a kind, optionally for a table and in a format.
+
+        Entries whose file was deleted are dropped from the catalog and skipped.
+
+        Returns:
+            Optional[Dict[str, Any]]: The catalog entry (path, kind, format, run_id, goal,
+                table_name, created_at, size_bytes), or None
+        """
+        while True:
+            entries = self.find(kind=kind, table_name=table_name, format=format, limit=1)
+            if not entries:
+                return None
+            if Path(entries[0]["path"]).exists():
+                return entries[0]
+            self.remove(entries[0]["path"])
+
+    def get(self, path: str) -> Optional[Dict[str, Any]]:
+        """Return the catalog entry of a file, or None if it is not catalogued."""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM reports WHERE path = ?", (self._key(Path(path)),)).fetchone()
+        return dict(row) if row else None
+
+    def find(
+        self,
+        kind: Optional[str] = None,
+        table_name: Optional[str] = None,
+        run_id: Optional[str] = None,
+        format: Optional[str] = None,
+        limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """Return catalog entries matching all given filters (table names case-insensitively), newest first."""
+        filters = {"kind": kind, "table_name": table_name, "run_id": run_id, "format": format}
+        conditions = [f"{column} = ?" for column, value in filters.items() if value is not None]
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM reports {where} ORDER BY created_at DESC LIMIT ?",
+                (*[value for value in filters.values() if value is not None], limit)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def count(self, kind: Optional[str] = None, format: Optional[str] = None) -> int:
+        """Return the number of catalogued reports of a kind and/or format."""
+        filters = {"kind": kind, "format": format}
+        conditions = [f"{column} = ?" for column, value in filters.items() if value is not None]
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._lock:
+            return self._conn.execute(
+                f"SELECT COUNT(*) FROM reports {where}", tuple(value for value in filters.values() if value is not None)
+            ).fetchone()[0]
+
+    def remove(self, path: str) -> None:
+        """Drop a path from the catalog (the file itself is left alone)."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM reports WHERE path = ?", (self._key(Path(path)),))
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        return str(path.resolve())
@@ -0,0 +1,315 @@
+"""
+Rule-Based Planner for common data quality goals
+
+Stock goals such as "Analyze missing values in the RIDEBOOKING table" do not need an LLM
+round trip to be planned. This module matches a goal against a small library of intents
+(completeness, duplicates, validity, consistency, freshness) and builds a DataQualityPlan
+directly from metadata/schema.json. Only goals the stock templates consume entirely are
+planned here: an imperative such as "Analyze", "Check" or "Find", one or more intents and
+optionally the table or its columns, e.g. "Find duplicate BOOKING_ID values in RIDEBOOKING".
+Goals with negation, row filters, time windows or trends, goals asking for anything else
+("... and explain the root cause"), goals that mention unknown objects and goals that match
+no intent return None and are left to the PlannerAgent.
+"""
+
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+
+from agent.PlannerAgent import DataQualityPlan, ProfilingTask, QueryTask
+from agent.SchemaRegistry import SchemaRegistry
+
+
+# Intent → goal patterns (matched case-insensitively against the whole goal)
+INTENT_PATTERNS = {
+    "completeness": [r"\bmissing\b", r"\bnulls?\b", r"\bblanks?\b", r"\bempty\b", r"\bcompleteness\b", r"\bincomplete data\b"],
+    "duplicates": [r"\bduplicat\w*", r"\buniqueness\b", r"\bunique\b"],
+    "validity": [r"\binvalid\b", r"\bvalidity\b", r"\bout[- ]of[- ]range\b", r"\bnegative\b", r"\boutliers?\b", r"\bnon-numeric\b"],
+    "consistency": [r"\bconsisten\w*", r"\binconsisten\w*", r"\bcontradict\w*", r"\bmismatch\w*", r"\bcross[- ]field\b"],
+    "freshness": [r"\bfresh\w*", r"\bstale\b", r"\btimeliness\b", r"\blatest\b", r"\bup[- ]to[- ]date\b"],
+}
+
+# Stock goal templates start with one of these imperatives
+_IMPERATIVES = (r"analy[sz]e|assess|audit|check|count|detect|evaluate|find|identify|look for|measure|"
+                r"profile|quantify|report|review|run|validate")
+STOCK_GOAL_PREFIX = re.compile(rf"^\s*(?:please\s+)?(?:{_IMPERATIVES})\b", re.IGNORECASE)
+
+# Words a stock template may contain besides imperatives, intents, the table and its columns
+TEMPLATE_WORDS = {
+    "a", "an", "the", "in", "of", "on", "for", "across", "all", "any", "every", "each", "and", "or", "its", "please",
+    "table", "column", "columns", "field", "fields", "data", "dataset", "quality", "issues", "problems",
+    "value", "values", "record", "records", "row", "rows", "entry", "entries", "id", "ids", "key", "keys",
+    "booking", "bookings", "ride", "rides", "rating", "ratings",
+}
+
+# Wording the templates cannot express: the goal is left to the PlannerAgent
+DEFERRED_PATTERNS = {
+    "negation": [r"\b(?:not|no|never|don'?t|doesn'?t|without|except|excluding|ignor\w*|skip\w*|other than)\b"],
+    "filter": [r"\b(?:where|whose|only|filter\w*|limited to|restricted to)\b", r"[=<>]", r"\bfor (?:rides|bookings|customers|drivers|trips)\b"],
+    "time_window": [
+        r"\b(?:last|past|previous|this|next)\s+(?:\d+\s+)?(?:hours?|days?|weeks?|months?|quarters?|years?)\b",
+        r"\b(?:yesterday|today|tonight|since|between|before|after|during|until)\b",
+        r"\b(?:january|february|march|april|may|june|july|august|september|october|november|december|"
+        r"jan|feb|mar|apr|jun|jul|aug|sep|sept|oct|nov|dec)\b",
+        r"\b(?:19|20)\d{2}\b",
+    ],
+    "trend": [r"\b(?:trends?|trending|over time|growth|grow\w*|drop\w*|increas\w*|decreas\w*|declin\w*|compar\w*|"
+              r"versus|vs\.?|changes?|changed|daily|weekly|monthly|per (?:day|week|month)|by (?:day|week|month)|"
+              r"(?:day|week|month)[- ]over[- ](?:day|week|month)|why)\b"],
+}
+
+# Goals that only ask for a general check run every intent
+GENERAL_PATTERNS = [r"\b(?:overall|full|general|complete)\s+data quality\b", r"\bdata quality (?:check|audit|assessment)\b"]
+
+# Upper-case words in goals that are not database objects
+_NON_OBJECT_WORDS = {"NULL", "NULLS", "SQL", "ID", "IDS", "KPI", "PII", "UTC"}
+
+_ENUMERATION = re.compile(r"\(([^()]*,[^()]*)\)")
+_NAME_TOKENS_IGNORED = {"BY", "FOR", "RIDES", "REASON", "CANCELLED", "CANCELLING", "CANCELLATION"}
+
+
+def _quote(name: str) -> str:
+    """Return a column reference usable in Snowflake SQL."""
+    return name if re.fullmatch(r"[A-Z_][A-Z0-9_$]*", name) else f'"{name}"'
+
+
+class RuleBasedPlanner:
+    """
+    Deterministic fast-path planner.
+
+    Attributes:
+        schema (dict): Table schema from the SchemaRegistry
+        table (str): Table name the schema describes
+        max_profile_rows (int): Row cap mentioned in profiling tasks
+    """
+
+    def __init__(self, schema: Optional[dict] = None, max_profile_rows: int = 100000):
+        self.schema = schema if schema is not None else SchemaRegistry.load_schema()
+        self.table = self.schema.get("table_name", "")
+        self.columns: List[dict] = self.schema.get("columns", [])
+        self.max_profile_rows = max_profile_rows
+        self._builders: Dict[str, Callable[[List[dict]], Tuple[List[str], List[str]]]] = {
+            "completeness": self._completeness_tasks,
+            "duplicates": self._duplicate_tasks,
+            "validity": self._validity_tasks,
+            "consistency": self._consistency_tasks,
+            "freshness": self._freshness_tasks,
+        }
+
+    def match_intents(self, goal: str) -> List[str]:
+        """Return the intents a goal asks for, in library order."""
+        intents = [
+            intent for intent, patterns in INTENT_PATTERNS.items()
+            if any(re.search(pattern, goal, re.IGNORECASE) for pattern in patterns)
+        ]
+        if not intents and any(re.search(pattern, goal, re.IGNORECASE) for pattern in GENERAL_PATTERNS):
+            intents = list(INTENT_PATTERNS)
+        return intents
+
+    def deferred_reason(self, goal: str) -> Optional[str]:
+        """Return why a goal does not fit the stock templates, or None if it does."""
+        if not STOCK_GOAL_PREFIX.search(goal):
+            return "not a stock template"
+        for reason, patterns in DEFERRED_PATTERNS.items():
+            if any(re.search(pattern, goal, re.IGNORECASE) for pattern in patterns):
+                return reason
+        if self.unconsumed_words(goal):
+            return "extra request"
+        return None
+
+    def unconsumed_words(self, goal: str) -> List[str]:
+        """
+        Return the words of a goal a stock template does not account for.
+
+        Imperatives, intent phrases, the table, column names and TEMPLATE_WORDS are
+        consumed; anything left over is a request the rule-based plan would silently drop.
+        """
+        text = goal.upper()
+        for name in [self.table] + [column["name"] for column in self.columns]:
+            words = re.split(r"[ _]+", name.upper())
+            text = re.sub(r"(?<![A-Z0-9_])" + r"[ _]".join(re.escape(word) for word in words) + r"(?![A-Z0-9_])",
+                          " ", text)
+        for pattern in [rf"\b(?:{_IMPERATIVES})\b"] + GENERAL_PATTERNS + [p for ps in INTENT_PATTERNS.values() for p in ps]:
+            text = re.sub(rf"(?:{pattern})", " ", text, flags=re.IGNORECASE)
+        return [word for word in re.findall(r"[a-z0-9']+", text.lower()) if word not in TEMPLATE_WORDS]
+
+    def _mentioned_columns(self, goal: str) -> Optional[List[dict]]:
+        """
+        Return the schema columns a goal mentions, or None if it references unknown objects.
+
+        An empty list means the goal targets the whole table.
+        """
+        mentioned = []
+        for column in self.columns:
+            # Spaces and underscores are interchangeable ("Booking Status" / BOOKING_STATUS)
+            words = re.split(r"[ _]+", column["name"].upper())
+            pattern = r"(?<![A-Z0-9_])" + r"[ _]".join(re.escape(word) for word in words) + r"(?![A-Z0-9_])"
+            if re.search(pattern, goal.upper()):
+                mentioned.append(column)
+
+        known = {self.table.upper()} | {column["name"].upper().replace(" ", "_") for column in self.columns}
+        for word in re.findall(r"\b[A-Z][A-Z0-9_]{2,}\b", goal):
+            if word not in known and word not in _NON_OBJECT_WORDS:
+                return None
+        return mentioned
+
+    def plan(self, goal: str) -> Optional[DataQualityPlan]:
+        """
+        Build a plan for a goal without calling the LLM.
+
+        Args:
+            goal: Data quality goal
+
+        Returns:
+            DataQualityPlan, or None if the goal should be planned by the PlannerAgent
+        """
+        if not self.table or not self.columns or self.deferred_reason(goal):
+            return None
+        intents = self.match_intents(goal)
+        mentioned = self._mentioned_columns(goal)
+        if not intents or mentioned is None:
+            return None
+        columns = mentioned or self.columns
+
+        query_goals: List[str] = []
+        success_criteria: List[str] = []
+        for intent in intents:
+            intent_queries, intent_criteria = self._builders[intent](columns)
+            query_goals.extend(intent_queries)
+            success_criteria.extend(intent_criteria)
+        if not query_goals:
+            return None
+
+        column_list = ", ".join(column["name"] for column in columns)
+        profiling_goal = (
+            f"Profile {self.table} (up to {self.max_profile_rows:,} rows) selecting columns {column_list} "
+            f"to measure {', '.join(intents)} through missing-value rates, distinct counts, distributions and alerts"
+        )
+
+        return DataQualityPlan(
+            goal=goal,
+            query_tasks=[QueryTask(goal=query_goal) for query_goal in query_goals],
+            profiling_tasks=[ProfilingTask(goal=profiling_goal)],
+            execution_sequence=[f"query_{i}" for i in range(1, len(query_goals) + 1)] + ["profile_1"],
+            success_criteria=success_criteria
+        )
+
+    # ------------------------------------------------------------------ intent builders
+
+    def _columns_with_string_nulls(self, columns: List[dict]) -> List[dict]:
+        return [column for column in columns if "'null'" in column.get("note", "").lower()]
+
+    def _completeness_tasks(self, columns: List[dict]) -> Tuple[List[str], List[str]]:
+        names = ", ".join(_quote(column["name"]) for column in columns)
+        queries = [
+            f"Count SQL NULLs per column in {self.table} for {names} with COUNT(*) - COUNT(column), "
+            f"returning the total row count and the null percentage per column"
+        ]
+        string_nulls = self._columns_with_string_nulls(columns)
+        if string_nulls:
+            string_names = ", ".join(_quote(column["name"]) for column in string_nulls)
+            queries.append(
+                f"Count literal 'null' strings and empty strings in {string_names} of {self.table} "
+                f"(compare with CAST(column AS VARCHAR)), with percentages of total rows"
+            )
+        return queries, [f"Null and blank rates are reported for every selected column of {self.table}"]
+
+    def _duplicate_tasks(self, columns: List[dict]) -> Tuple[List[str], List[str]]:
+        queries = []
+        identifiers = [
+            column for column in columns
+            if column["name"].upper().endswith("_ID") and "unique identifier for each" in column.get("description", "").lower()
+        ]
+        for column in identifiers:
+            queries.append(
+                f"Find duplicate {_quote(column['name'])} values in {self.table}: number of duplicated keys, "
+                f"extra rows they cause, and the 10 most repeated keys with their counts"
+            )
+        queries.append(
+            f"Count fully duplicated rows in {self.table} (rows identical across all columns) "
+            f"by comparing COUNT(*) with the count of distinct rows"
+        )
+        return queries, [f"Duplicate keys and fully duplicated rows in {self.table} are quantified"]
+
+    def _validity_tasks(self, columns: List[dict]) -> Tuple[List[str], List[str]]:
+        queries = []
+        numeric = [column for column in columns if column.get("type", "").upper() in ("DECIMAL", "NUMBER", "FLOAT", "INTEGER")]
+        string_nulls = {column["name"] for column in self._columns_with_string_nulls(columns)}
+        for column in numeric:
+            name = _quote(column["name"])
+            value = f"TRY_CAST({name} AS DECIMAL(10,2))" if column["name"] in string_nulls else name
+            if column.get("scale"):
+                low, _, high = column["scale"].partition("-")
+                queries.append(
+                    f"Count rows in {self.table} where {value} is outside the {column['scale']} scale "
+                    f"(below {low} or above {high}), with a sample of offending values"
+                )
+            elif column.get("unit"):
+                queries.append(
+                    f"Count rows in {self.table} where {value} is negative or zero ({column['unit']}), "
+                    f"and report MIN, MAX and the 99th percentile to spot outliers"
+                )
+        for column in numeric:
+            if column["name"] in string_nulls:
+                queries.append(
+                    f"Count non-numeric values in {_quote(column['name'])} of {self.table}: rows where the value is not "
+                    f"NULL, not the string 'null' and TRY_CAST to DECIMAL(10,2) returns NULL"
+                )
+        for column in columns:
+            enumeration = _ENUMERATION.search(column.get("description", ""))
+            if column.get("allowed_values"):
+                expected = ", ".join(map(str, column["allowed_values"]))
+            elif column.get("type", "").upper() == "VARCHAR" and enumeration:
+                expected = ", ".join(value.strip() for value in enumeration.group(1).split(",") if value.strip() != "etc.")
+            else:
+                continue
+            queries.append(
+                f"List distinct values of {_quote(column['name'])} in {self.table} with counts and flag values "
+                f"outside the expected set ({expected})"
+            )
+        if not queries:
+            return [], []
+        return queries, [f"Out-of-range, non-numeric and unexpected categorical values in {self.table} are counted"]
+
+    def _consistency_tasks(self, columns: List[dict]) -> Tuple[List[str], List[str]]:
+        queries = []
+        names = {column["name"] for column in columns}
+        flags = [column for column in self.columns if "flag" in column.get("description", "").lower()]
+        reasons = [column for column in self.columns if "REASON" in column["name"].upper()]
+        for flag in flags:
+            flag_tokens = set(flag["name"].upper().split("_")) - _NAME_TOKENS_IGNORED
+            for reason in reasons:
+                if reason["name"] == flag["name"]:
+                    continue
+                if flag["name"] not in names and reason["name"] not in names:
+                    continue
+                if flag_tokens & (set(reason["name"].upper().split("_")) - _NAME_TOKENS_IGNORED):
+                    queries.append(
+                        f"Check consistency between {_quote(flag['name'])} and {_quote(reason['name'])} in {self.table}: "
+                        f"count rows where the flag is set but the reason is missing, and rows with a reason but no flag"
+                    )
+
+        status = next((column for column in self.columns if "status" in column["name"].lower()), None)
+        if status and flags and (status["name"] in names or any(flag["name"] in names for flag in flags)):
+            flag_names = ", ".join(_quote(flag["name"]) for flag in flags)
+            queries.append(
+                f"Cross-tabulate {_quote(status['name'])} against {flag_names} in {self.table} and count rows whose "
+                f"status contradicts the flags (e.g. cancelled status without a cancellation flag)"
+            )
+        if not queries:
+            return [], []
+        return queries, [f"Contradictions between status, flag and reason columns in {self.table} are counted"]
+
+    def _freshness_tasks(self, columns: List[dict]) -> Tuple[List[str], List[str]]:
+        dates = [column for column in columns if column.get("type", "").upper() in ("DATE", "TIMESTAMP", "TIMESTAMP_NTZ", "DATETIME")]
+        if not dates:
+            dates = [column for column in self.columns if column.get("type", "").upper() in ("DATE", "TIMESTAMP", "TIMESTAMP_NTZ", "DATETIME")]
+        queries = []
+        for column in dates:
+            name = _quote(column["name"])
+            queries.append(
+                f"Report MIN and MAX of {name} in {self.table}, days between MAX({name}) and CURRENT_DATE, rows dated in "
+                f"the future, and dates without any rows in the last 30 days of data"
+            )
+        if not queries:
+            return [], []
+        return queries, [f"Latest data date, lag to today and gaps in {self.table} are reported"]
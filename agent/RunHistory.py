@@ -0,0 +1,244 @@
+"""
+Run history with trend queries
+
+Append-only SQLite store of what every run measured, so trends ("how has RIDEBOOKING's
+null rate moved over the last 90 days") are one indexed query instead of parsing every
+workflow_results_*.json. Each run adds:
+- runs: run metadata (goal, table, success, issue count)
+- issues: the issues reported by the analysis
+- metrics: one row per (table, column, metric) value, from the check suite (failed
+  percentage per check) and from the ydata-profiling JSON reports (table statistics and
+  per-column statistics such as p_missing, n_distinct or mean)
+
+Table-level metrics use an empty column name. Metric names:
+- check:<check_type> (column checks) or check:<check name> (table checks): failed_pct
+- profile statistics under their ydata-profiling names (p_missing, n_distinct, mean, ...)
+"""
+
+import json
+import math
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+# ydata-profiling statistics kept per column and per table
+PROFILE_COLUMN_STATS = ["n_missing", "p_missing", "n_distinct", "p_distinct", "n_zeros", "n_negative",
+                        "mean", "std", "min", "max"]
+PROFILE_TABLE_STATS = ["n", "n_var", "n_cells_missing", "p_cells_missing", "n_duplicates", "p_duplicates"]
+
+
+class RunHistory:
+    """
+    SQLite-backed history of run results.
+
+    Attributes:
+        path (Path): Location of the SQLite database file
+    """
+
+    def __init__(self, path: str = "ge_reports/run_history.db"):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS runs (
+                    run_id TEXT PRIMARY KEY,
+                    recorded_at REAL NOT NULL,
+                    goal TEXT NOT NULL,
+                    table_name TEXT COLLATE NOCASE,
+                    success INTEGER NOT NULL,
+                    issue_count INTEGER NOT NULL
+                )"""
+            )
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS issues (
+                    run_id TEXT NOT NULL,
+                    recorded_at REAL NOT NULL,
+                    table_name TEXT COLLATE NOCASE,
+                    type TEXT NOT NULL,
+                    severity TEXT NOT NULL,
+                    description TEXT NOT NULL
+                )"""
+            )
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS metrics (
+                    run_id TEXT NOT NULL,
+                    recorded_at REAL NOT NULL,
+                    table_name TEXT NOT NULL COLLATE NOCASE,
+                    column_name TEXT NOT NULL COLLATE NOCASE,
+                    metric TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    value REAL NOT NULL
+                )"""
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_table ON runs (table_name, recorded_at)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_issues_table ON issues (table_name, recorded_at)")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_metrics_series ON metrics (table_name, metric, column_name, recorded_at)"
+            )
+
+    def record(
+        self,
+        results: Dict[str, Any],
+        table_name: Optional[str] = None,
+        recorded_at: Optional[float] = None
+    ) -> bool:
+        """
+        Append a run to the history.
+
+        Args:
+            results: Serialized workflow results (as saved to workflow_results_*.json)
+            table_name: Table the run analyzed
+            recorded_at: Unix time of the run; defaults to now
+
+        Returns:
+            bool: False if the run was already recorded
+        """
+        run_id = results.get("run_id") or f"{results.get('goal', '')}@{results.get('timestamp', '')}"
+        recorded_at = recorded_at or time.time()
+        issues = (results.get("analysis") or {}).get("issues", []) if isinstance(results.get("analysis"), dict) else []
+        metrics = self._check_metrics(results.get("check_results") or [], table_name) + \
+            self._profile_metrics(results.get("profiling_results") or [], table_name)
+
+        with self._lock, self._conn:
+            inserted = self._conn.execute(
+                """INSERT OR IGNORE INTO runs (run_id, recorded_at, goal, table_name, success, issue_count)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                (run_id, recorded_at, results.get("goal", ""), table_name, int(bool(results.get("success"))), len(issues))
+            ).rowcount
+            if not inserted:
+                return False
+            self._conn.executemany(
+                "INSERT INTO issues (run_id, recorded_at, table_name, type, severity, description) VALUES (?, ?, ?, ?, ?, ?)",
+                [(run_id, recorded_at, table_name, issue.get("type", ""), issue.get("severity", ""),
+                  issue.get("evidence_description", "")) for issue in issues]
+            )
+            self._conn.executemany(
+                """INSERT INTO metrics (run_id, recorded_at, table_name, column_name, metric, source, value)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                [(run_id, recorded_at, *metric) for metric in metrics]
+            )
+        return True
+
+    def import_results_file(self, path: str, table_name: Optional[str] = None) -> bool:
+        """
+        Append a saved workflow_results_*.json file (e.g. to backfill runs from before the history).
+
+        The run time is taken from the file's timestamp field.
+        """
+        results = json.loads(Path(path).read_text(encoding='utf-8'))
+        recorded_at = None
+        if results.get("timestamp"):
+            recorded_at = datetime.strptime(results["timestamp"], "%Y%m%d_%H%M%S").timestamp()
+        return self.record(results, table_name=table_name, recorded_at=recorded_at)
+
+    def trend(
+        self,
+        table_name: str,
+        metric: str,
+        column_name: str = "",
+        days: Optional[float] = 90
+    ) -> List[Dict[str, Any]]:
+        """
+        Return the values of one metric over time, oldest first.
+
+        Args:
+            table_name: Table the metric belongs to
+            metric: Metric name, e.g. "p_missing" or "check:not_null"
+            column_name: Column of the metric ("" for table-level metrics)
+            days: Only include runs from the last N days (None = all)
+
+        Returns:
+            List of {"recorded_at", "run_id", "value"} rows
+        """
+        since = time.time() - days * 86400 if days else 0
+        return self.query(
+            """SELECT recorded_at, run_id, value FROM metrics
+               WHERE table_name = ? AND metric = ? AND column_name = ? AND recorded_at >= ?
+               ORDER BY recorded_at""",
+            (table_name, metric, column_name, since)
+        )
+
+    def issue_trend(self, table_name: str, days: Optional[float] = 90) -> List[Dict[str, Any]]:
+        """
+        Return the number of issues per run and severity over time, oldest first.
+
+        Runs without issues are included as one row with severity None and 0 issues.
+        """
+        since = time.time() - days * 86400 if days else 0
+        return self.query(
+            """SELECT r.recorded_at AS recorded_at, r.run_id AS run_id, i.severity AS severity,
+                      COUNT(i.run_id) AS issues
+               FROM runs r LEFT JOIN issues i ON i.run_id = r.run_id
+               WHERE r.table_name = ? AND r.recorded_at >= ?
+               GROUP BY r.run_id, i.severity ORDER BY r.recorded_at""",
+            (table_name, since)
+        )
+
+    def metric_names(self, table_name: str) -> List[Dict[str, Any]]:
+        """Return the (metric, column_name) series recorded for a table."""
+        return self.query(
+            "SELECT DISTINCT metric, column_name FROM metrics WHERE table_name = ? ORDER BY metric, column_name",
+            (table_name,)
+        )
+
+    def tables(self) -> List[str]:
+        """Return the tables with recorded runs."""
+        return [row["table_name"] for row in self.query(
+            "SELECT DISTINCT table_name FROM runs WHERE table_name IS NOT NULL ORDER BY table_name"
+        )]
+
+    def query(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        """Run a read query against the history and return rows as dictionaries."""
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params).fetchall()]
+
+    @staticmethod
+    def _check_metrics(check_results: List[Dict[str, Any]], table_name: Optional[str]) -> List[tuple]:
+        metrics = []
+        for check in check_results:
+            if check.get("column"):
+                column, metric = check["column"], f"check:{check['check_type']}"
+            else:
+                column, metric = "", f"check:{check['name'].split(':', 1)[-1]}"
+            metrics.append((table_name or "", column, metric, "check", float(check["failed_pct"])))
+        return metrics
+
+    @staticmethod
+    def _profile_metrics(profiling_results: List[Dict[str, Any]], table_name: Optional[str]) -> List[tuple]:
+        metrics = []
+        for report in profiling_results:
+            if not isinstance(report, dict):
+                continue
+            for task in report.get("tasks_executed", []):
+                path = Path(task.get("json_report_path") or "")
+                if not path.suffix == ".json" or not path.is_file():
+                    continue
+                try:
+                    profile = json.loads(path.read_text(encoding='utf-8'))
+                except (OSError, ValueError):
+                    continue
+                table = table_name or path.name.split("_profile_")[0]
+                for stat in PROFILE_TABLE_STATS:
+                    value = _number(profile.get("table", {}).get(stat))
+                    if value is not None:
+                        metrics.append((table, "", stat, "profile", value))
+                for column, variable in profile.get("variables", {}).items():
+                    for stat in PROFILE_COLUMN_STATS:
+                        value = _number(variable.get(stat))
+                        if value is not None:
+                            metrics.append((table, column, stat, "profile", value))
+        return metrics
+
+
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        return None
+    return float(value)
@@ -0,0 +1,298 @@
+"""
+Schema-wide fan-out analysis
+
+Runs the data quality workflow for every table in a Snowflake schema instead of only the
+table described in metadata/schema.json:
+1. list_tables enumerates the tables (largest first, so long analyses start early)
+2. A per-table schema context is built: the curated metadata file for tables it describes,
+   INFORMATION_SCHEMA columns via get_table_info for all others
+3. Up to max_parallel_tables Orchestrators run at the same time. They all share the
+   process-wide query engine, LLM response cache and pooled, rate-limited model clients,
+   so throughput scales with workers until the warehouse or the LLM limits saturate
+4. A roll-up (JSON + HTML) ranks issues across all tables
+
+Per-table reports are written to <reports_dir>/<TABLE>/.
+"""
+
+import asyncio
+import html
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from agent.SchemaRegistry import SchemaRegistry
+from agent.SummarizerAgent import DataQualityIssue
+from agent.tool.SnowflakeQueryEngine import SnowflakeQueryEngine
+
+
+SEVERITY_ORDER = ["Critical", "High", "Medium", "Low"]
+
+DEFAULT_GOAL_TEMPLATE = "Assess overall data quality of the {table} table"
+
+
+class TableAnalysisSummary(BaseModel):
+    """Outcome of the workflow for one table"""
+    table_name: str  # Analyzed table
+    success: bool  # Whether the workflow completed
+    summary: str  # Executive summary from the SummarizerAgent
+    issue_counts: dict[str, int]  # Number of issues per severity
+    issues: list[DataQualityIssue]  # Issues found in the table
+    report_dir: str  # Directory holding the table's reports
+    elapsed_seconds: float  # Wall-clock time of the table's workflow
+    error: Optional[str]  # Error message if the workflow failed
+
+
+class SchemaRollup(BaseModel):
+    """Roll-up of a schema-wide analysis"""
+    schema_name: str  # Analyzed schema (empty for the connection's current schema)
+    goal_template: str  # Goal used per table, with {table} placeholder
+    max_parallel_tables: int  # Concurrency the tables were analyzed with
+    elapsed_seconds: float  # Wall-clock time of the whole fan-out
+    tables: list[TableAnalysisSummary]  # Per-table outcomes, most severe first
+
+
+class SchemaFanOutRunner:
+    """
+    Fans the data quality workflow out over all tables of a schema.
+
+    Attributes:
+        schema_name (Optional[str]): Snowflake schema to analyze
+        database (Optional[str]): Snowflake database to analyze
+        max_parallel_tables (int): Number of table workflows running at the same time
+        reports_dir (Path): Root directory for per-table reports and the roll-up
+    """
+
+    def __init__(
+        self,
+        schema_name: Optional[str] = None,
+        database: Optional[str] = None,
+        max_parallel_tables: int = 3,
+        reports_dir: str = "ge_reports",
+        include_tables: Optional[List[str]] = None,
+        exclude_tables: Optional[List[str]] = None,
+        query_engine: Optional[SnowflakeQueryEngine] = None,
+        orchestrator_factory: Optional[Callable[[dict, str], Any]] = None,
+        **orchestrator_kwargs
+    ):
+        """
+        Initialize the SchemaFanOutRunner.
+
+        Args:
+            schema_name: Schema to enumerate (defaults to the connection's schema)
+            database: Database to enumerate (defaults to the connection's database)
+            max_parallel_tables: Number of tables analyzed concurrently
+            reports_dir: Root directory for reports
+            include_tables: Only analyze these tables (case-insensitive)
+            exclude_tables: Skip these tables (case-insensitive)
+            query_engine: Engine used for discovery; defaults to the shared engine
+            orchestrator_factory: Callable(schema, reports_dir) returning an object with an
+                async run_analysis(goal) method; defaults to an Orchestrator per table
+            **orchestrator_kwargs: Extra Orchestrator options (e.g. run_check_suite=True)
+        """
+        self.schema_name = schema_name
+        self.database = database
+        self.max_parallel_tables = max(1, max_parallel_tables)
+        self.reports_dir = Path(reports_dir)
+        self.include_tables = {name.upper() for name in include_tables} if include_tables else None
+        self.exclude_tables = {name.upper() for name in exclude_tables or []}
+        self._query_engine = query_engine
+        self.orchestrator_factory = orchestrator_factory or self._create_orchestrator
+        self.orchestrator_kwargs = orchestrator_kwargs
+        self._curated_schema = SchemaRegistry.load_schema()
+
+    @property
+    def query_engine(self) -> SnowflakeQueryEngine:
+        """Engine used for discovery; the shared engine is resolved on first use."""
+        if self._query_engine is None:
+            self._query_engine = SnowflakeQueryEngine.get_shared_instance()
+        return self._query_engine
+
+    def _create_orchestrator(self, schema: dict, reports_dir: str):
+        from agent.Orchestrator import Orchestrator
+
+        # Interleaved console streams from parallel tables are unreadable
+        options = {"enable_console_output": False, **self.orchestrator_kwargs}
+        return Orchestrator(reports_dir=reports_dir, schema=schema, **options)
+
+    def discover_tables(self) -> List[Dict[str, Any]]:
+        """
+        List the tables to analyze, largest first.
+
+        Returns:
+            List[Dict[str, Any]]: INFORMATION_SCHEMA.TABLES rows
+
+        Raises:
+            RuntimeError: If the tables cannot be listed
+        """
+        listing = self.query_engine.list_tables(self.schema_name or "", self.database or "")
+        if not listing["success"]:
+            raise RuntimeError(f"Could not list tables: {listing.get('error', 'Unknown error')}")
+
+        tables = []
+        for row in listing["tables"]:
+            name = str(row["TABLE_NAME"]).upper()
+            if self.include_tables is not None and name not in self.include_tables:
+                continue
+            if name in self.exclude_tables:
+                continue
+            tables.append(row)
+        # Longest jobs first keeps the last worker from starting a big table at the end
+        return sorted(tables, key=lambda row: row.get("BYTES") or 0, reverse=True)
+
+    def build_table_schema(self, table: Dict[str, Any]) -> dict:
+        """
+        Build the schema context for one table.
+
+        Args:
+            table: INFORMATION_SCHEMA.TABLES row
+
+        Returns:
+            dict: Curated schema for tables described in metadata/schema.json, otherwise a
+                schema derived from INFORMATION_SCHEMA.COLUMNS
+        """
+        table_name = table["TABLE_NAME"]
+        if table_name.upper() == str(self._curated_schema.get("table_name", "")).upper():
+            return SchemaRegistry.load_schema()
+
+        info = self.query_engine.get_table_info(
+            table_name, table.get("SCHEMA_NAME") or self.schema_name or "", table.get("DATABASE_NAME") or self.database or ""
+        )
+        if not info["success"]:
+            raise RuntimeError(f"Could not read columns of {table_name}: {info.get('error', 'Unknown error')}")
+        return SchemaRegistry.from_table_info(
+            table_name, info["columns"], description=table.get("COMMENT") or "", row_count=table.get("ROW_COUNT")
+        )
+
+    async def run(self, goal_template: str = DEFAULT_GOAL_TEMPLATE) -> SchemaRollup:
+        """
+        Analyze every table of the schema and write the roll-up report.
+
+        Args:
+            goal_template: Goal for each table; {table} is replaced by the table name
+
+        Returns:
+            SchemaRollup: Per-table outcomes, most severe first
+        """
+        started = time.perf_counter()
+        tables = await asyncio.to_thread(self.discover_tables)
+        print(f"🗂️ Analyzing {len(tables)} tables with up to {self.max_parallel_tables} in parallel")
+
+        semaphore = asyncio.Semaphore(self.max_parallel_tables)
+
+        async def analyze(table: Dict[str, Any]) -> TableAnalysisSummary:
+            async with semaphore:
+                return await self._analyze_table(table, goal_template)
+
+        summaries = await asyncio.gather(*(analyze(table) for table in tables))
+        rollup = SchemaRollup(
+            schema_name=self.schema_name or "",
+            goal_template=goal_template,
+            max_parallel_tables=self.max_parallel_tables,
+            elapsed_seconds=round(time.perf_counter() - started, 2),
+            tables=sorted(summaries, key=self._severity_rank)
+        )
+        rollup_path = self.save_rollup(rollup)
+        succeeded = sum(1 for summary in summaries if summary.success)
+        print(f"✅ Schema analysis complete: {succeeded}/{len(summaries)} tables in "
+              f"{rollup.elapsed_seconds:.1f}s, roll-up saved to {rollup_path}")
+        return rollup
+
+    async def _analyze_table(self, table: Dict[str, Any], goal_template: str) -> TableAnalysisSummary:
+        """Run the workflow for one table; failures are reported instead of raised."""
+        table_name = table["TABLE_NAME"]
+        report_dir = self.reports_dir / table_name
+        started = time.perf_counter()
+        print(f"  🔄 {table_name}: starting")
+        try:
+            schema = await asyncio.to_thread(self.build_table_schema, table)
+            orchestrator = self.orchestrator_factory(schema, str(report_dir))
+            results = await orchestrator.run_analysis(goal_template.format(table=table_name))
+        except Exception as e:
+            results = {"success": False, "error": str(e)}
+
+        analysis = results.get("analysis")
+        issues = list(analysis.issues) if analysis else []
+        issue_counts = {severity: 0 for severity in SEVERITY_ORDER}
+        for issue in issues:
+            issue_counts[issue.severity] = issue_counts.get(issue.severity, 0) + 1
+        summary = TableAnalysisSummary(
+            table_name=table_name,
+            success=bool(results.get("success")) and analysis is not None,
+            summary=analysis.summary if analysis else "",
+            issue_counts=issue_counts,
+            issues=issues,
+            report_dir=str(report_dir),
+            elapsed_seconds=round(time.perf_counter() - started, 2),
+            error=results.get("error")
+        )
+        status = f"{len(issues)} issues" if summary.success else f"failed ({summary.error or 'no analysis'})"
+        print(f"  ✅ {table_name}: {status} in {summary.elapsed_seconds:.1f}s")
+        return summary
+
+    @staticmethod
+    def _severity_rank(summary: TableAnalysisSummary) -> tuple:
+        """Sort key: most critical issues first, failed tables last."""
+        return (not summary.success,) + tuple(-summary.issue_counts.get(s, 0) for s in SEVERITY_ORDER)
+
+    def save_rollup(self, rollup: SchemaRollup) -> Path:
+        """Write the roll-up as JSON and HTML and return the HTML path."""
+        self.reports_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        with open(self.reports_dir / f"schema_rollup_{timestamp}.json", 'w', encoding='utf-8') as f:
+            json.dump(rollup.model_dump(), f, indent=2, ensure_ascii=False)
+        html_path = self.reports_dir / f"schema_rollup_{timestamp}.html"
+        with open(html_path, 'w', encoding='utf-8') as f:
+            f.write(self.render_rollup_html(rollup))
+        return html_path
+
+    @staticmethod
+    def render_rollup_html(rollup: SchemaRollup) -> str:
+        """Render the roll-up as a standalone HTML page."""
+        rows = []
+        for table in rollup.tables:
+            counts = "".join(f"<td>{table.issue_counts.get(severity, 0)}</td>" for severity in SEVERITY_ORDER)
+            status = "✅" if table.success else f"❌ {html.escape(table.error or 'no analysis')}"
+            rows.append(
+                f"<tr><td>{html.escape(table.table_name)}</td><td>{status}</td>{counts}"
+                f"<td>{html.escape(table.summary)}</td><td>{table.elapsed_seconds:.1f}s</td></tr>"
+            )
+
+        ranked = sorted(
+            ((table.table_name, issue) for table in rollup.tables for issue in table.issues),
+            key=lambda item: SEVERITY_ORDER.index(item[1].severity) if item[1].severity in SEVERITY_ORDER else len(SEVERITY_ORDER)
+        )
+        issue_items = "".join(
+            f"<li><strong>[{html.escape(issue.severity)}] {html.escape(table_name)}: {html.escape(issue.type)}</strong>"
+            f" — {html.escape(issue.evidence_description)}</li>"
+            for table_name, issue in ranked
+        )
+        severity_headers = "".join(f"<th>{severity}</th>" for severity in SEVERITY_ORDER)
+        return f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Schema Data Quality Roll-up</title>
+<style>
+body {{ font-family: -apple-system, Segoe UI, sans-serif; margin: 2rem; color: #222; }}
+table {{ border-collapse: collapse; width: 100%; }}
+th, td {{ border: 1px solid #ddd; padding: 0.5rem; text-align: left; vertical-align: top; }}
+th {{ background: #f4f4f4; }}
+</style>
+</head>
+<body>
+<h1>Schema Data Quality Roll-up{f": {html.escape(rollup.schema_name)}" if rollup.schema_name else ""}</h1>
+<p>{len(rollup.tables)} tables analyzed in {rollup.elapsed_seconds:.1f}s with up to {rollup.max_parallel_tables} in parallel.</p>
+<h2>Tables</h2>
+<table>
+<tr><th>Table</th><th>Status</th>{severity_headers}<th>Summary</th><th>Time</th></tr>
+{"".join(rows)}
+</table>
+<h2>Issues by Severity</h2>
+<ul>{issue_items or "<li>No issues found</li>"}</ul>
+</body>
+</html>
+"""
@@ -0,0 +1,98 @@
+"""
+Schema Registry
+
+Loads metadata/schema.json once per process and shares it across all agents, instead of
+every agent re-reading and re-parsing the file when it is constructed.
+"""
+
+import copy
+import json
+import os
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+
+DEFAULT_SCHEMA_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'metadata', 'schema.json')
+
+
+class SchemaRegistry:
+    """Process-wide cache of table schemas loaded from metadata files."""
+
+    @staticmethod
+    def load_schema(schema_path: str = DEFAULT_SCHEMA_PATH) -> dict:
+        """
+        Return the table schema from a metadata file.
+
+        The file is parsed once per path; each caller receives its own copy so agents can
+        safely adjust it (e.g. narrow it to one table).
+
+        Args:
+            schema_path: Path to the schema JSON file
+
+        Returns:
+            dict: Parsed schema, or an empty dict if the file is missing or invalid
+        """
+        return copy.deepcopy(SchemaRegistry._read_schema(os.path.abspath(schema_path)))
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _read_schema(schema_path: str) -> dict:
+        try:
+            with open(schema_path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            print(f"Warning: Schema file not found at {schema_path}")
+            return {}
+        except json.JSONDecodeError:
+            print(f"Warning: Invalid JSON in schema file {schema_path}")
+            return {}
+
+    @staticmethod
+    def from_table_info(
+        table_name: str,
+        columns: List[Dict[str, Any]],
+        description: str = "",
+        row_count: Optional[int] = None
+    ) -> dict:
+        """
+        Build a schema in the metadata/schema.json format from INFORMATION_SCHEMA rows.
+
+        Used for tables without a curated metadata file (e.g. in schema-wide analysis).
+
+        Args:
+            table_name: Table name
+            columns: Rows from SnowflakeQueryEngine.get_table_info (COLUMN_NAME, DATA_TYPE,
+                IS_NULLABLE, COMMENT)
+            description: Table comment
+            row_count: Approximate row count from INFORMATION_SCHEMA.TABLES
+
+        Returns:
+            dict: Schema with table_name, description and columns
+        """
+        schema_columns = []
+        for row in columns:
+            data_type = str(row.get("DATA_TYPE") or "").upper()
+            column = {
+                "name": row["COLUMN_NAME"],
+                # INFORMATION_SCHEMA reports VARCHAR columns as TEXT
+                "type": "VARCHAR" if data_type == "TEXT" else data_type,
+                "description": row.get("COMMENT") or ""
+            }
+            if str(row.get("IS_NULLABLE", "")).upper() == "NO":
+                column["max_null_pct"] = 0
+            schema_columns.append(column)
+
+        table_description = description or f"Table {table_name}"
+        if row_count is not None:
+            table_description += f" (about {row_count:,} rows)"
+        return {
+            "table_name": table_name,
+            "description": table_description,
+            "columns": schema_columns,
+            "data_quality_notes": []
+        }
+
+    @staticmethod
+    def clear() -> None:
+        """Drop cached schemas so the next load re-reads the files."""
+        SchemaRegistry._read_schema.cache_clear()
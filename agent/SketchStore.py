@@ -0,0 +1,217 @@
+"""
+Persistent per-column sketch store
+
+Keeps a HyperLogLog, a KLL quantile sketch (numeric columns) and a frequent-items sketch per
+(table, column, day partition) in SQLite, built from the rows the profiling tool already
+fetched. Distinct counts, percentiles and top values for any date range are then answered
+by merging the stored day sketches, without querying Snowflake again.
+
+The day partition of a row comes from the table's date column (the first DATE/TIMESTAMP
+column unless one is given); tables without one are stored under the day they were loaded.
+Loading rows for a day replaces that day's sketches, so re-profiling the same data does not
+count it twice. Answers describe the rows that were profiled: a sampled or filtered profiling
+query yields sketches of that sample.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from agent.Sketches import FrequentItems, HyperLogLog, KllSketch
+
+
+class SketchStore:
+    """
+    SQLite-backed store of mergeable column sketches.
+
+    Attributes:
+        path (Path): Location of the SQLite database file
+    """
+
+    def __init__(self, path: str = "ge_reports/sketches.db"):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS sketches (
+                    table_name TEXT NOT NULL COLLATE NOCASE,
+                    column_name TEXT NOT NULL COLLATE NOCASE,
+                    day TEXT NOT NULL,
+                    row_count INTEGER NOT NULL,
+                    null_count INTEGER NOT NULL,
+                    hll TEXT NOT NULL,
+                    kll TEXT,
+                    frequent TEXT NOT NULL,
+                    date_column TEXT,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (table_name, column_name, day)
+                )"""
+            )
+
+    def update_from_frame(self, table_name: str, df: pd.DataFrame, date_column: Optional[str] = None) -> int:
+        """
+        Build and store the sketches of every column, per day partition.
+
+        Args:
+            table_name: Table the rows belong to
+            df: Rows to sketch
+            date_column: Column holding the partition date; detected when omitted
+
+        Returns:
+            int: Number of (column, day) partitions written
+        """
+        if df.empty:
+            return 0
+        date_column = date_column or detect_date_column(df)
+        if date_column:
+            days = pd.to_datetime(df[date_column], errors="coerce").dt.strftime("%Y-%m-%d").fillna("unknown")
+        else:
+            days = pd.Series(date.today().isoformat(), index=df.index)
+
+        rows = []
+        updated_at = time.time()
+        for day, partition in df.groupby(days, sort=False):
+            for column in df.columns:
+                values = partition[column]
+                numeric = pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values)
+                rows.append((
+                    table_name, str(column), str(day), len(values), int(values.isna().sum()),
+                    json.dumps(HyperLogLog().update(values).to_dict()),
+                    json.dumps(KllSketch().update(values).to_dict()) if numeric else None,
+                    json.dumps(FrequentItems().update(values).to_dict()),
+                    date_column, updated_at
+                ))
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """INSERT OR REPLACE INTO sketches (table_name, column_name, day, row_count, null_count, hll, kll,
+                   frequent, date_column, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                rows
+            )
+        return len(rows)
+
+    def distinct_count(self, table_name: str, column_name: str, start: str = "", end: str = "") -> Dict[str, Any]:
+        """Estimated distinct values of a column between two days (inclusive, "" = open)."""
+        merged = self._merge(table_name, column_name, start, end)
+        if merged["partitions"]:
+            merged["distinct_count"] = round(merged.pop("hll").estimate())
+        return _public(merged)
+
+    def quantiles(
+        self,
+        table_name: str,
+        column_name: str,
+        fractions: List[float],
+        start: str = "",
+        end: str = ""
+    ) -> Dict[str, Any]:
+        """Estimated quantiles (fractions 0..1) of a numeric column between two days."""
+        merged = self._merge(table_name, column_name, start, end)
+        if merged["partitions"] and merged["kll"] is not None:
+            values = merged.pop("kll").quantiles(fractions)
+            merged["quantiles"] = {f"{fraction:g}": value for fraction, value in zip(fractions, values)}
+        return _public(merged)
+
+    def top_values(self, table_name: str, column_name: str, limit: int = 10, start: str = "", end: str = "") -> Dict[str, Any]:
+        """Most frequent values of a column between two days, with count bounds."""
+        merged = self._merge(table_name, column_name, start, end)
+        if merged["partitions"]:
+            merged["top_values"] = merged.pop("frequent").top(limit)
+        return _public(merged)
+
+    def describe(
+        self,
+        table_name: str,
+        column_name: str,
+        fractions: List[float],
+        limit: int = 10,
+        start: str = "",
+        end: str = ""
+    ) -> Dict[str, Any]:
+        """Distinct count, quantiles and top values of a column from a single merge of its partitions."""
+        merged = self._merge(table_name, column_name, start, end)
+        if merged["partitions"]:
+            merged["distinct_count"] = round(merged["hll"].estimate())
+            if merged["kll"] is not None:
+                merged["quantiles"] = {f"{fraction:g}": value
+                                       for fraction, value in zip(fractions, merged["kll"].quantiles(fractions))}
+            merged["top_values"] = merged["frequent"].top(limit)
+        return _public(merged)
+
+    def partitions(self, table_name: str, column_name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Return the stored (column, day) partitions of a table."""
+        sql = "SELECT column_name, day, row_count, null_count, date_column, updated_at FROM sketches WHERE table_name = ?"
+        params: tuple = (table_name,)
+        if column_name:
+            sql += " AND column_name = ?"
+            params += (column_name,)
+        return self.query(sql + " ORDER BY column_name, day", params)
+
+    def columns(self, table_name: str) -> List[Dict[str, Any]]:
+        """Return the sketched columns of a table with their first and last day."""
+        return self.query(
+            """SELECT column_name, MIN(NULLIF(day, 'unknown')) AS first_day, MAX(NULLIF(day, 'unknown')) AS last_day,
+                      SUM(row_count) AS row_count
+               FROM sketches WHERE table_name = ? GROUP BY column_name ORDER BY column_name""",
+            (table_name,)
+        )
+
+    def query(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        """Run a read query against the store and return rows as dictionaries."""
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params).fetchall()]
+
+    def _merge(self, table_name: str, column_name: str, start: str, end: str) -> Dict[str, Any]:
+        sql = "SELECT * FROM sketches WHERE table_name = ? AND column_name = ?"
+        params: tuple = (table_name, column_name)
+        if start or end:
+            # Rows without a parsable date only count when the whole history is requested
+            sql += " AND day BETWEEN ? AND ?"
+            params += (_day(start) or "0000-00-00", _day(end) or "9999-99-99")
+        rows = self.query(sql, params)
+
+        merged: Dict[str, Any] = {
+            "table_name": table_name, "column_name": column_name, "start_date": start, "end_date": end,
+            "partitions": len(rows), "row_count": sum(row["row_count"] for row in rows),
+            "null_count": sum(row["null_count"] for row in rows),
+            "first_day": min((row["day"] for row in rows if row["day"] != "unknown"), default=None),
+            "last_day": max((row["day"] for row in rows if row["day"] != "unknown"), default=None),
+            "hll": HyperLogLog(), "kll": None, "frequent": FrequentItems()
+        }
+        for row in rows:
+            merged["hll"].merge(HyperLogLog.from_dict(json.loads(row["hll"])))
+            merged["frequent"].merge(FrequentItems.from_dict(json.loads(row["frequent"])))
+            if row["kll"]:
+                kll = KllSketch.from_dict(json.loads(row["kll"]))
+                merged["kll"] = kll if merged["kll"] is None else merged["kll"].merge(kll)
+        return merged
+
+
+def detect_date_column(df: pd.DataFrame) -> Optional[str]:
+    """Return the first DATE/TIMESTAMP column of a frame (Snowflake DATE values arrive as date objects)."""
+    for column in df.columns:
+        values = df[column]
+        if pd.api.types.is_datetime64_any_dtype(values):
+            return column
+        sample = values.dropna().head(20)
+        if values.dtype == object and not sample.empty and all(isinstance(value, (date, datetime)) for value in sample):
+            return column
+    return None
+
+
+def _day(value: str) -> str:
+    return pd.Timestamp(value).strftime("%Y-%m-%d") if value else ""
+
+
+def _public(merged: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in merged.items() if key not in ("hll", "kll", "frequent")}
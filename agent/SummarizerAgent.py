@@ -1,10 +1,11 @@
 from pydantic import BaseModel
 from autogen_agentchat.agents import AssistantAgent
 from agent.model.ModelFactory import ModelFactory
+from agent.SchemaRegistry import SchemaRegistry
 import json
-import os
 
 from agent.tool.ProfilingReportReaderToolFactory import ProfilingReportReaderToolFactory
+from agent.tool.RunHistoryToolFactory import RunHistoryToolFactory
 
 class DataQualityIssue(BaseModel):
     type: str  # e.g., "Missing Values", "Type Mismatch"
@@ -19,11 +20,17 @@ class DataQualityAgentReport(BaseModel):
     analysis_complete: bool  # Flag to indicate if analysis is complete
 
 class SummarizerAgent:
-    def __init__(self, name="SummarizerAgent", system_message=None):
+    def __init__(self, name="SummarizerAgent", system_message=None, schema=None):
         self.model = ModelFactory.get_model()
         self.profile_reader_factory = ProfilingReportReaderToolFactory(reports_dir="ge_reports")
-        self.schema = self._get_schema()
-        self.tools = [self.profile_reader_factory.create_read_tool()]
+        self.run_history_factory = RunHistoryToolFactory()
+        self.schema = schema if schema is not None else SchemaRegistry.load_schema()
+        self.tools = [
+            self.profile_reader_factory.create_read_tool(),
+            self.profile_reader_factory.create_find_tool(),
+            self.run_history_factory.create_metric_trend_tool(),
+            self.run_history_factory.create_issue_trend_tool()
+        ]
         self.agent = AssistantAgent(
             name=name,
             model_client=self.model,
@@ -40,7 +47,8 @@ class SummarizerAgent:
                 "actions": [
                 "Correlate data samples with profiling statistics",
                 "Identify discrepancies, anomalies, and type mismatches",
-                "Summarize key findings with evidence and remediation steps"
+                "Summarize key findings with evidence and remediation steps",
+                "Compare key metrics with earlier runs (metric and issue trend tools) to tell regressions from long-standing issues"
                 ]
             },
 
@@ -77,18 +85,5 @@ class SummarizerAgent:
             output_content_type=DataQualityAgentReport
         )
 
-    def _get_schema(self):
-        """Load table schema from metadata/schema.json"""
-        schema_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'metadata', 'schema.json')
-        try:
-            with open(schema_path, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            print(f"Warning: Schema file not found at {schema_path}")
-            return {}
-        except json.JSONDecodeError:
-            print(f"Warning: Invalid JSON in schema file {schema_path}")
-            return {}
-        
     def get_agent(self):
         return self.agent
\ No newline at end of file
@@ -0,0 +1,282 @@
+"""
+Task worker server
+
+The worker side of the RemoteTaskExecutor protocol: accepts QueryTask and ProfilingTask
+units over TCP, runs up to `slots` of them at a time through a handler and sends a
+heartbeat every heartbeat_interval until the result is ready. A task whose client
+disconnects or that runs past the timeout sent with it is cancelled.
+
+Tasks run SQL with the worker's Snowflake credentials, so a worker reachable from other
+hosts must be started with a token; tasks without the same token are rejected.
+
+The default handler keeps one warm Orchestrator per process and runs each task on a
+DataAgent or DataProfilingAgent from the Orchestrator's agent pools: every task gets an
+agent no other task is using, reset before the task, so tasks of different callers never
+see each other's prompts or query results. Profiling reports refer to files written under the
+worker's reports_dir, so nodes should share that directory (e.g. a network mount) when the
+caller needs to read the profiles.
+
+LocalTaskCluster starts several workers as processes on localhost, as a stand-in for a
+multi-node cluster in tests and benchmarks.
+"""
+
+import asyncio
+import contextlib
+import hmac
+import importlib
+import multiprocessing
+import os
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from agent.RemoteTaskExecutor import TASK_KINDS, USAGE_COUNTERS, read_message, send_message
+from agent.Tracer import Tracer
+
+
+TaskHandler = Callable[[str, Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]]
+
+
+class _CountersOnly:
+    """Exporter that drops spans; the task's root span only collects usage counters."""
+
+    def export(self, span) -> None:
+        pass
+
+
+def orchestrator_task_handler(reports_dir: str = "ge_reports", **options) -> TaskHandler:
+    """
+    Handler factory running tasks on a warm Orchestrator created on the first task.
+
+    Args:
+        reports_dir: Directory the profiling reports are written to
+        **options: Orchestrator arguments (e.g. task_timeout)
+    """
+    from agent.Orchestrator import Orchestrator
+
+    orchestrator: Dict[str, Any] = {}
+
+    async def handle(kind: str, task: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if "instance" not in orchestrator:
+            instance = Orchestrator(reports_dir=reports_dir, enable_console_output=False, **options)
+            # Run the tasks here even if TASK_WORKERS is set on this node
+            instance.task_executor = None
+            orchestrator["instance"] = instance
+        report = await orchestrator["instance"].run_task(kind, task)
+        return report.model_dump(mode="json") if report is not None else None
+
+    return handle
+
+
+def load_handler_factory(path: str) -> Callable[..., TaskHandler]:
+    """Import a handler factory given as "module:function"."""
+    module_name, _, function_name = path.partition(":")
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+class TaskWorkerServer:
+    """
+    Serves tasks to RemoteTaskExecutors.
+
+    Attributes:
+        handler (TaskHandler): Runs a task (kind, task dict) and returns the report dict or None
+        host (str): Bind address
+        port (int): Bind port (0 = any free port; the bound port is set by start())
+        slots (int): Tasks run at the same time; further tasks wait (and heartbeat) for a slot
+        heartbeat_interval (float): Seconds between heartbeats of a running task
+        worker_id (str): Id reported to clients
+        token (Optional[str]): Shared secret every task must carry (None = no check)
+    """
+
+    def __init__(
+        self,
+        handler: TaskHandler,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        slots: int = 4,
+        heartbeat_interval: float = 5.0,
+        worker_id: Optional[str] = None,
+        token: Optional[str] = None
+    ):
+        self.handler = handler
+        self.host = host
+        self.port = port
+        self.slots = slots
+        self.heartbeat_interval = heartbeat_interval
+        self.worker_id = worker_id or f"{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self.token = token
+        self.stats = {"tasks": 0, "completed": 0, "failed": 0, "cancelled": 0, "rejected": 0}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> int:
+        """Start listening; returns the bound port."""
+        self._semaphore = asyncio.Semaphore(self.slots)
+        self._server = await asyncio.start_server(self._serve_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self.port
+
+    async def serve_forever(self) -> None:
+        """Start (if needed) and serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop accepting connections."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            message = await read_message(reader, timeout=self.heartbeat_interval * 3)
+            if not message or message.get("type") != "task":
+                return
+            if self.token and not hmac.compare_digest(str(message.get("token") or "").encode(), self.token.encode()):
+                self.stats["rejected"] += 1
+                await send_message(writer, {"type": "error", "error": "unauthorized: missing or wrong token",
+                                            "retryable": False})
+                return
+            if message.get("kind") not in TASK_KINDS:
+                await send_message(writer, {"type": "error", "error": f"unknown task kind {message.get('kind')!r}",
+                                            "retryable": False})
+                return
+            self.stats["tasks"] += 1
+            await send_message(writer, {"type": "accepted", "worker_id": self.worker_id})
+            timeout = message.get("timeout")
+            run = asyncio.create_task(asyncio.wait_for(self._run(message["kind"], message["task"]), timeout))
+            # The client sends nothing after the task; end of stream means it went away
+            disconnected = asyncio.create_task(reader.read())
+            while True:
+                done, _ = await asyncio.wait({run, disconnected}, timeout=self.heartbeat_interval,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                if run in done:
+                    break
+                if disconnected in done:
+                    run.cancel()
+                    with contextlib.suppress(asyncio.CancelledError, Exception):
+                        await run
+                    self.stats["cancelled"] += 1
+                    return
+                await send_message(writer, {"type": "heartbeat"})
+            disconnected.cancel()
+
+            try:
+                report, usage, query_ids = run.result()
+            except asyncio.TimeoutError:
+                self.stats["cancelled"] += 1
+                await send_message(writer, {"type": "error", "error": f"task timed out after {timeout:.1f}s",
+                                            "retryable": False, "timed_out": True})
+            except Exception as e:
+                self.stats["failed"] += 1
+                await send_message(writer, {"type": "error", "error": f"{type(e).__name__}: {e}", "retryable": True})
+            else:
+                self.stats["completed"] += 1
+                await send_message(writer, {"type": "result", "report": report, "usage": usage,
+                                            "query_ids": query_ids})
+        except (ConnectionError, asyncio.TimeoutError):
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError, OSError):
+                await writer.wait_closed()
+
+    async def _run(self, kind: str, task: Dict[str, Any]):
+        """Run a task in a slot, collecting its usage counters and Snowflake query ids."""
+        async with self._semaphore:
+            with Tracer.start_span(f"task:{kind}", "workflow", exporter=_CountersOnly()) as span:
+                report = await self.handler(kind, task)
+        usage = {key: span.attributes[key] for key in USAGE_COUNTERS if key in span.attributes}
+        return report, usage, list(span.query_ids)
+
+
+def _worker_main(
+    index: int,
+    handler_factory: str,
+    handler_kwargs: Dict[str, Any],
+    host: str,
+    slots: int,
+    heartbeat_interval: float,
+    ports,
+    token: Optional[str] = None
+) -> None:
+    """Entry point of a LocalTaskCluster process: report the bound port, then serve."""
+    handler = load_handler_factory(handler_factory)(**handler_kwargs)
+    server = TaskWorkerServer(handler, host=host, slots=slots, heartbeat_interval=heartbeat_interval, token=token)
+
+    async def main():
+        ports.put((index, await server.start()))
+        await server.serve_forever()
+
+    asyncio.run(main())
+
+
+class LocalTaskCluster:
+    """
+    Task workers running as processes on localhost, addressed like remote nodes.
+
+    Attributes:
+        workers (int): Number of worker processes
+        handler_factory (str): "module:function" building each process's handler
+        handler_kwargs (dict): Arguments of the handler factory (must be picklable)
+        slots (int): Tasks each worker runs at the same time
+        token (Optional[str]): Shared secret the workers require
+        addresses (List[str]): "host:port" of the started workers
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        handler_factory: str = "agent.TaskWorkerServer:orchestrator_task_handler",
+        handler_kwargs: Optional[Dict[str, Any]] = None,
+        slots: int = 4,
+        heartbeat_interval: float = 5.0,
+        host: str = "127.0.0.1",
+        token: Optional[str] = None
+    ):
+        self.workers = workers
+        self.handler_factory = handler_factory
+        self.handler_kwargs = handler_kwargs or {}
+        self.slots = slots
+        self.heartbeat_interval = heartbeat_interval
+        self.host = host
+        self.token = token
+        self.addresses: List[str] = []
+        self._context = multiprocessing.get_context("spawn")
+        self._processes: List[Any] = []
+
+    def start(self, timeout: float = 60.0) -> List[str]:
+        """Start the workers and wait until each one listens; returns their addresses."""
+        ports = self._context.Queue()
+        for index in range(self.workers):
+            process = self._context.Process(
+                target=_worker_main, daemon=True,
+                args=(index, self.handler_factory, self.handler_kwargs, self.host, self.slots, self.heartbeat_interval, ports,
+                      self.token)
+            )
+            process.start()
+            self._processes.append(process)
+        bound = dict(ports.get(timeout=timeout) for _ in range(self.workers))
+        self.addresses = [f"{self.host}:{bound[index]}" for index in range(self.workers)]
+        return self.addresses
+
+    def kill(self, index: int) -> None:
+        """Kill one worker process, as if its node failed."""
+        self._processes[index].kill()
+        self._processes[index].join()
+
+    def stop(self) -> None:
+        """Terminate all worker processes."""
+        for process in self._processes:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+        self._processes = []
+
+    def __enter__(self) -> "LocalTaskCluster":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
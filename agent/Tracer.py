@@ -0,0 +1,431 @@
+"""
+Tracer for workflow phases, agent runs, model calls and tool invocations
+
+Spans form a tree per workflow run:
+    workflow -> phase:* -> agent:<name> -> model:<model> / tool:<name>
+
+The active span is kept in a context variable (like WorkflowDeadline), so spans opened by
+concurrent tasks and by tool worker threads attach to the right parent. Counters such as
+prompt/completion tokens, rows, bytes and cache hits are rolled up from each span to all
+of its ancestors, so a phase span shows the totals of everything it ran.
+
+When no trace is active (no exporter configured), every span is a shared no-op and
+tracing costs one context variable lookup.
+
+Finished spans are appended to a JSONL file in the OTLP/JSON format (one
+ExportTraceServiceRequest per line, as written by the OpenTelemetry collector's file
+exporter), so the file can be inspected with TraceViewer.py or replayed into any
+OTLP-compatible backend.
+"""
+
+import asyncio
+import functools
+import json
+import os
+import threading
+import time
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+
+SERVICE_NAME = "datasentinel"
+
+# OTLP span kinds: model calls and tools talk to external services
+_OTLP_KIND = {"model": 3, "tool": 3}
+_STATUS_CODE = {"ok": 1, "error": 2}
+
+_rollup_lock = threading.Lock()
+
+
+class Span:
+    """
+    One timed operation of a workflow run.
+
+    Attributes:
+        name (str): Span name, e.g. "phase:planning" or "tool:execute_query"
+        kind (str): "workflow", "phase", "agent", "model", "tool" or "internal"
+        trace_id (str): 32 hex digit id shared by all spans of a run
+        span_id (str): 16 hex digit id of this span
+        parent (Optional[Span]): Enclosing span (None for the root)
+        start_ns (int): Start time in Unix nanoseconds
+        end_ns (Optional[int]): End time in Unix nanoseconds (None while running)
+        attributes (Dict[str, Any]): Span attributes and rolled-up counters
+        query_ids (List[str]): Snowflake query ids issued directly under this span
+        status (str): "ok" or "error"
+    """
+
+    def __init__(self, name: str, kind: str, parent: Optional["Span"], exporter: Optional["JsonlSpanExporter"], **attributes):
+        self.name = name
+        self.kind = kind
+        self.parent = parent
+        self.exporter = exporter
+        self.trace_id = parent.trace_id if parent else os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = {key: value for key, value in attributes.items() if value is not None}
+        self.query_ids: List[str] = []
+        self.status = "ok"
+        self.error: Optional[str] = None
+
+    @property
+    def recording(self) -> bool:
+        """Whether the span is part of a trace."""
+        return True
+
+    @property
+    def duration_seconds(self) -> float:
+        """Elapsed time of the span (up to now while it is running)."""
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e9
+
+    def set(self, **attributes) -> None:
+        """Set attributes on this span (None values are ignored)."""
+        self.attributes.update({key: value for key, value in attributes.items() if value is not None})
+
+    def accumulate(self, **counters: float) -> None:
+        """Add counters (tokens, rows, bytes, cache hits) to this span and all its ancestors."""
+        with _rollup_lock:
+            span = self
+            while span is not None:
+                for key, value in counters.items():
+                    if value:
+                        span.attributes[key] = span.attributes.get(key, 0) + value
+                span = span.parent
+
+    def record_query(self, query_id: str) -> None:
+        """Remember a Snowflake query id so its credits and bytes scanned can be looked up later."""
+        with _rollup_lock:
+            self.query_ids.append(query_id)
+        self.accumulate(queries=1)
+
+    def fail(self, error: BaseException) -> None:
+        """Mark the span as failed."""
+        self.status = "error"
+        self.error = f"{type(error).__name__}: {error}"
+
+    def activate(self):
+        """Make this the current span; returns a token for deactivate()."""
+        return Tracer._current.set(self)
+
+    @staticmethod
+    def deactivate(token) -> None:
+        """Restore the span that was current before activate()."""
+        Tracer._current.reset(token)
+
+    def end(self) -> None:
+        """Finish the span and export it."""
+        if self.end_ns is not None:
+            return
+        self.end_ns = time.time_ns()
+        if self.exporter is not None:
+            self.exporter.export(self)
+
+    def __enter__(self) -> "Span":
+        self._token = self.activate()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc is not None:
+            self.fail(exc)
+        self.deactivate(self._token)
+        self.end()
+
+
+class _NoOpSpan(Span):
+    """Span used when no trace is active; every operation does nothing."""
+
+    def __init__(self):
+        self.name = ""
+        self.kind = "internal"
+        self.parent = None
+        self.exporter = None
+        self.trace_id = None
+        self.span_id = None
+        self.start_ns = 0
+        self.end_ns = 0
+        self.attributes = {}
+        self.query_ids = []
+        self.status = "ok"
+        self.error = None
+
+    @property
+    def recording(self) -> bool:
+        return False
+
+    def set(self, **attributes) -> None:
+        pass
+
+    def accumulate(self, **counters: float) -> None:
+        pass
+
+    def record_query(self, query_id: str) -> None:
+        pass
+
+    def fail(self, error: BaseException) -> None:
+        pass
+
+    def activate(self):
+        return None
+
+    @staticmethod
+    def deactivate(token) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+    def __enter__(self) -> "Span":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+NOOP_SPAN = _NoOpSpan()
+
+
+class Tracer:
+    """Creates spans under the span that is current in the calling context."""
+
+    _current: ContextVar[Optional[Span]] = ContextVar("trace_span", default=None)
+
+    @classmethod
+    def current(cls) -> Span:
+        """Return the current span, or the no-op span outside a trace."""
+        span = cls._current.get()
+        return span if span is not None else NOOP_SPAN
+
+    @classmethod
+    def run_id(cls) -> Optional[str]:
+        """Return the span id of the enclosing workflow span (the run), or None outside a run."""
+        span = cls._current.get()
+        while span is not None and span.kind != "workflow":
+            span = span.parent
+        return span.span_id if span is not None else None
+
+    @classmethod
+    def start_span(
+        cls,
+        name: str,
+        kind: str = "internal",
+        exporter: Optional["JsonlSpanExporter"] = None,
+        **attributes
+    ) -> Span:
+        """
+        Start a span under the current span.
+
+        Args:
+            name: Span name
+            kind: Span kind ("workflow", "phase", "agent", "model", "tool", "internal")
+            exporter: Starts a new trace written to this exporter when no span is current
+            **attributes: Initial span attributes
+
+        Returns:
+            Span: The new span, or the no-op span when no trace is active and no exporter is given
+        """
+        parent = cls._current.get()
+        if parent is None:
+            if exporter is None:
+                return NOOP_SPAN
+            return Span(name, kind, None, exporter, **attributes)
+        return Span(name, kind, parent, parent.exporter, **attributes)
+
+    @classmethod
+    def span(cls, name: str, kind: str = "internal", **attributes) -> Span:
+        """Start a span under the current span, for use as a context manager."""
+        return cls.start_span(name, kind, **attributes)
+
+    @classmethod
+    def traced(cls, name: str, kind: str = "phase") -> Callable:
+        """
+        Decorator that runs a coroutine function inside a span.
+
+        Args:
+            name: Span name
+            kind: Span kind
+        """
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                with cls.span(name, kind):
+                    return await func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    @classmethod
+    def traced_tool(cls, func: Callable) -> Callable:
+        """
+        Wrap a synchronous tool function so each invocation is recorded as a tool span.
+
+        The function runs in a worker thread (as FunctionTool does for sync functions) with
+        the caller's context, so spans and the workflow deadline propagate into it. The
+        wrapper keeps the function's name, docstring and signature, so the FunctionTool
+        schema is unchanged. Row counts and the size of the result returned to the model
+        are recorded on the span.
+
+        Args:
+            func: Tool function returning a result dictionary
+
+        Returns:
+            Callable: Coroutine function to pass to FunctionTool
+        """
+        @functools.wraps(func)
+        async def wrapper(**kwargs):
+            with cls.span(f"tool:{func.__name__}", "tool") as span:
+                result = await asyncio.to_thread(func, **kwargs)
+                if span.recording and isinstance(result, dict):
+                    span.set(success=result.get("success"))
+                    span.accumulate(
+                        rows=result.get("row_count") or 0,
+                        bytes=len(json.dumps(result, default=str)),
+                        tool_calls=1
+                    )
+                return result
+        return wrapper
+
+
+class JsonlSpanExporter:
+    """
+    Appends finished spans to a JSONL file in the OTLP/JSON format.
+
+    Attributes:
+        path (Path): Trace file
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the exporter.
+
+        Args:
+            path: Trace file; parent directories are created on first export
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        """Append one finished span."""
+        line = json.dumps(self.to_otlp(span), default=str)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + "\n")
+
+    @staticmethod
+    def to_otlp(span: Span) -> Dict[str, Any]:
+        """Encode a span as an OTLP/JSON ExportTraceServiceRequest."""
+        attributes = {"datasentinel.kind": span.kind, **span.attributes}
+        otlp_span = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": _OTLP_KIND.get(span.kind, 1),
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns),
+            "attributes": [_otlp_attribute(key, value) for key, value in attributes.items()],
+            "status": {"code": _STATUS_CODE[span.status], **({"message": span.error} if span.error else {})},
+        }
+        if span.parent is not None:
+            otlp_span["parentSpanId"] = span.parent.span_id
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [_otlp_attribute("service.name", SERVICE_NAME)]},
+                "scopeSpans": [{"scope": {"name": SERVICE_NAME}, "spans": [otlp_span]}],
+            }]
+        }
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        encoded = {"boolValue": value}
+    elif isinstance(value, int):
+        encoded = {"intValue": str(value)}
+    elif isinstance(value, float):
+        encoded = {"doubleValue": value}
+    else:
+        encoded = {"stringValue": str(value)}
+    return {"key": key, "value": encoded}
+
+
+def _otlp_value(value: Dict[str, Any]) -> Any:
+    if "intValue" in value:
+        return int(value["intValue"])
+    if "doubleValue" in value:
+        return float(value["doubleValue"])
+    if "boolValue" in value:
+        return bool(value["boolValue"])
+    return value.get("stringValue")
+
+
+def load_traces(path: str) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Read an OTLP/JSON lines trace file.
+
+    Args:
+        path: Trace file written by JsonlSpanExporter (or any OTLP/JSON file exporter)
+
+    Returns:
+        Dict[str, List[Dict]]: Spans by trace id, each with trace_id, span_id, parent_id, name,
+        kind, start_ns, end_ns, status and attributes, ordered by start time
+    """
+    traces: Dict[str, List[Dict[str, Any]]] = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            for resource_spans in json.loads(line).get("resourceSpans", []):
+                for scope_spans in resource_spans.get("scopeSpans", []):
+                    for otlp_span in scope_spans.get("spans", []):
+                        attributes = {item["key"]: _otlp_value(item["value"]) for item in otlp_span.get("attributes", [])}
+                        span = {
+                            "trace_id": otlp_span["traceId"],
+                            "span_id": otlp_span["spanId"],
+                            "parent_id": otlp_span.get("parentSpanId") or None,
+                            "name": otlp_span["name"],
+                            "kind": attributes.pop("datasentinel.kind", "internal"),
+                            "start_ns": int(otlp_span["startTimeUnixNano"]),
+                            "end_ns": int(otlp_span["endTimeUnixNano"]),
+                            "status": "error" if otlp_span.get("status", {}).get("code") == 2 else "ok",
+                            "attributes": attributes,
+                        }
+                        traces.setdefault(span["trace_id"], []).append(span)
+    for spans in traces.values():
+        spans.sort(key=lambda span: span["start_ns"])
+    return traces
+
+
+def critical_path(spans: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Return the spans on the critical path of a trace.
+
+    Starting at the root, the path repeatedly follows the child that finished last before
+    the current point in time, then continues backwards from that child's start; time not
+    covered by any child is the parent's own work. Shortening any span on the path shortens
+    the run; spans off the path only overlap with it.
+
+    Args:
+        spans: Spans of one trace as returned by load_traces
+
+    Returns:
+        List[Dict]: Critical path spans ordered by start time (root first)
+    """
+    ids = {span["span_id"] for span in spans}
+    children: Dict[Optional[str], List[Dict[str, Any]]] = {}
+    for span in spans:
+        parent_id = span["parent_id"] if span["parent_id"] in ids else None
+        children.setdefault(parent_id, []).append(span)
+
+    def walk(span: Dict[str, Any]) -> List[Dict[str, Any]]:
+        path = [span]
+        cursor = span["end_ns"]
+        for child in sorted(children.get(span["span_id"], []), key=lambda s: s["end_ns"], reverse=True):
+            if child["end_ns"] <= cursor:
+                path.extend(walk(child))
+                cursor = child["start_ns"]
+        return path
+
+    roots = children.get(None, [])
+    if not roots:
+        return []
+    path = walk(max(roots, key=lambda span: span["end_ns"] - span["start_ns"]))
+    return sorted(path, key=lambda span: span["start_ns"])
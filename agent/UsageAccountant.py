@@ -0,0 +1,174 @@
+"""
+Usage accounting per agent, phase and run
+
+Every workflow run records its spans (see Tracer), and the UsageAccountant is the span
+exporter of the run: it keeps the counters of each finished span and forwards the span to
+the trace file when tracing is enabled. Counters recorded by the spans:
+- prompt_tokens / completion_tokens / model_calls / cache_hits: from each model call's RequestUsage
+- tool_calls / rows / bytes: tool invocations, rows returned and bytes sent back to the model
+- queries: Snowflake query ids issued, resolved to bytes scanned and credits via QUERY_HISTORY
+- profiling_cpu_seconds: CPU time spent building ydata-profiling reports
+
+summarize() aggregates them per agent, per phase and for the whole run.
+"""
+
+import threading
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+from agent.Tracer import Span
+
+
+class UsageTotals(BaseModel):
+    """Resources consumed by a run, an agent or a phase"""
+    prompt_tokens: int = 0  # Prompt tokens sent to the model
+    completion_tokens: int = 0  # Tokens generated by the model
+    model_calls: int = 0  # Model requests (including cache hits)
+    cache_hits: int = 0  # Model requests served from the LLM response cache
+    tool_calls: int = 0  # Agent tool invocations
+    rows: int = 0  # Rows returned by queries
+    bytes_returned: int = 0  # Bytes of tool results sent back to the model
+    queries: int = 0  # Snowflake queries issued
+    bytes_scanned: int = 0  # Bytes scanned by those queries (QUERY_HISTORY)
+    snowflake_credits: float = 0.0  # Estimated compute + cloud services credits
+    query_seconds: float = 0.0  # Warehouse execution time of the queries
+    profiling_cpu_seconds: float = 0.0  # CPU time spent building profiling reports
+    elapsed_seconds: float = 0.0  # Summed span durations (concurrent spans overlap)
+
+
+class RunUsage(BaseModel):
+    """Usage of one run broken down by agent and phase"""
+    run_id: str  # Span id of the run (unique per goal within a batch trace)
+    trace_id: str  # Trace id of the run
+    run: UsageTotals  # Totals for the whole run
+    by_agent: Dict[str, UsageTotals]  # Totals per agent name
+    by_phase: Dict[str, UsageTotals]  # Totals per phase name
+    unresolved_queries: int  # Query ids not (yet) found in QUERY_HISTORY
+
+
+class _SpanRecord:
+    """Counters of a finished span and the ids of its ancestors."""
+
+    __slots__ = ("span_id", "name", "kind", "attributes", "query_ids", "ancestors", "seconds")
+
+    def __init__(self, span: Span):
+        self.span_id = span.span_id
+        self.name = span.name
+        self.kind = span.kind
+        self.attributes = dict(span.attributes)
+        self.query_ids = list(span.query_ids)
+        self.seconds = span.duration_seconds
+        ancestors = []
+        parent = span.parent
+        while parent is not None:
+            ancestors.append(parent.span_id)
+            parent = parent.parent
+        self.ancestors = frozenset(ancestors)
+
+
+class UsageAccountant:
+    """
+    Span exporter that aggregates usage counters.
+
+    Attributes:
+        exporter: Exporter that finished spans are forwarded to (None = keep in memory only)
+    """
+
+    def __init__(self, exporter=None):
+        """
+        Initialize the accountant.
+
+        Args:
+            exporter: Optional trace exporter (e.g. JsonlSpanExporter) to forward spans to
+        """
+        self.exporter = exporter
+        self._records: List[_SpanRecord] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        """Record a finished span and forward it."""
+        record = _SpanRecord(span)
+        with self._lock:
+            self._records.append(record)
+        if self.exporter is not None:
+            self.exporter.export(span)
+
+    def _records_under(self, root: Span) -> List[_SpanRecord]:
+        with self._lock:
+            return [record for record in self._records if root.span_id in record.ancestors]
+
+    def query_ids(self, root: Span) -> List[str]:
+        """Return the Snowflake query ids issued under a span (including the span itself)."""
+        ids = list(root.query_ids)
+        for record in self._records_under(root):
+            ids.extend(record.query_ids)
+        return ids
+
+    def summarize(self, root: Span, query_stats: Optional[Dict[str, dict]] = None) -> RunUsage:
+        """
+        Aggregate the usage of everything that ran under a span.
+
+        Args:
+            root: The run's span (still running or finished)
+            query_stats: Per query id stats from SnowflakeQueryEngine.get_query_stats
+
+        Returns:
+            RunUsage: Totals for the run, per agent and per phase
+        """
+        query_stats = query_stats or {}
+        records = self._records_under(root)
+
+        # Query stats are attributed to the span that issued the query and its ancestors
+        query_totals: Dict[str, UsageTotals] = {}
+        unresolved = 0
+        for span_id, ancestors, ids in [(root.span_id, frozenset(), root.query_ids)] + \
+                [(record.span_id, record.ancestors, record.query_ids) for record in records]:
+            for query_id in ids:
+                stats = query_stats.get(query_id)
+                if stats is None:
+                    unresolved += 1
+                    continue
+                for owner in ancestors | {span_id}:
+                    totals = query_totals.setdefault(owner, UsageTotals())
+                    totals.bytes_scanned += stats.get("bytes_scanned", 0)
+                    totals.snowflake_credits += stats.get("credits", 0.0)
+                    totals.query_seconds += stats.get("execution_seconds", 0.0)
+
+        def totals_for(span_id: str, attributes: dict, seconds: float) -> UsageTotals:
+            totals = query_totals.get(span_id, UsageTotals()).model_copy()
+            totals.prompt_tokens = int(attributes.get("prompt_tokens", 0))
+            totals.completion_tokens = int(attributes.get("completion_tokens", 0))
+            totals.model_calls = int(attributes.get("model_calls", 0))
+            totals.cache_hits = int(attributes.get("cache_hits", 0))
+            totals.tool_calls = int(attributes.get("tool_calls", 0))
+            totals.rows = int(attributes.get("rows", 0))
+            totals.bytes_returned = int(attributes.get("bytes", 0))
+            totals.queries = int(attributes.get("queries", 0))
+            totals.profiling_cpu_seconds = float(attributes.get("profiling_cpu_seconds", 0.0))
+            totals.elapsed_seconds = seconds
+            return totals
+
+        by_agent: Dict[str, UsageTotals] = {}
+        by_phase: Dict[str, UsageTotals] = {}
+        for record in records:
+            if record.kind not in ("agent", "phase"):
+                continue
+            group = by_agent if record.kind == "agent" else by_phase
+            name = record.name.split(":", 1)[-1]
+            group[name] = _add(group.get(name), totals_for(record.span_id, record.attributes, record.seconds))
+
+        return RunUsage(
+            run_id=root.span_id,
+            trace_id=root.trace_id,
+            run=totals_for(root.span_id, root.attributes, root.duration_seconds),
+            by_agent=dict(sorted(by_agent.items())),
+            by_phase=by_phase,
+            unresolved_queries=unresolved
+        )
+
+
+def _add(first: Optional[UsageTotals], second: UsageTotals) -> UsageTotals:
+    if first is None:
+        return second
+    return UsageTotals(**{field: getattr(first, field) + getattr(second, field) for field in UsageTotals.model_fields})
@@ -0,0 +1,129 @@
+"""
+Usage history
+
+SQLite store of the usage of every workflow run, one row per run in `runs` and one row
+per agent and phase in `run_usage`, so costs can be compared across runs and budgets set
+from real numbers. The file can be queried directly:
+
+    SELECT name, AVG(prompt_tokens + completion_tokens) AS tokens, AVG(snowflake_credits)
+    FROM run_usage WHERE scope = 'agent' GROUP BY name ORDER BY tokens DESC;
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from agent.UsageAccountant import RunUsage, UsageTotals
+
+
+_METRICS = list(UsageTotals.model_fields)
+
+
+class UsageHistory:
+    """
+    SQLite-backed history of run usage.
+
+    Attributes:
+        path (Path): Location of the SQLite database file
+    """
+
+    def __init__(self, path: str = "ge_reports/usage_history.db"):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        metric_columns = ", ".join(
+            f"{metric} {'INTEGER' if UsageTotals.model_fields[metric].annotation is int else 'REAL'} NOT NULL DEFAULT 0"
+            for metric in _METRICS
+        )
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                f"""CREATE TABLE IF NOT EXISTS runs (
+                    run_id TEXT PRIMARY KEY,
+                    trace_id TEXT NOT NULL,
+                    recorded_at REAL NOT NULL,
+                    goal TEXT NOT NULL,
+                    success INTEGER NOT NULL,
+                    unresolved_queries INTEGER NOT NULL DEFAULT 0,
+                    {metric_columns}
+                )"""
+            )
+            self._conn.execute(
+                f"""CREATE TABLE IF NOT EXISTS run_usage (
+                    run_id TEXT NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+                    scope TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    {metric_columns},
+                    PRIMARY KEY (run_id, scope, name)
+                )"""
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_recorded_at ON runs (recorded_at)")
+
+    def record(self, goal: str, usage: RunUsage, success: bool) -> None:
+        """
+        Store the usage of a run (replacing an earlier record of the same run).
+
+        Args:
+            goal: The run's goal
+            usage: Aggregated usage of the run
+            success: Whether the run completed
+        """
+        columns = ", ".join(_METRICS)
+        placeholders = ", ".join("?" for _ in _METRICS)
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM run_usage WHERE run_id = ?", (usage.run_id,))
+            self._conn.execute(
+                f"""INSERT OR REPLACE INTO runs (run_id, trace_id, recorded_at, goal, success, unresolved_queries, {columns})
+                    VALUES (?, ?, ?, ?, ?, ?, {placeholders})""",
+                (usage.run_id, usage.trace_id, time.time(), goal, int(success), usage.unresolved_queries,
+                 *[getattr(usage.run, metric) for metric in _METRICS])
+            )
+            self._conn.executemany(
+                f"""INSERT INTO run_usage (run_id, scope, name, {columns})
+                    VALUES (?, ?, ?, {placeholders})""",
+                [
+                    (usage.run_id, scope, name, *[getattr(totals, metric) for metric in _METRICS])
+                    for scope, group in (("agent", usage.by_agent), ("phase", usage.by_phase))
+                    for name, totals in group.items()
+                ]
+            )
+
+    def recent_runs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Return the most recent runs with their totals, newest first."""
+        return self.query("SELECT * FROM runs ORDER BY recorded_at DESC LIMIT ?", (limit,))
+
+    def breakdown(
+        self,
+        scope: str = "agent",
+        metric: str = "prompt_tokens",
+        since: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Aggregate a metric per agent or phase across runs, most expensive first.
+
+        Args:
+            scope: "agent" or "phase"
+            metric: Any UsageTotals field, e.g. "prompt_tokens" or "snowflake_credits"
+            since: Only include runs recorded after this Unix time
+
+        Returns:
+            List of {"name", "runs", "total", "average"} rows
+        """
+        if metric not in _METRICS:
+            raise ValueError(f"Unknown metric '{metric}'. Expected one of: {', '.join(_METRICS)}")
+        return self.query(
+            f"""SELECT u.name AS name, COUNT(*) AS runs, SUM(u.{metric}) AS total, AVG(u.{metric}) AS average
+                FROM run_usage u JOIN runs r ON r.run_id = u.run_id
+                WHERE u.scope = ? AND r.recorded_at >= ?
+                GROUP BY u.name ORDER BY total DESC""",
+            (scope, since or 0)
+        )
+
+    def query(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        """Run a read query against the history and return rows as dictionaries."""
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params).fetchall()]
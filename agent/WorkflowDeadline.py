@@ -0,0 +1,73 @@
+"""
+Workflow Deadline
+
+Wall-clock budget of one workflow run. The active deadline is kept in a context variable,
+so every phase and agent task of a run (including tasks it spawns) sees the same deadline,
+while concurrent runs sharing one Orchestrator (batch, schema fan-out) keep their own.
+"""
+
+import time
+from contextvars import ContextVar
+from typing import List, Optional
+
+
+class WorkflowDeadline:
+    """
+    Deadline of one workflow run and the steps that hit a timeout.
+
+    Attributes:
+        expires_at (Optional[float]): time.monotonic() value at which the run must stop (None = no limit)
+        timed_out (List[str]): Names of phases and tasks that were cut short
+    """
+
+    _current: ContextVar[Optional["WorkflowDeadline"]] = ContextVar("workflow_deadline", default=None)
+
+    def __init__(self, timeout: Optional[float] = None):
+        """
+        Initialize the deadline.
+
+        Args:
+            timeout: Seconds the workflow may take from now (None = no limit)
+        """
+        self.expires_at = time.monotonic() + timeout if timeout else None
+        self.timed_out: List[str] = []
+
+    @classmethod
+    def current(cls) -> "WorkflowDeadline":
+        """Return the deadline of the running workflow, or an unlimited one outside a run."""
+        deadline = cls._current.get()
+        return deadline if deadline is not None else cls()
+
+    def activate(self):
+        """Make this the current deadline; returns a token for deactivate()."""
+        return WorkflowDeadline._current.set(self)
+
+    @staticmethod
+    def deactivate(token) -> None:
+        """Restore the deadline that was current before activate()."""
+        WorkflowDeadline._current.reset(token)
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left in the workflow (None = no limit)."""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def budget(self, limit: Optional[float]) -> Optional[float]:
+        """
+        Seconds available for a step.
+
+        Args:
+            limit: The step's own timeout (None = no limit)
+
+        Returns:
+            Optional[float]: The smaller of the step limit and the remaining workflow time
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return limit
+        return remaining if limit is None else min(limit, remaining)
+
+    def record_timeout(self, step: str) -> None:
+        """Remember that a step was cut short."""
+        self.timed_out.append(step)
@@ -0,0 +1,195 @@
+"""
+Background workflow worker
+
+Runs workflows as jobs on a long-lived event loop in a daemon thread, so a caller such as
+the Streamlit app can submit a goal and return immediately instead of blocking in
+asyncio.run() until the workflow finishes. Progress events emitted by a job are put on the
+job's queue and drained by the UI on its next refresh.
+
+One worker is shared by every session of the server. Up to max_concurrent_jobs workflows
+run at the same time; further jobs wait in the "queued" state. All jobs share the loop, so
+async model clients and the shared Snowflake engine are reused across jobs, while the
+per-run context (WorkflowDeadline, trace spans) stays per job because each job is its own
+task.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+
+class WorkflowJob:
+    """
+    A workflow submitted to the worker.
+
+    Attributes:
+        job_id (str): Unique id of the job
+        goal (str): Goal the workflow runs for
+        status (str): "queued", "running", "done", "failed" or "cancelled"
+        results (dict): The workflow's results once it is done
+        error (str): Error message if the job failed
+        created_at / started_at / finished_at (float): Unix times of the job's transitions
+    """
+
+    def __init__(self, goal: str):
+        self.job_id = uuid.uuid4().hex[:12]
+        self.goal = goal
+        self.status = JOB_QUEUED
+        self.results: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._events: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self._future = None
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has stopped (done, failed or cancelled)."""
+        return self.status in (JOB_DONE, JOB_FAILED, JOB_CANCELLED)
+
+    def emit(self, event: Dict[str, Any]) -> None:
+        """Publish a progress event (safe to call from any thread)."""
+        self._events.put(event)
+
+    def drain_events(self) -> List[Dict[str, Any]]:
+        """Return the events published since the last call, without blocking."""
+        events = []
+        while True:
+            try:
+                events.append(self._events.get_nowait())
+            except queue.Empty:
+                return events
+
+
+class WorkflowWorker:
+    """
+    Runs workflow jobs on a background event loop.
+
+    Attributes:
+        max_concurrent_jobs (int): Maximum number of workflows running at the same time
+        max_finished_jobs (int): Finished jobs kept for lookup before the oldest are forgotten
+    """
+
+    def __init__(self, max_concurrent_jobs: int = 2, max_finished_jobs: int = 50):
+        """
+        Start the worker thread and its event loop.
+
+        Args:
+            max_concurrent_jobs: Limit for concurrently running workflows
+            max_finished_jobs: Number of finished jobs to keep
+        """
+        self.max_concurrent_jobs = max(1, max_concurrent_jobs)
+        self.max_finished_jobs = max_finished_jobs
+        self._jobs: Dict[str, WorkflowJob] = {}
+        self._lock = threading.Lock()
+        self._loop = asyncio.new_event_loop()
+        self._slots: Optional[asyncio.Semaphore] = None
+        ready = threading.Event()
+        self._thread = threading.Thread(target=self._run_loop, args=(ready,), name="WorkflowWorker", daemon=True)
+        self._thread.start()
+        ready.wait()
+
+    def _run_loop(self, ready: threading.Event) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._slots = asyncio.Semaphore(self.max_concurrent_jobs)
+        ready.set()
+        self._loop.run_forever()
+
+    def submit(self, goal: str, run: Callable[[WorkflowJob], Awaitable[Dict[str, Any]]]) -> WorkflowJob:
+        """
+        Queue a workflow and return immediately.
+
+        Args:
+            goal: Goal of the workflow
+            run: Coroutine function that runs the workflow for the job and returns its
+                results; it reports progress with job.emit(...)
+
+        Returns:
+            WorkflowJob: The queued job
+        """
+        job = WorkflowJob(goal)
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._forget_finished_jobs()
+        job._future = asyncio.run_coroutine_threadsafe(self._run_job(job, run), self._loop)
+        job._future.add_done_callback(lambda _: self._mark_cancelled_before_start(job))
+        return job
+
+    async def _run_job(self, job: WorkflowJob, run: Callable[[WorkflowJob], Awaitable[Dict[str, Any]]]) -> None:
+        status, error = JOB_FAILED, None
+        try:
+            async with self._slots:
+                if job.finished_at is not None:
+                    return
+                job.status = JOB_RUNNING
+                job.started_at = time.time()
+                job.emit({"type": "status", "status": JOB_RUNNING})
+                job.results = await run(job)
+                status = JOB_DONE if job.results.get("success") else JOB_FAILED
+                error = job.results.get("error")
+        except asyncio.CancelledError:
+            status = JOB_CANCELLED
+        except Exception as e:
+            error = str(e)
+        finally:
+            self._finish(job, status, error)
+
+    def get(self, job_id: str) -> Optional[WorkflowJob]:
+        """Return a job by id (None if unknown or forgotten)."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self) -> List[WorkflowJob]:
+        """Return all known jobs, newest first."""
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda job: job.created_at, reverse=True)
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a queued or running job.
+
+        Returns:
+            bool: True if a cancellation was requested
+        """
+        job = self.get(job_id)
+        if job is None or job.finished:
+            return False
+        # Cancelling the concurrent future cancels the job's task on the worker loop
+        job._future.cancel()
+        return True
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Cancel all jobs and stop the worker thread."""
+        for job in self.jobs():
+            self.cancel(job.job_id)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+
+    def _mark_cancelled_before_start(self, job: WorkflowJob) -> None:
+        # Runs as soon as the job's future is cancelled, possibly before the loop has
+        # processed the cancellation; a job that never started has nothing left to stop
+        if job._future.cancelled() and job.started_at is None:
+            self._finish(job, JOB_CANCELLED, None)
+
+    def _finish(self, job: WorkflowJob, status: str, error: Optional[str]) -> None:
+        with self._lock:
+            if job.finished_at is not None:
+                return
+            job.status, job.error, job.finished_at = status, error, time.time()
+        job.emit({"type": "status", "status": status, "error": error})
+
+    def _forget_finished_jobs(self) -> None:
+        finished = sorted((job for job in self._jobs.values() if job.finished), key=lambda job: job.finished_at)
+        for job in finished[:max(0, len(finished) - self.max_finished_jobs)]:
+            del self._jobs[job.job_id]
@@ -8,14 +8,23 @@ This package contains all the specialized agents for data quality analysis:
 - SummarizerAgent: Synthesizes findings
 - ReportAgent: Creates HTML reports
 - Orchestrator: Coordinates all agents
+
+Agents are imported lazily (PEP 562) so that `import agent` stays cheap; a submodule is
+loaded the first time one of its classes is accessed.
 """
 
-from .PlannerAgent import PlannerAgent
-from .DataAgent import DataAgent
-from .DataProfilingAgent import DataProfilingAgent
-from .SummarizerAgent import SummarizerAgent
-from .ReportAgent import ReportAgent
-from .Orchestrator import Orchestrator
+import importlib
+import sys
+import types
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .PlannerAgent import PlannerAgent
+    from .DataAgent import DataAgent
+    from .DataProfilingAgent import DataProfilingAgent
+    from .SummarizerAgent import SummarizerAgent
+    from .ReportAgent import ReportAgent
+    from .Orchestrator import Orchestrator
 
 __all__ = [
     'PlannerAgent',
@@ -25,3 +34,29 @@ __all__ = [
     'ReportAgent',
     'Orchestrator'
 ]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        value = getattr(importlib.import_module(f".{name}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
+
+
+class _LazyPackage(types.ModuleType):
+    """Keeps `agent.<Name>` resolving to the class even after its submodule is imported."""
+
+    def __setattr__(self, name, value):
+        # The import system binds each loaded submodule on its package; skip that binding
+        # for the exported names so __getattr__ still returns the class, as before
+        if name in __all__ and isinstance(value, types.ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _LazyPackage
@@ -0,0 +1,194 @@
+"""
+Record/replay caching wrapper for AutoGen model clients
+
+Wraps any ChatCompletionClient and serves identical requests from an LLMResponseCache.
+The cache key is a SHA-256 hash of the model name, messages, tools, tool choice, output
+schema and extra create arguments.
+
+Modes:
+- "read_write": serve hits from the cache, call the model and record on misses
+- "record": always call the model and overwrite the cached response
+- "replay": serve hits only; a miss raises LLMCacheMissError (deterministic offline runs)
+"""
+
+import hashlib
+import json
+from typing import Any, AsyncGenerator, Literal, Mapping, Optional, Sequence, Union
+
+from autogen_core import CancellationToken
+from autogen_core.models import (
+    ChatCompletionClient,
+    CreateResult,
+    LLMMessage,
+    ModelCapabilities,
+    ModelInfo,
+    RequestUsage,
+)
+from autogen_core.tools import Tool, ToolSchema
+from pydantic import BaseModel, ValidationError
+
+from agent.model.LLMResponseCache import LLMResponseCache
+
+
+CACHE_MODES = ("read_write", "record", "replay")
+
+
+class LLMCacheMissError(RuntimeError):
+    """Raised in replay mode when a request has no recorded response."""
+
+
+class CachedChatCompletionClient(ChatCompletionClient):
+    """
+    ChatCompletionClient decorator that records and replays responses.
+
+    Attributes:
+        client (ChatCompletionClient): Wrapped model client
+        cache (LLMResponseCache): Persistent response store
+        model (str): Model name included in every cache key
+        mode (str): One of "read_write", "record" or "replay"
+        hits (int): Number of requests served from the cache
+        misses (int): Number of requests sent to the wrapped client
+    """
+
+    def __init__(
+        self,
+        client: ChatCompletionClient,
+        cache: LLMResponseCache,
+        model: str,
+        mode: str = "read_write"
+    ):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Invalid LLM cache mode '{mode}'. Expected one of: {', '.join(CACHE_MODES)}")
+        self.client = client
+        self.cache = cache
+        self.model = model
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+
+    def cache_key(
+        self,
+        messages: Sequence[LLMMessage],
+        tools: Sequence[Tool | ToolSchema] = [],
+        tool_choice: Tool | Literal["auto", "required", "none"] = "auto",
+        json_output: Optional[bool | type[BaseModel]] = None,
+        extra_create_args: Mapping[str, Any] = {}
+    ) -> str:
+        """Return the SHA-256 key identifying a request."""
+        if isinstance(json_output, type) and issubclass(json_output, BaseModel):
+            output_schema: Any = json_output.model_json_schema()
+        else:
+            output_schema = json_output
+
+        data = {
+            "model": self.model,
+            "messages": [message.model_dump(mode="json") for message in messages],
+            "tools": [tool.schema if isinstance(tool, Tool) else tool for tool in tools],
+            "tool_choice": tool_choice.name if isinstance(tool_choice, Tool) else tool_choice,
+            "json_output": output_schema,
+            "extra_create_args": dict(extra_create_args),
+        }
+        serialized = json.dumps(data, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def _lookup(self, key: str) -> Optional[CreateResult]:
+        if self.mode == "record":
+            return None
+        value = self.cache.get(key)
+        if value is None:
+            if self.mode == "replay":
+                raise LLMCacheMissError(f"No recorded LLM response for request {key[:12]} (replay mode)")
+            return None
+        try:
+            result = CreateResult.model_validate_json(value)
+        except ValidationError:
+            if self.mode == "replay":
+                raise LLMCacheMissError(f"Recorded LLM response for request {key[:12]} is invalid")
+            return None
+        result.cached = True
+        self.hits += 1
+        return result
+
+    async def create(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+        tool_choice: Tool | Literal["auto", "required", "none"] = "auto",
+        json_output: Optional[bool | type[BaseModel]] = None,
+        extra_create_args: Mapping[str, Any] = {},
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> CreateResult:
+        key = self.cache_key(messages, tools, tool_choice, json_output, extra_create_args)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        self.misses += 1
+        result = await self.client.create(
+            messages,
+            tools=tools,
+            tool_choice=tool_choice,
+            json_output=json_output,
+            extra_create_args=extra_create_args,
+            cancellation_token=cancellation_token,
+        )
+        self.cache.set(key, result.model_dump_json())
+        return result
+
+    def create_stream(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+        tool_choice: Tool | Literal["auto", "required", "none"] = "auto",
+        json_output: Optional[bool | type[BaseModel]] = None,
+        extra_create_args: Mapping[str, Any] = {},
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> AsyncGenerator[Union[str, CreateResult], None]:
+        async def _generator() -> AsyncGenerator[Union[str, CreateResult], None]:
+            key = self.cache_key(messages, tools, tool_choice, json_output, extra_create_args)
+            cached = self._lookup(key)
+            if cached is not None:
+                if isinstance(cached.content, str) and cached.content:
+                    yield cached.content
+                yield cached
+                return
+
+            self.misses += 1
+            async for chunk in self.client.create_stream(
+                messages,
+                tools=tools,
+                tool_choice=tool_choice,
+                json_output=json_output,
+                extra_create_args=extra_create_args,
+                cancellation_token=cancellation_token,
+            ):
+                if isinstance(chunk, CreateResult):
+                    self.cache.set(key, chunk.model_dump_json())
+                yield chunk
+
+        return _generator()
+
+    async def close(self) -> None:
+        await self.client.close()
+
+    def actual_usage(self) -> RequestUsage:
+        return self.client.actual_usage()
+
+    def total_usage(self) -> RequestUsage:
+        return self.client.total_usage()
+
+    def count_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+        return self.client.count_tokens(messages, tools=tools)
+
+    def remaining_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+        return self.client.remaining_tokens(messages, tools=tools)
+
+    @property
+    def capabilities(self) -> ModelCapabilities:  # type: ignore
+        return self.client.capabilities
+
+    @property
+    def model_info(self) -> ModelInfo:
+        return self.client.model_info
@@ -0,0 +1,137 @@
+"""
+Persistent LLM response store
+
+SQLite-backed key/value store for serialized model responses. Entries expire after a
+configurable TTL and the store is bounded by a maximum entry count with least-recently-used
+eviction, so repeated workflow runs can be served locally without growing without bound.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class LLMResponseCache:
+    """
+    SQLite store with TTL expiry and LRU eviction for cached model responses.
+
+    Attributes:
+        path (Path): Location of the SQLite database file
+        ttl_seconds (Optional[float]): Maximum age of an entry (None keeps entries forever)
+        max_entries (int): Maximum number of entries kept before LRU eviction
+    """
+
+    def __init__(
+        self,
+        path: str = ".cache/llm_responses.db",
+        ttl_seconds: Optional[float] = 7 * 24 * 3600,
+        max_entries: int = 10000
+    ):
+        log_level = os.environ.get('LOG_LEVEL', 'ERROR').upper()
+        numeric_level = getattr(logging, log_level, logging.ERROR)
+        logging.basicConfig(level=numeric_level)
+        self.logger = logging.getLogger(__name__)
+
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_accessed REAL NOT NULL,
+                    hits INTEGER NOT NULL DEFAULT 0
+                )"""
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_cache_last_accessed ON llm_cache (last_accessed)"
+            )
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Return the cached value for a key, or None if missing or expired.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            Optional[str]: Serialized response
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, created_at = row
+            if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                return None
+
+            self._conn.execute(
+                "UPDATE llm_cache SET last_accessed = ?, hits = hits + 1 WHERE key = ?", (now, key)
+            )
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Store a value, evicting the least recently used entries beyond max_entries.
+
+        Args:
+            key (str): Cache key
+            value (str): Serialized response
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                """INSERT INTO llm_cache (key, value, created_at, last_accessed, hits)
+                   VALUES (?, ?, ?, ?, 0)
+                   ON CONFLICT(key) DO UPDATE SET
+                       value = excluded.value,
+                       created_at = excluded.created_at,
+                       last_accessed = excluded.last_accessed""",
+                (key, value, now, now)
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        if self.ttl_seconds is not None:
+            self._conn.execute(
+                "DELETE FROM llm_cache WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+            )
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                """DELETE FROM llm_cache WHERE key IN (
+                       SELECT key FROM llm_cache ORDER BY last_accessed ASC LIMIT ?
+                   )""",
+                (overflow,)
+            )
+            self.logger.info(f"Evicted {overflow} least recently used LLM cache entries")
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM llm_cache")
+
+    def stats(self) -> Dict[str, Any]:
+        """Return entry count and total hit count."""
+        with self._lock:
+            count, hits = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(hits), 0) FROM llm_cache"
+            ).fetchone()
+        return {"entries": count, "hits": hits, "path": str(self.path)}
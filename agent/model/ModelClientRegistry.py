@@ -0,0 +1,170 @@
+"""
+Process-wide registry of shared model clients
+
+All agents asking for the same model and settings receive the same rate-limited client,
+backed by one tuned HTTP connection pool (HTTP/2 through the `h2` package from
+httpx[http2] in requirements.txt, bounded keep-alive connections). Because httpx connection pools are bound to the event
+loop that opened them, the shared HTTP client keeps one pool per running loop and drops
+pools whose loop has been closed (e.g. after each asyncio.run in a Streamlit rerun).
+
+Configuration (environment variables):
+- LLM_RPM / LLM_TPM: requests and tokens per minute per model (unset or 0 = unlimited)
+- LLM_MAX_RETRIES: retries after a 429 response (default 3)
+- LLM_MAX_CONNECTIONS / LLM_MAX_KEEPALIVE_CONNECTIONS / LLM_KEEPALIVE_EXPIRY: pool sizing
+- LLM_HTTP2: "true" (default) to negotiate HTTP/2 when available
+"""
+
+import asyncio
+import hashlib
+import importlib.util
+import logging
+import os
+import threading
+import weakref
+from typing import Any, Optional
+
+from autogen_core.models import ChatCompletionClient
+
+from agent.model.RateLimitedChatCompletionClient import RateLimitedChatCompletionClient
+from agent.model.TokenBucketRateLimiter import TokenBucketRateLimiter
+
+try:
+    import httpx
+except ImportError:  # the OpenAI SDK falls back to its own default pool
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+
+def _env_number(name: str, default: Optional[float] = None) -> Optional[float]:
+    value = os.environ.get(name)
+    if value is None or value.strip() == "":
+        return default
+    number = float(value)
+    return number if number > 0 else None
+
+
+if httpx is not None:
+
+    class LoopLocalAsyncClient(httpx.AsyncClient):
+        """
+        httpx.AsyncClient that sends each request through a pool owned by the running loop.
+
+        The base client only builds requests; connections live in per-loop inner clients
+        created with the same settings.
+        """
+
+        def __init__(self, **client_kwargs: Any):
+            super().__init__(**client_kwargs)
+            self._client_kwargs = client_kwargs
+            self._pools: dict[int, tuple[weakref.ref, httpx.AsyncClient]] = {}
+            self._pools_lock = threading.Lock()
+
+        def _pool(self) -> "httpx.AsyncClient":
+            loop = asyncio.get_running_loop()
+            with self._pools_lock:
+                # Pools of closed loops cannot be closed gracefully any more; just drop them
+                for key, (loop_ref, _) in list(self._pools.items()):
+                    owner = loop_ref()
+                    if owner is None or owner.is_closed():
+                        del self._pools[key]
+
+                entry = self._pools.get(id(loop))
+                if entry is None or entry[0]() is not loop:
+                    entry = (weakref.ref(loop), httpx.AsyncClient(**self._client_kwargs))
+                    self._pools[id(loop)] = entry
+                return entry[1]
+
+        async def send(self, request: "httpx.Request", **kwargs: Any) -> "httpx.Response":
+            return await self._pool().send(request, **kwargs)
+
+        async def aclose(self) -> None:
+            loop = asyncio.get_running_loop()
+            with self._pools_lock:
+                entry = self._pools.pop(id(loop), None)
+            if entry is not None and entry[0]() is loop:
+                await entry[1].aclose()
+            await super().aclose()
+
+
+class ModelClientRegistry:
+    """Shares model clients, HTTP pools and rate limiters across all agents in the process."""
+
+    _lock = threading.Lock()
+    _clients: dict[tuple, ChatCompletionClient] = {}
+    _limiters: dict[str, TokenBucketRateLimiter] = {}
+    _http_client: Any = None
+
+    @classmethod
+    def get_client(cls, model: str, api_key: str, **client_kwargs: Any) -> ChatCompletionClient:
+        """
+        Return the shared rate-limited client for a model and settings.
+
+        Args:
+            model: OpenAI model name
+            api_key: API key (only a fingerprint is used in the registry key)
+            **client_kwargs: Extra OpenAIChatCompletionClient settings
+
+        Returns:
+            ChatCompletionClient: Shared client
+        """
+        key = (
+            model,
+            hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16],
+            tuple(sorted((name, repr(value)) for name, value in client_kwargs.items())),
+        )
+        with cls._lock:
+            client = cls._clients.get(key)
+            if client is None:
+                # The OpenAI SDK is imported on first use; it is the slowest part of the model stack
+                from autogen_ext.models.openai import OpenAIChatCompletionClient
+
+                http_client = cls._get_http_client()
+                if http_client is not None:
+                    client_kwargs = {**client_kwargs, "http_client": http_client}
+                client = RateLimitedChatCompletionClient(
+                    client=OpenAIChatCompletionClient(model=model, api_key=api_key, **client_kwargs),
+                    limiter=cls._get_limiter(model),
+                    max_retries=int(_env_number("LLM_MAX_RETRIES", 3) or 0)
+                )
+                cls._clients[key] = client
+                logger.info(f"Created shared model client for {model}")
+            return client
+
+    @classmethod
+    def _get_limiter(cls, model: str) -> TokenBucketRateLimiter:
+        if model not in cls._limiters:
+            cls._limiters[model] = TokenBucketRateLimiter(
+                requests_per_minute=_env_number("LLM_RPM"),
+                tokens_per_minute=_env_number("LLM_TPM")
+            )
+        return cls._limiters[model]
+
+    @classmethod
+    def _get_http_client(cls) -> Any:
+        if httpx is None:
+            return None
+        if cls._http_client is None:
+            http2 = os.environ.get("LLM_HTTP2", "true").lower() == "true"
+            if http2 and importlib.util.find_spec("h2") is None:
+                logger.warning("LLM_HTTP2 is on but h2 is not installed (pip install 'httpx[http2]'); using HTTP/1.1")
+                http2 = False
+            cls._http_client = LoopLocalAsyncClient(
+                http2=http2,
+                timeout=httpx.Timeout(600.0, connect=10.0),
+                limits=httpx.Limits(
+                    max_connections=int(_env_number("LLM_MAX_CONNECTIONS", 20) or 20),
+                    max_keepalive_connections=int(_env_number("LLM_MAX_KEEPALIVE_CONNECTIONS", 10) or 10),
+                    keepalive_expiry=_env_number("LLM_KEEPALIVE_EXPIRY", 60.0)
+                )
+            )
+            logger.info(f"Created shared HTTP pool for model clients (http2={http2})")
+        return cls._http_client
+
+    @classmethod
+    def reset(cls) -> None:
+        """Forget all shared clients and limiters (e.g. after changing LLM_* settings)."""
+        with cls._lock:
+            cls._clients.clear()
+            cls._limiters.clear()
+            cls._http_client = None
@@ -1,21 +1,65 @@
 import os
 from typing import Any, Optional
-from autogen_ext.models.openai import OpenAIChatCompletionClient
 from dotenv import load_dotenv
 
+from agent.model.LLMResponseCache import LLMResponseCache
+from agent.model.CachedChatCompletionClient import CachedChatCompletionClient
+from agent.model.ModelClientRegistry import ModelClientRegistry
+from agent.model.TracingChatCompletionClient import TracingChatCompletionClient
+
 class ModelFactory:
     """Factory to create model client instances."""
 
+    # One response store per cache file, shared by all clients in the process
+    _caches: dict[str, LLMResponseCache] = {}
+    _env_loaded = False
+
     @staticmethod
     def get_model(
-        model: str = "gpt-5-mini"):
-        load_dotenv()
-        # Ensure the API key is available
-        if not os.environ.get("OPENAI_API_KEY"):
+        model: str = "gpt-5-mini",
+        cache_mode: Optional[str] = None):
+        """
+        Get the shared, rate-limited model client, optionally wrapped with the
+        record/replay response cache. Calls are recorded as model spans (including cache
+        hits) when a trace is active.
+
+        Args:
+            model: OpenAI model name
+            cache_mode: "off", "read_write", "record" or "replay"; defaults to the
+                LLM_CACHE_MODE environment variable ("off" when unset)
+        """
+        if not ModelFactory._env_loaded:
+            load_dotenv()
+            ModelFactory._env_loaded = True
+        cache_mode = (cache_mode or os.environ.get("LLM_CACHE_MODE", "off")).lower()
+        # Ensure the API key is available (replay mode never reaches the API)
+        if not os.environ.get("OPENAI_API_KEY") and cache_mode != "replay":
             raise EnvironmentError(
             "OPENAI_API_KEY not set. Export it in your environment or add it to a .env file."
             )
-        return OpenAIChatCompletionClient(
+        # Agents asking for the same model share one client, HTTP pool and rate limiter
+        client = ModelClientRegistry.get_client(
             model=model,
-            api_key=os.environ.get("OPENAI_API_KEY")  # Reads API key from environment variable
-    )
\ No newline at end of file
+            api_key=os.environ.get("OPENAI_API_KEY", "replay-only")  # Reads API key from environment variable
+        )
+        if cache_mode != "off":
+            client = CachedChatCompletionClient(
+                client=client,
+                cache=ModelFactory.get_response_cache(),
+                model=model,
+                mode=cache_mode
+            )
+        return TracingChatCompletionClient(client=client, model=model)
+
+    @staticmethod
+    def get_response_cache() -> LLMResponseCache:
+        """Return the process-wide response cache configured by LLM_CACHE_* variables."""
+        path = os.environ.get("LLM_CACHE_PATH", ".cache/llm_responses.db")
+        if path not in ModelFactory._caches:
+            ttl = os.environ.get("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600))
+            ModelFactory._caches[path] = LLMResponseCache(
+                path=path,
+                ttl_seconds=float(ttl) if float(ttl) > 0 else None,
+                max_entries=int(os.environ.get("LLM_CACHE_MAX_ENTRIES", "10000"))
+            )
+        return ModelFactory._caches[path]
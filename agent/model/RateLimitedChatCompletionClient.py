@@ -0,0 +1,173 @@
+"""
+Rate-limited wrapper for AutoGen model clients
+
+Every request first acquires capacity from a shared TokenBucketRateLimiter. When the API
+still answers with HTTP 429, the limiter is told to back off so all concurrent agents pause
+together (honouring Retry-After) before the request is retried. Streaming requests are
+retried the same way while the stream is being opened.
+"""
+
+import json
+from typing import Any, AsyncGenerator, Literal, Mapping, Optional, Sequence, Union
+
+from autogen_core import CancellationToken
+from autogen_core.models import (
+    ChatCompletionClient,
+    CreateResult,
+    LLMMessage,
+    ModelCapabilities,
+    ModelInfo,
+    RequestUsage,
+)
+from autogen_core.tools import Tool, ToolSchema
+from pydantic import BaseModel
+
+from agent.model.TokenBucketRateLimiter import TokenBucketRateLimiter
+
+
+class RateLimitedChatCompletionClient(ChatCompletionClient):
+    """
+    ChatCompletionClient decorator applying a process-wide RPM/TPM budget.
+
+    Attributes:
+        client (ChatCompletionClient): Wrapped model client
+        limiter (TokenBucketRateLimiter): Shared limiter
+        max_retries (int): Retries after a 429 response
+        completion_token_estimate (int): Tokens reserved for the completion of each request
+    """
+
+    def __init__(
+        self,
+        client: ChatCompletionClient,
+        limiter: TokenBucketRateLimiter,
+        max_retries: int = 3,
+        completion_token_estimate: int = 1000
+    ):
+        self.client = client
+        self.limiter = limiter
+        self.max_retries = max_retries
+        self.completion_token_estimate = completion_token_estimate
+
+    def estimate_tokens(self, messages: Sequence[LLMMessage], tools: Sequence[Tool | ToolSchema] = []) -> int:
+        """Cheap token estimate (~4 characters per token) used before the request is sent."""
+        characters = sum(len(str(getattr(message, "content", ""))) for message in messages)
+        characters += sum(
+            len(json.dumps(tool.schema if isinstance(tool, Tool) else tool, default=str)) for tool in tools
+        )
+        return characters // 4 + self.completion_token_estimate
+
+    def _retry_after(self, error: Exception, attempt: int) -> float:
+        response = getattr(error, "response", None)
+        header = response.headers.get("retry-after") if response is not None else None
+        try:
+            return max(float(header), 0.5)
+        except (TypeError, ValueError):
+            return min(2.0 ** attempt, 30.0)
+
+    async def create(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+        tool_choice: Tool | Literal["auto", "required", "none"] = "auto",
+        json_output: Optional[bool | type[BaseModel]] = None,
+        extra_create_args: Mapping[str, Any] = {},
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> CreateResult:
+        from openai import RateLimitError
+
+        estimated = self.estimate_tokens(messages, tools)
+        attempt = 0
+        while True:
+            await self.limiter.acquire(estimated)
+            try:
+                result = await self.client.create(
+                    messages,
+                    tools=tools,
+                    tool_choice=tool_choice,
+                    json_output=json_output,
+                    extra_create_args=extra_create_args,
+                    cancellation_token=cancellation_token,
+                )
+            except RateLimitError as e:
+                attempt += 1
+                if attempt > self.max_retries:
+                    raise
+                self.limiter.back_off(self._retry_after(e, attempt))
+                continue
+
+            self.limiter.reconcile(estimated, result.usage.prompt_tokens + result.usage.completion_tokens)
+            return result
+
+    def create_stream(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+        tool_choice: Tool | Literal["auto", "required", "none"] = "auto",
+        json_output: Optional[bool | type[BaseModel]] = None,
+        extra_create_args: Mapping[str, Any] = {},
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> AsyncGenerator[Union[str, CreateResult], None]:
+        async def _generator() -> AsyncGenerator[Union[str, CreateResult], None]:
+            from openai import RateLimitError
+
+            estimated = self.estimate_tokens(messages, tools)
+            attempt = 0
+            while True:
+                await self.limiter.acquire(estimated)
+                stream = self.client.create_stream(
+                    messages,
+                    tools=tools,
+                    tool_choice=tool_choice,
+                    json_output=json_output,
+                    extra_create_args=extra_create_args,
+                    cancellation_token=cancellation_token,
+                )
+                # A 429 surfaces when the stream is opened, i.e. before the first chunk; once
+                # chunks were yielded a retry would repeat them, so only opening is retried
+                try:
+                    chunk = await stream.__anext__()
+                except StopAsyncIteration:
+                    return
+                except RateLimitError as e:
+                    attempt += 1
+                    if attempt > self.max_retries:
+                        raise
+                    self.limiter.back_off(self._retry_after(e, attempt))
+                    continue
+                break
+
+            while True:
+                if isinstance(chunk, CreateResult):
+                    self.limiter.reconcile(estimated, chunk.usage.prompt_tokens + chunk.usage.completion_tokens)
+                yield chunk
+                try:
+                    chunk = await stream.__anext__()
+                except StopAsyncIteration:
+                    return
+
+        return _generator()
+
+    async def close(self) -> None:
+        await self.client.close()
+
+    def actual_usage(self) -> RequestUsage:
+        return self.client.actual_usage()
+
+    def total_usage(self) -> RequestUsage:
+        return self.client.total_usage()
+
+    def count_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+        return self.client.count_tokens(messages, tools=tools)
+
+    def remaining_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+        return self.client.remaining_tokens(messages, tools=tools)
+
+    @property
+    def capabilities(self) -> ModelCapabilities:  # type: ignore
+        return self.client.capabilities
+
+    @property
+    def model_info(self) -> ModelInfo:
+        return self.client.model_info
@@ -0,0 +1,110 @@
+"""
+Token bucket rate limiter for model requests
+
+Enforces requests-per-minute (RPM) and tokens-per-minute (TPM) budgets shared by every
+agent in the process, and lets all callers back off together after a 429 response.
+
+The limiter only uses a threading lock and asyncio.sleep, so a single instance can be
+shared across event loops (e.g. successive Streamlit reruns) and worker threads.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucketRateLimiter:
+    """
+    Dual token bucket (requests and tokens) with a shared back-off window.
+
+    Attributes:
+        requests_per_minute (Optional[float]): Request budget per minute (None = unlimited)
+        tokens_per_minute (Optional[float]): Token budget per minute (None = unlimited)
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None
+    ):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+
+        self._lock = threading.Lock()
+        self._request_tokens = float(requests_per_minute or 0)
+        self._token_tokens = float(tokens_per_minute or 0)
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        if self.requests_per_minute:
+            self._request_tokens = min(
+                float(self.requests_per_minute),
+                self._request_tokens + elapsed * self.requests_per_minute / 60.0
+            )
+        if self.tokens_per_minute:
+            self._token_tokens = min(
+                float(self.tokens_per_minute),
+                self._token_tokens + elapsed * self.tokens_per_minute / 60.0
+            )
+
+    def _try_acquire(self, tokens: int) -> float:
+        """Take capacity if available; otherwise return the seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                return self._blocked_until - now
+
+            self._refill(now)
+            waits = []
+            if self.requests_per_minute and self._request_tokens < 1:
+                waits.append((1 - self._request_tokens) * 60.0 / self.requests_per_minute)
+            if self.tokens_per_minute:
+                # A single request larger than the whole bucket is allowed once the bucket is full
+                needed = min(float(tokens), float(self.tokens_per_minute))
+                if self._token_tokens < needed:
+                    waits.append((needed - self._token_tokens) * 60.0 / self.tokens_per_minute)
+            if waits:
+                return max(waits)
+
+            if self.requests_per_minute:
+                self._request_tokens -= 1
+            if self.tokens_per_minute:
+                self._token_tokens -= tokens
+            return 0.0
+
+    async def acquire(self, tokens: int = 0) -> float:
+        """
+        Wait until one request with the estimated token count fits in the budget.
+
+        Args:
+            tokens (int): Estimated tokens for the request (prompt + expected completion)
+
+        Returns:
+            float: Total seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            wait = self._try_acquire(tokens)
+            if wait <= 0:
+                return waited
+            await asyncio.sleep(wait)
+            waited += wait
+
+    def reconcile(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Correct the token bucket once the real usage of a request is known."""
+        if not self.tokens_per_minute:
+            return
+        with self._lock:
+            self._token_tokens = min(
+                float(self.tokens_per_minute),
+                self._token_tokens + estimated_tokens - actual_tokens
+            )
+
+    def back_off(self, seconds: float) -> None:
+        """Block every caller for the given number of seconds (e.g. after a 429)."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
@@ -0,0 +1,127 @@
+"""
+Tracing wrapper for AutoGen model clients
+
+Records every model call as a "model:<model>" span under the current agent span, with the
+prompt/completion tokens and whether the response came from the LLM response cache. The
+token and cache-hit counters roll up to the agent, phase and workflow spans. Outside an
+active trace the wrapper only forwards calls.
+"""
+
+from typing import Any, AsyncGenerator, Literal, Mapping, Optional, Sequence, Union
+
+from autogen_core import CancellationToken
+from autogen_core.models import (
+    ChatCompletionClient,
+    CreateResult,
+    LLMMessage,
+    ModelCapabilities,
+    ModelInfo,
+    RequestUsage,
+)
+from autogen_core.tools import Tool, ToolSchema
+from pydantic import BaseModel
+
+from agent.Tracer import Span, Tracer
+
+
+class TracingChatCompletionClient(ChatCompletionClient):
+    """
+    ChatCompletionClient decorator that records a span per model call.
+
+    Attributes:
+        client (ChatCompletionClient): Wrapped model client
+        model (str): Model name used in span names
+    """
+
+    def __init__(self, client: ChatCompletionClient, model: str):
+        self.client = client
+        self.model = model
+
+    @staticmethod
+    def _record(span: Span, result: CreateResult) -> None:
+        span.set(finish_reason=result.finish_reason, cached=result.cached)
+        span.accumulate(
+            prompt_tokens=result.usage.prompt_tokens,
+            completion_tokens=result.usage.completion_tokens,
+            model_calls=1,
+            cache_hits=1 if result.cached else 0
+        )
+
+    async def create(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+        tool_choice: Tool | Literal["auto", "required", "none"] = "auto",
+        json_output: Optional[bool | type[BaseModel]] = None,
+        extra_create_args: Mapping[str, Any] = {},
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> CreateResult:
+        with Tracer.span(f"model:{self.model}", "model", messages=len(messages), tools=len(tools)) as span:
+            result = await self.client.create(
+                messages,
+                tools=tools,
+                tool_choice=tool_choice,
+                json_output=json_output,
+                extra_create_args=extra_create_args,
+                cancellation_token=cancellation_token,
+            )
+            self._record(span, result)
+            return result
+
+    def create_stream(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+        tool_choice: Tool | Literal["auto", "required", "none"] = "auto",
+        json_output: Optional[bool | type[BaseModel]] = None,
+        extra_create_args: Mapping[str, Any] = {},
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> AsyncGenerator[Union[str, CreateResult], None]:
+        # The span is started when the stream is created, in the caller's context
+        span = Tracer.start_span(f"model:{self.model}", "model", messages=len(messages), tools=len(tools))
+
+        async def _generator() -> AsyncGenerator[Union[str, CreateResult], None]:
+            try:
+                async for chunk in self.client.create_stream(
+                    messages,
+                    tools=tools,
+                    tool_choice=tool_choice,
+                    json_output=json_output,
+                    extra_create_args=extra_create_args,
+                    cancellation_token=cancellation_token,
+                ):
+                    if isinstance(chunk, CreateResult):
+                        self._record(span, chunk)
+                    yield chunk
+            except BaseException as e:
+                span.fail(e)
+                raise
+            finally:
+                span.end()
+
+        return _generator()
+
+    async def close(self) -> None:
+        await self.client.close()
+
+    def actual_usage(self) -> RequestUsage:
+        return self.client.actual_usage()
+
+    def total_usage(self) -> RequestUsage:
+        return self.client.total_usage()
+
+    def count_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+        return self.client.count_tokens(messages, tools=tools)
+
+    def remaining_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+        return self.client.remaining_tokens(messages, tools=tools)
+
+    @property
+    def capabilities(self) -> ModelCapabilities:  # type: ignore
+        return self.client.capabilities
+
+    @property
+    def model_info(self) -> ModelInfo:
+        return self.client.model_info
@@ -0,0 +1,214 @@
+"""
+Admission control for Snowflake statements
+
+Fanning out more statements than a warehouse can run makes them wait in the warehouse
+queue (QUEUED_OVERLOAD), so more parallelism ends up slower. The SnowflakeQueryEngine
+asks an AdmissionController before it opens a connection for a statement. There is one
+controller per warehouse, shared by every engine in the process.
+
+The controller caps the statements in flight with an AIMD limit:
+- A statement that waited in the warehouse queue longer than queue_target_seconds
+  multiplies the limit by decrease_factor. Only statements admitted after the last
+  decrease can cause another one, so one overloaded burst counts once.
+- Every other completed statement adds 1/limit, i.e. about +1 per full window.
+- The limit stays between min_limit and max_limit. It starts at max_limit (Snowflake's
+  default MAX_CONCURRENCY_LEVEL is 8), so an idle warehouse is never throttled.
+Processes on other nodes back off on their own when they observe queueing, the same way
+TCP flows share a link.
+
+When statements wait for a slot, the lowest priority class goes first: metadata lookups
+(INFORMATION_SCHEMA, SHOW, DESCRIBE, SYSTEM$ functions), then queries, then profiling
+pulls (DataFrame results). A waiter moves up one class for every aging_seconds it waited,
+so large pulls are not starved. Within a class, the workflow with the fewest statements in
+flight goes first (ties: the one served longest ago), so one workflow's fan-out cannot
+crowd out the others.
+"""
+
+import os
+import re
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+PRIORITY_METADATA = 0
+PRIORITY_QUERY = 1
+PRIORITY_PROFILING = 2
+PRIORITY_NAMES = {PRIORITY_METADATA: "metadata", PRIORITY_QUERY: "query", PRIORITY_PROFILING: "profiling"}
+
+_METADATA_QUERY = re.compile(
+    r"^\s*(SHOW|DESCRIBE|DESC)\b|INFORMATION_SCHEMA\.|SYSTEM\$|^\s*SELECT\s+CURRENT_\w+\(\)", re.IGNORECASE
+)
+
+
+def classify_query(query: str, return_format: str) -> int:
+    """Priority class of a statement: metadata lookups first, DataFrame (profiling) pulls last."""
+    if _METADATA_QUERY.search(query):
+        return PRIORITY_METADATA
+    if (return_format or "").lower() == "dataframe":
+        return PRIORITY_PROFILING
+    return PRIORITY_QUERY
+
+
+class AdmissionTicket:
+    """A statement waiting for or holding a slot."""
+
+    __slots__ = ("priority", "workflow", "enqueued_at", "admitted_at", "granted", "queued_seconds", "executed")
+
+    def __init__(self, priority: int, workflow: str):
+        self.priority = priority
+        self.workflow = workflow
+        self.enqueued_at = time.monotonic()
+        self.admitted_at: Optional[float] = None
+        self.granted = threading.Event()
+        self.queued_seconds = 0.0  # Time the statement spent in the warehouse queue, set by the engine
+        self.executed = False  # Whether the statement reached the warehouse (only then is it observed)
+
+    @property
+    def wait_seconds(self) -> float:
+        """Time spent waiting for admission."""
+        return (self.admitted_at or time.monotonic()) - self.enqueued_at
+
+
+class AdmissionController:
+    """
+    AIMD concurrency limit for one warehouse with prioritized, per-workflow fair admission.
+
+    Attributes:
+        warehouse (str): Warehouse the limit applies to
+        limit (float): Current concurrency limit (statements in flight = floor(limit))
+        min_limit (int): Lowest limit after decreases
+        max_limit (int): Highest limit after increases
+        queue_target_seconds (float): Warehouse queue time above which the limit is decreased
+        decrease_factor (float): Multiplier applied to the limit on a decrease
+        aging_seconds (float): Wait after which a waiter moves up one priority class
+    """
+
+    _shared: Dict[str, "AdmissionController"] = {}
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def get_shared(cls, warehouse: Optional[str]) -> "AdmissionController":
+        """Return the process-wide controller of a warehouse, configured from the environment."""
+        key = (warehouse or "default").upper()
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(
+                    warehouse=key,
+                    max_limit=int(os.environ.get("SNOWFLAKE_MAX_CONCURRENT_QUERIES") or 8),
+                    min_limit=int(os.environ.get("SNOWFLAKE_MIN_CONCURRENT_QUERIES") or 1),
+                    queue_target_seconds=float(os.environ.get("SNOWFLAKE_QUEUE_TARGET_SECONDS") or 1.0)
+                )
+            return cls._shared[key]
+
+    def __init__(
+        self,
+        warehouse: str = "default",
+        max_limit: int = 8,
+        min_limit: int = 1,
+        queue_target_seconds: float = 1.0,
+        decrease_factor: float = 0.5,
+        aging_seconds: float = 30.0
+    ):
+        self.warehouse = warehouse
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.limit = float(self.max_limit)
+        self.queue_target_seconds = queue_target_seconds
+        self.decrease_factor = decrease_factor
+        self.aging_seconds = aging_seconds
+        self._lock = threading.Lock()
+        self._waiting: List[AdmissionTicket] = []
+        self._in_flight: Dict[str, int] = {}
+        self._last_served: Dict[str, float] = {}
+        self._last_decrease_at = float("-inf")
+        self.stats = {"admitted": 0, "waited": 0, "cancelled": 0, "increases": 0, "decreases": 0,
+                      "max_queued_seconds": 0.0}
+
+    @property
+    def in_flight(self) -> int:
+        """Statements currently holding a slot."""
+        with self._lock:
+            return sum(self._in_flight.values())
+
+    def snapshot(self) -> Dict[str, object]:
+        """Current limit, statements in flight and waiters per priority class."""
+        with self._lock:
+            waiting = {name: 0 for name in PRIORITY_NAMES.values()}
+            for ticket in self._waiting:
+                waiting[PRIORITY_NAMES[ticket.priority]] += 1
+            return {"warehouse": self.warehouse, "limit": round(self.limit, 2), "in_flight": sum(self._in_flight.values()),
+                    "waiting": waiting, **self.stats}
+
+    def acquire(
+        self,
+        priority: int,
+        workflow: str,
+        cancel_requested: Optional[threading.Event] = None,
+        poll_interval: float = 0.05
+    ) -> Optional[AdmissionTicket]:
+        """
+        Wait for a slot.
+
+        Args:
+            priority: PRIORITY_METADATA, PRIORITY_QUERY or PRIORITY_PROFILING
+            workflow: Id of the workflow issuing the statement (fairness key)
+            cancel_requested: Event that abandons the wait when set
+
+        Returns:
+            The admitted ticket (pass it to release()), or None if the wait was cancelled
+        """
+        ticket = AdmissionTicket(priority, workflow)
+        with self._lock:
+            self._waiting.append(ticket)
+            self._dispatch()
+            if not ticket.granted.is_set():
+                self.stats["waited"] += 1
+        while not ticket.granted.wait(poll_interval):
+            if cancel_requested is not None and cancel_requested.is_set():
+                with self._lock:
+                    if not ticket.granted.is_set():
+                        self._waiting.remove(ticket)
+                        self.stats["cancelled"] += 1
+                        return None
+                # Admitted while being cancelled: give the slot back
+                self.release(ticket)
+                return None
+        return ticket
+
+    def release(self, ticket: AdmissionTicket) -> None:
+        """Free a ticket's slot and adapt the limit to the queue time its statement saw."""
+        with self._lock:
+            self._in_flight[ticket.workflow] -= 1
+            if not self._in_flight[ticket.workflow]:
+                del self._in_flight[ticket.workflow]
+                if not any(waiter.workflow == ticket.workflow for waiter in self._waiting):
+                    self._last_served.pop(ticket.workflow, None)
+            if ticket.executed:
+                self.stats["max_queued_seconds"] = max(self.stats["max_queued_seconds"], ticket.queued_seconds)
+                if ticket.queued_seconds > self.queue_target_seconds:
+                    if ticket.admitted_at > self._last_decrease_at:
+                        self.limit = max(float(self.min_limit), self.limit * self.decrease_factor)
+                        self._last_decrease_at = time.monotonic()
+                        self.stats["decreases"] += 1
+                elif self.limit < self.max_limit:
+                    self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+                    self.stats["increases"] += 1
+            self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Grant slots to the best waiters while the limit allows (caller holds the lock)."""
+        now = time.monotonic()
+        while self._waiting and sum(self._in_flight.values()) < max(self.min_limit, int(self.limit)):
+            ticket = min(self._waiting, key=lambda waiter: (
+                waiter.priority - int((now - waiter.enqueued_at) / self.aging_seconds),
+                self._in_flight.get(waiter.workflow, 0),
+                self._last_served.get(waiter.workflow, float("-inf")),
+                waiter.enqueued_at
+            ))
+            self._waiting.remove(ticket)
+            self._in_flight[ticket.workflow] = self._in_flight.get(ticket.workflow, 0) + 1
+            self._last_served[ticket.workflow] = now
+            ticket.admitted_at = now
+            self.stats["admitted"] += 1
+            ticket.granted.set()
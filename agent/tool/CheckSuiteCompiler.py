@@ -0,0 +1,274 @@
+"""
+Declarative data quality check suite and single-scan SQL compiler
+
+Checks are declared as data (built from metadata/schema.json or written by hand) and
+compiled into ONE aggregate query per table, so the whole suite costs a single scan:
+
+    SELECT COUNT(*) AS TOTAL_ROWS,
+           COUNT_IF(BOOKING_ID IS NULL) AS CHECK_0,
+           COUNT_IF(TRY_TO_DOUBLE(TO_VARCHAR(DRIVER_RATINGS)) < 1 OR ... > 5) AS CHECK_1,
+           COUNT(BOOKING_ID) - COUNT(DISTINCT BOOKING_ID) AS CHECK_2,
+           ...
+    FROM RIDEBOOKING
+
+Supported check types:
+- not_null: SQL NULLs in a column
+- null_sentinel: placeholder strings such as 'null' or '' stored instead of NULL
+- range: numeric values outside [min_value, max_value] (non-numeric values are ignored)
+- accepted_values: present values (not NULL, blank or a null sentinel) outside an allowed set
+- unique: extra rows caused by duplicated values
+- consistency: rows where a `when` predicate holds but the `then` predicate does not
+"""
+
+import re
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+CHECK_TYPES = ("not_null", "null_sentinel", "range", "accepted_values", "unique", "consistency")
+
+DEFAULT_SENTINELS = ["null", "none", "nan", ""]
+
+
+class DataQualityCheck(BaseModel):
+    """A single declarative check"""
+    name: str  # Unique check name, e.g. "not_null:BOOKING_ID"
+    check_type: str  # One of CHECK_TYPES
+    column: Optional[str] = None  # Column the check applies to (not used by consistency checks)
+    min_value: Optional[float] = None  # Lower bound for range checks
+    max_value: Optional[float] = None  # Upper bound for range checks
+    values: List[str] = []  # Allowed values or sentinel strings
+    when: Optional[str] = None  # SQL predicate selecting the rows a consistency rule applies to
+    then: Optional[str] = None  # SQL predicate those rows must satisfy
+    max_failed_pct: Optional[float] = None  # Pass threshold in percent (None = informational metric)
+    description: str = ""  # Human readable description of the check
+
+
+class CheckResult(BaseModel):
+    """Structured metric produced by one check"""
+    name: str
+    check_type: str
+    column: Optional[str]
+    description: str
+    failed_count: int  # Rows (or duplicate rows) violating the check
+    total_count: int  # Rows scanned
+    failed_pct: float  # failed_count / total_count in percent
+    max_failed_pct: Optional[float]  # Threshold the check was evaluated against
+    passed: Optional[bool]  # None for informational checks without a threshold
+    expression: str  # Compiled SQL aggregate for the check
+
+
+def quote_identifier(name: str) -> str:
+    """Return a Snowflake identifier, quoting names that are not plain upper-case."""
+    return name if re.fullmatch(r"[A-Z_][A-Z0-9_$]*", name) else '"' + name.replace('"', '""') + '"'
+
+
+def quote_literal(value: Any) -> str:
+    """Return a SQL string literal."""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def present_predicate(column: str) -> str:
+    """SQL predicate that is true when a column holds a real value (not NULL, blank or 'null')."""
+    text = f"LOWER(TRIM(TO_VARCHAR({quote_identifier(column)})))"
+    return f"({quote_identifier(column)} IS NOT NULL AND {text} NOT IN ('', 'null', 'none', 'nan'))"
+
+
+def _numeric_expression(column: str) -> str:
+    # TO_VARCHAR first so that columns holding 'null' strings do not fail the cast
+    return f"TRY_TO_DOUBLE(TO_VARCHAR({quote_identifier(column)}))"
+
+
+def _condition_to_sql(condition: Any) -> str:
+    """Translate a consistency-rule condition (SQL string or {column, equals|present}) to SQL."""
+    if isinstance(condition, str):
+        return f"({condition})"
+    column = condition["column"]
+    if "equals" in condition:
+        return f"({quote_identifier(column)} = {quote_literal(condition['equals'])})"
+    if "in" in condition:
+        values = ", ".join(quote_literal(value) for value in condition["in"])
+        return f"({quote_identifier(column)} IN ({values}))"
+    if condition.get("present", True):
+        return present_predicate(column)
+    return f"(NOT {present_predicate(column)})"
+
+
+def build_checks_from_schema(schema: dict) -> List[DataQualityCheck]:
+    """
+    Derive the default check suite from a table schema.
+
+    Uses the column metadata in metadata/schema.json: max_null_pct, 'null' notes, scale,
+    unit, allowed_values and unique, plus the table-level consistency_rules.
+
+    Args:
+        schema: Table schema
+
+    Returns:
+        List[DataQualityCheck]: Checks for the table
+    """
+    checks: List[DataQualityCheck] = []
+    for column in schema.get("columns", []):
+        name = column["name"]
+        checks.append(DataQualityCheck(
+            name=f"not_null:{name}",
+            check_type="not_null",
+            column=name,
+            max_failed_pct=column.get("max_null_pct"),
+            description=f"{name} is populated"
+        ))
+        if "'null'" in column.get("note", "").lower():
+            checks.append(DataQualityCheck(
+                name=f"null_sentinel:{name}",
+                check_type="null_sentinel",
+                column=name,
+                values=DEFAULT_SENTINELS,
+                max_failed_pct=0,
+                description=f"{name} does not store placeholder strings such as 'null' instead of NULL"
+            ))
+        if column.get("scale"):
+            low, _, high = str(column["scale"]).partition("-")
+            checks.append(DataQualityCheck(
+                name=f"range:{name}",
+                check_type="range",
+                column=name,
+                min_value=float(low),
+                max_value=float(high),
+                max_failed_pct=0,
+                description=f"{name} is within the {column['scale']} scale"
+            ))
+        elif column.get("unit") and column.get("type", "").upper() in ("DECIMAL", "NUMBER", "FLOAT", "INTEGER"):
+            checks.append(DataQualityCheck(
+                name=f"range:{name}",
+                check_type="range",
+                column=name,
+                min_value=0,
+                max_failed_pct=0,
+                description=f"{name} is not negative ({column['unit']})"
+            ))
+        if column.get("allowed_values"):
+            checks.append(DataQualityCheck(
+                name=f"accepted_values:{name}",
+                check_type="accepted_values",
+                column=name,
+                values=[str(value) for value in column["allowed_values"]],
+                max_failed_pct=0,
+                description=f"{name} only contains {', '.join(map(str, column['allowed_values']))}"
+            ))
+        if column.get("unique"):
+            checks.append(DataQualityCheck(
+                name=f"unique:{name}",
+                check_type="unique",
+                column=name,
+                max_failed_pct=0,
+                description=f"{name} is unique"
+            ))
+
+    for rule in schema.get("consistency_rules", []):
+        then = rule.get("then")
+        if then is None and rule.get("then_present"):
+            then = {"column": rule["then_present"], "present": True}
+        checks.append(DataQualityCheck(
+            name=f"consistency:{rule['name']}",
+            check_type="consistency",
+            when=_condition_to_sql(rule["when"]),
+            then=_condition_to_sql(then),
+            max_failed_pct=rule.get("max_failed_pct", 0),
+            description=rule.get("description", rule["name"])
+        ))
+    return checks
+
+
+def compile_check_expression(check: DataQualityCheck) -> str:
+    """Compile one check into a SQL aggregate counting the rows that violate it."""
+    if check.check_type not in CHECK_TYPES:
+        raise ValueError(f"Unknown check type '{check.check_type}' for check {check.name}")
+    if check.check_type == "consistency":
+        if not check.when or not check.then:
+            raise ValueError(f"Consistency check {check.name} needs both 'when' and 'then'")
+        return f"COUNT_IF({check.when} AND NOT COALESCE({check.then}, FALSE))"
+    if not check.column:
+        raise ValueError(f"Check {check.name} needs a column")
+
+    column = quote_identifier(check.column)
+    if check.check_type == "not_null":
+        return f"COUNT_IF({column} IS NULL)"
+    if check.check_type == "null_sentinel":
+        sentinels = ", ".join(quote_literal(value.lower()) for value in (check.values or DEFAULT_SENTINELS))
+        return f"COUNT_IF(LOWER(TRIM(TO_VARCHAR({column}))) IN ({sentinels}))"
+    if check.check_type == "range":
+        value = _numeric_expression(check.column)
+        bounds = []
+        if check.min_value is not None:
+            bounds.append(f"{value} < {check.min_value:g}")
+        if check.max_value is not None:
+            bounds.append(f"{value} > {check.max_value:g}")
+        if not bounds:
+            raise ValueError(f"Range check {check.name} needs min_value or max_value")
+        return f"COUNT_IF({' OR '.join(bounds)})"
+    if check.check_type == "accepted_values":
+        values = ", ".join(quote_literal(value) for value in check.values)
+        # Sentinels are excluded first: the null_sentinel check already counts those rows
+        return f"COUNT_IF({present_predicate(check.column)} AND {column} NOT IN ({values}))"
+    # unique: every row beyond the first occurrence of a value is a duplicate
+    return f"(COUNT({column}) - COUNT(DISTINCT {column}))"
+
+
+def compile_check_suite(table: str, checks: List[DataQualityCheck], source: Optional[str] = None) -> str:
+    """
+    Fuse all checks for a table into one aggregate query.
+
+    Args:
+        table: Table name (optionally qualified)
+        checks: Checks to compile
+        source: Relation to read instead of the whole table, e.g. the table with a CHANGES
+            clause or a subquery selecting new rows (used for incremental checks)
+
+    Returns:
+        str: SELECT statement returning TOTAL_ROWS and one CHECK_<n> column per check
+    """
+    if not checks:
+        raise ValueError("The check suite is empty")
+    select_list = ["COUNT(*) AS TOTAL_ROWS"] + [
+        f"{compile_check_expression(check)} AS CHECK_{index}" for index, check in enumerate(checks)
+    ]
+    return "SELECT\n    " + ",\n    ".join(select_list) + f"\nFROM {source or quote_table(table)}"
+
+
+def quote_table(table: str) -> str:
+    """Quote each part of an optionally qualified table name."""
+    return ".".join(quote_identifier(part) for part in table.split("."))
+
+
+def parse_check_results(row: Dict[str, Any], checks: List[DataQualityCheck]) -> List[CheckResult]:
+    """
+    Turn the single result row of a compiled suite into structured metrics.
+
+    Args:
+        row: Result row keyed by column alias (TOTAL_ROWS, CHECK_0, ...)
+        checks: The checks the query was compiled from, in the same order
+
+    Returns:
+        List[CheckResult]: One result per check
+    """
+    values = {key.upper(): value for key, value in row.items()}
+    total = int(values.get("TOTAL_ROWS") or 0)
+    results = []
+    for index, check in enumerate(checks):
+        failed = int(values.get(f"CHECK_{index}") or 0)
+        failed_pct = round(100.0 * failed / total, 4) if total else 0.0
+        passed = None if check.max_failed_pct is None else failed_pct <= check.max_failed_pct
+        results.append(CheckResult(
+            name=check.name,
+            check_type=check.check_type,
+            column=check.column,
+            description=check.description,
+            failed_count=failed,
+            total_count=total,
+            failed_pct=failed_pct,
+            max_failed_pct=check.max_failed_pct,
+            passed=passed,
+            expression=compile_check_expression(check)
+        ))
+    return results
@@ -0,0 +1,97 @@
+"""
+Pool of idle Snowflake connections for one warehouse
+
+Opening a Snowflake connection means a login round trip of a few hundred milliseconds. The
+SnowflakeQueryEngine keeps one pool per warehouse, so a statement reuses a connection that
+is already bound to its warehouse instead of logging in again. A pool only keeps idle
+connections; a statement that finds none opens a new one, so the pool never limits
+concurrency (the AdmissionController does).
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, List, Tuple
+
+
+class ConnectionPool:
+    """
+    Idle connections of one warehouse, reused most-recently-returned first.
+
+    Attributes:
+        warehouse (str): Warehouse the connections are bound to
+        max_idle (int): Idle connections kept; more are closed when returned
+        max_idle_seconds (float): Idle connections older than this are closed instead of reused
+        stats (Dict[str, int]): Connections created, reused and closed
+    """
+
+    def __init__(self, warehouse: str, connect: Callable[[], Any], max_idle: int = 4, max_idle_seconds: float = 900.0):
+        self.warehouse = warehouse
+        self.max_idle = max_idle
+        self.max_idle_seconds = max_idle_seconds
+        self._connect = connect
+        self._idle: List[Tuple[Any, float]] = []
+        self._lock = threading.Lock()
+        self.stats = {"created": 0, "reused": 0, "closed": 0}
+
+    @contextmanager
+    def connection(self):
+        """
+        Borrow a connection for one statement.
+
+        The connection goes back to the pool afterwards, even if the statement failed, unless
+        the connection itself was closed.
+
+        Yields:
+            Connection bound to the pool's warehouse
+        """
+        connection = self._take()
+        try:
+            yield connection
+        finally:
+            self._give_back(connection)
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection, _ in idle:
+            self._close(connection)
+
+    def _take(self) -> Any:
+        now = time.monotonic()
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                connection, returned_at = self._idle.pop()
+            if now - returned_at < self.max_idle_seconds and self._is_open(connection):
+                with self._lock:
+                    self.stats["reused"] += 1
+                return connection
+            self._close(connection)
+        connection = self._connect()
+        with self._lock:
+            self.stats["created"] += 1
+        return connection
+
+    def _give_back(self, connection: Any) -> None:
+        if self._is_open(connection):
+            with self._lock:
+                if len(self._idle) < self.max_idle:
+                    self._idle.append((connection, time.monotonic()))
+                    return
+        self._close(connection)
+
+    @staticmethod
+    def _is_open(connection: Any) -> bool:
+        is_closed = getattr(connection, "is_closed", None)
+        return not (callable(is_closed) and is_closed())
+
+    def _close(self, connection: Any) -> None:
+        with self._lock:
+            self.stats["closed"] += 1
+        try:
+            connection.close()
+        except Exception:
+            pass
@@ -0,0 +1,137 @@
+"""
+Data Quality Check Tool for AutoGen Agents
+
+Runs the declarative check suite for a table as one compiled aggregate query (a single
+table scan) and returns structured metrics per check.
+"""
+
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+from autogen_core import CancellationToken
+
+from agent.SchemaRegistry import SchemaRegistry
+from agent.tool.CheckSuiteCompiler import (
+    CheckResult,
+    DataQualityCheck,
+    build_checks_from_schema,
+    compile_check_suite,
+    parse_check_results,
+)
+from agent.tool.SnowflakeQueryEngine import SnowflakeQueryEngine
+
+
+class DataQualityCheckTool:
+    """
+    Executes compiled check suites against Snowflake.
+
+    Attributes:
+        query_engine (SnowflakeQueryEngine): Engine used to run the compiled query
+        schema (dict): Table schema the default checks are derived from
+    """
+
+    def __init__(self, query_engine: Optional[SnowflakeQueryEngine] = None, schema: Optional[dict] = None):
+        """
+        Initialize the DataQualityCheckTool.
+
+        Args:
+            query_engine (Optional[SnowflakeQueryEngine]): Engine to use; defaults to the
+                process-wide shared engine
+            schema (Optional[dict]): Table schema; defaults to metadata/schema.json
+        """
+        self.query_engine = query_engine or SnowflakeQueryEngine.get_shared_instance()
+        self.schema = schema if schema is not None else SchemaRegistry.load_schema()
+
+        log_level = os.environ.get('LOG_LEVEL', 'ERROR').upper()
+        numeric_level = getattr(logging, log_level, logging.ERROR)
+        logging.basicConfig(level=numeric_level)
+        self.logger = logging.getLogger(__name__)
+
+    def run_checks(
+        self,
+        table_name: str,
+        checks: List[DataQualityCheck],
+        cancellation_token: Optional[CancellationToken] = None
+    ) -> Dict[str, Any]:
+        """
+        Run a list of checks against a table in a single scan.
+
+        Args:
+            table_name (str): Table to check
+            checks (List[DataQualityCheck]): Checks to compile and run
+            cancellation_token (Optional[CancellationToken]): Cancels the running query
+
+        Returns:
+            Dict[str, Any]: success flag, compiled query and a list of CheckResult
+        """
+        try:
+            query = compile_check_suite(table_name, checks)
+        except (ValueError, KeyError) as e:
+            return {"success": False, "error": f"Invalid check suite: {str(e)}", "table_name": table_name}
+
+        self.logger.info(f"Running {len(checks)} checks on {table_name} in one scan")
+        query_result = self.query_engine.execute_query(
+            query, f"Data quality check suite for {table_name}", "list", cancellation_token
+        )
+        if not query_result["success"]:
+            return {
+                "success": False,
+                "error": f"Check suite query failed: {query_result.get('error', 'Unknown error')}",
+                "table_name": table_name,
+                "query": query
+            }
+        if not query_result["data"]:
+            return {"success": False, "error": "Check suite query returned no rows", "table_name": table_name, "query": query}
+
+        results = parse_check_results(query_result["data"][0], checks)
+        return {
+            "success": True,
+            "table_name": table_name,
+            "query": query,
+            "total_rows": results[0].total_count if results else 0,
+            "checks_run": len(results),
+            "checks_failed": sum(1 for result in results if result.passed is False),
+            "results": results
+        }
+
+    def run_check_suite(
+        self,
+        table_name: str,
+        cancellation_token: Optional[CancellationToken] = None
+    ) -> Dict[str, Any]:
+        """
+        Run the default check suite for a table (null %, 'null' sentinels, ranges, accepted
+        values, uniqueness and consistency rules from the schema) in a single scan.
+
+        Args:
+            table_name (str): Table to check; must match the table described in the schema
+            cancellation_token (Optional[CancellationToken]): Cancels the running query
+                (passed automatically when called as an agent tool)
+
+        Returns:
+            Dict[str, Any]: success flag, compiled query, totals and per-check metrics
+        """
+        schema_table = self.schema.get("table_name", "")
+        if table_name.split(".")[-1].strip('"').upper() != schema_table.upper():
+            return {
+                "success": False,
+                "error": f"No check suite defined for table {table_name}; known table: {schema_table or 'none'}",
+                "table_name": table_name
+            }
+
+        outcome = self.run_checks(table_name, build_checks_from_schema(self.schema), cancellation_token)
+        if outcome["success"]:
+            # Plain dicts keep the tool result JSON serializable for the agent
+            outcome["results"] = [result.model_dump() for result in outcome["results"]]
+        return outcome
+
+    def run_default_suite(self, cancellation_token: Optional[CancellationToken] = None) -> List[CheckResult]:
+        """Run the schema's check suite and return the structured results (empty on failure)."""
+        outcome = self.run_checks(
+            self.schema.get("table_name", ""), build_checks_from_schema(self.schema), cancellation_token
+        )
+        if not outcome["success"]:
+            self.logger.error(outcome["error"])
+            return []
+        return outcome["results"]
@@ -0,0 +1,37 @@
+from agent.tool.DataQualityCheckTool import DataQualityCheckTool
+from agent.Tracer import Tracer
+from autogen_core.tools import FunctionTool
+from typing import Optional
+
+class DataQualityCheckToolFactory:
+    """
+    Factory class to create AutoGen FunctionTools for DataQualityCheckTool methods.
+    """
+    def __init__(self, check_instance: Optional[DataQualityCheckTool] = None):
+        """
+        Initialize the factory.
+
+        Args:
+            check_instance (Optional[DataQualityCheckTool]): Tool to wrap; defaults to one
+                using the shared query engine and schema
+        """
+        self.check_instance = check_instance or DataQualityCheckTool()
+
+    def create_check_suite_tool(self):
+        """
+        Create an AutoGen FunctionTool wrapping the DataQualityCheckTool.run_check_suite method.
+
+        Returns:
+            FunctionTool: AutoGen tool for running the compiled check suite
+        """
+        try:
+            return FunctionTool(
+                Tracer.traced_tool(self.check_instance.run_check_suite),
+                description="""Run the standard data quality check suite for a table in ONE table scan:
+                null percentages, 'null' string sentinels, rating ranges, accepted values, key
+                uniqueness and cross-column consistency rules. Returns per-check failed counts,
+                percentages and pass/fail status. Prefer this over separate queries for these checks.""",
+                strict=True
+            )
+        except ImportError:
+            raise ImportError("autogen-core is required. Install with: pip install autogen-core")
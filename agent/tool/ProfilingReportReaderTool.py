@@ -10,6 +10,7 @@ Features:
 - Validates file existence and JSON format
 - Provides error handling for invalid files or formats
 - Supports both absolute and relative file paths
+- Finds the latest profiling reports of a table through the report catalog
 """
 
 import json
@@ -18,6 +19,8 @@ from typing import Dict, Any
 from pathlib import Path
 import os
 
+from agent.ReportCatalog import ReportCatalog
+
 
 class ProfilingReportReaderTool:
     """
@@ -143,3 +146,45 @@ class ProfilingReportReaderTool:
                 "error": error_msg,
                 "file_path": str(path) if 'path' in locals() else file_path
             }
+    
+    def find_profile_reports(self, table_name: str, limit: int) -> Dict[str, Any]:
+        """
+        Find the most recent JSON profiling reports of a table.
+        
+        Uses the report catalog's index rather than listing the reports directory.
+        
+        Args:
+            table_name (str): Table the profiling reports describe (case-insensitive)
+            limit (int): Maximum number of reports to return, newest first
+            
+        Returns:
+            Dict[str, Any]: Result containing the matching reports or error information
+                - success (bool): Whether the operation succeeded
+                - reports (list): file_path, goal, run_id, created_at and size_bytes per report
+                - error (str): Error message (if success=False)
+        """
+        try:
+            catalog = ReportCatalog.get_shared_instance(str(self.reports_dir))
+            entries = catalog.find(kind="profile", table_name=table_name, format="json", limit=max(1, limit))
+            return {
+                "success": True,
+                "table_name": table_name,
+                "reports": [
+                    {
+                        "file_path": entry["path"],
+                        "goal": entry["goal"],
+                        "run_id": entry["run_id"],
+                        "created_at": entry["created_at"],
+                        "size_bytes": entry["size_bytes"]
+                    }
+                    for entry in entries
+                ]
+            }
+        except Exception as e:
+            error_msg = f"Failed to look up profiling reports: {str(e)}"
+            self.logger.error(error_msg)
+            return {
+                "success": False,
+                "error": error_msg,
+                "table_name": table_name
+            }
@@ -6,6 +6,7 @@ as AutoGen FunctionTools, enabling agents to read and consume JSON profiling rep
 """
 
 from agent.tool.ProfilingReportReaderTool import ProfilingReportReaderTool
+from agent.Tracer import Tracer
 from autogen_core.tools import FunctionTool
 
 
@@ -37,7 +38,7 @@ class ProfilingReportReaderToolFactory:
         """
         try:
             return FunctionTool(
-                self.reader_instance.read_json_report,
+                Tracer.traced_tool(self.reader_instance.read_json_report),
                 description="""Read a JSON profiling report and return it as a string. 
                 Accepts a file path (absolute or relative to reports directory) and reads 
                 the JSON content, returning it as a formatted string that can be analyzed. 
@@ -47,3 +48,23 @@ class ProfilingReportReaderToolFactory:
             )
         except ImportError:
             raise ImportError("autogen-core is required. Install with: pip install autogen-core")
+    
+    def create_find_tool(self):
+        """
+        Create an AutoGen FunctionTool wrapping the ProfilingReportReaderTool.find_profile_reports method.
+        
+        This tool allows agents to look up the latest profiling reports of a table without knowing file names.
+        
+        Returns:
+            FunctionTool: AutoGen tool for finding JSON profiling reports
+        """
+        try:
+            return FunctionTool(
+                Tracer.traced_tool(self.reader_instance.find_profile_reports),
+                description="""Find the most recent JSON profiling reports of a table, newest first. 
+                Returns the file path, goal, run id, creation time and size of each report; 
+                pass a file path to the read tool to read the report.""",
+                strict=True
+            )
+        except ImportError:
+            raise ImportError("autogen-core is required. Install with: pip install autogen-core")
@@ -0,0 +1,140 @@
+"""
+Run History Tool for AutoGen Agents
+
+This module provides a RunHistoryTool class that answers trend questions from the run
+history (see agent/RunHistory.py), so agents can compare the current run with earlier ones.
+
+Features:
+- Returns the values of a check metric or profile statistic over time for a table/column
+- Summarizes the series (first, latest, min, max, change)
+- Returns issue counts per run and severity over time
+- Lists the available metrics when a requested series does not exist
+"""
+
+import logging
+import os
+from functools import cached_property
+from typing import Dict, Any
+from datetime import datetime
+
+from agent.RunHistory import RunHistory
+
+
+class RunHistoryTool:
+    """
+    A tool for querying metric and issue trends from the run history.
+    
+    Attributes:
+        history_path (str): SQLite run history file
+        history (RunHistory): The run history being queried (opened on first use)
+        logger (logging.Logger): Logger instance for the tool
+    """
+    
+    def __init__(self, history_path: str = None):
+        """
+        Initialize the RunHistoryTool.
+        
+        Args:
+            history_path (str): SQLite run history file; defaults to the RUN_HISTORY_PATH
+                env var, then to ge_reports/run_history.db
+        """
+        log_level = os.environ.get('LOG_LEVEL', 'ERROR').upper()
+        numeric_level = getattr(logging, log_level, logging.ERROR)
+        logging.basicConfig(level=numeric_level)
+        self.logger = logging.getLogger(__name__)
+        
+        self.history_path = history_path or os.environ.get("RUN_HISTORY_PATH") or "ge_reports/run_history.db"
+    
+    @cached_property
+    def history(self) -> RunHistory:
+        """Run history store, opened on first use."""
+        return RunHistory(self.history_path)
+    
+    def get_metric_trend(self, table_name: str, metric: str, column_name: str, days: int) -> Dict[str, Any]:
+        """
+        Return how a metric of a table or column changed across past runs.
+        
+        Args:
+            table_name (str): Table the metric belongs to
+            metric (str): Profile statistic (e.g. "p_missing", "n_distinct", "mean") or check
+                metric (e.g. "check:not_null") holding the failed percentage
+            column_name (str): Column of the metric; empty string for table-level metrics
+            days (int): Look-back window in days
+            
+        Returns:
+            Dict[str, Any]: Result containing the series or error information
+                - success (bool): Whether the operation succeeded
+                - points (list): {"date", "run_id", "value"} per run, oldest first
+                - first / latest / min / max / change (float): Summary of the series
+                - available_metrics (list): Recorded metrics of the table (when the series is empty)
+                - error (str): Error message (if success=False)
+        """
+        try:
+            rows = self.history.trend(table_name, metric, column_name, days)
+            result = {
+                "success": True,
+                "table_name": table_name,
+                "metric": metric,
+                "column_name": column_name,
+                "points": [
+                    {
+                        "date": datetime.fromtimestamp(row["recorded_at"]).isoformat(timespec="seconds"),
+                        "run_id": row["run_id"],
+                        "value": row["value"]
+                    }
+                    for row in rows
+                ]
+            }
+            if rows:
+                values = [row["value"] for row in rows]
+                result.update(first=values[0], latest=values[-1], min=min(values), max=max(values),
+                              change=values[-1] - values[0])
+            else:
+                result["available_metrics"] = [
+                    f"{row['metric']} ({row['column_name'] or 'table'})" for row in self.history.metric_names(table_name)
+                ]
+            return result
+        except Exception as e:
+            error_msg = f"Failed to read metric trend: {str(e)}"
+            self.logger.error(error_msg)
+            return {
+                "success": False,
+                "error": error_msg,
+                "table_name": table_name,
+                "metric": metric
+            }
+    
+    def get_issue_trend(self, table_name: str, days: int) -> Dict[str, Any]:
+        """
+        Return the number of reported issues per run and severity for a table.
+        
+        Args:
+            table_name (str): Table the runs analyzed
+            days (int): Look-back window in days
+            
+        Returns:
+            Dict[str, Any]: Result containing {"date", "run_id", "severity", "issues"} rows
+                (oldest first; runs without issues have severity None and 0 issues) or error information
+        """
+        try:
+            return {
+                "success": True,
+                "table_name": table_name,
+                "runs": [
+                    {
+                        "date": datetime.fromtimestamp(row["recorded_at"]).isoformat(timespec="seconds"),
+                        "run_id": row["run_id"],
+                        "severity": row["severity"],
+                        "issues": row["issues"]
+                    }
+                    for row in self.history.issue_trend(table_name, days)
+                ]
+            }
+        except Exception as e:
+            error_msg = f"Failed to read issue trend: {str(e)}"
+            self.logger.error(error_msg)
+            return {
+                "success": False,
+                "error": error_msg,
+                "table_name": table_name
+            }
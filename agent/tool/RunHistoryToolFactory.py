@@ -0,0 +1,63 @@
+"""
+Factory for creating AutoGen FunctionTools from RunHistoryTool.
+
+This module provides a factory class that wraps RunHistoryTool methods as AutoGen
+FunctionTools, enabling agents to compare the current run with the history of earlier runs.
+"""
+
+from agent.tool.RunHistoryTool import RunHistoryTool
+from agent.Tracer import Tracer
+from autogen_core.tools import FunctionTool
+
+
+class RunHistoryToolFactory:
+    """
+    Factory class to create AutoGen FunctionTools for RunHistoryTool methods.
+    """
+    
+    def __init__(self, history_path: str = None):
+        """
+        Initialize the factory with a RunHistoryTool instance.
+        
+        Args:
+            history_path (str): SQLite run history file (defaults to RUN_HISTORY_PATH)
+        """
+        self.history_tool = RunHistoryTool(history_path=history_path)
+    
+    def create_metric_trend_tool(self):
+        """
+        Create an AutoGen FunctionTool wrapping RunHistoryTool.get_metric_trend.
+        
+        Returns:
+            FunctionTool: AutoGen tool for reading a metric's history
+        """
+        try:
+            return FunctionTool(
+                Tracer.traced_tool(self.history_tool.get_metric_trend),
+                description="""Get how a data quality metric changed across past runs. 
+                Metrics are ydata-profiling statistics (p_missing, n_missing, n_distinct, p_distinct, 
+                mean, std, min, max; table level: n, p_cells_missing, p_duplicates) or check metrics 
+                (check:not_null, check:range, check:accepted_values, check:unique, check:null_sentinel) 
+                holding the failed percentage. Use an empty column_name for table-level metrics. 
+                Returns the values per run with first, latest, min, max and change.""",
+                strict=True
+            )
+        except ImportError:
+            raise ImportError("autogen-core is required. Install with: pip install autogen-core")
+    
+    def create_issue_trend_tool(self):
+        """
+        Create an AutoGen FunctionTool wrapping RunHistoryTool.get_issue_trend.
+        
+        Returns:
+            FunctionTool: AutoGen tool for reading issue counts of past runs
+        """
+        try:
+            return FunctionTool(
+                Tracer.traced_tool(self.history_tool.get_issue_trend),
+                description="""Get the number of data quality issues reported per past run and severity 
+                for a table, oldest first. Use it to tell new issues from recurring ones.""",
+                strict=True
+            )
+        except ImportError:
+            raise ImportError("autogen-core is required. Install with: pip install autogen-core")
@@ -0,0 +1,100 @@
+"""
+Column Sketch Tool for AutoGen Agents
+
+This module provides a SketchTool class that answers distinct-count, percentile and
+top-value questions from the stored column sketches (see agent/SketchStore.py), so agents
+do not need to query Snowflake for them.
+
+Features:
+- Merges the day partitions of a column for any date range
+- Returns the estimated distinct count, requested percentiles and most frequent values
+- Lists the sketched columns and their date ranges when a column has no sketches
+"""
+
+import logging
+import os
+from functools import cached_property
+from typing import Dict, Any, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from agent.SketchStore import SketchStore
+
+
+class SketchTool:
+    """
+    A tool for answering column statistics from stored sketches.
+
+    Attributes:
+        store_path (str): SQLite sketch store file
+        store (SketchStore): The sketch store being queried (opened on first use)
+        logger (logging.Logger): Logger instance for the tool
+    """
+
+    def __init__(self, store_path: str = None):
+        """
+        Initialize the SketchTool.
+
+        Args:
+            store_path (str): SQLite sketch store file; defaults to the SKETCH_STORE_PATH
+                env var, then to ge_reports/sketches.db
+        """
+        log_level = os.environ.get('LOG_LEVEL', 'ERROR').upper()
+        numeric_level = getattr(logging, log_level, logging.ERROR)
+        logging.basicConfig(level=numeric_level)
+        self.logger = logging.getLogger(__name__)
+
+        self.store_path = store_path or os.environ.get("SKETCH_STORE_PATH") or "ge_reports/sketches.db"
+
+    @cached_property
+    def store(self) -> "SketchStore":
+        """Sketch store, opened on first use (pandas is only imported then)."""
+        from agent.SketchStore import SketchStore
+        return SketchStore(self.store_path)
+
+    def get_column_statistics(
+        self,
+        table_name: str,
+        column_name: str,
+        start_date: str,
+        end_date: str,
+        percentiles: List[float]
+    ) -> Dict[str, Any]:
+        """
+        Return sketch-based statistics of a column for a date range.
+
+        Args:
+            table_name (str): Table the column belongs to
+            column_name (str): Column to describe
+            start_date (str): First day (YYYY-MM-DD) to include; empty string for no lower bound
+            end_date (str): Last day (YYYY-MM-DD) to include; empty string for no upper bound
+            percentiles (List[float]): Percentiles (0-100) to estimate for numeric columns
+
+        Returns:
+            Dict[str, Any]: Result containing the statistics or error information
+                - success (bool): Whether the operation succeeded
+                - distinct_count (int): Estimated distinct values (about 2% error)
+                - percentiles (dict): Estimated value per requested percentile (numeric columns)
+                - top_values (list): {"value", "count", "max_count"} of the most frequent values
+                - row_count / null_count (int): Rows covered by the merged partitions
+                - available_columns (list): Sketched columns of the table (when the column has none)
+                - error (str): Error message (if success=False)
+        """
+        try:
+            result = self.store.describe(table_name, column_name, [p / 100 for p in percentiles], 10,
+                                         start_date, end_date)
+            result["success"] = True
+            if not result["partitions"]:
+                result["available_columns"] = self.store.columns(table_name)
+            elif "quantiles" in result:
+                quantiles = result.pop("quantiles")
+                result["percentiles"] = {f"p{p:g}": quantiles[f"{p / 100:g}"] for p in percentiles}
+            return result
+        except Exception as e:
+            error_msg = f"Failed to read column sketches: {str(e)}"
+            self.logger.error(error_msg)
+            return {
+                "success": False,
+                "error": error_msg,
+                "table_name": table_name,
+                "column_name": column_name
+            }
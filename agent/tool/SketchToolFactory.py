@@ -0,0 +1,46 @@
+"""
+Factory for creating AutoGen FunctionTools from SketchTool.
+
+This module provides a factory class that wraps SketchTool methods as AutoGen
+FunctionTools, enabling agents to answer column statistics from stored sketches.
+"""
+
+from agent.tool.SketchTool import SketchTool
+from agent.Tracer import Tracer
+from autogen_core.tools import FunctionTool
+
+
+class SketchToolFactory:
+    """
+    Factory class to create AutoGen FunctionTools for SketchTool methods.
+    """
+
+    def __init__(self, store_path: str = None):
+        """
+        Initialize the factory with a SketchTool instance.
+
+        Args:
+            store_path (str): SQLite sketch store file (defaults to SKETCH_STORE_PATH)
+        """
+        self.sketch_tool = SketchTool(store_path=store_path)
+
+    def create_column_statistics_tool(self):
+        """
+        Create an AutoGen FunctionTool wrapping SketchTool.get_column_statistics.
+
+        Returns:
+            FunctionTool: AutoGen tool for sketch-based column statistics
+        """
+        try:
+            return FunctionTool(
+                Tracer.traced_tool(self.sketch_tool.get_column_statistics),
+                description="""Get the approximate distinct count, percentiles (numeric columns) and
+                most frequent values (up to 10) of a column for a date range, from sketches stored when the table was
+                profiled, without querying Snowflake. Dates are YYYY-MM-DD days of the table's date
+                column; use empty strings for an open range. Percentiles are 0-100 (e.g. [50, 95, 99]).
+                Counts cover the profiled rows (see row_count). When the column has no sketches the
+                result lists the sketched columns; then query Snowflake instead.""",
+                strict=True
+            )
+        except ImportError:
+            raise ImportError("autogen-core is required. Install with: pip install autogen-core")
@@ -27,19 +27,22 @@ Optional Parameters:
 
 import os
 import logging
-from typing import Dict, Any, Optional
+import threading
+import time
+from functools import cached_property
+from typing import Dict, Any, Optional, TYPE_CHECKING
 from datetime import datetime
 from pathlib import Path
 import json
-import pandas as pd
+from autogen_core import CancellationToken
 from dotenv import load_dotenv
 
-# Configure matplotlib to use non-interactive backend BEFORE ydata-profiling import
-# This prevents "NSWindow should only be instantiated on the main thread" errors on macOS
-import matplotlib
-matplotlib.use('Agg')  # Use non-GUI backend
+from agent.ReportCatalog import ReportCatalog
+from agent.Tracer import Tracer
 
-from ydata_profiling import ProfileReport
+if TYPE_CHECKING:
+    from ydata_profiling import ProfileReport
+    from agent.SketchStore import SketchStore
 
 try:
     from tool.SnowflakeQueryEngine import SnowflakeQueryEngine
@@ -48,6 +51,25 @@ except ImportError:
     from .SnowflakeQueryEngine import SnowflakeQueryEngine
 
 
+def _load_profile_report():
+    """
+    Import ydata-profiling on first use.
+
+    ydata-profiling pulls in matplotlib, scipy and visions, which take seconds to import,
+    so it is only loaded once a profile is actually requested.
+
+    Returns:
+        type: The ydata_profiling.ProfileReport class
+    """
+    # Configure matplotlib to use non-interactive backend BEFORE ydata-profiling import
+    # This prevents "NSWindow should only be instantiated on the main thread" errors on macOS
+    import matplotlib
+    matplotlib.use('Agg')  # Use non-GUI backend
+
+    from ydata_profiling import ProfileReport
+    return ProfileReport
+
+
 class SnowflakeDataProfilingTool:
     """
     A tool for profiling Snowflake data using ydata-profiling.
@@ -59,19 +81,46 @@ class SnowflakeDataProfilingTool:
     Attributes:
         query_engine (SnowflakeQueryEngine): Snowflake query execution engine
         reports_dir (Path): Directory for storing generated reports
+        report_catalog (ReportCatalog): Catalog the generated reports are registered in
+        sketch_store (SketchStore): Per-column sketches built from the profiled rows
     """
+
+    _shared_instances: Dict[str, "SnowflakeDataProfilingTool"] = {}
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def get_shared_instance(cls, reports_dir: str = "ge_reports") -> "SnowflakeDataProfilingTool":
+        """
+        Return the process-wide profiling tool for a reports directory.
+
+        Args:
+            reports_dir (str): Directory path for storing generated reports
+
+        Returns:
+            SnowflakeDataProfilingTool: Shared tool instance using the shared query engine
+        """
+        key = str(Path(reports_dir).resolve())
+        with cls._shared_lock:
+            if key not in cls._shared_instances:
+                cls._shared_instances[key] = cls(
+                    reports_dir=reports_dir,
+                    query_engine=SnowflakeQueryEngine.get_shared_instance()
+                )
+            return cls._shared_instances[key]
     
-    def __init__(self, reports_dir: str = "ge_reports"):
+    def __init__(self, reports_dir: str = "ge_reports", query_engine: Optional[SnowflakeQueryEngine] = None):
         """
         Initialize the SnowflakeDataProfilingTool.
         
         Args:
             reports_dir (str): Directory path for storing generated reports
+            query_engine (Optional[SnowflakeQueryEngine]): Engine to reuse; a new one is
+                created when omitted
         """
         load_dotenv()
         
         # Initialize Snowflake query engine
-        self.query_engine = SnowflakeQueryEngine()
+        self.query_engine = query_engine or SnowflakeQueryEngine()
         
         # Set up logging
         log_level = os.environ.get('LOG_LEVEL', 'ERROR').upper()
@@ -82,9 +131,16 @@ class SnowflakeDataProfilingTool:
         # Create reports directory
         self.reports_dir = Path(reports_dir)
         self.reports_dir.mkdir(parents=True, exist_ok=True)
+        self.report_catalog = ReportCatalog.get_shared_instance(str(self.reports_dir))
         
         self.logger.info(f"SnowflakeDataProfilingTool initialized. Reports will be saved to: {self.reports_dir}")
     
+    @cached_property
+    def sketch_store(self) -> "SketchStore":
+        """Sketch store (SKETCH_STORE_PATH, default <reports_dir>/sketches.db), opened on first use."""
+        from agent.SketchStore import SketchStore
+        return SketchStore(os.environ.get("SKETCH_STORE_PATH") or str(self.reports_dir / "sketches.db"))
+    
     def profile_data(
         self,
         query: str,
@@ -92,7 +148,8 @@ class SnowflakeDataProfilingTool:
         goal: str,
         generate_html: bool,
         generate_json: bool,
-        minimal_mode: bool
+        minimal_mode: bool,
+        cancellation_token: Optional[CancellationToken] = None
     ) -> Dict[str, Any]:
         """
         Profile a dataset from a Snowflake query using ydata-profiling.
@@ -108,6 +165,8 @@ class SnowflakeDataProfilingTool:
             generate_html (bool): Whether to generate HTML report
             generate_json (bool): Whether to generate JSON report
             minimal_mode (bool): If True, generate minimal profile (faster but less detail)
+            cancellation_token (Optional[CancellationToken]): Cancels the running query when
+                the agent task is stopped
             
         Returns:
             Dict[str, Any]: Profiling results including metrics and report paths
@@ -118,7 +177,7 @@ class SnowflakeDataProfilingTool:
                 self.logger.info(f"Profiling goal: {goal}")
             
             # Execute query to get data
-            query_result = self.query_engine.execute_query(query, goal, "dataframe")
+            query_result = self.query_engine.execute_query(query, goal, "dataframe", cancellation_token)
             
             if not query_result['success']:
                 return {
@@ -140,7 +199,9 @@ class SnowflakeDataProfilingTool:
             # Profile data using ydata-profiling
             self.logger.info(f"Profiling {len(df)} rows with {len(df.columns)} columns using ydata-profiling")
             
-            # Create profile with ydata-profiling
+            # Create profile with ydata-profiling (CPU time is accounted to the running task)
+            cpu_started = time.process_time()
+            ProfileReport = _load_profile_report()
             profile = ProfileReport(
                 df,
                 title=f"Data Profile: {table_name}",
@@ -163,6 +224,15 @@ class SnowflakeDataProfilingTool:
             description = profile.get_description()
             table_stats = description.table if hasattr(description, 'table') else {}
             
+            # Keep mergeable sketches of the fetched rows for later distinct/percentile/top-value questions
+            try:
+                sketch_partitions = self.sketch_store.update_from_frame(table_name, df)
+            except Exception as e:
+                sketch_partitions = 0
+                self.logger.warning(f"Failed to update column sketches: {str(e)}")
+            cpu_seconds = time.process_time() - cpu_started
+            Tracer.current().accumulate(profiling_cpu_seconds=cpu_seconds)
+            
             return {
                 "success": True,
                 "query": query,
@@ -180,6 +250,8 @@ class SnowflakeDataProfilingTool:
                     "duplicate_rows_pct": table_stats.get("p_duplicates", 0) if isinstance(table_stats, dict) else 0,
                 },
                 "report_paths": report_paths,
+                "sketch_partitions": sketch_partitions,
+                "cpu_seconds": round(cpu_seconds, 3),
                 "timestamp": datetime.now().isoformat()
             }
             
@@ -197,7 +269,7 @@ class SnowflakeDataProfilingTool:
     
     def _generate_html_report(
         self,
-        profile: ProfileReport,
+        profile: "ProfileReport",
         table_name: str,
         query: str,
         goal: str
@@ -220,7 +292,10 @@ class SnowflakeDataProfilingTool:
             html_path = self.reports_dir / html_filename
             
             # Generate HTML report using ydata-profiling
-            profile.to_file(html_path)
+            with self.report_catalog.writing(
+                html_path, "profile", goal=goal, table_name=table_name, run_id=Tracer.run_id()
+            ) as temp_path:
+                profile.to_file(temp_path)
             
             self.logger.info(f"HTML report generated: {html_path}")
             return html_path
@@ -231,7 +306,7 @@ class SnowflakeDataProfilingTool:
     
     def _generate_json_report(
         self,
-        profile: ProfileReport,
+        profile: "ProfileReport",
         table_name: str,
         query: str,
         goal: str
@@ -254,7 +329,10 @@ class SnowflakeDataProfilingTool:
             json_path = self.reports_dir / json_filename
             
             # Use the built-in JSON export from ydata-profiling
-            profile.to_file(json_path)
+            with self.report_catalog.writing(
+                json_path, "profile", goal=goal, table_name=table_name, run_id=Tracer.run_id()
+            ) as temp_path:
+                profile.to_file(temp_path)
             
             self.logger.info(f"JSON report generated: {json_path}")
             return json_path
@@ -1,18 +1,22 @@
 from agent.tool.SnowflakeDataProfilingTool import SnowflakeDataProfilingTool
+from agent.Tracer import Tracer
 from autogen_core.tools import FunctionTool
+from typing import Optional
 
 class SnowflakeDataProfilingToolFactory:
     """
     Factory class to create AutoGen FunctionTools for SnowflakeDataProfilingTool methods.
     """
-    def __init__(self, reports_dir: str = "ge_reports"):
+    def __init__(self, reports_dir: str = "ge_reports", profiling_instance: Optional[SnowflakeDataProfilingTool] = None):
         """
         Initialize the factory with a SnowflakeDataProfilingTool instance.
         
         Args:
             reports_dir (str): Directory path for storing generated reports
+            profiling_instance (Optional[SnowflakeDataProfilingTool]): Tool to wrap; defaults
+                to the process-wide shared tool for reports_dir
         """
-        self.profiling_instance = SnowflakeDataProfilingTool(reports_dir=reports_dir)
+        self.profiling_instance = profiling_instance or SnowflakeDataProfilingTool.get_shared_instance(reports_dir)
 
     def create_profile_tool(self):
         """
@@ -23,7 +27,7 @@ class SnowflakeDataProfilingToolFactory:
         """
         try:
             return FunctionTool(
-                self.profiling_instance.profile_data,
+                Tracer.traced_tool(self.profiling_instance.profile_data),
                 description="""Profile a Snowflake dataset using ydata-profiling. 
                 Executes a SQL query, analyzes the data quality, and generates comprehensive 
                 interactive HTML and JSON reports with statistics, correlations, missing values analysis, 
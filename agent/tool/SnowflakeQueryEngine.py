@@ -16,6 +16,14 @@ Optional Parameters:
 - SNOWFLAKE_DATABASE: Database name (optional, can be set in connection)  
 - SNOWFLAKE_SCHEMA: Schema name (optional, can be set in connection)
 - SNOWFLAKE_ROLE: Role name (optional)
+- SNOWFLAKE_QUERY_TIMEOUT_SECONDS: Cancel queries running longer than this (optional)
+- SNOWFLAKE_ADMISSION_CONTROL: Set to false to send statements without admission control (optional)
+- SNOWFLAKE_MAX_CONCURRENT_QUERIES / SNOWFLAKE_MIN_CONCURRENT_QUERIES: Bounds of the adaptive
+  per-warehouse concurrency limit (optional, default 8 / 1)
+- SNOWFLAKE_QUEUE_TARGET_SECONDS: Warehouse queue time that lowers the limit (optional, default 1)
+- SNOWFLAKE_WAREHOUSE_LIGHT / SNOWFLAKE_WAREHOUSE_STANDARD / SNOWFLAKE_WAREHOUSE_HEAVY: Warehouse
+  per workload tier (optional, default SNOWFLAKE_WAREHOUSE; see WarehouseRouter)
+- SNOWFLAKE_POOL_SIZE: Idle connections kept per warehouse (optional, default 4; 0 = connect per query)
 
 Note: This tool only supports PAT token authentication for security and automation purposes.
 To obtain a PAT token, log into Snowflake and generate one from your user profile settings.
@@ -23,14 +31,34 @@ To obtain a PAT token, log into Snowflake and generate one from your user profil
 """
 
 import os
+import json
 import logging
+import threading
+import time
 from typing import Dict, Any, Optional, List
 from contextlib import contextmanager
-import pandas as pd
-import snowflake.connector
-from snowflake.connector import DictCursor
+from autogen_core import CancellationToken
 from dotenv import load_dotenv
 
+from agent.Tracer import Tracer
+from agent.tool.AdmissionController import AdmissionController, AdmissionTicket, classify_query
+from agent.tool.ConnectionPool import ConnectionPool
+from agent.tool.WarehouseRouter import TIER_LIGHT, RouteDecision, WarehouseRouter, parse_explain_bytes
+
+# pandas and snowflake-connector-python are imported on first use so that importing the
+# agents (CLI, Streamlit reruns) does not pay for them before a query actually runs
+
+
+# Credits per hour by warehouse size (QUERY_HISTORY.WAREHOUSE_SIZE without dashes and spaces)
+WAREHOUSE_CREDITS_PER_HOUR = {
+    "XSMALL": 1, "SMALL": 2, "MEDIUM": 4, "LARGE": 8, "XLARGE": 16, "XXLARGE": 32, "2XLARGE": 32,
+    "XXXLARGE": 64, "3XLARGE": 64, "4XLARGE": 128, "5XLARGE": 256, "6XLARGE": 512,
+}
+
+
+class QueryCancelledError(Exception):
+    """Raised when a running query is cancelled or exceeds its timeout."""
+
 
 class SnowflakeQueryEngine:
     """
@@ -44,6 +72,24 @@ class SnowflakeQueryEngine:
         connection_params (Dict[str, Any]): Snowflake connection parameters
         _connection (Optional): Current database connection
     """
+
+    _shared_instance: Optional["SnowflakeQueryEngine"] = None
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def get_shared_instance(cls) -> "SnowflakeQueryEngine":
+        """
+        Return the process-wide query engine shared by all tools and agents.
+
+        The engine opens a connection per query, so one instance can serve concurrent callers.
+
+        Returns:
+            SnowflakeQueryEngine: Shared engine instance
+        """
+        with cls._shared_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls()
+            return cls._shared_instance
     
     def __init__(self):
         """
@@ -58,6 +104,21 @@ class SnowflakeQueryEngine:
         # Load connection parameters from environment variables
         self.connection_params = self._load_connection_params()
         self._connection = None
+        timeout = os.getenv('SNOWFLAKE_QUERY_TIMEOUT_SECONDS')
+        self.query_timeout = float(timeout) if timeout else None
+        # Query id -> cancel event of every query currently running through this engine
+        self._running_queries: Dict[str, threading.Event] = {}
+        self._running_lock = threading.Lock()
+        # Statements wait for a slot of the warehouse's shared AIMD concurrency limit
+        admission_enabled = os.getenv('SNOWFLAKE_ADMISSION_CONTROL', 'true').lower() not in ('false', '0', 'no')
+        self.admission: Optional[AdmissionController] = (
+            AdmissionController.get_shared(self.connection_params.get('warehouse')) if admission_enabled else None
+        )
+        # Statements go to the warehouse of their workload tier, over pooled connections
+        self.router = WarehouseRouter.from_env(self.connection_params.get('warehouse'))
+        self.pool_size = int(os.getenv('SNOWFLAKE_POOL_SIZE') or 4)
+        self._pools: Dict[Optional[str], ConnectionPool] = {}
+        self._pools_lock = threading.Lock()
         
         # Set up logging
         log_level = os.environ.get('LOG_LEVEL', 'ERROR').upper()
@@ -112,36 +173,75 @@ class SnowflakeQueryEngine:
         
         return params
     
-    def _create_connection(self):
+    def _create_connection(self, warehouse: Optional[str] = None):
         """
         Create a new Snowflake connection using the configured parameters.
         
+        Args:
+            warehouse (Optional[str]): Warehouse to use instead of the configured one
+        
         Returns:
             snowflake.connector.connection: Snowflake database connection
             
         Raises:
             Exception: If connection fails
         """
+        import snowflake.connector
+
         try:
             self.logger.info("Creating Snowflake connection...")
-            connection = snowflake.connector.connect(**self.connection_params)
+            params = dict(self.connection_params, warehouse=warehouse) if warehouse else self.connection_params
+            connection = snowflake.connector.connect(**params)
             self.logger.info("Successfully connected to Snowflake")
             return connection
         except Exception as e:
             self.logger.error(f"Failed to connect to Snowflake: {str(e)}")
             raise
     
+    def _pool(self, warehouse: Optional[str]) -> ConnectionPool:
+        """Return the connection pool of a warehouse, creating it on first use."""
+        key = warehouse or self.connection_params.get('warehouse')
+        with self._pools_lock:
+            if key not in self._pools:
+                if key == self.connection_params.get('warehouse'):
+                    connect = self._create_connection
+                else:
+                    connect = lambda: self._create_connection(key)
+                self._pools[key] = ConnectionPool(key, connect, max_idle=self.pool_size)
+            return self._pools[key]
+    
+    def close_connections(self) -> None:
+        """Close the idle pooled connections of every warehouse."""
+        with self._pools_lock:
+            pools = list(self._pools.values())
+        for pool in pools:
+            pool.close()
+    
     @contextmanager
-    def _get_connection(self):
+    def _get_connection(self, warehouse: Optional[str] = None):
         """
         Context manager for database connections with automatic cleanup.
         
+        With SNOWFLAKE_POOL_SIZE > 0 the connection is borrowed from the warehouse's pool and
+        returned to it afterwards; otherwise a new connection is opened and closed.
+        
+        Args:
+            warehouse (Optional[str]): Warehouse of the connection (default: the configured one)
+        
         Yields:
             snowflake.connector.connection: Database connection
         """
+        if self.pool_size > 0:
+            try:
+                with self._pool(warehouse).connection() as connection:
+                    yield connection
+            except Exception as e:
+                self.logger.error(f"Database connection error: {str(e)}")
+                raise
+            return
         connection = None
         try:
-            connection = self._create_connection()
+            connection = self._create_connection(warehouse) if warehouse else self._create_connection()
             yield connection
         except Exception as e:
             self.logger.error(f"Database connection error: {str(e)}")
@@ -189,7 +289,8 @@ class SnowflakeQueryEngine:
         self, 
         query: str, 
         goal: str,
-        return_format: str
+        return_format: str,
+        cancellation_token: Optional[CancellationToken] = None
     ) -> Dict[str, Any]:
         """
         Execute a SQL query against the Snowflake database.
@@ -198,22 +299,32 @@ class SnowflakeQueryEngine:
             query (str): SQL query to execute
             goal (str, optional): Description of what the query is trying to achieve
             return_format (str, optional): Format for returned data ('dict', 'dataframe', 'list')
+            cancellation_token (Optional[CancellationToken]): Cancelling it aborts the running
+                query with SYSTEM$CANCEL_QUERY (passed automatically when called as an agent tool)
             
         Returns:
             Dict[str, Any]: Query execution results with metadata
         """
+        import pandas as pd
+        from snowflake.connector import DictCursor
+
+        ticket = admission = None
         try:
             self.logger.info(f"Executing Snowflake query: {query}")
             if goal:
                 self.logger.info(f"Query goal: {goal}")
             
-            with self._get_connection() as conn:
+            cancel_requested = threading.Event()
+            if cancellation_token is not None:
+                cancellation_token.add_callback(cancel_requested.set)
+            route = self._route(query, return_format)
+            admission = self._admission_for(route.warehouse)
+            ticket = self._admit(query, return_format, cancel_requested, admission)
+            
+            with self._get_connection(route.warehouse) as conn:
                 # Use DictCursor for easier data handling
                 cursor = conn.cursor(DictCursor)
-                cursor.execute(query)
-                
-                # Fetch results
-                results = cursor.fetchall()
+                results = self._execute_cancellable(conn, cursor, query, cancel_requested, ticket)
                 
                 # Convert to pandas DataFrame for easier manipulation
                 if results:
@@ -241,7 +352,8 @@ class SnowflakeQueryEngine:
                     "row_count": row_count,
                     "columns": columns,
                     "data_frame": df,
-                    "return_format": return_format
+                    "return_format": return_format,
+                    "warehouse": route.warehouse
                 }
                 
         except Exception as e:
@@ -256,8 +368,160 @@ class SnowflakeQueryEngine:
                 "row_count": 0,
                 "columns": [],
                 "data": None,
-                "return_format": return_format
+                "return_format": return_format,
+                "cancelled": isinstance(e, QueryCancelledError)
             }
+        finally:
+            if ticket is not None:
+                admission.release(ticket)
+    
+    def _route(self, query: str, return_format: str) -> RouteDecision:
+        """
+        Pick the warehouse of a statement from its workload tier.
+        
+        Returns:
+            RouteDecision: Tier, warehouse and estimated bytes scanned of the statement
+        """
+        route = self.router.route(query, return_format, self._explain_bytes)
+        if route.source != "default":
+            self.logger.info(f"Routing query to {route.tier} warehouse {route.warehouse} ({route.source}, "
+                             f"{route.estimated_bytes} bytes estimated)")
+        return route
+    
+    def _explain_bytes(self, query: str) -> Optional[int]:
+        """
+        Bytes a statement will scan according to EXPLAIN (compiled only, no warehouse time).
+        
+        Returns:
+            Optional[int]: Estimated bytes scanned, or None if the plan has no estimate
+        """
+        with self._get_connection(self.router.warehouses[TIER_LIGHT]) as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"EXPLAIN USING JSON {query.strip().rstrip(';')}")
+            row = cursor.fetchone()
+        plan = row[0] if row else None
+        return parse_explain_bytes(plan if isinstance(plan, str) else json.dumps(plan)) if plan else None
+    
+    def _admission_for(self, warehouse: Optional[str]) -> Optional[AdmissionController]:
+        """Return the admission controller of a warehouse (None without admission control)."""
+        if self.admission is None or not warehouse or warehouse == self.connection_params.get('warehouse'):
+            return self.admission
+        return AdmissionController.get_shared(warehouse)
+    
+    def _admit(
+        self,
+        query: str,
+        return_format: str,
+        cancel_requested: threading.Event,
+        admission: Optional[AdmissionController]
+    ) -> Optional[AdmissionTicket]:
+        """
+        Wait for the warehouse's admission controller to grant the statement a slot.
+        
+        Metadata lookups are admitted before queries and profiling pulls; statements of the
+        workflow with the fewest in flight go first. The wait ends early if the query is
+        cancelled (cancellation token or cancel_all_queries()).
+        
+        Returns:
+            AdmissionTicket to release after the statement, or None without admission control
+            
+        Raises:
+            QueryCancelledError: If the query was cancelled while waiting
+        """
+        if admission is None:
+            return None
+        waiting_key = f"admission-{id(cancel_requested)}"
+        with self._running_lock:
+            self._running_queries[waiting_key] = cancel_requested
+        try:
+            ticket = admission.acquire(classify_query(query, return_format), Tracer.run_id() or "default",
+                                            cancel_requested)
+        finally:
+            with self._running_lock:
+                self._running_queries.pop(waiting_key, None)
+        if ticket is None:
+            raise QueryCancelledError("Query cancelled while waiting for a warehouse slot")
+        if ticket.wait_seconds > 0.001:
+            Tracer.current().accumulate(admission_wait_seconds=ticket.wait_seconds)
+        return ticket
+    
+    def _execute_cancellable(
+        self,
+        conn,
+        cursor,
+        query: str,
+        cancel_requested: threading.Event,
+        ticket: Optional[AdmissionTicket] = None
+    ) -> list:
+        """
+        Run a query asynchronously on the server and wait for its results.
+        
+        While waiting, the query is cancelled with SYSTEM$CANCEL_QUERY if cancel_requested is
+        set (cancellation token, cancel_all_queries()) or SNOWFLAKE_QUERY_TIMEOUT_SECONDS passes.
+        Time the query spends QUEUED in the warehouse is recorded on the admission ticket.
+        
+        Returns:
+            list: Fetched result rows
+            
+        Raises:
+            QueryCancelledError: If the query was cancelled
+        """
+        if cancel_requested.is_set():
+            raise QueryCancelledError("Query cancelled before it started")
+        
+        cursor.execute_async(query)
+        query_id = cursor.sfqid
+        if ticket is not None:
+            ticket.executed = True
+        # Attributes the query's credits and bytes scanned to the running agent/phase
+        Tracer.current().record_query(query_id)
+        with self._running_lock:
+            self._running_queries[query_id] = cancel_requested
+        queued_seconds = 0.0
+        try:
+            deadline = time.monotonic() + self.query_timeout if self.query_timeout else None
+            delay = 0.05
+            polled_at = time.monotonic()
+            while conn.is_still_running(status := conn.get_query_status_throw_if_error(query_id)):
+                # QUEUED means the warehouse is overloaded (not resuming or repairing)
+                now = time.monotonic()
+                if getattr(status, "name", str(status)) == "QUEUED":
+                    queued_seconds += now - polled_at
+                polled_at = now
+                timed_out = deadline is not None and now >= deadline
+                if cancel_requested.wait(delay) or timed_out:
+                    reason = "was cancelled" if cancel_requested.is_set() else f"timed out after {self.query_timeout:g}s"
+                    self.logger.warning(f"Query {query_id} {reason}; cancelling it in Snowflake")
+                    try:
+                        cursor.abort_query(query_id)  # Issues SYSTEM$CANCEL_QUERY
+                    except Exception as e:
+                        self.logger.warning(f"Could not cancel query {query_id}: {str(e)}")
+                    raise QueryCancelledError(f"Query {query_id} {reason}")
+                # Poll quickly for short queries, back off for long ones
+                delay = min(delay * 2, 1.0)
+            
+            cursor.get_results_from_sfqid(query_id)
+            return cursor.fetchall()
+        finally:
+            with self._running_lock:
+                self._running_queries.pop(query_id, None)
+            if ticket is not None:
+                ticket.queued_seconds = queued_seconds
+            if queued_seconds:
+                Tracer.current().accumulate(queued_seconds=queued_seconds)
+    
+    def cancel_all_queries(self) -> int:
+        """
+        Cancel every query currently running through this engine.
+        
+        Returns:
+            int: Number of queries asked to cancel
+        """
+        with self._running_lock:
+            events = list(self._running_queries.values())
+        for event in events:
+            event.set()
+        return len(events)
     
     def get_table_info(self, table_name: str, schema: str, database: str) -> Dict[str, Any]:
         """
@@ -295,7 +559,7 @@ class SnowflakeQueryEngine:
             ORDER BY ORDINAL_POSITION
             """
             
-            result = self.execute_query(info_query, f"Get table information for {table_ref}")
+            result = self.execute_query(info_query, f"Get table information for {table_ref}", "dict")
             
             if result["success"]:
                 return {
@@ -316,6 +580,54 @@ class SnowflakeQueryEngine:
                 "table_name": table_name
             }
 
+    def get_query_stats(self, query_ids: List[str]) -> Dict[str, Any]:
+        """
+        Look up bytes scanned, execution time and credits of queries by id.
+        
+        Uses INFORMATION_SCHEMA.QUERY_HISTORY (last 7 days, current user), which is available
+        without ACCOUNT_USAGE privileges. Compute credits are estimated from execution time and
+        warehouse size; cloud services credits are reported by Snowflake.
+        
+        Args:
+            query_ids (List[str]): Query ids (cursor.sfqid) to look up
+            
+        Returns:
+            Dict[str, Any]: success flag and "queries" mapping each found query id to
+            bytes_scanned, execution_seconds, warehouse_size and credits
+        """
+        ids = sorted({query_id for query_id in query_ids if query_id})
+        if not ids:
+            return {"success": True, "queries": {}}
+        try:
+            id_list = ", ".join("'" + query_id.replace("'", "''") + "'" for query_id in ids)
+            query = f"""
+            SELECT QUERY_ID, BYTES_SCANNED, EXECUTION_TIME, WAREHOUSE_SIZE, CREDITS_USED_CLOUD_SERVICES
+            FROM TABLE(INFORMATION_SCHEMA.QUERY_HISTORY(RESULT_LIMIT => 10000))
+            WHERE QUERY_ID IN ({id_list})
+            """
+            result = self.execute_query(query, "Look up query cost", "list")
+            if not result["success"]:
+                return result
+            
+            queries = {}
+            for row in result["data"] or []:
+                execution_seconds = (row.get("EXECUTION_TIME") or 0) / 1000.0
+                size = (row.get("WAREHOUSE_SIZE") or "").upper().replace("-", "").replace(" ", "")
+                compute_credits = execution_seconds / 3600.0 * WAREHOUSE_CREDITS_PER_HOUR.get(size, 0)
+                queries[row["QUERY_ID"]] = {
+                    "bytes_scanned": int(row.get("BYTES_SCANNED") or 0),
+                    "execution_seconds": execution_seconds,
+                    "warehouse_size": row.get("WAREHOUSE_SIZE"),
+                    "credits": compute_credits + float(row.get("CREDITS_USED_CLOUD_SERVICES") or 0)
+                }
+            return {"success": True, "queries": queries}
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Failed to look up query stats: {str(e)}"
+            }
+    
     def list_tables(self, schema: str, database: str) -> Dict[str, Any]:
         """
         List all tables in the specified schema/database.
@@ -352,7 +664,7 @@ class SnowflakeQueryEngine:
             
             query += " ORDER BY TABLE_SCHEMA, TABLE_NAME"
             
-            result = self.execute_query(query, f"List tables in {schema or 'current schema'}")
+            result = self.execute_query(query, f"List tables in {schema or 'current schema'}", "dict")
             
             if result["success"]:
                 return {
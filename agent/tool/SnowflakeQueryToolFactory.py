@@ -1,12 +1,21 @@
 from agent.tool.SnowflakeQueryEngine import SnowflakeQueryEngine
+from agent.Tracer import Tracer
 from autogen_core.tools import FunctionTool
+from typing import Optional
 
 class SnowflakeQueryToolFactory:
     """
     Factory class to create AutoGen FunctionTools for SnowflakeQueryTool methods.
     """
-    def __init__(self):
-        self.snowflake_instance = SnowflakeQueryEngine()
+    def __init__(self, snowflake_instance: Optional[SnowflakeQueryEngine] = None):
+        """
+        Initialize the factory.
+
+        Args:
+            snowflake_instance (Optional[SnowflakeQueryEngine]): Engine to wrap; defaults to
+                the process-wide shared engine
+        """
+        self.snowflake_instance = snowflake_instance or SnowflakeQueryEngine.get_shared_instance()
 
     def create_query_tool(self):
         """
@@ -17,7 +26,7 @@ class SnowflakeQueryToolFactory:
         """
         try:
             return FunctionTool(
-                self.snowflake_instance.execute_query,
+                Tracer.traced_tool(self.snowflake_instance.execute_query),
                 description="Execute SQL queries on Snowflake database. Returns structured data with success status, results, and metadata.",
                 strict=True
             )
@@ -33,7 +42,7 @@ class SnowflakeQueryToolFactory:
         """
         try:
             return FunctionTool(
-                self.snowflake_instance.get_table_info,
+                Tracer.traced_tool(self.snowflake_instance.get_table_info),
                 description="Get detailed information about a Snowflake table including column names, data types, and metadata.",
                 strict=True
             )
@@ -49,7 +58,7 @@ class SnowflakeQueryToolFactory:
         """
         try:
             return FunctionTool(
-                self.snowflake_instance.list_tables,
+                Tracer.traced_tool(self.snowflake_instance.list_tables),
                 description="List all tables in a Snowflake schema/database with metadata including row counts and table types.",
                 strict=True
             )
@@ -0,0 +1,174 @@
+"""
+Workload-based routing of Snowflake statements to warehouse tiers
+
+Metadata lookups, data quality aggregates and profiling extracts differ in cost by orders of
+magnitude. Sending them all to one warehouse makes the cheap ones queue behind the heavy ones,
+and the heavy ones run on a warehouse sized for the cheap ones. The router puts each
+statement in a tier and the SnowflakeQueryEngine sends it to that tier's warehouse:
+
+- light: metadata lookups and statements that scan little data
+- standard: everything else
+- heavy: statements that scan a lot of data
+
+Metadata lookups (INFORMATION_SCHEMA, SHOW, DESCRIBE) always go to the light tier. For other
+SELECT statements the router asks Snowflake for the bytes the statement will scan with
+EXPLAIN, which only compiles the statement and needs no warehouse. Estimates are cached by
+statement text. If EXPLAIN is off or fails, DataFrame results (profiling pulls) count as
+heavy and the rest as standard.
+
+Routing is off unless at least one tier has its own warehouse, so by default every statement
+goes to SNOWFLAKE_WAREHOUSE without an EXPLAIN.
+"""
+
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from agent.tool.AdmissionController import PRIORITY_METADATA, classify_query
+
+
+TIER_LIGHT = "light"
+TIER_STANDARD = "standard"
+TIER_HEAVY = "heavy"
+TIERS = (TIER_LIGHT, TIER_STANDARD, TIER_HEAVY)
+
+_EXPLAINABLE = re.compile(r"^\s*(SELECT|WITH)\b", re.IGNORECASE)
+
+
+def parse_explain_bytes(plan_json: str) -> Optional[int]:
+    """Bytes a statement will scan, from the output of EXPLAIN USING JSON."""
+    stats = json.loads(plan_json).get("GlobalStats") or {}
+    value = stats.get("bytesAssigned")
+    return int(value) if value is not None else None
+
+
+class RouteDecision:
+    """Tier and warehouse a statement is sent to."""
+
+    __slots__ = ("tier", "warehouse", "estimated_bytes", "source")
+
+    def __init__(self, tier: str, warehouse: Optional[str], estimated_bytes: Optional[int] = None,
+                 source: str = "heuristic"):
+        self.tier = tier
+        self.warehouse = warehouse
+        self.estimated_bytes = estimated_bytes
+        self.source = source  # "default" (routing off), "metadata", "explain" or "heuristic"
+
+    def __repr__(self) -> str:
+        return f"RouteDecision({self.tier!r}, {self.warehouse!r}, {self.estimated_bytes!r}, {self.source!r})"
+
+
+class WarehouseRouter:
+    """
+    Picks a warehouse tier per statement from its estimated cost.
+
+    Attributes:
+        default_warehouse (Optional[str]): Warehouse of the connection parameters
+        warehouses (Dict[str, Optional[str]]): Warehouse per tier (default_warehouse if not configured)
+        light_max_bytes (int): Statements scanning at most this many bytes are light
+        heavy_min_bytes (int): Statements scanning at least this many bytes are heavy
+        explain (bool): Whether to estimate bytes scanned with EXPLAIN
+        stats (Dict[str, int]): Statements per tier, EXPLAIN calls and cache hits
+    """
+
+    @classmethod
+    def from_env(cls, default_warehouse: Optional[str]) -> "WarehouseRouter":
+        """Configure the router from SNOWFLAKE_WAREHOUSE_LIGHT/STANDARD/HEAVY and the byte thresholds."""
+        return cls(
+            default_warehouse,
+            warehouses={tier: os.environ.get(f"SNOWFLAKE_WAREHOUSE_{tier.upper()}") for tier in TIERS},
+            light_max_bytes=int(os.environ.get("SNOWFLAKE_LIGHT_MAX_BYTES") or 100 * 1024 ** 2),
+            heavy_min_bytes=int(os.environ.get("SNOWFLAKE_HEAVY_MIN_BYTES") or 5 * 1024 ** 3),
+            explain=os.environ.get("SNOWFLAKE_ROUTING_EXPLAIN", "true").lower() not in ("false", "0", "no")
+        )
+
+    def __init__(
+        self,
+        default_warehouse: Optional[str],
+        warehouses: Optional[Dict[str, Optional[str]]] = None,
+        light_max_bytes: int = 100 * 1024 ** 2,
+        heavy_min_bytes: int = 5 * 1024 ** 3,
+        explain: bool = True,
+        cache_size: int = 512
+    ):
+        self.default_warehouse = default_warehouse
+        self.warehouses = {tier: (warehouses or {}).get(tier) or default_warehouse for tier in TIERS}
+        self.light_max_bytes = light_max_bytes
+        self.heavy_min_bytes = heavy_min_bytes
+        self.explain = explain
+        self.cache_size = cache_size
+        self._estimates: "OrderedDict[str, Optional[int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {**{tier: 0 for tier in TIERS}, "explains": 0, "explain_failures": 0, "cache_hits": 0}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any tier has a warehouse other than the default one."""
+        return any(warehouse != self.default_warehouse for warehouse in self.warehouses.values())
+
+    def route(
+        self,
+        query: str,
+        return_format: str,
+        explain_bytes: Optional[Callable[[str], Optional[int]]] = None
+    ) -> RouteDecision:
+        """
+        Pick the tier and warehouse of a statement.
+
+        Args:
+            query: SQL statement
+            return_format: Requested result format ('dataframe' marks a profiling pull)
+            explain_bytes: Returns the bytes the statement will scan (EXPLAIN), or None if unknown
+
+        Returns:
+            RouteDecision with the tier, warehouse and, if known, estimated bytes scanned
+        """
+        if not self.enabled:
+            return RouteDecision(TIER_STANDARD, self.default_warehouse, source="default")
+        if classify_query(query, return_format) == PRIORITY_METADATA:
+            return self._decide(TIER_LIGHT, None, "metadata")
+
+        estimated_bytes = None
+        if self.explain and explain_bytes is not None and _EXPLAINABLE.match(query):
+            estimated_bytes = self._estimate(query, explain_bytes)
+        if estimated_bytes is not None:
+            if estimated_bytes <= self.light_max_bytes:
+                tier = TIER_LIGHT
+            elif estimated_bytes >= self.heavy_min_bytes:
+                tier = TIER_HEAVY
+            else:
+                tier = TIER_STANDARD
+            return self._decide(tier, estimated_bytes, "explain")
+        tier = TIER_HEAVY if (return_format or "").lower() == "dataframe" else TIER_STANDARD
+        return self._decide(tier, None, "heuristic")
+
+    def _decide(self, tier: str, estimated_bytes: Optional[int], source: str) -> RouteDecision:
+        with self._lock:
+            self.stats[tier] += 1
+        return RouteDecision(tier, self.warehouses[tier], estimated_bytes, source)
+
+    def _estimate(self, query: str, explain_bytes: Callable[[str], Optional[int]]) -> Optional[int]:
+        """Bytes scanned by a statement, cached by its whitespace-normalized text."""
+        key = " ".join(query.split())
+        with self._lock:
+            if key in self._estimates:
+                self._estimates.move_to_end(key)
+                self.stats["cache_hits"] += 1
+                return self._estimates[key]
+            self.stats["explains"] += 1
+        try:
+            estimated_bytes = explain_bytes(query)
+        except Exception:
+            estimated_bytes = None
+        with self._lock:
+            if estimated_bytes is None:
+                # Not cached: the next run of the statement tries again
+                self.stats["explain_failures"] += 1
+                return None
+            self._estimates[key] = estimated_bytes
+            while len(self._estimates) > self.cache_size:
+                self._estimates.popitem(last=False)
+        return estimated_bytes
@@ -2,16 +2,24 @@
 DataSentinel Streamlit App
 
 A user-friendly web interface for running data quality analysis workflows.
-Users can input goals and monitor the 4-phase execution in real-time.
+Users can input goals and monitor the 4-phase execution in real-time. Workflows run as
+jobs on a background worker (agent/WorkflowWorker.py), so the page stays responsive and
+several analyses can run at once.
 """
 
 import streamlit as st
 import asyncio
+import os
+import pandas as pd
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any
 
 from agent.Orchestrator import Orchestrator
+from agent.ReportCatalog import ReportCatalog
+from agent.RunHistory import RunHistory
+from agent.WorkflowDeadline import WorkflowDeadline
+from agent.WorkflowWorker import WorkflowJob, WorkflowWorker
 
 
 # Page configuration
@@ -97,25 +105,31 @@ class WorkflowLogger:
     
     def log(self, message: str, level: str = "info", show_in_ui: bool = True):
         """Add a log entry."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.logs.append({
-            "timestamp": timestamp,
+        self._publish({
+            "type": "log",
+            "timestamp": datetime.now().strftime("%H:%M:%S"),
             "message": message,
             "level": level,
             "show_in_ui": show_in_ui
         })
-        # Trigger callback if provided
-        if self.update_callback:
-            self.update_callback()
     
     def update_phase_status(self, phase: str, status: str, details: Dict[str, Any] = None):
         """Update the status of a phase."""
-        self.phase_status[phase] = status
-        if details:
-            self.phase_details[phase].update(details)
-        # Trigger callback if provided
+        self._publish({"type": "phase", "phase": phase, "status": status, "details": details or {}})
+    
+    def apply(self, event: Dict[str, Any]):
+        """Apply a progress event (used to mirror a background job's logger in the UI)."""
+        if event["type"] == "log":
+            self.logs.append({key: value for key, value in event.items() if key != "type"})
+        elif event["type"] == "phase":
+            self.phase_status[event["phase"]] = event["status"]
+            self.phase_details[event["phase"]].update(event["details"])
+    
+    def _publish(self, event: Dict[str, Any]):
+        self.apply(event)
+        # Trigger callback if provided (e.g. WorkflowJob.emit to stream the event to the UI)
         if self.update_callback:
-            self.update_callback()
+            self.update_callback(event)
     
     def get_logs(self):
         """Get all logs."""
@@ -135,6 +149,9 @@ class StreamlitOrchestrator(Orchestrator):
     
     async def run_analysis(self, goal: str) -> Dict[str, Any]:
         """Override run_analysis to include Streamlit logging."""
+        deadline = WorkflowDeadline(self.workflow_timeout)
+        deadline_token = deadline.activate()
+        trace_span, trace_token = self._start_trace("workflow", goal=goal)
         results = {
             "goal": goal,
             "plan": None,
@@ -173,9 +190,20 @@ class StreamlitOrchestrator(Orchestrator):
             # Phase 2: Investigation & Profiling
             self.logger.log("Phase 2: Running queries and profiling data", "info")
             self.logger.update_phase_status("Phase 2: Investigation", "running")
-            investigation_results, profiling_results = await self._run_investigation_phase_logged(plan)
+            findings = None
+            check_task = asyncio.create_task(self._run_check_suite_phase()) if self.run_check_suite else None
+            if self.incremental_analysis:
+                investigation_results, profiling_results, findings = await self._run_incremental_investigation_phase_logged(plan)
+                results["findings"] = findings
+            else:
+                investigation_results, profiling_results = await self._run_investigation_phase_logged(plan)
             results["investigation_results"] = investigation_results
             results["profiling_results"] = profiling_results
+            check_results = await self._await_check_suite(check_task)
+            results["check_results"] = check_results
+            if check_results:
+                failed_checks = sum(1 for result in check_results if result.passed is False)
+                self.logger.log(f"Check suite - {len(check_results)} checks in one scan, {failed_checks} failed", "info")
             
             investigation_count = len(investigation_results) if investigation_results else 0
             profiling_count = len(profiling_results) if profiling_results else 0
@@ -193,7 +221,7 @@ class StreamlitOrchestrator(Orchestrator):
             # Phase 3: Analysis & Summarization
             self.logger.log("Phase 3: Analyzing findings and identifying issues", "info")
             self.logger.update_phase_status("Phase 3: Analysis", "running")
-            analysis = await self._run_analysis_phase_logged(goal, plan, investigation_results, profiling_results)
+            analysis = await self._run_analysis_phase_logged(goal, plan, investigation_results, profiling_results, findings, check_results)
             results["analysis"] = analysis
             
             if analysis:
@@ -210,6 +238,19 @@ class StreamlitOrchestrator(Orchestrator):
                 self.logger.update_phase_status("Phase 3: Analysis", "error")
                 self.logger.log("Phase 3 failed - Could not complete analysis", "error")
             
+            if self.followup_iterations > 0 and analysis:
+                self.logger.log("Running follow-up queries requested by the analysis", "info")
+                analysis, followup_results = await self._run_followup_phase(goal, analysis)
+                results["analysis"] = analysis
+                results["followup_results"] = followup_results
+                succeeded = sum(1 for result in followup_results if result.success)
+                self.logger.log(f"Follow-up complete - {succeeded}/{len(followup_results)} queries succeeded, {len(analysis.issues)} issues after refinement", "success")
+            
+            if self.detect_drift:
+                self.logger.log("Comparing profiles with their baselines", "info")
+                analysis = await self._apply_drift_detection(analysis, results["profiling_results"], results)
+                self.logger.log(f"Drift check complete - {len(results['drift_alerts'])} drift alerts", "success")
+            
             # Phase 4: Report Generation
             self.logger.log("Phase 4: Generating final report", "info")
             self.logger.update_phase_status("Phase 4: Reporting", "running")
@@ -224,7 +265,16 @@ class StreamlitOrchestrator(Orchestrator):
                 self.logger.log("Phase 4 failed - Could not generate report", "error")
             
             results["success"] = True
-            self.logger.log("Analysis completed successfully!", "success")
+            results["timed_out"] = deadline.timed_out
+            results["partial"] = bool(deadline.timed_out)
+            results["usage"] = await self._account_usage(trace_span, goal, success=True)
+            if results["usage"]:
+                run_usage = results["usage"].run
+                self.logger.log(f"Usage - {run_usage.prompt_tokens + run_usage.completion_tokens:,} tokens, {run_usage.queries} queries, ~{run_usage.snowflake_credits:.4f} credits", "info")
+            if deadline.timed_out:
+                self.logger.log(f"Analysis completed with partial results - timed out: {', '.join(deadline.timed_out)}", "warning")
+            else:
+                self.logger.log("Analysis completed successfully!", "success")
             
             # Save results to file
             self._save_results(results)
@@ -236,7 +286,12 @@ class StreamlitOrchestrator(Orchestrator):
             results["error"] = str(e)
             import traceback
             results["traceback"] = traceback.format_exc()
+            trace_span.fail(e)
+            results["usage"] = await self._account_usage(trace_span, goal, success=False)
             return results
+        finally:
+            self._end_trace(trace_span, trace_token, results)
+            deadline.deactivate(deadline_token)
     
     async def _run_planning_phase_logged(self, goal: str):
         """Planning phase with logging."""
@@ -256,10 +311,20 @@ class StreamlitOrchestrator(Orchestrator):
             self.logger.log(f"Investigation error: {str(e)}", "error")
             raise
     
-    async def _run_analysis_phase_logged(self, goal, plan, investigation_results, profiling_results):
+    async def _run_incremental_investigation_phase_logged(self, plan):
+        """Incremental investigation phase with logging."""
+        try:
+            return await super()._run_incremental_investigation_phase(plan)
+        except Exception as e:
+            self.logger.log(f"Investigation error: {str(e)}", "error")
+            raise
+    
+    async def _run_analysis_phase_logged(self, goal, plan, investigation_results, profiling_results, findings=None, check_results=None):
         """Analysis phase with logging."""
         try:
-            result = await super()._run_analysis_phase(goal, plan, investigation_results, profiling_results)
+            result = await super()._run_analysis_phase(
+                goal, plan, investigation_results, profiling_results, findings=findings, check_results=check_results
+            )
             return result
         except Exception as e:
             self.logger.log(f"Analysis error: {str(e)}", "error")
@@ -360,6 +425,171 @@ async def run_workflow_async(goal: str, logger: WorkflowLogger):
     return results
 
 
+@st.cache_resource
+def get_worker() -> WorkflowWorker:
+    """Background worker shared by all sessions of this server."""
+    return WorkflowWorker(max_concurrent_jobs=int(os.environ.get("STREAMLIT_MAX_CONCURRENT_JOBS", "2")))
+
+
+def submit_workflow(goal: str) -> WorkflowJob:
+    """Queue a workflow on the background worker; progress is streamed through the job."""
+    job = get_worker().submit(goal, lambda job: run_workflow_async(goal, WorkflowLogger(update_callback=job.emit)))
+    st.session_state.job_ids.insert(0, job.job_id)
+    st.session_state.job_loggers[job.job_id] = WorkflowLogger()
+    st.session_state.selected_job = job.job_id
+    return job
+
+
+@st.cache_resource
+def get_run_history() -> RunHistory:
+    """Run history written by the Orchestrator, shared by all sessions."""
+    return RunHistory(os.environ.get("RUN_HISTORY_PATH") or "ge_reports/run_history.db")
+
+
+def render_trends():
+    """Render a metric's trend across past runs from the run history."""
+    history = get_run_history()
+    tables = history.tables()
+    if not tables:
+        st.info("No runs recorded yet.")
+        return
+    col_table, col_series, col_days = st.columns([1, 2, 1])
+    with col_table:
+        table_name = st.selectbox("Table", tables, key="trend_table")
+    series = history.metric_names(table_name)
+    if not series:
+        st.info("No metrics recorded for this table yet.")
+        return
+    with col_series:
+        selected = st.selectbox(
+            "Metric",
+            series,
+            format_func=lambda row: f"{row['metric']} — {row['column_name'] or 'table'}",
+            key="trend_metric"
+        )
+    with col_days:
+        days = st.number_input("Days", min_value=1, value=90, key="trend_days")
+    
+    points = history.trend(table_name, selected["metric"], selected["column_name"], days)
+    if points:
+        frame = pd.DataFrame(points)
+        frame["recorded_at"] = pd.to_datetime(frame["recorded_at"], unit="s")
+        st.line_chart(frame, x="recorded_at", y="value")
+    else:
+        st.info(f"No values in the last {days} days.")
+    
+    issues = history.issue_trend(table_name, days)
+    if issues:
+        frame = pd.DataFrame(issues)
+        frame["recorded_at"] = pd.to_datetime(frame["recorded_at"], unit="s")
+        frame["severity"] = frame["severity"].fillna("None")  # runs without issues
+        st.bar_chart(frame, x="recorded_at", y="issues", color="severity")
+
+
+def find_report_path(results: Dict[str, Any]) -> Optional[Path]:
+    """
+    HTML report of a run from the report catalog.
+    
+    Runs without an id, or whose report file is gone, fall back to ReportCatalog.latest("report")
+    (which skips and drops deleted files) instead of globbing ge_reports by mtime.
+    """
+    catalog = ReportCatalog.get_shared_instance("ge_reports")
+    entries = catalog.find(kind="report", run_id=results["run_id"], limit=1) if results.get("run_id") else []
+    entry = entries[0] if entries and Path(entries[0]["path"]).exists() else catalog.latest("report")
+    return Path(entry["path"]) if entry else None
+
+
+def render_results(results: Dict[str, Any]):
+    """Render the summary of a finished workflow."""
+    if results.get("success"):
+        st.markdown("---")
+        if results.get("partial"):
+            st.warning(f"⚠️ Workflow completed with partial results - timed out: {', '.join(results.get('timed_out', []))}")
+        else:
+            st.success("✅ Workflow completed successfully!")
+        
+        # Display summary
+        if results.get("analysis"):
+            analysis = results["analysis"]
+            st.markdown("---")
+            st.markdown("### 📋 Summary")
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Issues Found", len(analysis.issues) if hasattr(analysis, 'issues') else 0)
+            with col2:
+                st.metric("Recommendations", len(analysis.recommendations) if hasattr(analysis, 'recommendations') else 0)
+            with col3:
+                st.metric("Follow-up Queries", len(analysis.required_followup_queries) if hasattr(analysis, 'required_followup_queries') else 0)
+            
+            if hasattr(analysis, 'summary'):
+                st.markdown("#### Executive Summary")
+                st.info(analysis.summary)
+        
+        # Show report location
+        if results.get("report"):
+            report_path = find_report_path(results)
+            if report_path:
+                st.markdown("---")
+                st.markdown("### 📄 Generated Reports")
+                st.success(f"Report saved to: `{report_path}`")
+    else:
+        st.error(f"❌ Workflow failed: {results.get('error', 'Unknown error')}")
+        if results.get('traceback'):
+            with st.expander("View Error Details"):
+                st.code(results['traceback'])
+
+
+@st.fragment(run_every=1.0)
+def render_job_progress(job_id: str):
+    """
+    Render the progress of a job, refreshed every second without rerunning the page.
+    
+    Events streamed by the job since the last refresh are applied to the session's copy
+    of its logger. When the job finishes the whole page is rerun once so the download
+    button and report counts pick up the new report.
+    """
+    job = get_worker().get(job_id)
+    if job is None:
+        st.info("This job is no longer available.")
+        return
+    logger = st.session_state.job_loggers.setdefault(job_id, WorkflowLogger())
+    for event in job.drain_events():
+        logger.apply(event)
+    
+    status_labels = {
+        "queued": "⏳ Waiting for a free worker slot...",
+        "running": "🔄 Running data quality analysis...",
+        "done": "✅ Analysis complete!",
+        "failed": "❌ Analysis failed",
+        "cancelled": "🛑 Analysis cancelled"
+    }
+    col_status, col_cancel = st.columns([3, 1])
+    with col_status:
+        st.markdown(f"**{status_labels.get(job.status, job.status)}** — {job.goal}")
+    with col_cancel:
+        if not job.finished and st.button("🛑 Cancel", key=f"cancel_{job_id}", use_container_width=True):
+            get_worker().cancel(job_id)
+    
+    st.markdown("## 📊 Workflow Status")
+    phase_status, phase_details = logger.get_phase_status()
+    for phase_name, status_val in phase_status.items():
+        render_phase_card(phase_name, status_val, phase_details.get(phase_name, {}))
+    
+    st.markdown("---")
+    render_logs(logger.get_logs())
+    
+    if job.finished:
+        if job.results:
+            render_results(job.results)
+        elif job.error:
+            st.error(f"❌ Workflow failed: {job.error}")
+        if job_id not in st.session_state.completed_jobs:
+            st.session_state.completed_jobs.add(job_id)
+            st.session_state.results = job.results
+            st.rerun()
+
+
 def main():
     """Main Streamlit app."""
     
@@ -387,10 +617,14 @@ def main():
         """)
         
     # Initialize session state
-    if "workflow_running" not in st.session_state:
-        st.session_state.workflow_running = False
-    if "logger" not in st.session_state:
-        st.session_state.logger = None
+    if "job_ids" not in st.session_state:
+        st.session_state.job_ids = []
+    if "job_loggers" not in st.session_state:
+        st.session_state.job_loggers = {}
+    if "completed_jobs" not in st.session_state:
+        st.session_state.completed_jobs = set()
+    if "selected_job" not in st.session_state:
+        st.session_state.selected_job = None
     if "results" not in st.session_state:
         st.session_state.results = None
     
@@ -408,15 +642,9 @@ def main():
     
     with col2:
         st.markdown("### 📊 Quick Stats")
-        reports_dir = Path("ge_reports")
-        if reports_dir.exists():
-            html_reports = list(reports_dir.glob("*.html"))
-            json_reports = list(reports_dir.glob("*.json"))
-            st.metric("HTML Reports", len(html_reports))
-            st.metric("JSON Reports", len(json_reports))
-        else:
-            st.metric("HTML Reports", 0)
-            st.metric("JSON Reports", 0)
+        catalog = ReportCatalog.get_shared_instance("ge_reports")
+        st.metric("HTML Reports", catalog.count(format="html"))
+        st.metric("JSON Reports", catalog.count(format="json"))
     
     # Run button
     st.markdown("---")
@@ -424,15 +652,14 @@ def main():
     col_btn1, col_btn2, col_btn3 = st.columns([1, 1, 2])
     
     with col_btn1:
-        run_button = st.button("🚀 Run Analysis", disabled=st.session_state.workflow_running or not goal, use_container_width=True)
+        # Workflows run in the background, so another goal can be submitted while one runs
+        run_button = st.button("🚀 Run Analysis", disabled=not goal, use_container_width=True)
     
     with col_btn2:
         if st.session_state.results and st.session_state.results.get("report"):
-            # Find the latest HTML report
-            reports_dir = Path("ge_reports")
-            html_reports = sorted(reports_dir.glob("data_quality_report_*.html"), key=lambda x: x.stat().st_mtime, reverse=True)
-            if html_reports:
-                report_path = html_reports[0]
+            # Find the run's HTML report in the catalog
+            report_path = find_report_path(st.session_state.results)
+            if report_path:
                 with open(report_path, 'r', encoding='utf-8') as f:
                     report_html = f.read()
                 st.download_button(
@@ -443,106 +670,28 @@ def main():
                     use_container_width=True
                 )
     
-    # Handle workflow execution
+    # Queue the workflow on the background worker
     if run_button and goal:
-        st.session_state.workflow_running = True
-        st.session_state.logger = WorkflowLogger()
-        st.session_state.results = None
-        
-        # Display workflow status section immediately
+        submit_workflow(goal)
+    
+    # Jobs of this session and the progress of the selected one
+    if st.session_state.job_ids:
         st.markdown("## 📊 Workflow Progress")
-        
-        # Use st.status for expandable progress tracking
-        with st.status("Running data quality analysis...", expanded=True) as status:
-            st.write("🔄 Starting workflow...")
-            
-            # Run the workflow
-            try:
-                # Run async workflow in Streamlit
-                results = asyncio.run(run_workflow_async(goal, st.session_state.logger))
-                st.session_state.results = results
-                
-                # Show completion
-                status.update(label="✅ Analysis complete!", state="complete", expanded=True)
-            
-            except Exception as e:
-                status.update(label="❌ Analysis failed", state="error", expanded=True)
-                st.error(f"Error: {str(e)}")
-                import traceback
-                with st.expander("View Error Details"):
-                    st.code(traceback.format_exc())
-                st.session_state.workflow_running = False
-                st.stop()
-        
-        # Display phase cards after completion
-        st.markdown("---")
-        st.markdown("## 📊 Workflow Status")
-        
-        phase_status, phase_details = st.session_state.logger.get_phase_status()
-        for phase_name, status_val in phase_status.items():
-            render_phase_card(phase_name, status_val, phase_details.get(phase_name, {}))
-        
-        # Display logs after completion
-        st.markdown("---")
-        render_logs(st.session_state.logger.get_logs())
-        
-        # Show success message and summary
-        try:
-            if results.get("success"):
-                st.markdown("---")
-                st.success("✅ Workflow completed successfully!")
-                
-                # Display summary
-                if results.get("analysis"):
-                    analysis = results["analysis"]
-                    st.markdown("---")
-                    st.markdown("### 📋 Summary")
-                    
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Issues Found", len(analysis.issues) if hasattr(analysis, 'issues') else 0)
-                    with col2:
-                        st.metric("Recommendations", len(analysis.recommendations) if hasattr(analysis, 'recommendations') else 0)
-                    with col3:
-                        st.metric("Follow-up Queries", len(analysis.required_followup_queries) if hasattr(analysis, 'required_followup_queries') else 0)
-                    
-                    if hasattr(analysis, 'summary'):
-                        st.markdown("#### Executive Summary")
-                        st.info(analysis.summary)
-                
-                # Show report location
-                if results.get("report"):
-                    reports_dir = Path("ge_reports")
-                    html_reports = sorted(reports_dir.glob("data_quality_report_*.html"), key=lambda x: x.stat().st_mtime, reverse=True)
-                    if html_reports:
-                        st.markdown("---")
-                        st.markdown("### 📄 Generated Reports")
-                        st.success(f"Report saved to: `{html_reports[0]}`")
-            else:
-                st.error(f"❌ Workflow failed: {results.get('error', 'Unknown error')}")
-                if results.get('traceback'):
-                    with st.expander("View Error Details"):
-                        st.code(results['traceback'])
-        
-        except Exception as e:
-            st.error(f"❌ Unexpected error: {str(e)}")
-            import traceback
-            with st.expander("View Error Details"):
-                st.code(traceback.format_exc())
-        
-        finally:
-            st.session_state.workflow_running = False
+        worker = get_worker()
+        jobs = {job_id: worker.get(job_id) for job_id in st.session_state.job_ids}
+        if len(jobs) > 1:
+            st.session_state.selected_job = st.selectbox(
+                "Job",
+                options=list(jobs),
+                index=list(jobs).index(st.session_state.selected_job) if st.session_state.selected_job in jobs else 0,
+                format_func=lambda job_id: f"[{jobs[job_id].status if jobs[job_id] else 'expired'}] {jobs[job_id].goal if jobs[job_id] else job_id}"
+            )
+        render_job_progress(st.session_state.selected_job or st.session_state.job_ids[0])
     
-    # Display existing results if available
-    elif st.session_state.logger:
-        phase_status, phase_details = st.session_state.logger.get_phase_status()
-        
-        st.markdown("## 📊 Workflow Status")
-        for phase_name, status in phase_status.items():
-            render_phase_card(phase_name, status, phase_details.get(phase_name, {}))
-        
-        st.markdown("---")
-        render_logs(st.session_state.logger.get_logs())
+    # Trends across past runs
+    st.markdown("---")
+    with st.expander("📈 Trends"):
+        render_trends()
     
     # Footer
     st.markdown("---")
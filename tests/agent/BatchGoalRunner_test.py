@@ -0,0 +1,177 @@
+"""
+Test script for BatchGoalRunner
+
+Goals are planned by the real rule-based planner; task execution, analysis and reporting
+are stubbed so neither Snowflake nor the LLM is needed.
+"""
+
+import asyncio
+import json
+import tempfile
+from pathlib import Path
+
+from agent.AgentPool import AgentPool
+from agent.BatchGoalRunner import BatchGoalRunner, load_goals, task_key
+from agent.DataAgent import DataAgentReport, QueryExecution
+from agent.DataProfilingAgent import DataProfilingReport
+from agent.Orchestrator import Orchestrator
+from agent.PlannerAgent import DataQualityPlan, QueryTask
+from agent.ReportAgent import ReportResponse
+from agent.SummarizerAgent import DataQualityAgentReport
+
+
+class StubOrchestrator(Orchestrator):
+    """Orchestrator whose agent calls are replaced by counters."""
+
+    def __init__(self, **kwargs):
+        super().__init__(enable_console_output=False, **kwargs)
+        self.executed_queries = []
+        self.executed_profiles = []
+
+    async def _execute_query_task(self, query_task):
+        self.executed_queries.append(query_task.goal)
+        await asyncio.sleep(0.01)
+        execution = QueryExecution(investigation_goal=query_task.goal, sql_query="SELECT 1", row_count=1,
+                                   sample_data="", summary="ok")
+        return DataAgentReport(plan_goal=query_task.goal, tasks_executed=[execution], next_steps=[])
+
+    async def _execute_profiling_task(self, profiling_task):
+        self.executed_profiles.append(profiling_task.goal)
+        return DataProfilingReport(plan_goal=profiling_task.goal, tasks_executed=[], next_steps=[])
+
+    async def _run_analysis_phase(self, goal, plan, investigation_results, profiling_results,
+                                  findings=None, check_results=None):
+        return DataQualityAgentReport(summary=f"{len(investigation_results)} results", issues=[],
+                                      recommendations=[], required_followup_queries=[], analysis_complete=True)
+
+    async def _run_reporting_phase(self, goal, plan, investigation_results, profiling_results, analysis):
+        return "<html></html>"
+
+
+class ContextAgent:
+    """Stand-in agent that keeps the tasks it was given until it is reset, like an AssistantAgent."""
+
+    def __init__(self, name):
+        self.name = name
+        self.context = []
+        self.busy = False
+
+    async def on_reset(self, cancellation_token):
+        assert not self.busy, f"{self.name} was reset during a run"
+        self.context = []
+
+
+class ContextOrchestrator(StubOrchestrator):
+    """Runs planning, analysis and reporting on ContextAgents and records what each run saw."""
+
+    def __init__(self, **kwargs):
+        super().__init__(use_rule_based_planner=False, **kwargs)
+        self.runs = []
+        for role in ("planner", "summarizer", "report"):
+            setattr(self, f"{role}_agents", AgentPool(lambda index, role=role: ContextAgent(f"{role}{index}")))
+
+    _run_analysis_phase = Orchestrator._run_analysis_phase
+    _run_reporting_phase = Orchestrator._run_reporting_phase
+
+    async def _run_single_agent_team(self, agent, task, output_type, max_messages):
+        assert not agent.busy, f"{agent.name} runs two tasks at once"
+        agent.busy = True
+        agent.context.append(task)
+        self.runs.append((agent.name, list(agent.context)))
+        await asyncio.sleep(0.01)
+        agent.busy = False
+        goal = task.split("goal: ", 1)[-1]
+        if output_type is DataQualityPlan:
+            return DataQualityPlan(goal=goal, query_tasks=[QueryTask(goal=f"Count nulls for: {goal}")],
+                                   profiling_tasks=[], execution_sequence=[], success_criteria=[])
+        if output_type is DataQualityAgentReport:
+            return DataQualityAgentReport(summary="ok", issues=[], recommendations=[],
+                                          required_followup_queries=[], analysis_complete=True)
+        return ReportResponse(html="<html></html>", thoughts="")
+
+
+def test_load_goals():
+    """Text files skip comments and blank lines; JSON files accept a list or {"goals": [...]}."""
+    print("=" * 80)
+    print("Testing BatchGoalRunner - Goals files")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        text_path = Path(tmp) / "goals.txt"
+        text_path.write_text("# nightly\nAnalyze missing values in RIDEBOOKING\n\n  Find duplicate bookings  \n")
+        json_path = Path(tmp) / "goals.json"
+        json_path.write_text(json.dumps({"goals": ["Check freshness of RIDEBOOKING", " "]}))
+
+        assert load_goals(str(text_path)) == ["Analyze missing values in RIDEBOOKING", "Find duplicate bookings"]
+        assert load_goals(str(json_path)) == ["Check freshness of RIDEBOOKING"]
+    assert task_key("Count  NULLs per column.") == task_key("count nulls per column")
+    assert task_key("Count the NULL values of the \"Booking Value\" column") == \
+        task_key("count null values in BOOKING_VALUE")
+    assert task_key("Rows with BOOKING_VALUE < 0") != task_key("Rows with BOOKING_VALUE > 0")
+    assert task_key("Count rides with status 'Cancelled'") != task_key("Count rides with status 'Completed'")
+    print("✓ Goals files parsed")
+
+
+def test_shared_tasks_run_once():
+    """Tasks planned by several goals are executed once and fanned out to every goal."""
+    goals = [
+        "Analyze missing values in the RIDEBOOKING table",
+        "Check completeness of RIDEBOOKING data",
+        "Analyze missing values in the RIDEBOOKING table",
+        "Find duplicate records in RIDEBOOKING",
+    ]
+    with tempfile.TemporaryDirectory() as reports_dir:
+        orchestrator = StubOrchestrator(reports_dir=reports_dir)
+        batch = asyncio.run(BatchGoalRunner(orchestrator=orchestrator, max_concurrent_tasks=2).run(goals))
+
+        assert batch["success"]
+        assert batch["total_query_tasks"] > batch["unique_query_tasks"] == len(orchestrator.executed_queries)
+        assert len(set(map(task_key, orchestrator.executed_queries))) == len(orchestrator.executed_queries)
+        assert batch["unique_profiling_tasks"] == len(orchestrator.executed_profiles) < batch["total_profiling_tasks"]
+
+        # Every goal still receives all results of its own plan
+        for result in batch["goal_results"]:
+            assert len(result["investigation_results"]) == len(result["plan"].query_tasks)
+        shared = batch["goal_results"][0]["investigation_results"][0]
+        assert batch["goal_results"][1]["investigation_results"][0] is shared
+
+        # One results file per goal even when they finish within the same second
+        assert len(list(Path(reports_dir).glob("workflow_results_*.json"))) == len(goals)
+        assert len(list(Path(reports_dir).glob("batch_results_*.json"))) == 1
+    print(f"✓ {batch['unique_query_tasks']} of {batch['total_query_tasks']} planned query tasks executed")
+
+
+def test_goals_run_on_separate_agents():
+    """Concurrent goals never share an agent run, and no run sees another goal's messages."""
+    goals = [f"Analyze missing values in column {num}" for num in range(4)]
+    with tempfile.TemporaryDirectory() as reports_dir:
+        orchestrator = ContextOrchestrator(reports_dir=reports_dir)
+        batch = asyncio.run(BatchGoalRunner(orchestrator=orchestrator, max_parallel_goals=4).run(goals))
+
+    assert batch["success"]
+    assert len(orchestrator.runs) == 3 * len(goals)
+    # Every run started from a reset agent: its context holds only its own task
+    assert all(len(context) == 1 for _, context in orchestrator.runs)
+    assert orchestrator.planner_agents.stats["created"] == len(goals)  # planned concurrently
+    print(f"✓ {len(orchestrator.runs)} agent runs, each on a freshly reset agent")
+
+
+def main():
+    """Run all tests."""
+    try:
+        test_load_goals()
+        test_shared_tasks_run_once()
+        test_goals_run_on_separate_agents()
+
+        print("\n" + "=" * 80)
+        print("All tests completed!")
+        print("=" * 80)
+
+    except Exception as e:
+        print(f"\n✗ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Test script for the profile DriftDetector
+
+Profiles are synthetic ydata-profiling descriptions (plus the sample report in ge_reports),
+so neither Snowflake nor the LLM is needed.
+"""
+
+import asyncio
+import copy
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from agent.DataProfilingAgent import DataProfilingReport, DataProfilingTasksExecuted
+from agent.DriftDetector import DriftDetector, histogram_drift
+from agent.Orchestrator import Orchestrator
+from agent.SummarizerAgent import DataQualityAgentReport
+
+SAMPLE_PROFILE = Path("ge_reports/RIDEBOOKING_profile_20251016_133353.json")
+
+
+def numeric_variable(values, p_missing=0.0):
+    """Profile statistics of a numeric column."""
+    counts, edges = np.histogram(values, bins=20)
+    quantiles = np.percentile(values, [5, 25, 50, 75, 95])
+    return {
+        "type": "Numeric", "p_missing": p_missing, "n_distinct": len(set(values)), "p_distinct": 0.9,
+        "histogram": {"counts": counts.tolist(), "bin_edges": edges.tolist()},
+        "std": float(np.std(values)),
+        **{q: float(v) for q, v in zip(["5%", "25%", "50%", "75%", "95%"], quantiles)},
+    }
+
+
+def categorical_variable(counts, p_missing=0.0):
+    """Profile statistics of a categorical column."""
+    return {"type": "Categorical", "p_missing": p_missing, "n_distinct": len(counts),
+            "p_distinct": len(counts) / sum(counts.values()), "value_counts_without_nan": counts}
+
+
+def profiles():
+    """A baseline profile and a drifted current profile."""
+    rng = np.random.default_rng(7)
+    baseline = {"variables": {
+        "BOOKING_VALUE": numeric_variable(rng.normal(500, 100, 5000), p_missing=0.01),
+        "RIDE_DISTANCE": numeric_variable(rng.normal(20, 5, 5000)),
+        "VEHICLE_TYPE": categorical_variable({"Auto": 250, "Bike": 160, "Go Mini": 200, "Uber XL": 25}),
+        "PAYMENT_METHOD": categorical_variable({"UPI": 400, "Cash": 200, "Card": 100}),
+    }}
+    current = {"variables": {
+        "BOOKING_VALUE": numeric_variable(rng.normal(650, 100, 5000), p_missing=0.12),
+        "RIDE_DISTANCE": numeric_variable(rng.normal(20, 5, 5000)),
+        "VEHICLE_TYPE": categorical_variable({"Auto": 250, "Bike": 160, "Go Mini": 200, "eBike": 90}),
+        "PAYMENT_METHOD": categorical_variable({"UPI": 402, "Cash": 199, "Card": 99}),
+    }}
+    return baseline, current
+
+
+def test_drift_signals_are_ranked():
+    """Shifted distributions, null rates and categories raise ranked alerts; stable columns do not."""
+    print("=" * 80)
+    print("Testing DriftDetector - Drift signals")
+    print("=" * 80)
+
+    baseline, current = profiles()
+    alerts = DriftDetector().compare(baseline, current, table="RIDEBOOKING")
+    by_signal = {(alert.column, alert.metric): alert for alert in alerts}
+
+    assert ("BOOKING_VALUE", "psi") in by_signal and ("BOOKING_VALUE", "ks") in by_signal
+    assert by_signal[("BOOKING_VALUE", "quantile_shift")].severity == "Critical"  # 150 shift over a ~135 IQR
+    assert by_signal[("BOOKING_VALUE", "null_rate")].value == 11.0
+    assert "eBike" in by_signal[("VEHICLE_TYPE", "new_categories")].description
+    assert "Uber XL" in by_signal[("VEHICLE_TYPE", "vanished_categories")].description
+    assert not [alert for alert in alerts if alert.column in ("RIDE_DISTANCE", "PAYMENT_METHOD")]
+
+    order = {"Critical": 0, "High": 1, "Medium": 2}
+    assert [order[alert.severity] for alert in alerts] == sorted(order[alert.severity] for alert in alerts)
+    assert alerts[0].to_issue().type.startswith("Data Drift")
+    assert DriftDetector().compare(baseline, copy.deepcopy(baseline)) == []
+    print(f"✓ {len(alerts)} alerts, top: {alerts[0].description}")
+
+
+def test_histograms_with_different_bins():
+    """Histograms are compared on the baseline bins even when the edges differ."""
+    same = {"counts": [10, 20, 30, 40], "bin_edges": [0, 1, 2, 3, 4]}
+    rebinned = {"counts": [5, 5, 10, 10, 15, 15, 20, 20], "bin_edges": [0, 0.5, 1, 1.5, 2, 2.5, 3, 3.5, 4]}
+    psi, ks = histogram_drift(same, rebinned)
+    assert psi < 1e-6 and ks < 1e-9
+    psi, ks = histogram_drift(same, {"counts": [100], "bin_edges": [10, 20]})  # entirely out of range
+    assert psi > 1 and abs(ks - 1) < 1e-9
+    print("✓ Histograms rebinned onto baseline edges")
+
+
+def test_real_profile_in_milliseconds():
+    """Comparing full ydata-profiling reports takes milliseconds."""
+    profile = json.loads(SAMPLE_PROFILE.read_text(encoding='utf-8'))
+    drifted = copy.deepcopy(profile)
+    counts = drifted["variables"]["VEHICLE_TYPE"]["value_counts_without_nan"]
+    counts["Rickshaw"] = counts.pop("Uber XL") * 10
+
+    detector = DriftDetector()
+    assert detector.compare(profile, profile) == []
+    started = time.perf_counter()
+    alerts = detector.compare(profile, drifted)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    assert {alert.metric for alert in alerts if alert.column == "VEHICLE_TYPE"} >= {"new_categories", "vanished_categories"}
+    assert elapsed_ms < 200
+    print(f"✓ {len(profile['variables'])} columns compared in {elapsed_ms:.1f} ms")
+
+
+def test_orchestrator_adds_drift_issues():
+    """The drift phase finds the catalogued baseline and appends alerts to the analysis."""
+    baseline, current = profiles()
+    with tempfile.TemporaryDirectory() as reports_dir:
+        orchestrator = Orchestrator(reports_dir=reports_dir, enable_console_output=False, detect_drift=True,
+                                    max_drift_alerts=3)
+        paths = []
+        for index, profile in enumerate([baseline, current]):
+            path = Path(reports_dir) / f"RIDEBOOKING_profile_2025010{index + 1}_120000.json"
+            orchestrator.report_catalog.write_text(path, json.dumps(profile), "profile", table_name="RIDEBOOKING",
+                                                   run_id=f"run-{index}")
+            os.utime(path, (1_700_000_000 + index, 1_700_000_000 + index))
+            orchestrator.report_catalog.register(path, "profile", table_name="RIDEBOOKING", run_id=f"run-{index}")
+            paths.append(path)
+
+        profiling_results = [DataProfilingReport(plan_goal="profile", next_steps=[], tasks_executed=[
+            DataProfilingTasksExecuted(task_purpose="profile", query_or_dataset="RIDEBOOKING", row_count=5000,
+                                       column_count=4, html_report_path="", json_report_path=str(paths[1]))
+        ])]
+        analysis = DataQualityAgentReport(summary="s", issues=[], recommendations=[], required_followup_queries=[],
+                                          analysis_complete=True)
+        results = {}
+        analysis = asyncio.run(orchestrator._apply_drift_detection(analysis, profiling_results, results))
+
+    assert len(results["drift_alerts"]) > 3 and len(analysis.issues) == 3
+    assert analysis.issues[0].severity == "Critical" and results["analysis"] is analysis
+    print(f"✓ {len(results['drift_alerts'])} alerts, top {len(analysis.issues)} added to the analysis")
+
+
+def main():
+    """Run all tests."""
+    try:
+        test_drift_signals_are_ranked()
+        test_histograms_with_different_bins()
+        test_real_profile_in_milliseconds()
+        test_orchestrator_adds_drift_issues()
+
+        print("\n" + "=" * 80)
+        print("All tests completed!")
+        print("=" * 80)
+
+    except Exception as e:
+        print(f"\n✗ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Test script for FindingExtractor
+
+This script demonstrates how completed DataAgent and DataProfilingAgent reports are
+mapped to compact findings for the incremental analysis mode of the Orchestrator.
+"""
+
+from pathlib import Path
+
+from agent.FindingExtractor import FindingExtractor, detect_table, detect_theme
+from agent.DataAgent import DataAgentReport, QueryExecution
+from agent.DataProfilingAgent import DataProfilingReport, DataProfilingTasksExecuted
+
+
+def test_query_report_findings():
+    """Each executed query becomes one compact finding."""
+    print("=" * 80)
+    print("Testing FindingExtractor - Query Report")
+    print("=" * 80)
+
+    report = DataAgentReport(
+        plan_goal="Analyze duplicates",
+        tasks_executed=[
+            QueryExecution(
+                investigation_goal="Find duplicate BOOKING_ID entries",
+                sql_query="SELECT BOOKING_ID, COUNT(*) AS CNT FROM RIDEBOOKING GROUP BY BOOKING_ID HAVING COUNT(*) > 1",
+                row_count=3,
+                sample_data="",
+                summary="3 BOOKING_IDs appear more than once " + "x" * 2000
+            )
+        ],
+        next_steps=[]
+    )
+
+    findings = FindingExtractor(max_observation_chars=200).extract(report)
+    for finding in findings:
+        print(finding.model_dump_json(indent=2))
+
+    assert len(findings) == 1
+    assert findings[0].source == "query"
+    assert findings[0].table == "RIDEBOOKING"
+    assert findings[0].theme == "uniqueness"
+    assert len(findings[0].observation) <= 200
+
+
+def test_profiling_report_findings():
+    """Profiling reports are summarized from their JSON output."""
+    print("\n" + "=" * 80)
+    print("Testing FindingExtractor - Profiling Report")
+    print("=" * 80)
+
+    json_reports = sorted(Path("ge_reports").glob("*_profile_*.json"))
+    if not json_reports:
+        print("No profiling JSON reports found in ge_reports/ - skipping")
+        return
+
+    report = DataProfilingReport(
+        plan_goal="Profile bookings",
+        tasks_executed=[
+            DataProfilingTasksExecuted(
+                task_purpose="Profile BOOKING_VALUE distribution and outliers",
+                query_or_dataset="SELECT * FROM RIDEBOOKING LIMIT 1000",
+                row_count=1000,
+                column_count=34,
+                html_report_path=str(json_reports[0].with_suffix(".html")),
+                json_report_path=str(json_reports[0])
+            )
+        ],
+        next_steps=[]
+    )
+
+    findings = FindingExtractor().extract(report)
+    for finding in findings:
+        print(finding.model_dump_json(indent=2))
+
+    assert len(findings) == 1
+    assert findings[0].source == "profile"
+    assert "rows x" in findings[0].observation
+
+
+def test_detection_helpers():
+    """Table and theme detection used to tag findings."""
+    assert detect_table('SELECT * FROM "DB"."PUBLIC"."RIDEBOOKING" WHERE 1=1') == "RIDEBOOKING"
+    assert detect_table("SELECT 1") == "UNKNOWN"
+    assert detect_theme("Check for null values in BOOKING_VALUE") == "completeness"
+    assert detect_theme("Something unrelated") == "general"
+    print("\n✓ Detection helpers behave as expected")
+
+
+def main():
+    """Run all tests."""
+    try:
+        test_query_report_findings()
+        test_profiling_report_findings()
+        test_detection_helpers()
+
+        print("\n" + "=" * 80)
+        print("All tests completed!")
+        print("=" * 80)
+
+    except Exception as e:
+        print(f"\n✗ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Test script for FollowupQueryRunner
+
+Covers deduplication, read-only validation and budgeted concurrent execution. Queries run
+against an in-memory stand-in for SnowflakeQueryEngine, so no Snowflake connection is needed.
+"""
+
+import asyncio
+import tempfile
+import threading
+import time
+
+import pytest
+
+from agent.FollowupQueryRunner import FollowupBudget, FollowupQueryRunner
+from agent.Orchestrator import Orchestrator
+from agent.SummarizerAgent import DataQualityAgentReport
+
+
+class SlowQueryEngine:
+    """Sleeps per query and records how many queries ran at the same time."""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.queries = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def execute_query(self, query, goal, return_format, cancellation_token=None):
+        with self.lock:
+            self.queries.append(query)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        return {"success": True, "data": [{"N": 1}], "row_count": 1, "columns": ["N"]}
+
+
+def test_dedupe_and_validation():
+    """Equivalent queries run once; writes, multi-statements and system calls are rejected."""
+    print("=" * 80)
+    print("Testing FollowupQueryRunner - Dedupe and validation")
+    print("=" * 80)
+
+    runner = FollowupQueryRunner(query_engine=SlowQueryEngine(0))
+    requested = [
+        "SELECT COUNT(*) FROM RIDEBOOKING WHERE BOOKING_VALUE IS NULL",
+        "select count(*)\n  from ridebooking where booking_value is null;  -- same query",
+        "SELECT * FROM RIDEBOOKING WHERE \"Booking Status\" = 'Delete me'",
+        "DELETE FROM RIDEBOOKING",
+        "SELECT 1; DROP TABLE RIDEBOOKING",
+        "SELECT SYSTEM$CANCEL_QUERY('01a')",
+        "WITH t AS (SELECT 1 AS N) SELECT N FROM t",
+    ]
+    seen = set()
+    accepted, rejected = runner.select_queries(requested, seen, iteration=1)
+
+    assert accepted == [requested[0], requested[2], requested[6]]
+    assert [result.sql for result in rejected] == requested[3:6]
+    assert all(result.error.startswith("Rejected") for result in rejected)
+
+    # Already seen queries are not requested again in later rounds
+    accepted, rejected = runner.select_queries(requested, seen, iteration=2)
+    assert accepted == [] and rejected == []
+    print("✓ Duplicates dropped and unsafe statements rejected")
+
+
+def test_concurrent_execution_within_budget():
+    """Queries run concurrently, are row capped, and charge estimated credits to the budget."""
+    engine = SlowQueryEngine(0.2)
+    runner = FollowupQueryRunner(query_engine=engine, max_concurrency=3, max_rows=50, credits_per_hour=3600)
+    budget = FollowupBudget(max_iterations=2, max_seconds=10, max_credits=100)
+    queries = [f"SELECT {n} AS N" for n in range(3)]
+
+    started = time.perf_counter()
+    results = asyncio.run(runner.run_queries(queries, budget, iteration=1))
+    elapsed = time.perf_counter() - started
+
+    assert all(result.success for result in results)
+    assert engine.max_active == 3 and elapsed < 0.5
+    assert all(query.endswith("LIMIT 50") for query in engine.queries)
+    assert 0.5 < budget.credits_spent < 1.5  # 3 x ~0.2s at one credit per second
+    print(f"✓ 3 queries in {elapsed:.2f}s, {budget.credits_spent:.2f} credits charged")
+
+
+def test_budget_limits():
+    """Exhausted credit or time budgets skip or time out remaining queries."""
+    runner = FollowupQueryRunner(query_engine=SlowQueryEngine(0.3), max_concurrency=1, credits_per_hour=3600)
+
+    budget = FollowupBudget(max_iterations=5, max_seconds=10, max_credits=0.1)
+    results = asyncio.run(runner.run_queries(["SELECT 1", "SELECT 2"], budget, iteration=1))
+    assert results[0].success and results[1].error.startswith("Skipped")
+    assert "credit budget" in budget.exhausted()
+
+    budget = FollowupBudget(max_iterations=5, max_seconds=0.1, max_credits=100)
+    results = asyncio.run(runner.run_queries(["SELECT 3"], budget, iteration=1))
+    assert results[0].error.startswith("Timed out")
+    assert "time budget" in budget.exhausted()
+
+    budget = FollowupBudget(max_iterations=1, max_seconds=10, max_credits=100)
+    budget.iterations = 1
+    assert "iteration budget" in budget.exhausted()
+    print("✓ Credit, time and iteration budgets enforced")
+
+
+class SlowRefinementOrchestrator(Orchestrator):
+    """Orchestrator whose summarizer takes longer than the follow-up time budget."""
+
+    async def _run_single_agent_team(self, agent, task, output_type, max_messages=10):
+        await asyncio.sleep(30)
+
+
+@pytest.mark.usefixtures("placeholder_credentials")
+def test_refinement_bounded_by_time_budget():
+    """A slow refinement is cut off at the loop's time budget and the previous analysis is kept."""
+    analysis = DataQualityAgentReport(
+        summary="initial", issues=[], recommendations=[],
+        required_followup_queries=["SELECT COUNT(*) FROM RIDEBOOKING"], analysis_complete=False
+    )
+    with tempfile.TemporaryDirectory() as reports_dir:
+        orchestrator = SlowRefinementOrchestrator(
+            reports_dir=reports_dir, enable_console_output=False, followup_iterations=3, followup_time_budget=0.5
+        )
+        orchestrator.followup_runner = FollowupQueryRunner(query_engine=SlowQueryEngine(0.1))
+
+        started = time.perf_counter()
+        refined, executed = asyncio.run(orchestrator._run_followup_phase("goal", analysis))
+        elapsed = time.perf_counter() - started
+
+    assert refined is analysis and len(executed) == 1 and executed[0].success
+    assert elapsed < 1.5
+    print(f"✓ Refinement stopped after {elapsed:.2f}s with a 0.5s follow-up time budget")
+
+
+def main():
+    """Run all tests."""
+    try:
+        test_dedupe_and_validation()
+        test_concurrent_execution_within_budget()
+        test_budget_limits()
+        test_refinement_bounded_by_time_budget()
+
+        print("\n" + "=" * 80)
+        print("All tests completed!")
+        print("=" * 80)
+
+    except Exception as e:
+        print(f"\n✗ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
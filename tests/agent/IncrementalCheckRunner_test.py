@@ -0,0 +1,168 @@
+"""
+Test script for incremental check suites
+
+Uses the SQLite change source (rowid watermark) as a stand-in for Snowflake change
+tracking, so neither Snowflake nor the LLM is needed. Cumulative incremental results are
+compared with a full-table run of the same compiled suite.
+"""
+
+import sqlite3
+import tempfile
+from pathlib import Path
+
+from agent.IncrementalCheckRunner import IncrementalCheckRunner, SQLiteChangeSource, SnowflakeChangeSource
+from agent.tool.CheckSuiteCompiler import DataQualityCheck, parse_check_results
+
+CHECKS = [
+    DataQualityCheck(name="not_null:BOOKING_VALUE", check_type="not_null", column="BOOKING_VALUE", max_failed_pct=5),
+    DataQualityCheck(name="null_sentinel:PAYMENT_METHOD", check_type="null_sentinel", column="PAYMENT_METHOD",
+                     values=["null", ""], max_failed_pct=0),
+    DataQualityCheck(name="range:DRIVER_RATINGS", check_type="range", column="DRIVER_RATINGS", min_value=1,
+                     max_value=5, max_failed_pct=0),
+    DataQualityCheck(name="accepted_values:BOOKING_STATUS", check_type="accepted_values", column="BOOKING_STATUS",
+                     values=["Completed", "Cancelled"], max_failed_pct=0),
+    DataQualityCheck(name="unique:BOOKING_ID", check_type="unique", column="BOOKING_ID", max_failed_pct=0),
+    DataQualityCheck(name="consistency:cancelled_has_no_value", check_type="consistency",
+                     when="(BOOKING_STATUS = 'Cancelled')", then="(BOOKING_VALUE IS NULL)", max_failed_pct=0),
+]
+
+
+def booking_rows(start, count):
+    """Rows with periodic quality problems and some duplicated booking ids."""
+    rows = []
+    for index in range(start, start + count):
+        rows.append((
+            f"CNR{index % 900}",  # ids repeat after 900 rows
+            None if index % 17 == 0 else 100.0 + index % 50,
+            "null" if index % 23 == 0 else "UPI",
+            "7" if index % 31 == 0 else str(1 + index % 5),
+            ["Completed", "Cancelled", "Pending"][index % 3] if index % 11 == 0 else "Completed",
+        ))
+    return rows
+
+
+def create_table():
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.execute("CREATE TABLE RIDEBOOKING (BOOKING_ID TEXT, BOOKING_VALUE REAL, PAYMENT_METHOD TEXT, "
+                 "DRIVER_RATINGS TEXT, BOOKING_STATUS TEXT)")
+    return conn
+
+
+def append(conn, rows):
+    conn.executemany("INSERT INTO RIDEBOOKING VALUES (?, ?, ?, ?, ?)", rows)
+    conn.commit()
+
+
+def failed_counts(outcome):
+    return {result.name: result.failed_count for result in outcome["results"]}
+
+
+def test_incremental_matches_full_scan():
+    """Running aggregates over baseline + deltas equal a full scan of the table."""
+    print("=" * 80)
+    print("Testing IncrementalCheckRunner - Delta aggregates")
+    print("=" * 80)
+
+    conn = create_table()
+    source = SQLiteChangeSource("RIDEBOOKING", conn)
+    with tempfile.TemporaryDirectory() as state_dir:
+        runner = IncrementalCheckRunner(source, state_path=str(Path(state_dir) / "incremental.db"))
+        append(conn, booking_rows(0, 600))
+        baseline = runner.run(CHECKS)
+        assert baseline["success"] and baseline["mode"] == "baseline" and baseline["delta_rows"] == 600
+
+        for start, count in [(600, 400), (1000, 400), (1400, 250)]:
+            append(conn, booking_rows(start, count))
+            outcome = runner.run(CHECKS)
+            assert outcome["mode"] == "incremental" and outcome["delta_rows"] == count
+
+        full = parse_check_results(source.aggregate(CHECKS, None, source.current_offset()), CHECKS)
+        assert outcome["total_rows"] == 1650 == full[0].total_count
+        assert failed_counts(outcome) == {result.name: result.failed_count for result in full}
+        assert failed_counts(outcome)["unique:BOOKING_ID"] == 1650 - 900
+
+        idle = runner.run(CHECKS)
+        assert idle["delta_rows"] == 0 and failed_counts(idle) == failed_counts(outcome)
+    print(f"✓ {outcome['total_rows']} rows, {outcome['checks_failed']} failing checks, "
+          f"last delta {outcome['delta_rows']} rows")
+
+
+def test_offset_advances_atomically():
+    """A run that lost the race does not double count; a changed suite takes a new baseline."""
+    conn = create_table()
+    append(conn, booking_rows(0, 100))
+    with tempfile.TemporaryDirectory() as state_dir:
+        state_path = str(Path(state_dir) / "incremental.db")
+        first = IncrementalCheckRunner(SQLiteChangeSource("RIDEBOOKING", conn), state_path=state_path)
+        first.run(CHECKS)
+        append(conn, booking_rows(100, 100))
+
+        # A second runner consumes the delta between the first runner's state read and commit
+        second = IncrementalCheckRunner(SQLiteChangeSource("RIDEBOOKING", conn), state_path=state_path)
+        state = first._state()
+        second.run(CHECKS)
+        try:
+            first._commit(state, state["suite"], first.source.current_offset(), CHECKS, 100,
+                          {check.name: 1 for check in CHECKS}, {})
+            raise AssertionError("stale commit was accepted")
+        except RuntimeError:
+            pass
+        assert first.run(CHECKS)["total_rows"] == 200
+
+        narrowed = first.run(CHECKS[:2])
+        assert narrowed["mode"] == "baseline" and narrowed["total_rows"] == 200
+
+        # A failing delta read leaves the offset untouched
+        conn.execute("ALTER TABLE RIDEBOOKING RENAME TO RIDEBOOKING_OLD")
+        assert not first.run(CHECKS[:2])["success"]
+        conn.execute("ALTER TABLE RIDEBOOKING_OLD RENAME TO RIDEBOOKING")
+        assert first.run(CHECKS[:2])["delta_rows"] == 0
+    print("✓ Stale commits rejected, suite changes rebaseline")
+
+
+def test_snowflake_source_reads_changes():
+    """The Snowflake source reads deltas with the CHANGES clause and the baseline with AT."""
+
+    class RecordingEngine:
+        def __init__(self):
+            self.queries = []
+
+        def execute_query(self, query, goal, return_format, cancellation_token=None):
+            self.queries.append(query)
+            if "CURRENT_TIMESTAMP" in query:
+                return {"success": True, "data": [{"NOW": "2025-01-02 00:00:00.000000000 +0000"}]}
+            if "HASH(" in query:
+                return {"success": True, "data": [{"H": 1}, {"H": -2}]}
+            return {"success": True, "data": [{"TOTAL_ROWS": 10, "CHECK_0": 1}]}
+
+    engine = RecordingEngine()
+    source = SnowflakeChangeSource("ANALYTICS.PUBLIC.RIDEBOOKING", engine)
+    end = source.current_offset()
+    source.aggregate(CHECKS[:1], "2025-01-01 00:00:00.000000000 +0000", end)
+    assert source.key_hashes("BOOKING_ID", None, end) == [1, -2]
+    delta, baseline = engine.queries[1], engine.queries[2]
+    assert "FROM ANALYTICS.PUBLIC.RIDEBOOKING CHANGES(INFORMATION => APPEND_ONLY) AT(TIMESTAMP =>" in delta
+    assert "END(TIMESTAMP =>" in delta
+    assert "CHANGES" not in baseline and "AT(TIMESTAMP =>" in baseline
+    print("✓ CHANGES clause between offsets")
+
+
+def main():
+    """Run all tests."""
+    try:
+        test_incremental_matches_full_scan()
+        test_offset_advances_atomically()
+        test_snowflake_source_reads_changes()
+
+        print("\n" + "=" * 80)
+        print("All tests completed!")
+        print("=" * 80)
+
+    except Exception as e:
+        print(f"\n✗ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""
+Test script for the job queue and its worker processes
+
+Jobs are run by stand-in runners defined here, so neither Snowflake nor the LLM is needed.
+The pool test spawns real worker processes that import the runner factory from this module.
+"""
+
+import asyncio
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from agent.JobQueue import JobQueue, goal_hash
+from agent.JobWorkerPool import JobEventExporter, JobWorker, JobWorkerPool, orchestrator_runner
+from agent.Orchestrator import Orchestrator
+from agent.Tracer import Tracer
+
+
+def stub_runner(delay: float = 0.0, fail_goal: str = "boom"):
+    """Runner factory: traces a workflow with one phase per job like the Orchestrator, taking delay seconds."""
+    started = {"count": 0}
+    exporter = JobEventExporter()
+
+    async def run(job, emit):
+        started["count"] += 1
+        exporter.emit = emit
+        with Tracer.start_span("workflow", "workflow", exporter=exporter, goal=job["goal"]):
+            with Tracer.span("phase:planning", "phase"):
+                await asyncio.sleep(delay)
+            with Tracer.span("model:gpt", "model"):
+                pass
+        if job["goal"] == fail_goal:
+            raise RuntimeError("runner failed")
+        return {"success": True, "run_id": f"run-{job['job_id']}", "results_path": None, "report_path": None,
+                "summary": {"issue_count": len(job["goal"]), "runner_jobs": started["count"]}, "error": None}
+
+    return run
+
+
+def test_submit_is_idempotent_and_cached():
+    """Equal goals share a job while it is pending and reuse its result within the TTL."""
+    print("=" * 80)
+    print("Testing JobQueue - Idempotent submission and result cache")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as reports_dir:
+        queue = JobQueue(str(Path(reports_dir) / "job_queue.db"), result_ttl=60)
+        job, disposition = queue.submit("Check NULLs in RIDEBOOKING", {"run_check_suite": True})
+        assert disposition == "created" and job["status"] == "queued"
+        same, disposition = queue.submit("  check nulls in   ridebooking ", {"run_check_suite": True})
+        assert disposition == "existing" and same["job_id"] == job["job_id"]
+        other, disposition = queue.submit("Check NULLs in RIDEBOOKING", {"run_check_suite": False})
+        assert disposition == "created" and other["goal_hash"] != job["goal_hash"]
+        assert goal_hash("a  b") == goal_hash("A b")
+
+        claimed = queue.claim("w1")
+        assert claimed["job_id"] == job["job_id"] and claimed["attempts"] == 1
+        assert queue.complete(job["job_id"], "w1", True, run_id="r1", summary={"issue_count": 3})
+        cached, disposition = queue.submit("check nulls in ridebooking", {"run_check_suite": True})
+        assert disposition == "cached" and cached["job_id"] == job["job_id"] and cached["summary"]["issue_count"] == 3
+
+        fresh, disposition = queue.submit("check nulls in ridebooking", {"run_check_suite": True}, use_cache=False)
+        assert disposition == "created" and fresh["job_id"] != job["job_id"]
+        keyed, _ = queue.submit("Find duplicates", idempotency_key="client-1")
+        again, disposition = queue.submit("A different goal", idempotency_key="client-1")
+        assert disposition == "existing" and again["job_id"] == keyed["job_id"]
+
+        statuses = [event["status"] for event in queue.events(job["job_id"])]
+        assert statuses == ["queued", "running", "done"]
+        assert queue.stats()["queued"] == 3
+    print("✓ Duplicate, cached and keyed submissions resolved to existing jobs")
+
+
+def test_claim_heartbeat_and_recovery():
+    """Concurrent claims never share a job; stale jobs are requeued, then failed; queued jobs cancel."""
+    with tempfile.TemporaryDirectory() as reports_dir:
+        path = str(Path(reports_dir) / "job_queue.db")
+        queue = JobQueue(path, max_attempts=2)
+        for index in range(40):
+            queue.submit(f"goal {index}")
+
+        claimed, lock = [], threading.Lock()
+
+        def claim_all(worker_id):
+            own_queue = JobQueue(path)
+            while (job := own_queue.claim(worker_id)) is not None:
+                with lock:
+                    claimed.append(job["job_id"])
+
+        threads = [threading.Thread(target=claim_all, args=(f"w{index}",)) for index in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(claimed) == 40 == len(set(claimed)) and queue.stats()["running"] == 40
+
+        job_id = claimed[0]
+        owner = queue.get(job_id)["worker_id"]
+        assert queue.heartbeat(job_id, owner) and not queue.heartbeat(job_id, "someone-else")
+        time.sleep(0.05)
+        assert queue.requeue_stale(0.01) == 40 and queue.stats()["queued"] == 40
+        assert not queue.heartbeat(job_id, owner) and not queue.complete(job_id, owner, True)
+
+        while queue.claim("w9") is not None:
+            pass
+        time.sleep(0.05)
+        queue.requeue_stale(0.01)
+        assert queue.stats()["failed"] == 40 and "2 attempts" in queue.get(job_id)["error"]
+
+        queued, _ = queue.submit("cancel me while queued")
+        assert queue.cancel(queued["job_id"])["status"] == "cancelled" and queue.claim("w1") is None
+    print("✓ 40 jobs claimed exactly once, stale jobs requeued then failed, cancels honoured")
+
+
+def test_worker_runs_jobs_and_streams_events():
+    """A worker runs queued jobs, records their outcome and writes span events."""
+    with tempfile.TemporaryDirectory() as reports_dir:
+        queue = JobQueue(str(Path(reports_dir) / "job_queue.db"))
+        ok, _ = queue.submit("Check NULLs")
+        bad, _ = queue.submit("boom")
+        worker = JobWorker(queue, stub_runner(), worker_id="w1", poll_interval=0.01)
+
+        assert asyncio.run(worker.run_once())["status"] == "done"
+        assert asyncio.run(worker.run_once())["status"] == "failed"
+        assert asyncio.run(worker.run_once()) is None
+
+        done = queue.get(ok["job_id"])
+        assert done["run_id"] == f"run-{ok['job_id']}" and done["summary"]["runner_jobs"] == 1
+        assert "RuntimeError: runner failed" in queue.get(bad["job_id"])["error"]
+        events = queue.events(ok["job_id"])
+        assert [event["type"] for event in events] == ["status", "status", "span", "span", "status"]
+        assert [event["name"] for event in events[2:4]] == ["phase:planning", "workflow"]
+        assert events[2]["kind"] == "phase" and events[2]["status"] == "ok"
+        assert queue.events(ok["job_id"], after=events[1]["seq"]) == events[2:]
+
+        # A cancelled running job is stopped at the next heartbeat
+        slow, _ = queue.submit("slow")
+        worker = JobWorker(queue, stub_runner(delay=5), worker_id="w2", heartbeat_interval=0.05)
+
+        async def cancel_soon():
+            run = asyncio.create_task(worker.run_once())
+            await asyncio.sleep(0.1)
+            queue.cancel(slow["job_id"])
+            return await asyncio.wait_for(run, timeout=2)
+
+        assert asyncio.run(cancel_soon())["status"] == "cancelled"
+    print(f"✓ Jobs done/failed/cancelled, {len(events)} events for the successful job")
+
+
+def test_orchestrator_runner_keeps_few_orchestrators():
+    """Jobs with the same options share a warm Orchestrator; at most max_orchestrators are kept."""
+    used = []
+
+    async def run_analysis(self, goal):
+        used.append(self)
+        return {"success": True, "run_id": None}
+
+    original = Orchestrator.run_analysis
+    Orchestrator.run_analysis = run_analysis
+    try:
+        with tempfile.TemporaryDirectory() as reports_dir:
+            runner = orchestrator_runner(reports_dir=reports_dir, max_orchestrators=2)
+
+            def run(timeout):
+                job = {"goal": "Check NULLs", "options": {"task_timeout": timeout}}
+                return asyncio.run(runner(job, lambda event: None))
+
+            for timeout in (10, 10, 20, 30, 10):
+                assert run(timeout)["success"]
+    finally:
+        Orchestrator.run_analysis = original
+
+    assert used[0] is used[1]  # same options: warm Orchestrator reused
+    assert len({id(orchestrator) for orchestrator in used}) == 4  # options 10 were dropped and rebuilt
+    assert [orchestrator.task_timeout for orchestrator in used] == [10, 10, 20, 30, 10]
+    print("✓ Orchestrators reused per options and capped at max_orchestrators")
+
+
+def test_pool_processes_share_the_queue():
+    """Worker processes build their runner once and drain the queue together."""
+    with tempfile.TemporaryDirectory() as reports_dir:
+        path = str(Path(reports_dir) / "job_queue.db")
+        queue = JobQueue(path)
+        jobs = [queue.submit(f"goal {index}")[0]["job_id"] for index in range(8)]
+        pool = JobWorkerPool(path, workers=2, runner_factory="tests.agent.JobQueue_test:stub_runner",
+                             runner_kwargs={"delay": 0.2}, poll_interval=0.05, heartbeat_interval=1)
+        started_at = time.perf_counter()
+        pool.start()
+        try:
+            deadline = time.monotonic() + 60
+            while queue.stats()["done"] < 8 and time.monotonic() < deadline:
+                time.sleep(0.1)
+                pool.supervise()
+        finally:
+            pool.stop(timeout=10)
+        elapsed = time.perf_counter() - started_at
+
+        finished = [queue.get(job_id) for job_id in jobs]
+        assert all(job["status"] == "done" for job in finished)
+        workers = {job["worker_id"] for job in finished}
+        assert len(workers) == 2 and pool.alive() == 0
+        # Each process reused its runner: its counter went past 1
+        assert max(job["summary"]["runner_jobs"] for job in finished) > 1
+    print(f"✓ 8 jobs on {len(workers)} worker processes in {elapsed:.1f}s")
+
+
+def main():
+    """Run all tests."""
+    try:
+        test_submit_is_idempotent_and_cached()
+        test_claim_heartbeat_and_recovery()
+        test_worker_runs_jobs_and_streams_events()
+        test_orchestrator_runner_keeps_few_orchestrators()
+        test_pool_processes_share_the_queue()
+
+        print("\n" + "=" * 80)
+        print("All tests completed!")
+        print("=" * 80)
+
+    except Exception as e:
+        print(f"\n✗ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Test script for MapReduceSummarizer
+
+Demonstrates chunking of findings by table/theme, parallel summarization over a pool of
+workers and the deduplicating merge of partial DataQualityAgentReports.
+"""
+
+import asyncio
+
+from agent.FindingExtractor import InvestigationFinding
+from agent.MapReduceSummarizer import MapReduceSummarizer, chunk_findings, merge_reports
+from agent.SummarizerAgent import DataQualityAgentReport, DataQualityIssue
+
+
+def make_finding(table: str, theme: str, num: int) -> InvestigationFinding:
+    return InvestigationFinding(
+        source="query",
+        goal=f"{theme} check {num}",
+        table=table,
+        theme=theme,
+        evidence_query=f"SELECT COUNT(*) FROM {table}",
+        row_count=num,
+        observation=f"observation {num}"
+    )
+
+
+class RecordingWorker:
+    """Minimal worker used to observe how the summarizer distributes chunks."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.resets = 0
+        self.busy = False
+
+    async def on_reset(self, cancellation_token) -> None:
+        assert not self.busy, f"{self.name} was reset while summarizing a chunk"
+        self.resets += 1
+
+
+def test_chunking():
+    """Findings are grouped by (table, theme) and large groups are split."""
+    findings = [make_finding("RIDEBOOKING", "completeness", i) for i in range(5)]
+    findings += [make_finding("RIDEBOOKING", "uniqueness", i) for i in range(2)]
+    findings += [make_finding("PAYMENTS", "completeness", i) for i in range(1)]
+
+    chunks = chunk_findings(findings, max_findings_per_chunk=3)
+    print(f"Chunk sizes: {[len(chunk) for chunk in chunks]}")
+
+    assert sum(len(chunk) for chunk in chunks) == len(findings)
+    assert [len(chunk) for chunk in chunks] == [3, 2, 2, 1]
+    for chunk in chunks:
+        assert len({(f.table, f.theme) for f in chunk}) == 1
+
+
+def test_merge_deduplicates_issues():
+    """Duplicated issues keep the highest severity; lists are deduplicated."""
+    issue = DataQualityIssue(
+        type="Missing Values",
+        severity="Medium",
+        evidence_query="SELECT COUNT(*) FROM RIDEBOOKING WHERE BOOKING_VALUE IS NULL",
+        evidence_description="nulls found"
+    )
+    report_a = DataQualityAgentReport(
+        summary="Chunk A.", issues=[issue], recommendations=["Impute values"],
+        required_followup_queries=["SELECT 1"], analysis_complete=True
+    )
+    report_b = DataQualityAgentReport(
+        summary="Chunk B.",
+        issues=[issue.model_copy(update={"severity": "High", "evidence_description": "15% of rows are null"})],
+        recommendations=["impute values ", "Add NOT NULL constraint"],
+        required_followup_queries=["select 1"],
+        analysis_complete=True
+    )
+
+    merged = merge_reports([report_a, report_b])
+    print(merged.model_dump_json(indent=2))
+
+    assert len(merged.issues) == 1
+    assert merged.issues[0].severity == "High"
+    assert merged.issues[0].evidence_description == "15% of rows are null"
+    assert merged.recommendations == ["Impute values", "Add NOT NULL constraint"]
+    assert merged.required_followup_queries == ["SELECT 1"]
+    assert merged.analysis_complete
+
+
+def test_parallel_summarization():
+    """Chunks are spread across at most fan_out workers running concurrently."""
+    findings = [make_finding("RIDEBOOKING", theme, i)
+                for theme in ("completeness", "uniqueness", "validity", "consistency")
+                for i in range(2)]
+    active = {"now": 0, "peak": 0}
+
+    async def run_team(agent, task, output_type, max_messages):
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(0.01)
+        active["now"] -= 1
+        return output_type(
+            summary=f"{agent.name} summarized a chunk.",
+            issues=[], recommendations=[], required_followup_queries=[], analysis_complete=True
+        )
+
+    workers = []
+
+    def create_worker(index):
+        workers.append(RecordingWorker(f"worker{index}"))
+        return workers[-1]
+
+    summarizer = MapReduceSummarizer(worker_factory=create_worker, fan_out=2)
+    merged = asyncio.run(summarizer.summarize("Analyze RIDEBOOKING", findings, run_team))
+
+    print(f"Peak concurrency: {active['peak']}")
+    assert merged is not None
+    assert active["peak"] == 2
+    assert len(workers) == 2 and sum(worker.resets for worker in workers) == 4
+
+
+def test_concurrent_calls_use_separate_workers():
+    """Concurrent summarize() calls never drive or reset a worker another call is using."""
+    findings = [make_finding("RIDEBOOKING", theme, 0) for theme in ("completeness", "uniqueness", "validity")]
+    workers = []
+
+    def create_worker(index):
+        workers.append(RecordingWorker(f"worker{index}"))
+        return workers[-1]
+
+    async def run_team(agent, task, output_type, max_messages):
+        assert not agent.busy, f"{agent.name} was given two chunks at once"
+        agent.busy = True
+        await asyncio.sleep(0.01)
+        agent.busy = False
+        return output_type(
+            summary=f"{agent.name} summarized a chunk.",
+            issues=[], recommendations=[], required_followup_queries=[], analysis_complete=True
+        )
+
+    summarizer = MapReduceSummarizer(worker_factory=create_worker, fan_out=2)
+
+    async def run():
+        return await asyncio.gather(*(summarizer.summarize(f"Goal {num}", findings, run_team) for num in range(3)))
+
+    merged = asyncio.run(run())
+    assert all(report is not None for report in merged)
+    assert len(workers) == 6  # 3 calls x fan_out 2
+    assert sum(worker.resets for worker in workers) == 9  # one reset per chunk
+
+    # A later call reuses the idle workers instead of creating new ones
+    asyncio.run(summarizer.summarize("Goal 3", findings, run_team))
+    assert len(workers) == 6 and summarizer.workers.stats["reused"] >= 3
+    print(f"✓ 3 concurrent calls summarized {3 * len(findings)} chunks on {len(workers)} separate workers")
+
+
+def main():
+    """Run all tests."""
+    try:
+        test_chunking()
+        test_merge_deduplicates_issues()
+        test_parallel_summarization()
+        test_concurrent_calls_use_separate_workers()
+
+        print("\n" + "=" * 80)
+        print("All tests completed!")
+        print("=" * 80)
+
+    except Exception as e:
+        print(f"\n✗ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
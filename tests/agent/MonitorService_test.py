@@ -0,0 +1,163 @@
+"""
+Test script for the change-triggered MonitorService
+
+Change signals and check suite results come from a stand-in query engine that serves
+INFORMATION_SCHEMA rows, so neither Snowflake nor the LLM is needed.
+"""
+
+import asyncio
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from agent.MonitorService import MonitorService, MonitoredTable
+from agent.RunHistory import RunHistory
+from agent.SchemaRegistry import SchemaRegistry
+
+
+class FakeSignalEngine:
+    """Serves table metadata and check suite rows; counts the queries per kind."""
+
+    def __init__(self, tables, commit_time_supported=True):
+        self.tables = tables  # name -> {"LAST_ALTERED", "ROW_COUNT", "BYTES"}
+        self.commit_time_supported = commit_time_supported
+        self.queries = {"signals": 0, "commit_time": 0, "checks": 0}
+        self.lock = threading.Lock()
+
+    def execute_query(self, query, goal, return_format, cancellation_token=None):
+        with self.lock:
+            if "INFORMATION_SCHEMA.TABLES" in query:
+                self.queries["signals"] += 1
+                rows = [{"TABLE_NAME": name, **signals} for name, signals in self.tables.items() if f"'{name}'" in query]
+                return {"success": True, "data": rows, "row_count": len(rows)}
+            if "SYSTEM$LAST_CHANGE_COMMIT_TIME" in query:
+                self.queries["commit_time"] += 1
+                if not self.commit_time_supported:
+                    return {"success": False, "error": "Unsupported feature", "data": None}
+                names = [name for name in sorted(self.tables)]
+                return {"success": True, "data": [{f"C{index}": self.tables[name]["LAST_ALTERED"]
+                                                   for index, name in enumerate(names)}]}
+            self.queries["checks"] += 1
+            return {"success": True, "data": [{"TOTAL_ROWS": 100, "CHECK_0": 7, "CHECK_1": 0}], "row_count": 1}
+
+
+def test_checks_run_only_on_change():
+    """The first poll runs every table, later polls only the changed ones; state survives a restart."""
+    print("=" * 80)
+    print("Testing MonitorService - Change-triggered runs")
+    print("=" * 80)
+
+    schema = SchemaRegistry.load_schema()
+    engine = FakeSignalEngine({
+        "RIDEBOOKING": {"LAST_ALTERED": "2025-01-01 10:00", "ROW_COUNT": 100, "BYTES": 4096},
+        "PAYMENTS": {"LAST_ALTERED": "2025-01-01 09:00", "ROW_COUNT": 50, "BYTES": 1024},
+    })
+    with tempfile.TemporaryDirectory() as reports_dir:
+        state_path = str(Path(reports_dir) / "monitor_state.db")
+        history = RunHistory(str(Path(reports_dir) / "run_history.db"))
+
+        def make_service():
+            service = MonitorService(query_engine=engine, state_path=state_path, run_history=history)
+            service.register(MonitoredTable(table_name="RIDEBOOKING", table_schema=schema,
+                                            check_names=["not_null:DATE", "not_null:BOOKING_ID"]))
+            service.register(MonitoredTable(table_name="payments", table_schema=schema))
+            return service
+
+        service = make_service()
+        assert sorted(asyncio.run(service.run_once())) == ["PAYMENTS", "RIDEBOOKING"]
+        assert engine.queries["checks"] == 2 and len(service.checks_for(service.tables()[1])) == 2
+
+        assert asyncio.run(service.run_once()) == []
+        assert engine.queries["checks"] == 2 and service.stats["unchanged"] == 2
+
+        engine.tables["PAYMENTS"]["ROW_COUNT"] = 75
+        restarted = make_service()
+        assert asyncio.run(restarted.run_once()) == ["PAYMENTS"]
+        assert engine.queries["checks"] == 3 and engine.queries["signals"] == 3
+
+        nulls = history.trend("RIDEBOOKING", "check:not_null", schema["columns"][0]["name"])
+        assert [row["value"] for row in nulls] == [7.0]
+    print(f"✓ 3 check runs over 3 polls ({engine.queries['signals']} signal queries)")
+
+
+def test_priority_queue_and_concurrency_cap():
+    """Changed tables run in priority order with at most max_concurrent_runs at a time."""
+    engine = FakeSignalEngine({f"T{index}": {"LAST_ALTERED": "x", "ROW_COUNT": index, "BYTES": 1} for index in range(6)},
+                              commit_time_supported=False)
+    started, active = [], {"now": 0, "max": 0}
+
+    async def run_table(table):
+        started.append(table.key)
+        active["now"] += 1
+        active["max"] = max(active["max"], active["now"])
+        await asyncio.sleep(0.05)
+        active["now"] -= 1
+        return {"success": table.key != "T3", "error": "boom"}
+
+    with tempfile.TemporaryDirectory() as reports_dir:
+        service = MonitorService(query_engine=engine, state_path=str(Path(reports_dir) / "state.db"),
+                                 max_concurrent_runs=2, run_table=run_table)
+        for index in range(6):
+            service.register(MonitoredTable(table_name=f"T{index}", priority=5 - index))
+        started_at = time.perf_counter()
+        asyncio.run(service.run_once())
+        elapsed = time.perf_counter() - started_at
+
+        assert started == ["T5", "T4", "T3", "T2", "T1", "T0"]
+        assert active["max"] == 2 and elapsed < 0.3
+        assert not service.use_commit_time and engine.queries["commit_time"] == 1
+
+        # The failed table is retried by the next poll; the others are unchanged
+        started.clear()
+        asyncio.run(service.run_once())
+        assert started == ["T3"] and service.stats["failed_runs"] == 2
+    print(f"✓ Priority order {['T5', 'T4', 'T3', 'T2', 'T1', 'T0']}, max {active['max']} concurrent")
+
+
+def test_run_forever_stops():
+    """run_forever polls until the stop event is set."""
+    engine = FakeSignalEngine({"RIDEBOOKING": {"LAST_ALTERED": "a", "ROW_COUNT": 1, "BYTES": 1}})
+    runs = []
+
+    async def run_table(table):
+        runs.append(table.key)
+        return {"success": True}
+
+    async def scenario(service):
+        stop = asyncio.Event()
+        loop = asyncio.create_task(service.run_forever(stop))
+        await asyncio.sleep(0.05)
+        engine.tables["RIDEBOOKING"]["ROW_COUNT"] = 2
+        await asyncio.sleep(0.05)
+        stop.set()
+        await asyncio.wait_for(loop, timeout=1)
+
+    with tempfile.TemporaryDirectory() as reports_dir:
+        service = MonitorService(query_engine=engine, state_path=str(Path(reports_dir) / "state.db"),
+                                 poll_interval=0.02, run_table=run_table)
+        service.register(MonitoredTable(table_name="RIDEBOOKING"))
+        asyncio.run(scenario(service))
+    assert runs == ["RIDEBOOKING", "RIDEBOOKING"] and service.stats["polls"] >= 4
+    print(f"✓ {service.stats['polls']} polls, {len(runs)} runs")
+
+
+def main():
+    """Run all tests."""
+    try:
+        test_checks_run_only_on_change()
+        test_priority_queue_and_concurrency_cap()
+        test_run_forever_stops()
+
+        print("\n" + "=" * 80)
+        print("All tests completed!")
+        print("=" * 80)
+
+    except Exception as e:
+        print(f"\n✗ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
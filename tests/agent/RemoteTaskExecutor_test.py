@@ -0,0 +1,268 @@
+"""
+Test script for distributing investigation tasks to remote task workers
+
+Workers run stand-in handlers defined here instead of agents, so neither Snowflake nor the
+LLM is needed. The cluster tests start real worker processes on localhost that import the
+handler factories from this module.
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+
+from agent.AgentPool import AgentPool
+from agent.DataAgent import DataAgentReport
+from agent.DataProfilingAgent import DataProfilingReport
+from agent.Orchestrator import Orchestrator
+from agent.PlannerAgent import DataQualityPlan, ProfilingTask, QueryTask
+from agent.RemoteTaskExecutor import RemoteTaskError, RemoteTaskExecutor
+from agent.TaskWorkerServer import LocalTaskCluster, TaskWorkerServer
+from agent.Tracer import Tracer
+from agent.UsageAccountant import UsageAccountant
+
+
+def stub_handler(delay: float = 0.0, fail_first: int = 0, hang_goal: str = "hang"):
+    """Handler factory: answers with a report naming the worker process, like an agent would."""
+    calls = {"count": 0}
+
+    async def handle(kind, task):
+        calls["count"] += 1
+        if calls["count"] <= fail_first:
+            raise RuntimeError("model call failed")
+        if task["goal"] == hang_goal:
+            await asyncio.sleep(3600)
+        await asyncio.sleep(delay)
+        Tracer.current().accumulate(prompt_tokens=100, completion_tokens=20, model_calls=1)
+        Tracer.current().record_query(f"q-{os.getpid()}-{calls['count']}")
+        return {"plan_goal": task["goal"], "tasks_executed": [], "next_steps": [f"pid {os.getpid()}", kind]}
+
+    return handle
+
+
+async def with_server(handler, scenario, **server_kwargs):
+    """Run a scenario against an in-process worker."""
+    server = TaskWorkerServer(handler, **server_kwargs)
+    port = await server.start()
+    try:
+        return await scenario(server, f"127.0.0.1:{port}")
+    finally:
+        await server.close()
+
+
+def test_result_heartbeat_and_usage():
+    """A remote task returns a validated report, heartbeats keep it alive and usage is rolled up locally."""
+    print("=" * 80)
+    print("Testing RemoteTaskExecutor - Results, heartbeats and usage")
+    print("=" * 80)
+
+    async def scenario(server, address):
+        executor = RemoteTaskExecutor([address], heartbeat_timeout=0.2)
+        accountant = UsageAccountant()
+        with Tracer.start_span("workflow", "workflow", exporter=accountant) as root:
+            # The task takes several heartbeat timeouts; heartbeats every 0.05s keep it alive
+            report = await executor.execute("query", QueryTask(goal="Count NULLs"), DataAgentReport)
+        usage = accountant.summarize(root)
+        return report, usage, executor
+
+    report, usage, executor = asyncio.run(with_server(stub_handler(delay=0.5), scenario, heartbeat_interval=0.05))
+    assert isinstance(report, DataAgentReport) and report.plan_goal == "Count NULLs"
+    assert report.next_steps[1] == "query"
+    assert usage.run.prompt_tokens == 100 and usage.run.queries == 1
+    assert usage.by_agent["query"].completion_tokens == 20
+    assert executor.stats == {"tasks": 1, "retries": 0, "failed": 0}
+    print(f"✓ Report returned after 0.5s with a 0.2s heartbeat timeout, {usage.run.prompt_tokens} prompt tokens")
+
+
+def test_retries_on_failures():
+    """Refused connections, worker errors and silent workers are retried on other workers."""
+
+    async def scenario(server, address):
+        # A port nobody listens on, then a worker whose handler fails once
+        dead = await asyncio.start_server(lambda reader, writer: None, "127.0.0.1", 0)
+        dead_address = f"127.0.0.1:{dead.sockets[0].getsockname()[1]}"
+        dead.close()
+        await dead.wait_closed()
+
+        executor = RemoteTaskExecutor([dead_address, address], max_attempts=3, cooldown=60)
+        report = await executor.execute("profiling", ProfilingTask(goal="Profile FARE"), DataProfilingReport)
+        stats = {worker["address"]: worker for worker in executor.worker_stats()}
+        assert report.plan_goal == "Profile FARE" and stats[dead_address]["down"]
+        assert executor.stats["retries"] >= 1 and stats[address]["completed"] == 1
+
+        try:
+            await RemoteTaskExecutor([address], max_attempts=2).execute("lint", QueryTask(goal="x"), DataAgentReport)
+            raise AssertionError("unknown task kind was accepted")
+        except RemoteTaskError as e:
+            assert "unknown task kind" in str(e) and "1 attempt" in str(e)
+        return executor
+
+    asyncio.run(with_server(stub_handler(fail_first=1), scenario, heartbeat_interval=0.05))
+
+    async def token_required(server, address):
+        for token in (None, "wrong"):
+            try:
+                await RemoteTaskExecutor([address], token=token).execute("query", QueryTask(goal="x"), DataAgentReport)
+                raise AssertionError(f"task with token {token!r} was accepted")
+            except RemoteTaskError as e:
+                assert "unauthorized" in str(e) and "1 attempt" in str(e)
+        report = await RemoteTaskExecutor([address], token="s3cret").execute("query", QueryTask(goal="x"), DataAgentReport)
+        return report, server.stats
+
+    report, stats = asyncio.run(with_server(stub_handler(), token_required, token="s3cret"))
+    assert report.plan_goal == "x" and stats["rejected"] == 2 and stats["tasks"] == 1
+
+    async def silent_worker(server, address):
+        # Heartbeats every 10s: the client gives up after 0.2s of silence
+        executor = RemoteTaskExecutor([address], max_attempts=2, heartbeat_timeout=0.2, cooldown=0)
+        started = time.perf_counter()
+        try:
+            await executor.execute("query", QueryTask(goal="hang"), DataAgentReport)
+            raise AssertionError("silent worker was not detected")
+        except RemoteTaskError as e:
+            assert "no heartbeat" in str(e)
+        await asyncio.sleep(0.1)
+        return time.perf_counter() - started, server.stats
+
+    elapsed, stats = asyncio.run(with_server(stub_handler(), silent_worker, heartbeat_interval=10))
+    assert elapsed < 2 and stats["cancelled"] == 2
+    print(f"✓ Dead worker skipped, failed task retried, tasks without the token rejected, silent worker given up "
+          f"after {elapsed:.1f}s")
+
+
+def test_task_timeout_bounds_remote_tasks():
+    """A remote agent that hangs while its worker heartbeats is cut off by task_timeout on both sides."""
+
+    async def scenario(server, address):
+        executor = RemoteTaskExecutor([address], heartbeat_timeout=1)
+        with tempfile.TemporaryDirectory() as reports_dir:
+            orchestrator = Orchestrator(reports_dir=reports_dir, enable_console_output=False, task_executor=executor,
+                                        task_timeout=0.5)
+            started = time.perf_counter()
+            report = await orchestrator._execute_query_task(QueryTask(goal="hang"))
+            elapsed = time.perf_counter() - started
+
+        # Without the client: the worker cancels the task when the timeout sent with it runs out
+        try:
+            await executor.execute("query", QueryTask(goal="hang"), DataAgentReport, timeout=0.3)
+            raise AssertionError("hung task was not timed out")
+        except asyncio.TimeoutError as e:
+            assert "timed out after 0.3s" in str(e)
+        await asyncio.sleep(0.1)
+        return report, elapsed, dict(server.stats), executor.worker_stats()[0]
+
+    report, elapsed, stats, worker = asyncio.run(with_server(stub_handler(), scenario, heartbeat_interval=0.05))
+    assert report is None and elapsed < 1.5
+    assert stats["cancelled"] == 2 and not worker["down"]
+    print(f"✓ Hung remote task given up after {elapsed:.2f}s and cancelled on the worker")
+
+
+class ContextAgent:
+    """Stand-in agent that keeps the tasks it was given until it is reset, like an AssistantAgent."""
+
+    def __init__(self, name):
+        self.name = name
+        self.context = []
+
+    async def on_reset(self, cancellation_token):
+        self.context = []
+
+
+class WorkerOrchestrator(Orchestrator):
+    """Worker-side Orchestrator whose DataAgents are ContextAgents; records what each task's agent saw."""
+
+    def __init__(self, reports_dir):
+        super().__init__(reports_dir=reports_dir, enable_console_output=False, task_executor=None)
+        self.data_agents = AgentPool(lambda index: ContextAgent(f"DataAgent{index}"))
+        self.seen = []
+        self.running = set()
+
+    async def _run_single_agent_team(self, agent, task, output_type, max_messages):
+        assert agent.name not in self.running, f"{agent.name} runs two tasks at once"
+        self.running.add(agent.name)
+        agent.context.append(task)
+        self.seen.append(list(agent.context))
+        await asyncio.sleep(0.05)
+        self.running.discard(agent.name)
+        return DataAgentReport(plan_goal=task.split("Goal: ")[-1].strip(), tasks_executed=[], next_steps=[])
+
+
+def test_worker_tasks_run_on_isolated_agents():
+    """A long-lived worker runs every task on a freshly reset agent no other task is using."""
+    with tempfile.TemporaryDirectory() as reports_dir:
+        orchestrator = WorkerOrchestrator(reports_dir)
+
+        async def handle(kind, task):
+            # What orchestrator_task_handler does with its warm Orchestrator
+            report = await orchestrator.run_task(kind, task)
+            return report.model_dump(mode="json")
+
+        async def scenario(server, address):
+            executor = RemoteTaskExecutor([address], slots_per_worker=3)
+            reports = await asyncio.gather(*(
+                executor.execute("query", QueryTask(goal=f"caller A query {index}"), DataAgentReport)
+                for index in range(6)
+            ))
+            reports.append(await executor.execute("query", QueryTask(goal="caller B query"), DataAgentReport))
+            return reports
+
+        reports = asyncio.run(with_server(handle, scenario, slots=3, heartbeat_interval=0.05))
+
+    assert [report.plan_goal for report in reports][-1] == "caller B query"
+    assert all(len(context) == 1 for context in orchestrator.seen)  # no task saw another task's messages
+    assert orchestrator.data_agents.stats["created"] == 3  # one agent per slot, reused afterwards
+    print(f"✓ {len(reports)} tasks on {orchestrator.data_agents.stats['created']} reset agents")
+
+
+def test_orchestrator_ships_tasks_to_cluster():
+    """The investigation phase runs on a localhost cluster and survives losing a node."""
+    plan = DataQualityPlan(
+        goal="Check RIDEBOOKING",
+        query_tasks=[QueryTask(goal=f"query {index}") for index in range(6)],
+        profiling_tasks=[ProfilingTask(goal=f"profile {index}") for index in range(2)],
+        execution_sequence=[],
+        success_criteria=[]
+    )
+    with LocalTaskCluster(workers=2, handler_factory="tests.agent.RemoteTaskExecutor_test:stub_handler",
+                          handler_kwargs={"delay": 0.3}, slots=2, heartbeat_interval=0.1) as cluster:
+        executor = RemoteTaskExecutor(cluster.addresses, slots_per_worker=2, heartbeat_timeout=1)
+        with tempfile.TemporaryDirectory() as reports_dir:
+            orchestrator = Orchestrator(reports_dir=reports_dir, enable_console_output=False, task_executor=executor)
+
+            async def run_and_kill():
+                phase = asyncio.create_task(orchestrator._run_investigation_phase(plan))
+                await asyncio.sleep(0.1)
+                cluster.kill(0)
+                return await phase
+
+            investigation, profiling = asyncio.run(run_and_kill())
+
+    assert len(investigation) == 6 and len(profiling) == 2
+    assert all(isinstance(report, DataProfilingReport) for report in profiling)
+    assert sorted(report.plan_goal for report in investigation) == [f"query {index}" for index in range(6)]
+    assert executor.stats["retries"] >= 1 and executor.worker_stats()[0]["down"]
+    assert len({report.next_steps[0] for report in investigation + profiling}) == 1  # all finished on the survivor
+    print(f"✓ 8 tasks completed after a node was killed ({executor.stats['retries']} retries)")
+
+
+def main():
+    """Run all tests."""
+    try:
+        test_result_heartbeat_and_usage()
+        test_retries_on_failures()
+        test_task_timeout_bounds_remote_tasks()
+        test_worker_tasks_run_on_isolated_agents()
+        test_orchestrator_ships_tasks_to_cluster()
+
+        print("\n" + "=" * 80)
+        print("All tests completed!")
+        print("=" * 80)
+
+    except Exception as e:
+        print(f"\n✗ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
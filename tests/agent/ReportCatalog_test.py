@@ -0,0 +1,122 @@
+"""
+Test script for the ReportCatalog
+
+Reports are written to a temporary directory, so neither Snowflake nor the LLM is needed.
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from agent.Orchestrator import Orchestrator
+from agent.ReportCatalog import ReportCatalog
+from agent.tool.ProfilingReportReaderTool import ProfilingReportReaderTool
+
+
+def test_existing_reports_are_indexed_once():
+    """A new catalog indexes the files already in the directory by their name."""
+    print("=" * 80)
+    print("Testing ReportCatalog - Indexing and lookups")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as reports_dir:
+        for index, name in enumerate([
+            "RIDEBOOKING_profile_20250101_120000.json",
+            "RIDEBOOKING_profile_20250102_120000.json",
+            "RIDEBOOKING_profile_20250102_120000.html",
+            "DRIVERS_profile_20250103_120000.json",
+            "data_quality_report_Missing values_20250104_120000.html",
+            "workflow_results_20250104_120000.json",
+            "notes.txt",
+        ]):
+            path = Path(reports_dir) / name
+            path.write_text("{}", encoding='utf-8')
+            os.utime(path, (1_700_000_000 + index, 1_700_000_000 + index))
+
+        catalog = ReportCatalog(reports_dir)
+        assert catalog.count() == 6 and catalog.count(format="html") == 2
+        latest = catalog.latest("profile", table_name="ridebooking", format="json")
+        assert Path(latest["path"]).name == "RIDEBOOKING_profile_20250102_120000.json"
+        assert Path(catalog.latest("report")["path"]).name.startswith("data_quality_report_")
+
+        # Deleted files are dropped on lookup
+        Path(latest["path"]).unlink()
+        latest = catalog.latest("profile", table_name="RIDEBOOKING", format="json")
+        assert Path(latest["path"]).name == "RIDEBOOKING_profile_20250101_120000.json"
+        assert catalog.count(kind="profile") == 3
+
+        # Reopening does not rescan the directory
+        (Path(reports_dir) / "ORDERS_profile_20250105_120000.json").write_text("{}", encoding='utf-8')
+        assert ReportCatalog(reports_dir).count(kind="profile") == 3
+    print("✓ Existing reports indexed; latest profile per table found")
+
+
+def test_atomic_writes():
+    """Writes go through a temporary file; failed writes leave nothing behind."""
+    with tempfile.TemporaryDirectory() as reports_dir:
+        catalog = ReportCatalog(reports_dir)
+        path = catalog.write_text(Path(reports_dir) / "workflow_results_x.json", '{"goal": "g"}', "results",
+                                  goal="g", run_id="run-1")
+        assert json.loads(path.read_text(encoding='utf-8')) == {"goal": "g"}
+        assert catalog.find(run_id="run-1")[0]["size_bytes"] == path.stat().st_size
+
+        try:
+            with catalog.writing(Path(reports_dir) / "T_profile_20250101_000000.html", "profile") as temp_path:
+                temp_path.write_text("<html>partial", encoding='utf-8')
+                raise RuntimeError("profiling crashed")
+        except RuntimeError:
+            pass
+        leftovers = sorted(p.name for p in Path(reports_dir).iterdir() if not p.name.startswith("report_catalog"))
+        assert leftovers == ["workflow_results_x.json"] and catalog.count() == 1
+    print("✓ Atomic writes registered; failed writes cleaned up")
+
+
+def test_orchestrator_and_reader_use_catalog():
+    """Reports and results written during a run are registered with the run id."""
+    with tempfile.TemporaryDirectory() as reports_dir:
+        orchestrator = Orchestrator(reports_dir=reports_dir, enable_console_output=False)
+
+        async def run():
+            span, token = orchestrator._start_trace("workflow", goal="catalog test")
+            results = {"goal": "catalog test", "success": True}
+            try:
+                orchestrator._save_html_report("<html></html>", "catalog test")
+                orchestrator._save_results(results)
+            finally:
+                orchestrator._end_trace(span, token, results)
+            return results
+
+        results = asyncio.run(run())
+        entries = orchestrator.report_catalog.find(run_id=results["run_id"])
+        assert sorted(entry["kind"] for entry in entries) == ["report", "results"]
+        saved = json.loads(Path(orchestrator.report_catalog.latest("results")["path"]).read_text(encoding='utf-8'))
+        assert saved["run_id"] == results["run_id"]
+
+        profile_path = Path(reports_dir) / "RIDEBOOKING_profile_20250101_120000.json"
+        orchestrator.report_catalog.write_text(profile_path, "{}", "profile", table_name="RIDEBOOKING", goal="nulls")
+        found = ProfilingReportReaderTool(reports_dir=reports_dir).find_profile_reports("ridebooking", 5)
+        assert found["success"] and [report["file_path"] for report in found["reports"]] == [str(profile_path.resolve())]
+    print("✓ Orchestrator reports and profiles looked up through the catalog")
+
+
+def main():
+    """Run all tests."""
+    try:
+        test_existing_reports_are_indexed_once()
+        test_atomic_writes()
+        test_orchestrator_and_reader_use_catalog()
+
+        print("\n" + "=" * 80)
+        print("All tests completed!")
+        print("=" * 80)
+
+    except Exception as e:
+        print(f"\n✗ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
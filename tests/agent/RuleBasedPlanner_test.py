@@ -0,0 +1,95 @@
+"""
+Test script for RuleBasedPlanner
+
+Plans are built from metadata/schema.json without calling the LLM.
+"""
+
+import time
+
+from agent.RuleBasedPlanner import RuleBasedPlanner
+
+
+def test_stock_goal_is_planned_without_llm():
+    """A stock completeness goal becomes a plan within milliseconds."""
+    print("=" * 80)
+    print("Testing RuleBasedPlanner - Stock goals")
+    print("=" * 80)
+
+    planner = RuleBasedPlanner()
+    goal = "Analyze missing values in the RIDEBOOKING table and assess data quality"
+    start = time.perf_counter()
+    plan = planner.plan(goal)
+    elapsed = time.perf_counter() - start
+
+    print(f"Planned in {elapsed * 1000:.2f}ms: {len(plan.query_tasks)} query tasks")
+    for task in plan.query_tasks:
+        print(f"  - {task.goal}")
+    assert plan.goal == goal
+    assert plan.profiling_tasks and plan.success_criteria
+    assert len(plan.execution_sequence) == len(plan.query_tasks) + len(plan.profiling_tasks)
+    assert any("BOOKING_VALUE" in task.goal and "'null'" in task.goal for task in plan.query_tasks)
+    assert elapsed < 0.1
+
+
+def test_intents_and_column_focus():
+    """Several intents are combined and mentioned columns narrow the tasks."""
+    planner = RuleBasedPlanner()
+    assert planner.match_intents("Check duplicates and consistency of cancellation flags") == ["duplicates", "consistency"]
+    assert planner.match_intents("Run a full data quality check") == [
+        "completeness", "duplicates", "validity", "consistency", "freshness"
+    ]
+
+    plan = planner.plan("Find invalid ratings in DRIVER_RATINGS")
+    assert len(plan.query_tasks) == 1 and "1-5" in plan.query_tasks[0].goal
+
+    plan = planner.plan("Check missing values in Booking Status")
+    assert '"Booking Status"' in plan.query_tasks[0].goal and "CUSTOMER_ID" not in plan.query_tasks[0].goal
+    print("✓ Intents combined and columns narrowed")
+
+
+def test_unmatched_goals_fall_back_to_llm():
+    """Free-form goals and unknown tables are left to the PlannerAgent."""
+    planner = RuleBasedPlanner()
+    assert planner.plan("Why did booking revenue drop for UberXL in March?") is None
+    assert planner.plan("Check freshness of the ORDERS table") is None
+    assert RuleBasedPlanner(schema={}).plan("Analyze missing values") is None
+
+    # Keywords alone are not enough: negation, filters, time windows and trends need the LLM
+    assert planner.plan("Do not check for duplicates, analyze revenue") is None
+    assert planner.plan("Show me rides where Booking Status is null in the last week") is None
+    assert planner.plan("What is the null rate trend in RIDEBOOKING?") is None
+    assert planner.deferred_reason("Check nulls in Booking Status where Vehicle Type = 'Auto'") == "filter"
+    assert planner.deferred_reason("Check missing values in RIDEBOOKING for the past 30 days") == "time_window"
+    assert planner.deferred_reason("Check how duplicates changed month over month") == "trend"
+    assert planner.deferred_reason("Check duplicates but ignore CUSTOMER_ID") == "negation"
+
+    # Templates must account for the whole goal: extra requests are not silently dropped
+    assert planner.plan("Find duplicate booking ids and explain the root cause of the revenue anomaly") is None
+    assert planner.plan("Check nulls in the rides of premium customers") is None
+    assert planner.plan("Identify outliers in ride distance and estimate their impact on revenue") is None
+    assert planner.unconsumed_words("Check nulls in the rides of premium customers") == ["premium", "customers"]
+    assert planner.deferred_reason("Count nulls in the account balance") == "extra request"
+    assert planner.plan("Find duplicate BOOKING_ID values in RIDEBOOKING") is not None
+    assert planner.plan("Find outliers in ride distance") is not None
+    print("✓ Unmatched goals fall back to the PlannerAgent")
+
+
+def main():
+    """Run all tests."""
+    try:
+        test_stock_goal_is_planned_without_llm()
+        test_intents_and_column_focus()
+        test_unmatched_goals_fall_back_to_llm()
+
+        print("\n" + "=" * 80)
+        print("All tests completed!")
+        print("=" * 80)
+
+    except Exception as e:
+        print(f"\n✗ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
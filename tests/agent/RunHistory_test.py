@@ -0,0 +1,119 @@
+"""
+Test script for the RunHistory store and the RunHistoryTool
+
+Runs are synthetic workflow results with check metrics and ydata-profiling JSON reports
+written to a temporary directory, so neither Snowflake nor the LLM is needed.
+"""
+
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from agent.Orchestrator import Orchestrator
+from agent.RunHistory import RunHistory
+from agent.tool.RunHistoryTool import RunHistoryTool
+
+
+def make_results(reports_dir, run_id, null_pct, p_missing, issues):
+    """Serialized workflow results with one check, one profile and some issues."""
+    profile_path = Path(reports_dir) / f"RIDEBOOKING_profile_{run_id}.json"
+    profile_path.write_text(json.dumps({
+        "table": {"n": 1000, "p_cells_missing": p_missing / 4, "types": {"Numeric": 2}},
+        "variables": {
+            "BOOKING_VALUE": {"type": "Numeric", "p_missing": p_missing, "n_distinct": 800, "mean": 512.5},
+            "BOOKING_STATUS": {"type": "Categorical", "p_missing": 0.0, "n_distinct": 5, "mean": None},
+        }
+    }), encoding='utf-8')
+    return {
+        "goal": "Analyze missing values",
+        "run_id": run_id,
+        "timestamp": "20250101_120000",
+        "success": True,
+        "check_results": [
+            {"name": "not_null:BOOKING_VALUE", "check_type": "not_null", "column": "BOOKING_VALUE",
+             "failed_pct": null_pct},
+            {"name": "consistency:cancelled_has_reason", "check_type": "consistency", "column": None,
+             "failed_pct": 0.5},
+        ],
+        "profiling_results": [{"plan_goal": "profile", "next_steps": [], "tasks_executed": [
+            {"json_report_path": str(profile_path), "html_report_path": ""}
+        ]}],
+        "analysis": {"issues": [{"type": "Missing Values", "severity": severity, "evidence_description": "nulls"}
+                                for severity in issues]},
+    }
+
+
+def test_trends_across_runs():
+    """Check metrics, profile statistics and issues are queryable as series per table and column."""
+    print("=" * 80)
+    print("Testing RunHistory - Trend queries")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as reports_dir:
+        history = RunHistory(str(Path(reports_dir) / "run_history.db"))
+        now = time.time()
+        for day, (null_pct, p_missing, issues) in enumerate([(2.0, 0.02, ["High"]), (5.0, 0.05, ["High", "Low"]),
+                                                             (9.0, 0.09, ["Critical"])]):
+            results = make_results(reports_dir, f"run-{day}", null_pct, p_missing, issues)
+            assert history.record(results, table_name="RIDEBOOKING", recorded_at=now - (2 - day) * 86400)
+        assert not history.record(results, table_name="RIDEBOOKING")  # append-only, recorded once
+
+        nulls = history.trend("ridebooking", "check:not_null", "booking_value")
+        assert [row["value"] for row in nulls] == [2.0, 5.0, 9.0]
+        missing = history.trend("RIDEBOOKING", "p_missing", "BOOKING_VALUE", days=1.5)
+        assert [row["run_id"] for row in missing] == ["run-1", "run-2"]
+        assert history.trend("RIDEBOOKING", "check:cancelled_has_reason")[0]["value"] == 0.5
+        assert history.trend("RIDEBOOKING", "n")[0]["value"] == 1000
+        assert not history.trend("RIDEBOOKING", "mean", "BOOKING_STATUS")
+
+        issues = history.issue_trend("RIDEBOOKING")
+        assert [(row["run_id"], row["severity"], row["issues"]) for row in issues][-1] == ("run-2", "Critical", 1)
+        assert history.tables() == ["RIDEBOOKING"]
+    print(f"✓ {len(nulls)} runs of not_null:BOOKING_VALUE: {[row['value'] for row in nulls]}")
+
+
+def test_tool_and_orchestrator():
+    """Saved results are recorded by the Orchestrator and summarized by the tool."""
+    with tempfile.TemporaryDirectory() as reports_dir:
+        orchestrator = Orchestrator(reports_dir=reports_dir, enable_console_output=False)
+        orchestrator._save_results({"goal": "g", "success": True})
+        history = RunHistory(orchestrator.run_history_path)
+        history.record(make_results(reports_dir, "old", 1.0, 0.01, []), "RIDEBOOKING", time.time() - 86400)
+        history.record(make_results(reports_dir, "new", 4.0, 0.04, ["High"]), "RIDEBOOKING")
+        assert len(history.query("SELECT * FROM runs")) == 3
+
+        # Backfill from a saved results file is idempotent
+        saved = next(Path(reports_dir).glob("workflow_results_*.json"))
+        assert not history.import_results_file(str(saved), "RIDEBOOKING")
+
+        tool = RunHistoryTool(history_path=orchestrator.run_history_path)
+        trend = tool.get_metric_trend("RIDEBOOKING", "p_missing", "BOOKING_VALUE", 30)
+        assert trend["success"] and trend["latest"] == 0.04 and abs(trend["change"] - 0.03) < 1e-9
+        missing = tool.get_metric_trend("RIDEBOOKING", "p_zeros", "BOOKING_VALUE", 30)
+        assert missing["points"] == [] and "p_missing (BOOKING_VALUE)" in missing["available_metrics"]
+        runs = tool.get_issue_trend("RIDEBOOKING", 30)["runs"]
+        # Runs without issues are listed with 0 issues, including the run saved by the Orchestrator
+        assert [(run["severity"], run["issues"]) for run in runs] == [(None, 0), (None, 0), ("High", 1)]
+        assert runs[0]["run_id"] == "old" and runs[-1]["run_id"] == "new"
+    print("✓ Orchestrator records saved runs; tool returns trend summaries")
+
+
+def main():
+    """Run all tests."""
+    try:
+        test_trends_across_runs()
+        test_tool_and_orchestrator()
+
+        print("\n" + "=" * 80)
+        print("All tests completed!")
+        print("=" * 80)
+
+    except Exception as e:
+        print(f"\n✗ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Test script for SchemaFanOutRunner
+
+Discovery runs against an in-memory stand-in for SnowflakeQueryEngine and each table's
+workflow is a stub orchestrator, so neither Snowflake nor the LLM is needed.
+"""
+
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from agent.SchemaFanOutRunner import SchemaFanOutRunner
+from agent.SchemaRegistry import SchemaRegistry
+from agent.SummarizerAgent import DataQualityAgentReport, DataQualityIssue
+
+
+class CatalogQueryEngine:
+    """Serves list_tables/get_table_info from fixed INFORMATION_SCHEMA rows."""
+
+    tables = [
+        {"DATABASE_NAME": "DB", "SCHEMA_NAME": "PUBLIC", "TABLE_NAME": "DRIVERS", "ROW_COUNT": 500, "BYTES": 10, "COMMENT": None},
+        {"DATABASE_NAME": "DB", "SCHEMA_NAME": "PUBLIC", "TABLE_NAME": "RIDEBOOKING", "ROW_COUNT": 150000, "BYTES": 9000, "COMMENT": None},
+        {"DATABASE_NAME": "DB", "SCHEMA_NAME": "PUBLIC", "TABLE_NAME": "PAYMENTS", "ROW_COUNT": 80000, "BYTES": 500, "COMMENT": "Card payments"},
+        {"DATABASE_NAME": "DB", "SCHEMA_NAME": "PUBLIC", "TABLE_NAME": "TMP_LOAD", "ROW_COUNT": 1, "BYTES": 1, "COMMENT": None},
+    ]
+
+    def list_tables(self, schema, database):
+        return {"success": True, "tables": self.tables, "table_count": len(self.tables)}
+
+    def get_table_info(self, table_name, schema, database):
+        columns = [
+            {"COLUMN_NAME": f"{table_name[:-1]}_ID", "DATA_TYPE": "TEXT", "IS_NULLABLE": "NO", "COMMENT": None},
+            {"COLUMN_NAME": "AMOUNT", "DATA_TYPE": "NUMBER", "IS_NULLABLE": "YES", "COMMENT": "Amount in INR"},
+        ]
+        return {"success": True, "table_name": table_name, "columns": columns, "column_count": len(columns)}
+
+
+class StubOrchestrator:
+    """Sleeps like a workflow and reports one issue per column; PAYMENTS fails."""
+
+    running = 0
+    max_running = 0
+
+    def __init__(self, schema, reports_dir):
+        self.schema = schema
+        self.reports_dir = reports_dir
+
+    async def run_analysis(self, goal):
+        StubOrchestrator.running += 1
+        StubOrchestrator.max_running = max(StubOrchestrator.max_running, StubOrchestrator.running)
+        await asyncio.sleep(0.2)
+        StubOrchestrator.running -= 1
+        if self.schema["table_name"] == "PAYMENTS":
+            raise RuntimeError("warehouse suspended")
+        severity = "Critical" if self.schema["table_name"] == "RIDEBOOKING" else "Low"
+        issues = [
+            DataQualityIssue(type=f"Missing values in {column['name']}", severity=severity,
+                             evidence_query="SELECT 1", evidence_description=goal)
+            for column in self.schema["columns"]
+        ]
+        analysis = DataQualityAgentReport(summary=f"{len(issues)} issues", issues=issues, recommendations=[],
+                                          required_followup_queries=[], analysis_complete=True)
+        return {"success": True, "analysis": analysis}
+
+
+def test_schema_from_table_info():
+    """INFORMATION_SCHEMA rows become a schema in the metadata/schema.json format."""
+    print("=" * 80)
+    print("Testing SchemaFanOutRunner - Per-table schema context")
+    print("=" * 80)
+
+    info = CatalogQueryEngine().get_table_info("DRIVERS", "PUBLIC", "DB")
+    schema = SchemaRegistry.from_table_info("DRIVERS", info["columns"], row_count=500)
+    assert schema["table_name"] == "DRIVERS" and "500 rows" in schema["description"]
+    assert schema["columns"][0] == {"name": "DRIVER_ID", "type": "VARCHAR", "description": "", "max_null_pct": 0}
+    assert schema["columns"][1]["type"] == "NUMBER" and "max_null_pct" not in schema["columns"][1]
+    print("✓ Schema built from INFORMATION_SCHEMA columns")
+
+
+def test_fan_out_runs_tables_in_parallel():
+    """Tables run concurrently up to the limit, failures are captured and a roll-up is written."""
+    StubOrchestrator.max_running = 0
+    with tempfile.TemporaryDirectory() as reports_dir:
+        runner = SchemaFanOutRunner(
+            schema_name="PUBLIC",
+            max_parallel_tables=2,
+            reports_dir=reports_dir,
+            exclude_tables=["tmp_load"],
+            query_engine=CatalogQueryEngine(),
+            orchestrator_factory=StubOrchestrator
+        )
+        assert [t["TABLE_NAME"] for t in runner.discover_tables()] == ["RIDEBOOKING", "PAYMENTS", "DRIVERS"]
+
+        started = time.perf_counter()
+        rollup = asyncio.run(runner.run())
+        elapsed = time.perf_counter() - started
+
+        assert StubOrchestrator.max_running == 2 and elapsed < 0.55
+        assert [t.table_name for t in rollup.tables] == ["RIDEBOOKING", "DRIVERS", "PAYMENTS"]
+
+        ridebooking, drivers, payments = rollup.tables
+        # The curated metadata is used for RIDEBOOKING, INFORMATION_SCHEMA for the rest
+        assert ridebooking.issue_counts["Critical"] == len(SchemaRegistry.load_schema()["columns"])
+        assert drivers.issue_counts["Low"] == 2
+        assert drivers.issues[0].evidence_description == "Assess overall data quality of the DRIVERS table"
+        assert drivers.report_dir == str(Path(reports_dir) / "DRIVERS")
+        assert not payments.success and payments.error == "warehouse suspended"
+
+        html_reports = list(Path(reports_dir).glob("schema_rollup_*.html"))
+        assert len(html_reports) == 1 and len(list(Path(reports_dir).glob("schema_rollup_*.json"))) == 1
+        assert "warehouse suspended" in html_reports[0].read_text()
+    print(f"✓ 3 tables analyzed in {elapsed:.2f}s with 2 workers")
+
+
+def main():
+    """Run all tests."""
+    try:
+        test_schema_from_table_info()
+        test_fan_out_runs_tables_in_parallel()
+
+        print("\n" + "=" * 80)
+        print("All tests completed!")
+        print("=" * 80)
+
+    except Exception as e:
+        print(f"\n✗ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Test script for SchemaRegistry and lazy Orchestrator construction
+
+No API or Snowflake calls are made; placeholder credentials are used when none are set.
+"""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from agent.SchemaRegistry import SchemaRegistry
+
+
+def test_schema_is_parsed_once():
+    """The schema file is read once per path and callers get independent copies."""
+    print("=" * 80)
+    print("Testing SchemaRegistry")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "schema.json"
+        path.write_text('{"table_name": "RIDEBOOKING", "columns": []}')
+
+        first = SchemaRegistry.load_schema(str(path))
+        path.write_text('{"table_name": "CHANGED"}')
+        second = SchemaRegistry.load_schema(str(path))
+        assert first == second and first is not second
+        assert second["table_name"] == "RIDEBOOKING"
+
+        SchemaRegistry.clear()
+        assert SchemaRegistry.load_schema(str(path))["table_name"] == "CHANGED"
+        assert SchemaRegistry.load_schema(str(Path(tmp_dir) / "missing.json")) == {}
+    print("✓ Schema cached per path")
+
+
+@pytest.mark.usefixtures("placeholder_credentials")
+def test_orchestrator_builds_agents_lazily():
+    """Agents are created on first use and share one query engine."""
+    from agent.Orchestrator import Orchestrator
+    from agent.tool.SnowflakeQueryEngine import SnowflakeQueryEngine
+    from agent.tool.SnowflakeDataProfilingTool import SnowflakeDataProfilingTool
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        orchestrator = Orchestrator(reports_dir=tmp_dir, enable_console_output=False)
+        assert orchestrator.data_agents.stats["created"] == 0
+
+        orchestrator.data_agents.warm()
+        assert orchestrator.data_agents.stats["created"] == 1
+        assert orchestrator.planner_agents.stats["created"] == 0
+
+        profiling_tool = SnowflakeDataProfilingTool.get_shared_instance(tmp_dir)
+        assert profiling_tool.query_engine is SnowflakeQueryEngine.get_shared_instance()
+        assert SnowflakeDataProfilingTool.get_shared_instance(tmp_dir) is profiling_tool
+    print("✓ Agents created lazily with shared tools")
+
+
+def main():
+    """Run all tests."""
+    try:
+        test_schema_is_parsed_once()
+        test_orchestrator_builds_agents_lazily()
+
+        print("\n" + "=" * 80)
+        print("All tests completed!")
+        print("=" * 80)
+
+    except Exception as e:
+        print(f"\n✗ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Test script for the column sketches, the SketchStore and the SketchTool
+
+Rows are synthetic ride bookings sketched into a temporary store, so neither Snowflake
+nor the LLM is needed.
+"""
+
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from agent.SketchStore import SketchStore, detect_date_column
+from agent.Sketches import FrequentItems, HyperLogLog, KllSketch
+from agent.tool.SketchTool import SketchTool
+
+
+def bookings(days=10, rows_per_day=5000, seed=3):
+    """Synthetic bookings with a Snowflake-style DATE column (date objects)."""
+    rng = np.random.default_rng(seed)
+    n = days * rows_per_day
+    first = date(2025, 1, 1)
+    return pd.DataFrame({
+        "DATE": [first + timedelta(days=int(day)) for day in np.repeat(np.arange(days), rows_per_day)],
+        "CUSTOMER_ID": [f"CID{value}" for value in rng.integers(0, 20000, n)],
+        "BOOKING_VALUE": np.where(rng.random(n) < 0.05, np.nan, rng.lognormal(6, 0.5, n)),
+        "VEHICLE_TYPE": rng.choice(["Auto", "Go Mini", "Bike", "Uber XL"], n, p=[0.5, 0.3, 0.15, 0.05]),
+    })
+
+
+def test_sketch_accuracy_and_merge():
+    """Sketches stay within their error bounds, also after merging partial sketches."""
+    print("=" * 80)
+    print("Testing Sketches - Accuracy and merge")
+    print("=" * 80)
+
+    rng = np.random.default_rng(11)
+    values = pd.Series(rng.integers(0, 100000, 300000))
+    halves = [values[:150000], values[150000:]]
+
+    hll = HyperLogLog().update(halves[0]).merge(HyperLogLog().update(halves[1]))
+    exact = values.nunique()
+    assert abs(hll.estimate() - exact) / exact < 0.05
+    assert abs(HyperLogLog().update(pd.Series(range(50))).estimate() - 50) < 2
+
+    kll = KllSketch(seed=0).update(halves[0]).merge(KllSketch(seed=1).update(halves[1]))
+    estimated = np.array(kll.quantiles([0.1, 0.5, 0.9]))
+    assert np.all(np.abs(estimated - np.quantile(values, [0.1, 0.5, 0.9])) < 0.03 * 100000)
+    assert sum(level.size for level in kll.levels) < 1000
+    assert KllSketch.from_dict(kll.to_dict()).quantiles([0.5]) == kll.quantiles([0.5])
+
+    skewed = pd.Series(rng.zipf(1.6, 100000))
+    frequent = FrequentItems(capacity=16).update(skewed[:50000]).merge(FrequentItems(capacity=16).update(skewed[50000:]))
+    top = frequent.top(3)
+    true_counts = skewed.astype(str).value_counts()
+    assert [item["value"] for item in top] == list(true_counts.index[:3])
+    assert all(item["count"] <= true_counts[item["value"]] <= item["max_count"] for item in top)
+    print(f"✓ HLL {hll.estimate():.0f} vs {exact}, median {estimated[1]:.0f}, top {top[0]}")
+
+
+def test_store_answers_date_ranges():
+    """Day partitions are merged for any date range and reloading a day replaces it."""
+    df = bookings()
+    assert detect_date_column(df) == "DATE"
+    with tempfile.TemporaryDirectory() as reports_dir:
+        store = SketchStore(str(Path(reports_dir) / "sketches.db"))
+        assert store.update_from_frame("RIDEBOOKING", df) == 10 * len(df.columns)
+        assert store.update_from_frame("RIDEBOOKING", df[df["DATE"] == date(2025, 1, 1)]) == len(df.columns)
+
+        window = df[(df["DATE"] >= date(2025, 1, 3)) & (df["DATE"] <= date(2025, 1, 5))]
+        distinct = store.distinct_count("ridebooking", "customer_id", "2025-01-03", "2025-01-05")
+        exact = window["CUSTOMER_ID"].nunique()
+        assert distinct["partitions"] == 3 and distinct["row_count"] == len(window)
+        assert abs(distinct["distinct_count"] - exact) / exact < 0.05
+
+        everything = store.describe("RIDEBOOKING", "BOOKING_VALUE", [0.5, 0.95])
+        assert everything["row_count"] == len(df) and everything["null_count"] == df["BOOKING_VALUE"].isna().sum()
+        exact_p95 = df["BOOKING_VALUE"].quantile(0.95)
+        assert abs(everything["quantiles"]["0.95"] - exact_p95) / exact_p95 < 0.05
+        assert store.top_values("RIDEBOOKING", "VEHICLE_TYPE", 2)["top_values"][0]["value"] == "Auto"
+        assert store.describe("RIDEBOOKING", "VEHICLE_TYPE", [0.5]).get("quantiles") is None
+        assert store.distinct_count("RIDEBOOKING", "CUSTOMER_ID", "2026-01-01", "")["partitions"] == 0
+    print(f"✓ {distinct['distinct_count']} distinct customers (exact {exact}) over 3 day partitions")
+
+
+def test_tool_reports_statistics():
+    """The tool returns percentiles, top values and the sketched columns when a column is missing."""
+    with tempfile.TemporaryDirectory() as reports_dir:
+        store_path = str(Path(reports_dir) / "sketches.db")
+        SketchStore(store_path).update_from_frame("RIDEBOOKING", bookings(days=3, rows_per_day=1000))
+        tool = SketchTool(store_path=store_path)
+
+        result = tool.get_column_statistics("RIDEBOOKING", "BOOKING_VALUE", "", "2025-01-02", [50, 99])
+        assert result["success"] and result["partitions"] == 2
+        assert set(result["percentiles"]) == {"p50", "p99"} and result["percentiles"]["p50"] < result["percentiles"]["p99"]
+        assert result["top_values"] == []  # all values unique: no heavy hitters
+        vehicles = tool.get_column_statistics("RIDEBOOKING", "VEHICLE_TYPE", "", "", [50])
+        assert "percentiles" not in vehicles and [item["value"] for item in vehicles["top_values"]][:2] == ["Auto", "Go Mini"]
+
+        missing = tool.get_column_statistics("RIDEBOOKING", "PICKUP_LOCATION", "", "", [50])
+        assert missing["success"] and missing["partitions"] == 0
+        assert {column["column_name"] for column in missing["available_columns"]} >= {"VEHICLE_TYPE", "DATE"}
+        assert not tool.get_column_statistics("RIDEBOOKING", "DATE", "not a date", "", [50])["success"]
+    print("✓ Tool answers from sketches and lists sketched columns")
+
+
+def main():
+    """Run all tests."""
+    try:
+        test_sketch_accuracy_and_merge()
+        test_store_answers_date_ranges()
+        test_tool_reports_statistics()
+
+        print("\n" + "=" * 80)
+        print("All tests completed!")
+        print("=" * 80)
+
+    except Exception as e:
+        print(f"\n✗ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
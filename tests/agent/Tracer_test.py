@@ -0,0 +1,152 @@
+"""
+Test script for Tracer, the JSONL span exporter and TraceViewer
+
+Model calls use AutoGen's ReplayChatCompletionClient and tools are plain functions, so
+neither Snowflake nor the LLM is needed.
+"""
+
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from autogen_agentchat.agents import AssistantAgent
+from autogen_core.models import CreateResult, RequestUsage
+from autogen_ext.models.replay import ReplayChatCompletionClient
+
+from agent.model.TracingChatCompletionClient import TracingChatCompletionClient
+from agent.Orchestrator import Orchestrator
+from agent.PlannerAgent import DataQualityPlan
+from agent.Tracer import JsonlSpanExporter, NOOP_SPAN, Tracer, critical_path, load_traces
+from TraceViewer import render_html, render_tree
+
+
+def count_rows(query: str) -> dict:
+    """Pretend to run a query."""
+    time.sleep(0.02)
+    return {"success": True, "row_count": 42, "data": [{"N": 42}]}
+
+
+def _span(span_id, parent_id, start, end, name=None):
+    return {"trace_id": "t", "span_id": span_id, "parent_id": parent_id, "name": name or span_id,
+            "kind": "phase", "start_ns": start, "end_ns": end, "status": "ok", "attributes": {}}
+
+
+def test_spans_nest_and_roll_up():
+    """Phase, model and tool spans nest under the workflow span and roll up their counters."""
+    print("=" * 80)
+    print("Testing Tracer - Span tree and counters")
+    print("=" * 80)
+
+    model = TracingChatCompletionClient(
+        ReplayChatCompletionClient([CreateResult(
+            finish_reason="stop", content="ok", usage=RequestUsage(prompt_tokens=120, completion_tokens=30), cached=True
+        )]),
+        model="gpt-5-mini"
+    )
+    tool = Tracer.traced_tool(count_rows)
+
+    @Tracer.traced("phase:investigation")
+    async def investigate():
+        await asyncio.gather(tool(query="SELECT 1"), tool(query="SELECT 2"), model.create([]))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        exporter = JsonlSpanExporter(str(Path(tmp) / "trace.jsonl"))
+
+        async def run():
+            with Tracer.start_span("workflow", "workflow", exporter=exporter, goal="trace test"):
+                await investigate()
+
+        asyncio.run(run())
+        traces = load_traces(str(exporter.path))
+
+    assert len(traces) == 1
+    spans = {span["name"]: span for span in next(iter(traces.values()))}
+    by_id = {span["span_id"]: span for span in spans.values()}
+    assert by_id[spans["tool:count_rows"]["parent_id"]]["name"] == "phase:investigation"
+    assert by_id[spans["model:gpt-5-mini"]["parent_id"]]["name"] == "phase:investigation"
+
+    workflow = spans["workflow"]["attributes"]
+    assert workflow["goal"] == "trace test"
+    assert workflow["rows"] == 84 and workflow["tool_calls"] == 2 and workflow["bytes"] > 0
+    assert workflow["prompt_tokens"] == 120 and workflow["completion_tokens"] == 30 and workflow["cache_hits"] == 1
+    print(f"✓ {len(next(iter(traces.values())))} spans exported with rolled-up counters")
+
+
+def test_agent_team_spans():
+    """Model calls made by an agent team are recorded under the agent span."""
+    agent = AssistantAgent(
+        "PlannerAgent",
+        model_client=TracingChatCompletionClient(ReplayChatCompletionClient(["no plan"]), model="replay")
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        orchestrator = Orchestrator(reports_dir=tmp, enable_console_output=False, trace_path=str(Path(tmp) / "t.jsonl"))
+
+        async def run():
+            span, token = orchestrator._start_trace("workflow", goal="agent test")
+            results = {"success": True}
+            try:
+                await orchestrator._run_single_agent_team(agent, "Plan", DataQualityPlan, max_messages=2)
+            finally:
+                orchestrator._end_trace(span, token, results)
+            return results
+
+        results = asyncio.run(run())
+        spans = next(iter(load_traces(str(orchestrator.trace_exporter.path)).values()))
+
+    by_id = {span["span_id"]: span for span in spans}
+    model_span = next(span for span in spans if span["kind"] == "model")
+    assert by_id[model_span["parent_id"]]["name"] == "agent:PlannerAgent"
+    assert results["trace_id"] == model_span["trace_id"]
+    print("✓ Model call nested under agent:PlannerAgent")
+
+
+def test_critical_path():
+    """The critical path follows the child that finished last, then work before it."""
+    spans = [
+        _span("root", None, 0, 100),
+        _span("planning", "root", 0, 10),
+        _span("query_fast", "root", 10, 30),
+        _span("query_slow", "root", 10, 70),
+        _span("model", "query_slow", 15, 65),
+        _span("reporting", "root", 70, 100),
+    ]
+    path = [span["span_id"] for span in critical_path(spans)]
+    assert path == ["root", "planning", "query_slow", "model", "reporting"]
+
+    tree = render_tree(spans)
+    assert "★ root" in tree and "  query_fast" in tree and "★     model" in tree
+    assert "★ query_slow" in render_html(spans)
+    print("✓ Critical path: " + " -> ".join(path))
+
+
+def test_disabled_tracing_is_noop():
+    """Without an exporter no spans are created."""
+    assert Tracer.start_span("workflow", "workflow") is NOOP_SPAN
+    with Tracer.span("phase:planning", "phase") as span:
+        assert span is NOOP_SPAN and Tracer.current() is NOOP_SPAN
+    result = asyncio.run(Tracer.traced_tool(count_rows)(query="SELECT 1"))
+    assert result["row_count"] == 42
+    print("✓ Tracing disabled by default")
+
+
+def main():
+    """Run all tests."""
+    try:
+        test_spans_nest_and_roll_up()
+        test_agent_team_spans()
+        test_critical_path()
+        test_disabled_tracing_is_noop()
+
+        print("\n" + "=" * 80)
+        print("All tests completed!")
+        print("=" * 80)
+
+    except Exception as e:
+        print(f"\n✗ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
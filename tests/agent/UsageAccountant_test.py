@@ -0,0 +1,170 @@
+"""
+Test script for usage accounting and the usage history
+
+Model calls use AutoGen's ReplayChatCompletionClient and Snowflake is replaced by a stand-in
+engine that returns QUERY_HISTORY rows, so neither Snowflake nor the LLM is needed.
+"""
+
+import asyncio
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+from autogen_core.models import CreateResult, RequestUsage
+from autogen_ext.models.replay import ReplayChatCompletionClient
+
+from agent.model.TracingChatCompletionClient import TracingChatCompletionClient
+from agent.Orchestrator import Orchestrator
+from agent.Tracer import Tracer
+from agent.UsageHistory import UsageHistory
+from agent.tool.SnowflakeQueryEngine import SnowflakeQueryEngine
+
+
+class QueryHistoryEngine(SnowflakeQueryEngine):
+    """Engine whose QUERY_HISTORY lookups return fixed rows."""
+
+    def __init__(self):
+        super().__init__()
+        self.lookups = []
+
+    def execute_query(self, query, goal, return_format, cancellation_token=None):
+        self.lookups.append(query)
+        rows = [
+            {"QUERY_ID": "q-data", "BYTES_SCANNED": 4096, "EXECUTION_TIME": 3600000,
+             "WAREHOUSE_SIZE": "X-Small", "CREDITS_USED_CLOUD_SERVICES": 0.5},
+            {"QUERY_ID": "q-profile", "BYTES_SCANNED": 1024, "EXECUTION_TIME": 1800000,
+             "WAREHOUSE_SIZE": "Small", "CREDITS_USED_CLOUD_SERVICES": 0.0},
+        ]
+        return {"success": True, "data": rows, "row_count": len(rows)}
+
+
+def _model(prompt_tokens, completion_tokens):
+    return TracingChatCompletionClient(
+        ReplayChatCompletionClient([CreateResult(
+            finish_reason="stop", content="ok", cached=False,
+            usage=RequestUsage(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens)
+        )]),
+        model="gpt-5-mini"
+    )
+
+
+def run_workflow(orchestrator):
+    """Run two traced phases with agents issuing model calls, queries and profiling."""
+
+    @Tracer.traced("phase:investigation")
+    async def investigate():
+        async def data_agent():
+            with Tracer.span("agent:DataAgent", "agent"):
+                await _model(100, 20).create([])
+                with Tracer.span("tool:execute_query", "tool"):
+                    Tracer.current().record_query("q-data")
+
+        async def profiling_agent():
+            with Tracer.span("agent:DataProfilingAgent", "agent"):
+                await _model(50, 10).create([])
+                with Tracer.span("tool:profile_data", "tool"):
+                    Tracer.current().record_query("q-profile")
+                    Tracer.current().record_query("q-missing")
+                    Tracer.current().accumulate(profiling_cpu_seconds=2.5)
+
+        await asyncio.gather(data_agent(), profiling_agent())
+
+    @Tracer.traced("phase:analysis")
+    async def analyze():
+        with Tracer.span("agent:SummarizerAgent", "agent"):
+            await _model(400, 80).create([])
+
+    async def run():
+        span, token = orchestrator._start_trace("workflow", goal="usage test")
+        results = {"goal": "usage test", "success": True}
+        try:
+            await investigate()
+            await analyze()
+            results["usage"] = await orchestrator._account_usage(span, "usage test", success=True)
+        finally:
+            orchestrator._end_trace(span, token, results)
+        return results
+
+    return asyncio.run(run())
+
+
+@pytest.mark.usefixtures("placeholder_credentials")
+def test_usage_per_agent_phase_and_run():
+    """Tokens, queries and CPU are aggregated per agent, per phase and per run."""
+    print("=" * 80)
+    print("Testing UsageAccountant - Aggregation")
+    print("=" * 80)
+
+    engine = QueryHistoryEngine()
+    previous, SnowflakeQueryEngine._shared_instance = SnowflakeQueryEngine._shared_instance, engine
+    try:
+        with tempfile.TemporaryDirectory() as reports_dir:
+            orchestrator = Orchestrator(reports_dir=reports_dir, enable_console_output=False)
+            results = run_workflow(orchestrator)
+            usage = results["usage"]
+
+            assert usage.run.prompt_tokens == 550 and usage.run.completion_tokens == 110
+            assert usage.run.model_calls == 3 and usage.run.queries == 3
+            assert usage.unresolved_queries == 1 and len(engine.lookups) == 1
+
+            # 1h on X-Small (1 credit) + 0.5 cloud services; 0.5h on Small (2 credits/h)
+            assert abs(usage.by_agent["DataAgent"].snowflake_credits - 1.5) < 1e-9
+            assert abs(usage.by_agent["DataProfilingAgent"].snowflake_credits - 1.0) < 1e-9
+            assert usage.by_agent["DataProfilingAgent"].profiling_cpu_seconds == 2.5
+            assert usage.by_phase["investigation"].bytes_scanned == 5120
+            assert usage.by_phase["analysis"].prompt_tokens == 400
+            assert abs(usage.run.snowflake_credits - 2.5) < 1e-9
+
+            # Saved with the workflow results
+            orchestrator._save_results(results)
+            saved = json.loads(next(Path(reports_dir).glob("workflow_results_*.json")).read_text())
+            assert saved["usage"]["by_agent"]["SummarizerAgent"]["completion_tokens"] == 80
+    finally:
+        SnowflakeQueryEngine._shared_instance = previous
+    print(f"✓ {usage.run.prompt_tokens + usage.run.completion_tokens} tokens and "
+          f"{usage.run.snowflake_credits:.2f} credits across {len(usage.by_agent)} agents")
+
+
+@pytest.mark.usefixtures("placeholder_credentials")
+def test_usage_history_queries():
+    """Each run is stored and can be broken down per agent or phase across runs."""
+    previous, SnowflakeQueryEngine._shared_instance = SnowflakeQueryEngine._shared_instance, QueryHistoryEngine()
+    try:
+        with tempfile.TemporaryDirectory() as reports_dir:
+            orchestrator = Orchestrator(reports_dir=reports_dir, enable_console_output=False)
+            run_workflow(orchestrator)
+            run_workflow(orchestrator)
+            history = UsageHistory(orchestrator.usage_history_path)
+            runs = history.recent_runs()
+            by_agent = history.breakdown("agent", "prompt_tokens")
+            by_phase = history.breakdown("phase", "completion_tokens")
+    finally:
+        SnowflakeQueryEngine._shared_instance = previous
+
+    assert len(runs) == 2 and runs[0]["goal"] == "usage test"
+    assert runs[0]["prompt_tokens"] == 550 and runs[0]["snowflake_credits"] == 2.5
+    assert by_agent[0]["name"] == "SummarizerAgent" and by_agent[0]["total"] == 800
+    assert by_agent[0]["runs"] == 2 and by_agent[0]["average"] == 400
+    assert [row["name"] for row in by_phase] == ["analysis", "investigation"]
+    print("✓ Usage history breakdown by agent and phase")
+
+
+def main():
+    """Run all tests."""
+    try:
+        test_usage_per_agent_phase_and_run()
+        test_usage_history_queries()
+
+        print("\n" + "=" * 80)
+        print("All tests completed!")
+        print("=" * 80)
+
+    except Exception as e:
+        print(f"\n✗ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+Test script for workflow, phase and task timeouts with cooperative cancellation
+
+Snowflake connections and agents are replaced by in-memory stand-ins that run for a
+configurable time, so neither Snowflake nor the LLM is needed.
+"""
+
+import asyncio
+import tempfile
+import threading
+import time
+from typing import Sequence
+
+import pytest
+from autogen_agentchat.agents import BaseChatAgent
+from autogen_agentchat.base import Response
+from autogen_agentchat.messages import TextMessage
+from autogen_core import CancellationToken
+
+from agent.DataAgent import DataAgentReport
+from agent.Orchestrator import Orchestrator
+from agent.PlannerAgent import DataQualityPlan, ProfilingTask, QueryTask
+from agent.tool.SnowflakeQueryEngine import SnowflakeQueryEngine
+
+
+class RunningConnection:
+    """Connection whose async query stays RUNNING for a fixed time."""
+
+    def __init__(self, run_seconds):
+        self.finishes_at = time.monotonic() + run_seconds
+        self.aborted = []
+
+    def cursor(self, cursor_class=None):
+        return RunningCursor(self)
+
+    def get_query_status_throw_if_error(self, query_id):
+        return "RUNNING" if time.monotonic() < self.finishes_at else "SUCCESS"
+
+    def is_still_running(self, status):
+        return status == "RUNNING"
+
+    def close(self):
+        pass
+
+
+class RunningCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.sfqid = None
+
+    def execute_async(self, query):
+        self.sfqid = "01b2-query"
+
+    def abort_query(self, query_id):
+        self.connection.aborted.append(query_id)
+
+    def get_results_from_sfqid(self, query_id):
+        pass
+
+    def fetchall(self):
+        return [{"N": 1}]
+
+
+class StubQueryEngine(SnowflakeQueryEngine):
+    """Query engine with a stand-in connection."""
+
+    def __init__(self, run_seconds):
+        super().__init__()
+        self.connection = RunningConnection(run_seconds)
+
+    def _create_connection(self):
+        return self.connection
+
+
+class SleepingAgent(BaseChatAgent):
+    """Agent that never answers and remembers the cancellation token it was given."""
+
+    def __init__(self, name):
+        super().__init__(name, "Sleeps until cancelled")
+        self.token = None
+
+    @property
+    def produced_message_types(self) -> Sequence[type]:
+        return (TextMessage,)
+
+    async def on_messages(self, messages, cancellation_token: CancellationToken) -> Response:
+        self.token = cancellation_token
+        # Like a model client call, the pending work is linked to the token
+        sleep = asyncio.ensure_future(asyncio.sleep(30))
+        cancellation_token.link_future(sleep)
+        await sleep
+        return Response(chat_message=TextMessage(content="done", source=self.name))
+
+    async def on_reset(self, cancellation_token: CancellationToken) -> None:
+        pass
+
+
+class TimedOrchestrator(Orchestrator):
+    """Orchestrator whose query tasks take as many seconds as their goal says."""
+
+    def __init__(self, **kwargs):
+        super().__init__(enable_console_output=False, **kwargs)
+        self.cancelled_tasks = []
+
+    async def _execute_query_task(self, query_task):
+        try:
+            await asyncio.sleep(float(query_task.goal))
+        except asyncio.CancelledError:
+            self.cancelled_tasks.append(query_task.goal)
+            raise
+        return DataAgentReport(plan_goal=query_task.goal, tasks_executed=[], next_steps=[])
+
+    async def _execute_profiling_task(self, profiling_task):
+        return None
+
+
+@pytest.mark.usefixtures("placeholder_credentials")
+def test_query_cancelled_in_snowflake():
+    """Cancelling the token or exceeding the query timeout aborts the running query."""
+    print("=" * 80)
+    print("Testing timeouts - Snowflake query cancellation")
+    print("=" * 80)
+
+    engine = StubQueryEngine(run_seconds=0.1)
+    result = engine.execute_query("SELECT 1", "fast query", "list")
+    assert result["success"] and result["data"] == [{"N": 1}]
+
+    engine = StubQueryEngine(run_seconds=30)
+    token = CancellationToken()
+    threading.Timer(0.2, token.cancel).start()
+    started = time.perf_counter()
+    result = engine.execute_query("SELECT 1", "hung query", "list", token)
+    assert not result["success"] and result["cancelled"]
+    assert time.perf_counter() - started < 2 and engine.connection.aborted == ["01b2-query"]
+
+    engine = StubQueryEngine(run_seconds=30)
+    engine.query_timeout = 0.3
+    started = time.perf_counter()
+    result = engine.execute_query("SELECT 1", "slow query", "list")
+    assert result["cancelled"] and "timed out" in result["error"]
+    assert time.perf_counter() - started < 2 and engine.connection.aborted == ["01b2-query"]
+    print("✓ Running queries cancelled via SYSTEM$CANCEL_QUERY")
+
+
+def test_task_timeout_cancels_team():
+    """A task exceeding task_timeout stops its team through the cancellation token."""
+    with tempfile.TemporaryDirectory() as reports_dir:
+        orchestrator = Orchestrator(reports_dir=reports_dir, enable_console_output=False, task_timeout=0.3)
+        agent = SleepingAgent("SleepingAgent")
+
+        started = time.perf_counter()
+        result = asyncio.run(orchestrator._run_single_agent_team(agent, "Plan", DataQualityPlan, max_messages=3))
+        elapsed = time.perf_counter() - started
+
+        assert result is None and elapsed < 1.5
+        assert agent.token is not None and agent.token.is_cancelled()
+    print(f"✓ Hung agent task stopped after {elapsed:.2f}s")
+
+
+def test_phase_timeout_keeps_partial_results():
+    """Tasks unfinished at the phase deadline are cancelled and completed ones are kept."""
+    plan = DataQualityPlan(
+        goal="timeouts",
+        query_tasks=[QueryTask(goal="0.05"), QueryTask(goal="0.1"), QueryTask(goal="30")],
+        profiling_tasks=[ProfilingTask(goal="profile")],
+        execution_sequence=[],
+        success_criteria=[]
+    )
+    with tempfile.TemporaryDirectory() as reports_dir:
+        orchestrator = TimedOrchestrator(reports_dir=reports_dir, phase_timeout=0.5)
+
+        async def run():
+            from agent.WorkflowDeadline import WorkflowDeadline
+            deadline = WorkflowDeadline(orchestrator.workflow_timeout)
+            token = deadline.activate()
+            try:
+                investigation, _ = await orchestrator._run_investigation_phase(plan)
+            finally:
+                deadline.deactivate(token)
+            return investigation, deadline
+
+        started = time.perf_counter()
+        investigation, deadline = asyncio.run(run())
+        elapsed = time.perf_counter() - started
+
+        assert [report.plan_goal for report in investigation] == ["0.05", "0.1"]
+        assert orchestrator.cancelled_tasks == ["30"]
+        assert deadline.timed_out == ["Investigation phase (queries)"] and elapsed < 1.5
+    print(f"✓ Phase cut at {elapsed:.2f}s with 2 of 3 query results kept")
+
+
+def test_workflow_timeout_bounds_later_phases():
+    """The workflow deadline caps phases that have no timeout of their own."""
+    from agent.WorkflowDeadline import WorkflowDeadline
+
+    deadline = WorkflowDeadline(0.5)
+    assert 0.4 < deadline.budget(None) <= 0.5
+    assert deadline.budget(0.1) == 0.1
+    assert WorkflowDeadline().budget(None) is None
+
+    async def run():
+        token = deadline.activate()
+        try:
+            return WorkflowDeadline.current() is deadline
+        finally:
+            deadline.deactivate(token)
+
+    assert asyncio.run(run())
+    assert WorkflowDeadline.current() is not deadline
+    print("✓ Workflow deadline propagates to phases")
+
+
+def main():
+    """Run all tests."""
+    try:
+        test_query_cancelled_in_snowflake()
+        test_task_timeout_cancels_team()
+        test_phase_timeout_keeps_partial_results()
+        test_workflow_timeout_bounds_later_phases()
+
+        print("\n" + "=" * 80)
+        print("All tests completed!")
+        print("=" * 80)
+
+    except Exception as e:
+        print(f"\n✗ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Test script for the background WorkflowWorker
+
+Workflows are stand-in coroutines that emit progress events, so neither Snowflake nor the
+LLM is needed.
+"""
+
+import asyncio
+import threading
+import time
+
+from agent.WorkflowWorker import WorkflowWorker
+
+
+def wait_for(condition, timeout=5.0):
+    """Poll until condition() is true."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Timed out waiting for condition"
+        time.sleep(0.01)
+
+
+def make_workflow(release: threading.Event, loops: list):
+    """Workflow that reports two phases and waits for release between them."""
+
+    async def run(job):
+        loops.append(asyncio.get_running_loop())
+        job.emit({"type": "phase", "phase": "Phase 1: Planning", "status": "complete"})
+        while not release.is_set():
+            await asyncio.sleep(0.01)
+        job.emit({"type": "log", "message": f"Analyzed {job.goal}"})
+        return {"goal": job.goal, "success": True}
+
+    return run
+
+
+def test_jobs_run_in_background_with_concurrency_limit():
+    """submit() returns immediately, extra jobs queue, and events stream while running."""
+    print("=" * 80)
+    print("Testing WorkflowWorker - Background jobs")
+    print("=" * 80)
+
+    worker = WorkflowWorker(max_concurrent_jobs=2)
+    release, loops = threading.Event(), []
+    try:
+        jobs = [worker.submit(f"goal {i}", make_workflow(release, loops)) for i in range(3)]
+        wait_for(lambda: sum(job.status == "running" for job in jobs) == 2)
+        assert [job.status for job in jobs].count("queued") == 1
+
+        # Progress is visible before the workflow finishes
+        events = jobs[0].drain_events()
+        assert [event["type"] for event in events] == ["status", "phase"]
+        assert jobs[0].drain_events() == []
+
+        release.set()
+        wait_for(lambda: all(job.finished for job in jobs))
+        assert all(job.status == "done" and job.results["success"] for job in jobs)
+        assert jobs[0].drain_events()[-1] == {"type": "status", "status": "done", "error": None}
+
+        # Jobs share the worker's long-lived loop
+        assert len(set(map(id, loops))) == 1 and len(worker.jobs()) == 3
+    finally:
+        worker.shutdown()
+    print(f"✓ {len(jobs)} jobs ran on one background loop, at most 2 at a time")
+
+
+def test_cancel_and_failure():
+    """Running and queued jobs can be cancelled; exceptions mark the job failed."""
+    worker = WorkflowWorker(max_concurrent_jobs=1)
+    never = threading.Event()
+
+    async def broken(job):
+        raise RuntimeError("warehouse suspended")
+
+    try:
+        running = worker.submit("long goal", make_workflow(never, []))
+        queued = worker.submit("queued goal", make_workflow(never, []))
+        wait_for(lambda: running.status == "running")
+
+        assert worker.cancel(queued.job_id) and worker.cancel(running.job_id)
+        wait_for(lambda: running.finished and queued.finished)
+        assert running.status == "cancelled" and queued.status == "cancelled"
+        assert queued.started_at is None
+        assert not worker.cancel(running.job_id)
+
+        failed = worker.submit("broken goal", broken)
+        wait_for(lambda: failed.finished)
+        assert failed.status == "failed" and failed.error == "warehouse suspended"
+    finally:
+        worker.shutdown()
+    print("✓ Cancelled and failed jobs reported")
+
+
+def main():
+    """Run all tests."""
+    try:
+        test_jobs_run_in_background_with_concurrency_limit()
+        test_cancel_and_failure()
+
+        print("\n" + "=" * 80)
+        print("All tests completed!")
+        print("=" * 80)
+
+    except Exception as e:
+        print(f"\n✗ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Import-time budget test
+
+Runs `python -X importtime` in a fresh process and checks that importing the Orchestrator
+(what the CLI and every Streamlit rerun do) stays within budget and does not load the heavy
+dependencies that are only needed once a query or profile actually runs.
+
+The budget can be tuned with IMPORT_TIME_BUDGET_SECONDS (default 2.0).
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Loaded on first use only
+DEFERRED_MODULES = ["ydata_profiling", "matplotlib", "pandas", "snowflake.connector", "openai"]
+
+
+def import_profile(statement: str) -> dict:
+    """Return {module: cumulative seconds} for a statement run in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, cwd=REPO_ROOT, check=True
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.split("|")
+        if cumulative.strip().isdigit():
+            profile[module.strip()] = int(cumulative.strip()) / 1_000_000
+    return profile
+
+
+def test_orchestrator_import_defers_heavy_dependencies():
+    """Importing the Orchestrator does not load profiling, dataframe, Snowflake or OpenAI modules."""
+    print("=" * 80)
+    print("Testing import time of agent.Orchestrator")
+    print("=" * 80)
+
+    profile = import_profile("import agent.Orchestrator")
+    loaded = [module for module in DEFERRED_MODULES if module in profile]
+    print(f"agent.Orchestrator: {profile['agent.Orchestrator']:.3f}s cumulative")
+    assert not loaded, f"Heavy modules imported eagerly: {loaded}"
+
+
+def test_import_time_budget():
+    """`import agent` is nearly free and the Orchestrator import stays within budget."""
+    budget = float(os.environ.get("IMPORT_TIME_BUDGET_SECONDS", "2.0"))
+
+    package_profile = import_profile("import agent")
+    assert "agent.Orchestrator" not in package_profile
+
+    orchestrator_time = import_profile("import agent.Orchestrator")["agent.Orchestrator"]
+    print(f"agent: {package_profile['agent']:.3f}s, agent.Orchestrator: {orchestrator_time:.3f}s (budget {budget}s)")
+    assert orchestrator_time < budget
+
+
+def main():
+    """Run all tests."""
+    try:
+        test_orchestrator_import_defers_heavy_dependencies()
+        test_import_time_budget()
+
+        print("\n" + "=" * 80)
+        print("All tests completed!")
+        print("=" * 80)
+
+    except Exception as e:
+        print(f"\n✗ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark for Orchestrator startup and Streamlit rerun latency
+
+Measures, in a fresh process:
+- import: importing agent.Orchestrator
+- construct: creating the first Orchestrator
+- first_use: creating all five agents on the first Orchestrator
+- rerun: creating a second Orchestrator and all its agents, as a Streamlit rerun does
+
+No API or Snowflake calls are made; placeholder credentials are used when none are set.
+
+Usage:
+    python -m tests.benchmark.OrchestratorStartup_benchmark [runs]
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+
+def measure_once() -> dict:
+    """Measure one cold start in the current process."""
+    for name, value in {
+        "OPENAI_API_KEY": "benchmark-key",
+        "SNOWFLAKE_ACCOUNT": "benchmark",
+        "SNOWFLAKE_USER": "benchmark",
+        "SNOWFLAKE_PASSWORD": "benchmark",
+    }.items():
+        os.environ.setdefault(name, value)
+
+    timings = {}
+    start = time.perf_counter()
+    from agent.Orchestrator import Orchestrator
+    timings["import"] = time.perf_counter() - start
+
+    def build_all_agents(orchestrator):
+        for pool in (orchestrator.planner_agents, orchestrator.data_agents, orchestrator.profiling_agents,
+                     orchestrator.summarizer_agents, orchestrator.report_agents):
+            pool.warm()
+
+    start = time.perf_counter()
+    orchestrator = Orchestrator(enable_console_output=False)
+    timings["construct"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    build_all_agents(orchestrator)
+    timings["first_use"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    build_all_agents(Orchestrator(enable_console_output=False))
+    timings["rerun"] = time.perf_counter() - start
+    return timings
+
+
+def main():
+    """Run the benchmark in fresh processes and print median timings."""
+    if len(sys.argv) > 1 and sys.argv[1] == "--once":
+        print(json.dumps(measure_once()))
+        return
+
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-m", "tests.benchmark.OrchestratorStartup_benchmark", "--once"],
+            capture_output=True, text=True, check=True
+        ).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+
+    print("=" * 80)
+    print(f"Orchestrator startup benchmark ({runs} runs, median seconds)")
+    print("=" * 80)
+    for phase in ("import", "construct", "first_use", "rerun"):
+        values = sorted(sample[phase] for sample in samples)
+        print(f"{phase:<10} {values[len(values) // 2]:.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark for remote task throughput against the number of workers
+
+Starts a LocalTaskCluster of 1, 2, 4 and 8 worker processes and runs the same batch of
+query tasks through a RemoteTaskExecutor. Each task is a stand-in that waits task_seconds,
+like an agent waiting on the model and Snowflake, so the numbers show the executor's
+dispatch overhead and how throughput grows with the worker count. No API or Snowflake
+calls are made.
+
+Usage:
+    python -m tests.benchmark.RemoteTaskThroughput_benchmark [tasks] [task_seconds] [slots]
+"""
+
+import asyncio
+import sys
+import time
+
+from agent.DataAgent import DataAgentReport
+from agent.PlannerAgent import QueryTask
+from agent.RemoteTaskExecutor import RemoteTaskExecutor
+from agent.TaskWorkerServer import LocalTaskCluster
+
+
+WORKER_COUNTS = [1, 2, 4, 8]
+
+
+def measure(workers: int, tasks: int, task_seconds: float, slots: int) -> float:
+    """Return the seconds a cluster of the given size takes for the batch."""
+    with LocalTaskCluster(workers=workers, handler_factory="tests.agent.RemoteTaskExecutor_test:stub_handler",
+                          handler_kwargs={"delay": task_seconds}, slots=slots, heartbeat_interval=1) as cluster:
+        executor = RemoteTaskExecutor(cluster.addresses, slots_per_worker=slots)
+
+        async def run_batch():
+            await asyncio.gather(*[
+                executor.execute("query", QueryTask(goal=f"task {index}"), DataAgentReport) for index in range(tasks)
+            ])
+
+        start = time.perf_counter()
+        asyncio.run(run_batch())
+        return time.perf_counter() - start
+
+
+def main():
+    """Run the batch on each cluster size and print throughput and speedup."""
+    tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    task_seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 0.25
+    slots = int(sys.argv[3]) if len(sys.argv) > 3 else 2
+
+    print("=" * 80)
+    print(f"Remote task throughput ({tasks} tasks of {task_seconds:g}s, {slots} slot(s) per worker)")
+    print("=" * 80)
+    print(f"{'workers':>8} {'seconds':>9} {'tasks/s':>9} {'speedup':>8} {'ideal':>6}")
+    baseline = None
+    for workers in WORKER_COUNTS:
+        elapsed = measure(workers, tasks, task_seconds, slots)
+        baseline = baseline or elapsed
+        print(f"{workers:>8} {elapsed:>9.2f} {tasks / elapsed:>9.1f} {baseline / elapsed:>7.2f}x {workers:>5}x")
+
+
+if __name__ == "__main__":
+    main()
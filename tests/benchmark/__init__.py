@@ -0,0 +1 @@
+# Startup and performance benchmarks
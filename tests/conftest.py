@@ -0,0 +1,15 @@
+"""
+Shared pytest fixtures
+"""
+
+import pytest
+
+
+PLACEHOLDER_CREDENTIALS = ("OPENAI_API_KEY", "SNOWFLAKE_ACCOUNT", "SNOWFLAKE_USER", "SNOWFLAKE_PASSWORD")
+
+
+@pytest.fixture
+def placeholder_credentials(monkeypatch):
+    """Set placeholder OpenAI and Snowflake credentials for one test; its stand-ins never connect."""
+    for name in PLACEHOLDER_CREDENTIALS:
+        monkeypatch.setenv(name, "test")
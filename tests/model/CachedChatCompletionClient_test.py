@@ -0,0 +1,117 @@
+"""
+Test script for CachedChatCompletionClient and LLMResponseCache
+
+Uses AutoGen's ReplayChatCompletionClient as the wrapped model so no API key is needed.
+"""
+
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from autogen_core.models import SystemMessage, UserMessage
+from autogen_ext.models.replay import ReplayChatCompletionClient
+
+from agent.model.CachedChatCompletionClient import CachedChatCompletionClient, LLMCacheMissError
+from agent.model.LLMResponseCache import LLMResponseCache
+
+
+MESSAGES = [
+    SystemMessage(content="You are the Planner Agent."),
+    UserMessage(content="Analyze missing values in the RIDEBOOKING table", source="user"),
+]
+
+
+def make_cache(tmp_dir: str, **kwargs) -> LLMResponseCache:
+    return LLMResponseCache(path=str(Path(tmp_dir) / "llm.db"), **kwargs)
+
+
+def test_record_and_replay():
+    """A recorded response is replayed without calling the wrapped model again."""
+    print("=" * 80)
+    print("Testing CachedChatCompletionClient - Record and Replay")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = make_cache(tmp_dir)
+        model = ReplayChatCompletionClient(["first answer", "second answer"])
+        client = CachedChatCompletionClient(model, cache, model="gpt-5-mini")
+
+        first = asyncio.run(client.create(MESSAGES))
+        second = asyncio.run(client.create(MESSAGES))
+        print(f"First: {first.content} (cached={first.cached})")
+        print(f"Second: {second.content} (cached={second.cached})")
+
+        assert first.content == "first answer"
+        assert second.content == "first answer" and second.cached
+        assert (client.hits, client.misses) == (1, 1)
+
+        replay = CachedChatCompletionClient(
+            ReplayChatCompletionClient([]), cache, model="gpt-5-mini", mode="replay"
+        )
+        assert asyncio.run(replay.create(MESSAGES)).content == "first answer"
+
+        try:
+            asyncio.run(replay.create([UserMessage(content="new goal", source="user")]))
+            raise AssertionError("Replay mode must not call the model on a miss")
+        except LLMCacheMissError as e:
+            print(f"✓ Replay miss raised: {e}")
+
+
+def test_key_includes_output_schema_and_model():
+    """Different output schemas or models never share cache entries."""
+    from agent.PlannerAgent import DataQualityPlan
+    from agent.SummarizerAgent import DataQualityAgentReport
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = make_cache(tmp_dir)
+        client = CachedChatCompletionClient(ReplayChatCompletionClient([]), cache, model="gpt-5-mini")
+        other_model = CachedChatCompletionClient(ReplayChatCompletionClient([]), cache, model="gpt-4o")
+
+        keys = {
+            client.cache_key(MESSAGES, json_output=DataQualityPlan),
+            client.cache_key(MESSAGES, json_output=DataQualityAgentReport),
+            client.cache_key(MESSAGES),
+            other_model.cache_key(MESSAGES),
+        }
+        assert len(keys) == 4
+        print("✓ Cache keys differ by output schema and model")
+
+
+def test_ttl_and_lru_eviction():
+    """Expired entries are dropped and the store stays within max_entries."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        lru = make_cache(tmp_dir, max_entries=2)
+        lru.set("a", "1")
+        lru.set("b", "2")
+        assert lru.get("a") == "1"  # "a" becomes most recently used
+        time.sleep(0.01)
+        lru.set("c", "3")
+        assert lru.get("b") is None and lru.get("a") == "1" and lru.get("c") == "3"
+
+        ttl = LLMResponseCache(path=str(Path(tmp_dir) / "ttl.db"), ttl_seconds=0.05)
+        ttl.set("k", "v")
+        time.sleep(0.1)
+        assert ttl.get("k") is None
+        print(f"✓ TTL/LRU eviction works: {lru.stats()}")
+
+
+def main():
+    """Run all tests."""
+    try:
+        test_record_and_replay()
+        test_key_includes_output_schema_and_model()
+        test_ttl_and_lru_eviction()
+
+        print("\n" + "=" * 80)
+        print("All tests completed!")
+        print("=" * 80)
+
+    except Exception as e:
+        print(f"\n✗ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Test script for TokenBucketRateLimiter, RateLimitedChatCompletionClient and ModelClientRegistry
+
+No API calls are made: the registry only constructs clients and the rate-limited wrapper
+is exercised around AutoGen's ReplayChatCompletionClient.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+from autogen_core.models import UserMessage
+from autogen_ext.models.replay import ReplayChatCompletionClient
+
+from agent.model.ModelClientRegistry import ModelClientRegistry
+from agent.model.RateLimitedChatCompletionClient import RateLimitedChatCompletionClient
+from agent.model.TokenBucketRateLimiter import TokenBucketRateLimiter
+
+
+def test_request_budget_and_back_off():
+    """Requests beyond the RPM burst wait, and back_off pauses every caller."""
+    print("=" * 80)
+    print("Testing TokenBucketRateLimiter")
+    print("=" * 80)
+
+    async def run():
+        limiter = TokenBucketRateLimiter(requests_per_minute=600)  # 10 requests/second
+        limiter._request_tokens = 2
+        assert await limiter.acquire() == 0
+        assert await limiter.acquire() == 0
+        waited = await limiter.acquire()
+        print(f"Third request waited {waited:.3f}s")
+        assert 0.05 < waited < 0.5
+
+        limiter.back_off(0.2)
+        start = time.monotonic()
+        await limiter.acquire()
+        assert time.monotonic() - start >= 0.19
+
+    asyncio.run(run())
+    print("✓ RPM budget and shared back-off enforced")
+
+
+def test_token_budget_is_reconciled():
+    """The token bucket is corrected with the real usage after each request."""
+    async def run():
+        limiter = TokenBucketRateLimiter(tokens_per_minute=10000)
+        client = RateLimitedChatCompletionClient(
+            ReplayChatCompletionClient(["ok"]), limiter, completion_token_estimate=500
+        )
+        messages = [UserMessage(content="x" * 400, source="user")]
+        estimated = client.estimate_tokens(messages)
+        assert estimated == 600
+
+        result = await client.create(messages)
+        actual = result.usage.prompt_tokens + result.usage.completion_tokens
+        remaining = limiter._token_tokens
+        print(f"Estimated {estimated}, actual {actual}, remaining {remaining:.0f}")
+        assert abs(remaining - (10000 - actual)) < 5
+
+    asyncio.run(run())
+    print("✓ Token usage reconciled")
+
+
+class RateLimitedOnce(ReplayChatCompletionClient):
+    """Replay client whose first stream is refused with a 429."""
+
+    def __init__(self, chat_completions):
+        super().__init__(chat_completions)
+        self.stream_calls = 0
+
+    def create_stream(self, *args, **kwargs):
+        self.stream_calls += 1
+        if self.stream_calls == 1:
+            from openai import RateLimitError
+
+            async def refused():
+                response = SimpleNamespace(status_code=429, headers={"retry-after": "0.1"}, request=None)
+                raise RateLimitError("Rate limit reached", response=response, body=None)
+                yield
+
+            return refused()
+        return super().create_stream(*args, **kwargs)
+
+
+def test_stream_is_retried_after_429():
+    """Opening a stream that is refused with a 429 backs off and retries like create()."""
+    async def run():
+        limiter = TokenBucketRateLimiter()
+        inner = RateLimitedOnce(["streamed answer"])
+        client = RateLimitedChatCompletionClient(inner, limiter, max_retries=2)
+        start = time.monotonic()
+        chunks = [chunk async for chunk in client.create_stream([UserMessage(content="hi", source="user")])]
+        return chunks, inner.stream_calls, time.monotonic() - start
+
+    chunks, calls, elapsed = asyncio.run(run())
+    assert calls == 2 and elapsed >= 0.09
+    assert chunks[-1].content == "streamed answer"
+    print(f"✓ Stream retried after a 429 ({elapsed:.2f}s back-off)")
+
+
+def test_registry_shares_clients():
+    """Agents asking for the same model and settings get one shared client and limiter."""
+    ModelClientRegistry.reset()
+    first = ModelClientRegistry.get_client(model="gpt-5-mini", api_key="test-key")
+    second = ModelClientRegistry.get_client(model="gpt-5-mini", api_key="test-key")
+    other = ModelClientRegistry.get_client(model="gpt-4o", api_key="test-key")
+
+    assert first is second
+    assert other is not first
+    assert isinstance(first, RateLimitedChatCompletionClient)
+    assert first.limiter is not other.limiter
+    ModelClientRegistry.reset()
+    print("✓ Registry shares clients per model and settings")
+
+
+def main():
+    """Run all tests."""
+    try:
+        test_request_budget_and_back_off()
+        test_token_budget_is_reconciled()
+        test_stream_is_retried_after_429()
+        test_registry_shares_clients()
+
+        print("\n" + "=" * 80)
+        print("All tests completed!")
+        print("=" * 80)
+
+    except Exception as e:
+        print(f"\n✗ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+# Model unit tests
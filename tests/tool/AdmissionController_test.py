@@ -0,0 +1,240 @@
+"""
+Test script for the Snowflake admission controller
+
+Statements run against an in-memory warehouse stand-in that queues everything above its
+capacity, so no Snowflake connection is needed.
+"""
+
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from agent.Tracer import Tracer
+from agent.UsageAccountant import UsageAccountant
+from agent.tool.AdmissionController import (
+    PRIORITY_METADATA,
+    PRIORITY_PROFILING,
+    PRIORITY_QUERY,
+    AdmissionController,
+    classify_query,
+)
+from agent.tool.SnowflakeQueryEngine import SnowflakeQueryEngine
+
+
+class FakeWarehouse:
+    """Runs up to capacity statements for service_seconds each; the rest wait QUEUED."""
+
+    def __init__(self, capacity, service_seconds):
+        self.capacity = capacity
+        self.service_seconds = service_seconds
+        self.lock = threading.Lock()
+        self.queue = deque()
+        self.running = {}
+        self.done = set()
+        self.submitted = 0
+        self.max_queued = 0
+
+    def submit(self):
+        with self.lock:
+            self.submitted += 1
+            query_id = f"q{self.submitted}"
+            self.queue.append(query_id)
+            self._advance()
+            return query_id
+
+    def status(self, query_id):
+        with self.lock:
+            self._advance()
+            if query_id in self.queue:
+                return "QUEUED"
+            return "RUNNING" if query_id in self.running else "SUCCESS"
+
+    def _advance(self):
+        now = time.monotonic()
+        for query_id in [query_id for query_id, ends_at in self.running.items() if ends_at <= now]:
+            del self.running[query_id]
+            self.done.add(query_id)
+        while self.queue and len(self.running) < self.capacity:
+            self.running[self.queue.popleft()] = now + self.service_seconds
+        self.max_queued = max(self.max_queued, len(self.queue))
+
+
+class FakeConnection:
+    def __init__(self, warehouse):
+        self.warehouse = warehouse
+
+    def cursor(self, cursor_class=None):
+        return FakeCursor(self.warehouse)
+
+    def get_query_status_throw_if_error(self, query_id):
+        return self.warehouse.status(query_id)
+
+    def is_still_running(self, status):
+        return status in ("RUNNING", "QUEUED")
+
+    def close(self):
+        pass
+
+
+class FakeCursor:
+    def __init__(self, warehouse):
+        self.warehouse = warehouse
+        self.sfqid = None
+
+    def execute_async(self, query):
+        self.sfqid = self.warehouse.submit()
+
+    def abort_query(self, query_id):
+        pass
+
+    def get_results_from_sfqid(self, query_id):
+        pass
+
+    def fetchall(self):
+        return [{"N": 1}]
+
+
+class WarehouseEngine(SnowflakeQueryEngine):
+    """Query engine whose connections go to a FakeWarehouse, with its own admission controller."""
+
+    def __init__(self, warehouse, admission):
+        super().__init__()
+        self.warehouse = warehouse
+        self.admission = admission
+
+    def _create_connection(self):
+        return FakeConnection(self.warehouse)
+
+
+def test_aimd_limit():
+    """Queueing halves the limit once per burst; clean completions add about one slot per window."""
+    print("=" * 80)
+    print("Testing AdmissionController - AIMD limit")
+    print("=" * 80)
+
+    controller = AdmissionController(max_limit=8, min_limit=2, queue_target_seconds=0.5)
+    burst = [controller.acquire(PRIORITY_QUERY, "wf") for _ in range(8)]
+    for ticket in burst:
+        ticket.executed, ticket.queued_seconds = True, 2.0
+        controller.release(ticket)
+    assert controller.limit == 4 and controller.stats["decreases"] == 1
+
+    for expected in (2, 2):
+        burst = [controller.acquire(PRIORITY_QUERY, "wf") for _ in range(int(controller.limit))]
+        for ticket in burst:
+            ticket.executed, ticket.queued_seconds = True, 2.0
+            controller.release(ticket)
+        assert controller.limit == expected  # floored at min_limit
+
+    for _ in range(20):
+        ticket = controller.acquire(PRIORITY_QUERY, "wf")
+        ticket.executed = True
+        controller.release(ticket)
+    assert 6 < controller.limit <= 8 and controller.stats["increases"] == 20
+
+    unexecuted = controller.acquire(PRIORITY_QUERY, "wf")
+    before = controller.limit
+    controller.release(unexecuted)  # never reached the warehouse: no feedback
+    assert controller.limit == before and controller.in_flight == 0
+    print(f"✓ Limit 8 -> 4 -> 2 under queueing, back to {controller.limit:.1f} after 20 clean statements")
+
+
+def test_priority_and_fairness():
+    """Waiters are served metadata first, then alternating between workflows, profiling last."""
+    assert classify_query("SELECT * FROM INFORMATION_SCHEMA.COLUMNS", "dict") == PRIORITY_METADATA
+    assert classify_query("show tables", "list") == PRIORITY_METADATA
+    assert classify_query("SELECT * FROM RIDEBOOKING", "dataframe") == PRIORITY_PROFILING
+    assert classify_query("SELECT COUNT(*) FROM RIDEBOOKING", "dict") == PRIORITY_QUERY
+
+    controller = AdmissionController(max_limit=1)
+    holder = controller.acquire(PRIORITY_QUERY, "busy")
+    order, threads = [], []
+
+    def wait_for_slot(label, priority, workflow):
+        ticket = controller.acquire(priority, workflow)
+        order.append(label)
+        time.sleep(0.01)
+        controller.release(ticket)
+
+    arrivals = [("A-profile", PRIORITY_PROFILING, "A"), ("A-q1", PRIORITY_QUERY, "A"), ("A-q2", PRIORITY_QUERY, "A"),
+                ("A-q3", PRIORITY_QUERY, "A"), ("B-q1", PRIORITY_QUERY, "B"), ("B-meta", PRIORITY_METADATA, "B"),
+                ("B-q2", PRIORITY_QUERY, "B")]
+    for index, arrival in enumerate(arrivals):
+        threads.append(threading.Thread(target=wait_for_slot, args=arrival))
+        threads[-1].start()
+        while sum(controller.snapshot()["waiting"].values()) < index + 1:
+            time.sleep(0.001)
+
+    cancel = threading.Event()
+    cancel.set()
+    assert controller.acquire(PRIORITY_QUERY, "C", cancel) is None
+
+    controller.release(holder)
+    for thread in threads:
+        thread.join(timeout=5)
+    # A was served first among queries (B's metadata went before), so B's queries interleave
+    assert order == ["B-meta", "A-q1", "B-q1", "A-q2", "B-q2", "A-q3", "A-profile"], order
+    assert controller.stats["cancelled"] == 1 and controller.in_flight == 0
+    print(f"✓ Admission order {order}")
+
+
+@pytest.mark.usefixtures("placeholder_credentials")
+def test_engine_backs_off_when_warehouse_queues():
+    """Statements through the engine shrink the limit when the warehouse queues them."""
+    warehouse = FakeWarehouse(capacity=2, service_seconds=0.15)
+    admission = AdmissionController(max_limit=8, min_limit=1, queue_target_seconds=0.1)
+    engine = WarehouseEngine(warehouse, admission)
+    accountant = UsageAccountant()
+
+    def run_query(index):
+        return engine.execute_query(f"SELECT {index}", "load test", "list")
+
+    with Tracer.start_span("workflow", "workflow", exporter=accountant) as root:
+        # Tool calls run in threads with the caller's context, like asyncio.to_thread
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            futures = [pool.submit(contextvars.copy_context().run, run_query, index) for index in range(24)]
+            results = [future.result() for future in futures]
+    assert all(result["success"] for result in results)
+    assert admission.stats["decreases"] >= 1 and admission.limit < 8
+    assert admission.stats["admitted"] == 24 and admission.in_flight == 0
+    assert root.attributes.get("queued_seconds", 0) > 0 and root.attributes.get("admission_wait_seconds", 0) > 0
+
+    # A waiting statement is cancelled by cancel_all_queries without reaching the warehouse
+    admission.limit = 1
+    holder = admission.acquire(PRIORITY_QUERY, "other")
+    submitted = warehouse.submitted
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        waiting = pool.submit(run_query, 99)
+        while sum(admission.snapshot()["waiting"].values()) == 0:
+            time.sleep(0.005)
+        assert engine.cancel_all_queries() == 1
+        outcome = waiting.result(timeout=5)
+    admission.release(holder)
+    assert outcome["cancelled"] and warehouse.submitted == submitted
+    print(f"✓ Limit fell to {admission.limit:.1f} with {warehouse.max_queued} statements queued at most, "
+          f"{root.attributes['admission_wait_seconds']:.2f}s spent waiting for admission")
+
+
+def main():
+    """Run all tests."""
+    try:
+        test_aimd_limit()
+        test_priority_and_fairness()
+        test_engine_backs_off_when_warehouse_queues()
+
+        print("\n" + "=" * 80)
+        print("All tests completed!")
+        print("=" * 80)
+
+    except Exception as e:
+        print(f"\n✗ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Test script for the declarative check suite compiler and DataQualityCheckTool
+
+The compiled query is executed against an in-memory stand-in for SnowflakeQueryEngine,
+so no Snowflake connection is needed.
+"""
+
+from agent.SchemaRegistry import SchemaRegistry
+from agent.tool.CheckSuiteCompiler import (
+    DataQualityCheck,
+    build_checks_from_schema,
+    compile_check_suite,
+    parse_check_results,
+)
+from agent.tool.DataQualityCheckTool import DataQualityCheckTool
+
+
+class StaticQueryEngine:
+    """Returns one fixed aggregate row and records the executed queries."""
+
+    def __init__(self, row):
+        self.row = row
+        self.queries = []
+
+    def execute_query(self, query, goal, return_format, cancellation_token=None):
+        self.queries.append(query)
+        return {"success": True, "data": [self.row], "row_count": 1}
+
+
+def test_schema_checks_compile_to_one_scan():
+    """All checks for RIDEBOOKING compile into a single aggregate SELECT."""
+    print("=" * 80)
+    print("Testing CheckSuiteCompiler - Single scan")
+    print("=" * 80)
+
+    schema = SchemaRegistry.load_schema()
+    checks = build_checks_from_schema(schema)
+    query = compile_check_suite(schema["table_name"], checks)
+    print(query)
+
+    check_types = {check.check_type for check in checks}
+    assert check_types == {"not_null", "null_sentinel", "range", "accepted_values", "unique", "consistency"}
+    assert query.count("FROM") == 1 and query.strip().endswith("FROM RIDEBOOKING")
+    assert query.count(" AS CHECK_") == len(checks)
+    booking_status = 'LOWER(TRIM(TO_VARCHAR("Booking Status"))) NOT IN (\'\', \'null\', \'none\', \'nan\'))'
+    assert f'COUNT_IF(("Booking Status" IS NOT NULL AND {booking_status} AND "Booking Status" NOT IN (\'Completed\'' in query
+    assert "(COUNT(BOOKING_ID) - COUNT(DISTINCT BOOKING_ID))" in query
+    assert "TRY_TO_DOUBLE(TO_VARCHAR(DRIVER_RATINGS)) < 1 OR TRY_TO_DOUBLE(TO_VARCHAR(DRIVER_RATINGS)) > 5" in query
+    print(f"✓ {len(checks)} checks compiled into one query")
+
+
+def test_results_are_structured_metrics():
+    """The single result row is parsed into per-check metrics with pass/fail status."""
+    checks = [
+        DataQualityCheck(name="not_null:BOOKING_ID", check_type="not_null", column="BOOKING_ID", max_failed_pct=0),
+        DataQualityCheck(name="not_null:DRIVER_CANCELLATION_REASON", check_type="not_null",
+                         column="DRIVER_CANCELLATION_REASON"),
+        DataQualityCheck(name="unique:BOOKING_ID", check_type="unique", column="BOOKING_ID", max_failed_pct=1),
+    ]
+    results = parse_check_results({"total_rows": 200, "check_0": 2, "check_1": 150, "check_2": 1}, checks)
+
+    assert [r.failed_count for r in results] == [2, 150, 1]
+    assert results[0].failed_pct == 1.0 and results[0].passed is False
+    assert results[1].passed is None  # informational, no threshold
+    assert results[2].passed is True
+    print("✓ Results parsed into structured metrics")
+
+
+def test_tool_runs_suite_with_one_query():
+    """DataQualityCheckTool issues exactly one query and rejects unknown tables."""
+    schema = SchemaRegistry.load_schema()
+    checks = build_checks_from_schema(schema)
+    row = {"TOTAL_ROWS": 1000, **{f"CHECK_{i}": 0 for i in range(len(checks))}}
+    row["CHECK_0"] = 5
+    engine = StaticQueryEngine(row)
+    tool = DataQualityCheckTool(query_engine=engine, schema=schema)
+
+    outcome = tool.run_check_suite("RIDEBOOKING")
+    assert outcome["success"] and len(engine.queries) == 1
+    assert outcome["checks_run"] == len(checks) and outcome["checks_failed"] == 1
+    assert outcome["results"][0]["failed_count"] == 5
+
+    assert not tool.run_check_suite("ORDERS")["success"]
+    assert len(engine.queries) == 1
+    print(f"✓ Suite ran with one query: {outcome['checks_failed']} of {outcome['checks_run']} checks failed")
+
+
+def main():
+    """Run all tests."""
+    try:
+        test_schema_checks_compile_to_one_scan()
+        test_results_are_structured_metrics()
+        test_tool_runs_suite_with_one_query()
+
+        print("\n" + "=" * 80)
+        print("All tests completed!")
+        print("=" * 80)
+
+    except Exception as e:
+        print(f"\n✗ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 from agent.tool.ProfilingReportReaderTool import ProfilingReportReaderTool
 
@@ -7,14 +9,21 @@ if __name__ == "__main__":
     Example usage of the ProfilingReportReaderTool
     """
     try:
+        # Work on a copy of the reports so the report catalog (report_catalog.db) is
+        # created in a temporary directory instead of ge_reports/
+        tmp_dir = tempfile.TemporaryDirectory()
+        reports_dir = Path(tmp_dir.name)
+        if Path("ge_reports").exists():
+            for report in Path("ge_reports").glob("*.json"):
+                shutil.copy2(report, reports_dir / report.name)
+
         # Create tool instance
-        tool = ProfilingReportReaderTool(reports_dir="ge_reports")
+        tool = ProfilingReportReaderTool(reports_dir=str(reports_dir))
 
         # Check for available reports in the directory
         print("Looking for profiling reports in ge_reports/...")
-        reports_dir = Path("ge_reports")
         
-        if reports_dir.exists():
+        if Path("ge_reports").exists():
             json_files = list(reports_dir.glob("*.json"))
             
             if json_files:
@@ -34,6 +43,10 @@ if __name__ == "__main__":
                     print(read_result["content"][:500] + "...")
                 else:
                     print(f"Error reading report: {read_result['error']}")
+
+                # Look up the newest profiles of the table through the catalog
+                found = tool.find_profile_reports("RIDEBOOKING", limit=3)
+                print(f"\nCatalog lookup: {found}")
             else:
                 print("No JSON reports found in the ge_reports directory.")
         else:
@@ -0,0 +1,228 @@
+"""
+Test script for workload-based warehouse routing and per-warehouse connection pools
+
+Connections go to in-memory warehouse stand-ins that answer EXPLAIN from a table of sizes
+and run statements for a time that depends on the table, so no Snowflake connection is needed.
+"""
+
+import contextvars
+import json
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from agent.tool.SnowflakeQueryEngine import SnowflakeQueryEngine
+from agent.tool.WarehouseRouter import TIER_HEAVY, TIER_LIGHT, TIER_STANDARD, WarehouseRouter
+
+
+MB = 1024 ** 2
+GB = 1024 ** 3
+# Table -> (bytes scanned, seconds the statement runs)
+TABLES = {"DIM_CITY": (2 * MB, 0.02), "RIDEBOOKING": (800 * MB, 0.05), "RIDE_EVENTS": (40 * GB, 0.6)}
+
+
+class FakeWarehouse:
+    """Runs one statement at a time per slot; statements above capacity wait QUEUED."""
+
+    def __init__(self, name, capacity):
+        self.name = name
+        self.capacity = capacity
+        self.lock = threading.Lock()
+        self.ends_at = {}
+        self.queue = []
+        self.statements = []
+        self.logins = 0
+
+    def submit(self, query):
+        table = re.search(r"FROM\s+(\w+)", query, re.IGNORECASE).group(1).upper()
+        with self.lock:
+            query_id = f"{self.name}-{len(self.statements)}"
+            self.statements.append(query)
+            self.queue.append((query_id, TABLES.get(table, (0, 0.01))[1]))
+            return query_id
+
+    def status(self, query_id):
+        with self.lock:
+            now = time.monotonic()
+            running = sum(1 for ends_at in self.ends_at.values() if ends_at > now)
+            while self.queue and running < self.capacity:
+                started_id, seconds = self.queue.pop(0)
+                self.ends_at[started_id] = now + seconds
+                running += 1
+            if query_id not in self.ends_at:
+                return "QUEUED"
+            return "RUNNING" if self.ends_at[query_id] > now else "SUCCESS"
+
+
+class FakeConnection:
+    def __init__(self, warehouse):
+        self.warehouse = warehouse
+        self.closed = False
+
+    def cursor(self, cursor_class=None):
+        return FakeCursor(self.warehouse)
+
+    def get_query_status_throw_if_error(self, query_id):
+        return self.warehouse.status(query_id)
+
+    def is_still_running(self, status):
+        return status in ("RUNNING", "QUEUED")
+
+    def is_closed(self):
+        return self.closed
+
+    def close(self):
+        self.closed = True
+
+
+class FakeCursor:
+    def __init__(self, warehouse):
+        self.warehouse = warehouse
+        self.sfqid = None
+        self.plan = None
+
+    def execute(self, query):
+        # EXPLAIN compiles the statement; it is answered without using the warehouse
+        table = re.search(r"FROM\s+(\w+)", query, re.IGNORECASE).group(1).upper()
+        if table not in TABLES:
+            raise RuntimeError(f"Object '{table}' does not exist or not authorized.")
+        self.plan = json.dumps({"GlobalStats": {"partitionsTotal": 10, "partitionsAssigned": 10,
+                                                "bytesAssigned": TABLES[table][0]}, "Operations": []})
+
+    def fetchone(self):
+        return (self.plan,)
+
+    def execute_async(self, query):
+        self.sfqid = self.warehouse.submit(query)
+
+    def abort_query(self, query_id):
+        pass
+
+    def get_results_from_sfqid(self, query_id):
+        pass
+
+    def fetchall(self):
+        return [{"N": 1}]
+
+
+class RoutedEngine(SnowflakeQueryEngine):
+    """Query engine connected to one FakeWarehouse per warehouse name."""
+
+    def __init__(self, warehouses, router):
+        super().__init__()
+        self.connection_params["warehouse"] = router.default_warehouse
+        self.warehouses = warehouses
+        self.router = router
+        self.admission = None
+
+    def _create_connection(self, warehouse=None):
+        target = self.warehouses[warehouse or self.connection_params["warehouse"]]
+        target.logins += 1
+        return FakeConnection(target)
+
+
+def test_router_tiers():
+    """Metadata goes light, other statements by EXPLAIN bytes, with a heuristic fallback."""
+    print("=" * 80)
+    print("Testing WarehouseRouter - Tiers")
+    print("=" * 80)
+
+    single = WarehouseRouter("DQ_WH", warehouses={TIER_HEAVY: "DQ_WH"})
+    decision = single.route("SELECT * FROM RIDE_EVENTS", "dataframe", lambda query: 1 / 0)
+    assert not single.enabled and decision.warehouse == "DQ_WH" and decision.source == "default"
+
+    explained = []
+
+    def explain_bytes(query):
+        explained.append(query)
+        table = re.search(r"FROM\s+(\w+)", query).group(1)
+        if table not in TABLES:
+            raise RuntimeError("does not exist")
+        return TABLES[table][0]
+
+    router = WarehouseRouter("DQ_WH", warehouses={TIER_LIGHT: "XS_WH", TIER_HEAVY: "L_WH"},
+                             light_max_bytes=100 * MB, heavy_min_bytes=5 * GB)
+    routes = {
+        "SHOW TABLES": router.route("SHOW TABLES", "dict", explain_bytes),
+        "DIM_CITY": router.route("SELECT COUNT(*) FROM DIM_CITY", "dict", explain_bytes),
+        "RIDEBOOKING": router.route("SELECT COUNT(*) FROM RIDEBOOKING", "dict", explain_bytes),
+        "RIDE_EVENTS": router.route("SELECT * FROM RIDE_EVENTS", "dataframe", explain_bytes),
+        "again": router.route("SELECT  COUNT(*)\n FROM RIDEBOOKING", "dict", explain_bytes),
+        "unknown": router.route("SELECT * FROM STAGING", "dataframe", explain_bytes),
+    }
+    assert {name: (route.tier, route.warehouse) for name, route in routes.items()} == {
+        "SHOW TABLES": (TIER_LIGHT, "XS_WH"),
+        "DIM_CITY": (TIER_LIGHT, "XS_WH"),
+        "RIDEBOOKING": (TIER_STANDARD, "DQ_WH"),
+        "RIDE_EVENTS": (TIER_HEAVY, "L_WH"),
+        "again": (TIER_STANDARD, "DQ_WH"),
+        "unknown": (TIER_HEAVY, "L_WH"),
+    }
+    assert routes["RIDEBOOKING"].estimated_bytes == 800 * MB and routes["unknown"].source == "heuristic"
+    assert len(explained) == 4  # no EXPLAIN for metadata, the repeated statement hit the cache
+    assert router.stats["cache_hits"] == 1 and router.stats["explain_failures"] == 1
+    print(f"✓ Routes: { {name: route.tier for name, route in routes.items()} }")
+
+
+@pytest.mark.usefixtures("placeholder_credentials")
+def test_engine_routes_over_pooled_connections():
+    """Light statements finish on their own warehouse while heavy extracts occupy the heavy one."""
+    warehouses = {name: FakeWarehouse(name, capacity) for name, capacity in
+                  (("XS_WH", 8), ("DQ_WH", 2), ("L_WH", 1))}
+    router = WarehouseRouter("DQ_WH", warehouses={TIER_LIGHT: "XS_WH", TIER_HEAVY: "L_WH"})
+    engine = RoutedEngine(warehouses, router)
+
+    def timed(query, return_format):
+        started = time.perf_counter()
+        result = engine.execute_query(query, "routing test", return_format)
+        return result, time.perf_counter() - started
+
+    timed("SELECT COUNT(*) FROM DIM_CITY", "dict")  # first call imports pandas
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        heavy = [pool.submit(contextvars.copy_context().run, timed, "SELECT * FROM RIDE_EVENTS", "dataframe")
+                 for _ in range(2)]
+        time.sleep(0.05)
+        light = [pool.submit(contextvars.copy_context().run, timed, query, "dict") for query in
+                 ["SELECT COUNT(*) FROM DIM_CITY"] * 6 + ["SELECT * FROM INFORMATION_SCHEMA.TABLES"] * 2]
+        heavy_results = [future.result() for future in heavy]
+        light_results = [future.result() for future in light]
+
+    assert all(result["success"] and result["warehouse"] == "L_WH" for result, _ in heavy_results)
+    assert all(result["success"] and result["warehouse"] == "XS_WH" for result, _ in light_results)
+    assert max(seconds for _, seconds in light_results) < 0.5 < max(seconds for _, seconds in heavy_results)
+    assert not warehouses["DQ_WH"].statements and len(warehouses["L_WH"].statements) == 2
+
+    # Later statements reuse the pooled connections instead of logging in again
+    logins = sum(warehouse.logins for warehouse in warehouses.values())
+    for _ in range(5):
+        assert engine.execute_query("SELECT COUNT(*) FROM RIDEBOOKING", "routing test", "dict")["warehouse"] == "DQ_WH"
+        assert engine.execute_query("SELECT COUNT(*) FROM DIM_CITY", "routing test", "dict")["success"]
+    assert sum(warehouse.logins for warehouse in warehouses.values()) == logins + 1  # only DQ_WH's first
+    engine.close_connections()
+    assert engine._pool("XS_WH").stats["closed"] >= 1
+    print(f"✓ Light statements took at most {max(seconds for _, seconds in light_results):.2f}s while heavy "
+          f"extracts took {max(seconds for _, seconds in heavy_results):.2f}s; {logins + 1} logins for "
+          f"{sum(len(warehouse.statements) for warehouse in warehouses.values())} statements")
+
+
+def main():
+    """Run all tests."""
+    try:
+        test_router_tiers()
+        test_engine_routes_over_pooled_connections()
+
+        print("\n" + "=" * 80)
+        print("All tests completed!")
+        print("=" * 80)
+
+    except Exception as e:
+        print(f"\n✗ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()